@@ -0,0 +1,432 @@
+"""
+Bootstrap of the parameter estimates of a model
+
+The observations are resampled and the model is estimated on each
+bootstrap sample. The available resampling schemes are
+
+pairs
+    rows of endog and exog, drawn independently with replacement
+cluster
+    groups of observations, drawn independently with replacement
+block
+    moving blocks of consecutive observations, for time series
+residual
+    endog = fittedvalues + resampled residuals, exog fixed
+wild
+    endog = fittedvalues + resid * v with independent random signs v,
+    robust to heteroscedasticity
+
+Each replication draws from its own RandomState, seeded from the seed
+given by the user. The samples do not depend on how the replications are
+distributed over processes, and the vectorized estimation of linear
+regression models gives the same estimates as refitting the model.
+
+Resampling the observations of GLS with correlated errors, a sigma that
+is not diagonal, would duplicate rows and columns of sigma and make it
+singular. Only the residual and wild bootstrap, which resample the
+whitened residuals, are available for these models.
+
+For OLS, WLS and GLS the estimates of many replications are computed at
+once, in blocks of replications of bounded memory. Resampling rows only reweights the cross-products of the whitened
+data, X'CX and X'Cy with the counts C of the observations in the sample,
+and for the residual and wild bootstrap the estimates are linear in the
+resampled residuals. For other models the model is created again on the
+bootstrap sample and fit with the original estimates as starting values.
+
+References
+----------
+Davison, A. C. and Hinkley, D. V. 1997. Bootstrap Methods and their
+    Application. Cambridge University Press.
+Cameron, A. C., Gelbach, J. B. and Miller, D. L. 2008. "Bootstrap-based
+    improvements for inference with clustered errors". Review of Economics
+    and Statistics 90(3), pp. 414-427.
+"""
+import inspect
+import numpy as np
+from scipy import stats
+from statsmodels.tools.tools import _is_sparse
+
+_methods = ['pairs', 'cluster', 'block', 'residual', 'wild']
+
+# number of observations of the blocks of the vectorized cross-products
+_CHUNKSIZE = 1024
+# maximum number of elements of the counts or resampled residuals of a
+# block of replications, replications x observations
+_MAX_BLOCK_SIZE = 2**20
+
+
+class _Resampler(object):
+    """
+    Draws the bootstrap samples for one resampling method.
+
+    draw returns the indices of the rows of the sample for pairs, cluster
+    and block, the indices of the resampled residuals for residual and the
+    multipliers of the residuals for wild.
+    """
+    def __init__(self, method, nobs, groups=None, block_length=None,
+                 wild_dist='rademacher'):
+        if method not in _methods:
+            raise ValueError("method has to be one of %s" % _methods)
+        self.method = method
+        self.nobs = nobs
+        if method == 'cluster':
+            if groups is None:
+                raise ValueError("the cluster bootstrap requires groups")
+            groups = np.asarray(groups)
+            if len(groups) != nobs:
+                raise ValueError("groups has to have one element per "
+                                 "observation")
+            _, labels = np.unique(groups, return_inverse=True)
+            order = np.argsort(labels, kind='mergesort')
+            bounds = np.r_[0, np.cumsum(np.bincount(labels))]
+            self.group_rows = [order[bounds[i]:bounds[i+1]]
+                               for i in range(len(bounds) - 1)]
+        elif method == 'block':
+            if block_length is None:
+                raise ValueError("the block bootstrap requires block_length")
+            block_length = int(block_length)
+            if not 1 <= block_length <= nobs:
+                raise ValueError("block_length has to be between 1 and the "
+                                 "number of observations")
+            self.block_length = block_length
+        elif method == 'wild':
+            if wild_dist not in ['rademacher', 'mammen']:
+                raise ValueError("wild_dist has to be 'rademacher' or "
+                                 "'mammen'")
+            self.wild_dist = wild_dist
+
+    def draw(self, random_state):
+        method = self.method
+        nobs = self.nobs
+        if method in ['pairs', 'residual']:
+            return random_state.randint(0, nobs, size=nobs)
+        elif method == 'cluster':
+            group_rows = self.group_rows
+            drawn = random_state.randint(0, len(group_rows),
+                                         size=len(group_rows))
+            return np.concatenate([group_rows[i] for i in drawn])
+        elif method == 'block':
+            length = self.block_length
+            n_blocks = -(-nobs // length)
+            starts = random_state.randint(0, nobs - length + 1,
+                                          size=n_blocks)
+            return (starts[:,None] + np.arange(length)).ravel()[:nobs]
+        elif self.wild_dist == 'rademacher':
+            return 2. * random_state.randint(0, 2, size=nobs) - 1
+        else:
+            sqrt5 = np.sqrt(5)
+            low = random_state.rand(nobs) < (sqrt5 + 1) / (2 * sqrt5)
+            return np.where(low, -(sqrt5 - 1) / 2, (sqrt5 + 1) / 2)
+
+
+def _is_linear(model):
+    from statsmodels.regression.linear_model import GLS, WLS
+    return isinstance(model, (GLS, WLS))
+
+
+def _has_full_sigma(model):
+    # GLS with correlated errors
+    sigma = getattr(model, 'sigma', None)
+    if sigma is None or np.ndim(sigma) < 2:
+        return False
+    return np.any(sigma - np.diag(np.diag(sigma)))
+
+
+def _take_kwds(kwds, rows, nobs):
+    """
+    Resamples the arrays in kwds that have one element or row per
+    observation. Diagonal nobs x nobs arrays, the sigma of GLS, are
+    replaced by their resampled diagonal, and both axes of other nobs x
+    nobs arrays are resampled.
+    """
+    new_kwds = {}
+    for key, value in kwds.iteritems():
+        if isinstance(value, np.ndarray) and value.ndim > 0 and \
+                value.shape[0] == nobs:
+            if value.ndim == 2 and value.shape[1] == nobs:
+                diag = np.diag(value)
+                if not np.any(value - np.diag(diag)):
+                    value = diag[rows]
+                else:
+                    value = value[rows][:,rows]
+            else:
+                value = value[rows]
+        new_kwds[key] = value
+    return new_kwds
+
+
+def _refit_replications(model, params, resampler, seeds, fit_kwds,
+                        fittedvalues=None, resid=None):
+    """
+    Estimates the model on the bootstrap samples of the seeds.
+
+    Returns the estimates, one row per replication.
+    """
+    nobs = model.endog.shape[0]
+    endog = model.endog
+    exog = model.exog
+    kwds = model._get_init_kwds()
+    fit_kwds = dict(fit_kwds)
+    fit_args = inspect.getargspec(model.fit)[0]
+    if 'start_params' in fit_args:
+        fit_kwds.setdefault('start_params', params)
+    if 'disp' in fit_args:
+        fit_kwds.setdefault('disp', 0)
+    cloneattr = getattr(model, 'cloneattr', [])
+    method = resampler.method
+
+    results = []
+    for seed in seeds:
+        draw = resampler.draw(np.random.RandomState(seed))
+        if method in ['pairs', 'cluster', 'block']:
+            rows = draw
+            endog_b = endog[rows]
+            exog_b = exog[rows]
+            kwds_b = _take_kwds(kwds, rows, nobs)
+        else:
+            if method == 'residual':
+                endog_b = fittedvalues + resid[draw]
+            else:
+                endog_b = fittedvalues + resid * draw
+            exog_b = exog
+            kwds_b = kwds
+        mod = model.__class__(endog_b, exog_b, **kwds_b)
+        for attr in cloneattr:
+            setattr(mod, attr, getattr(model, attr))
+        results.append(np.ravel(mod.fit(**fit_kwds).params, order='F'))
+    return np.array(results)
+
+
+def _linear_replications(model, params, resampler, seeds, wresid=None):
+    """
+    Estimates of OLS, WLS or GLS on the bootstrap samples of the seeds,
+    computed from the whitened data of many replications at once.
+
+    The replications are processed in blocks, the counts of the
+    observations or the resampled residuals of a block have at most
+    _MAX_BLOCK_SIZE elements.
+
+    Returns the estimates, one row per replication.
+    """
+    wexog = model.wexog
+    nobs, k_vars = wexog.shape
+    method = resampler.method
+    if method in ['residual', 'wild']:
+        pinv_wexog = getattr(model, 'pinv_wexog', None)
+        if pinv_wexog is None:
+            pinv_wexog = np.linalg.pinv(wexog)
+    else:
+        wxy = wexog * model.wendog[:,None]
+
+    step = max(1, _MAX_BLOCK_SIZE // nobs)
+    bparams = []
+    for start in range(0, len(seeds), step):
+        draws = [resampler.draw(np.random.RandomState(seed))
+                 for seed in seeds[start:start+step]]
+        if method in ['residual', 'wild']:
+            if method == 'residual':
+                resid_b = np.column_stack([wresid[draw] for draw in draws])
+            else:
+                resid_b = wresid[:,None] * np.column_stack(draws)
+            bparams.append(params + np.dot(pinv_wexog, resid_b).T)
+            continue
+
+        # number of times each observation is in the sample
+        counts = np.array([np.bincount(draw, minlength=nobs)
+                           for draw in draws], dtype=float)
+        xty = np.dot(counts, wxy)
+        xtx = np.zeros((len(draws), k_vars * k_vars))
+        for start_obs in range(0, nobs, _CHUNKSIZE):
+            chunk = wexog[start_obs:start_obs+_CHUNKSIZE]
+            outer = (chunk[:,:,None] * chunk[:,None,:]).reshape(len(chunk),
+                                                                -1)
+            xtx += np.dot(counts[:,start_obs:start_obs+_CHUNKSIZE], outer)
+        xtx = xtx.reshape(-1, k_vars, k_vars)
+        # pinv(X'CX) X'Cy is the estimate of pinv as in fit
+        bparams.append(np.array([np.dot(np.linalg.pinv(xtx[i]), xty[i])
+                                 for i in range(len(draws))]))
+    return np.concatenate(bparams)
+
+
+def bootstrap(results, nrep=100, method='pairs', groups=None,
+              block_length=None, wild_dist='rademacher', seed=None,
+              n_jobs=1, fit_kwds=None, vectorized=True):
+    """
+    Bootstrap distribution of the parameter estimates of a model
+
+    Parameters
+    ----------
+    results : LikelihoodModelResults instance
+        results of the fit of the model on the original data
+    nrep : int
+        number of bootstrap replications
+    method : str
+        The resampling scheme, 'pairs', 'cluster', 'block', 'residual' or
+        'wild'. See Notes.
+    groups : array-like
+        group labels of the observations, required for method 'cluster'
+    block_length : int
+        number of observations of the blocks, required for method 'block'
+    wild_dist : str
+        distribution of the multipliers of the wild bootstrap,
+        'rademacher' for -1 and 1 with equal probability or 'mammen' for
+        the two point distribution with skewness one of Mammen (1993).
+    seed : int or None
+        Seed of the random number generator. If None, the seed is drawn
+        from numpy's global random state, so that np.random.seed makes the
+        bootstrap reproducible.
+    n_jobs : int
+        Number of processes to use for the replications, -1 uses all
+        cpus. Requires joblib, see statsmodels.tools.parallel.
+    fit_kwds : dict
+        Keyword arguments for the fit method of the model. The original
+        estimates are used as start_params if fit accepts them. For
+        QuantReg, q defaults to the quantile of results.
+    vectorized : bool
+        If True, the estimates of OLS, WLS and GLS are computed at once
+        for many replications instead of refitting the model.
+
+    Returns
+    -------
+    BootstrapResults instance
+
+    Notes
+    -----
+    pairs, cluster and block resample the observations and are
+    available for all models except GLS with a sigma that is not
+    diagonal. The resampled observations keep their offset, exposure,
+    weights and the diagonal of sigma.
+
+    residual and wild keep exog fixed and add resampled residuals to the
+    fitted values. They are only available for linear models with
+    additive errors, the regression models, RLM and QuantReg. For OLS,
+    WLS and GLS the residuals of the whitened model are resampled. The
+    residual bootstrap assumes independent and identically distributed
+    errors, the wild bootstrap allows for heteroscedasticity.
+    """
+    model = results.model
+    if fit_kwds is None:
+        fit_kwds = {}
+    else:
+        fit_kwds = dict(fit_kwds)
+    if hasattr(results, 'q'):
+        fit_kwds.setdefault('q', results.q)
+    nobs = model.endog.shape[0]
+    resampler = _Resampler(method, nobs, groups=groups,
+                           block_length=block_length, wild_dist=wild_dist)
+    params = np.asarray(results.params)
+
+    if method in ['pairs', 'cluster', 'block'] and _has_full_sigma(model):
+        raise ValueError("the %s bootstrap is not available for GLS with a "
+                         "sigma that is not diagonal, use the residual or "
+                         "wild bootstrap" % method)
+    sparse = _is_sparse(model.exog)
+    linear = vectorized and _is_linear(model) and not sparse
+    if method in ['residual', 'wild']:
+        from statsmodels.regression.linear_model import RegressionModel
+        from statsmodels.robust.robust_linear_model import RLM
+        if not isinstance(model, (RegressionModel, RLM)):
+            raise ValueError("the %s bootstrap is only available for linear "
+                             "models" % method)
+        if _is_linear(model):
+            # whitened residuals, the estimates do not depend on how the
+            # whitened data is transformed back
+            linear = True
+            resid = results.wresid
+        else:
+            resid = np.asarray(results.resid)
+
+    if seed is None:
+        seed = np.random.randint(0, 2**31 - 1)
+    seeds = np.random.RandomState(seed).randint(0, 2**31 - 1, size=nrep)
+
+    if linear:
+        if method in ['residual', 'wild']:
+            bparams = _linear_replications(model, params, resampler, seeds,
+                                           wresid=resid)
+        else:
+            bparams = _linear_replications(model, params, resampler, seeds)
+        return BootstrapResults(results, bparams, method)
+
+    args = ()
+    if method in ['residual', 'wild']:
+        args = (np.asarray(results.fittedvalues), resid)
+    if n_jobs == 1:
+        bparams = _refit_replications(model, params, resampler, seeds,
+                                      fit_kwds, *args)
+    else:
+        from statsmodels.tools.parallel import parallel_func
+        parallel, p_func, n_jobs = parallel_func(_refit_replications,
+                                                 n_jobs=n_jobs, verbose=0)
+        chunks = np.array_split(seeds, min(n_jobs, nrep))
+        bparams = np.concatenate(parallel(p_func(model, params, resampler,
+                                                 chunk, fit_kwds, *args)
+                                          for chunk in chunks))
+    return BootstrapResults(results, bparams, method)
+
+
+class BootstrapResults(object):
+    """
+    Bootstrap distribution of the parameter estimates
+
+    Attributes
+    ----------
+    results : LikelihoodModelResults instance
+        results of the fit on the original data
+    params : array
+        estimates of the bootstrap replications, one row per replication
+    method : str
+        the resampling scheme
+    nrep : int
+        number of replications
+    mean : array
+        mean of the bootstrap estimates
+    bse : array
+        standard deviation of the bootstrap estimates
+    """
+    def __init__(self, results, params, method):
+        self.results = results
+        self.params = params
+        self.method = method
+        self.nrep = len(params)
+        self.mean = params.mean(0)
+        self.bse = params.std(0)
+
+    def cov_params(self):
+        """
+        Covariance matrix of the bootstrap estimates
+        """
+        return np.cov(self.params, rowvar=0, bias=1)
+
+    def conf_int(self, alpha=.05, kind='percentile'):
+        """
+        Bootstrap confidence intervals of the parameters
+
+        Parameters
+        ----------
+        alpha : float
+            The intervals have coverage 1 - alpha.
+        kind : str
+            'percentile' uses the alpha / 2 and 1 - alpha / 2 quantiles of
+            the bootstrap estimates, 'basic' reflects them around the
+            original estimate and 'normal' uses the normal distribution with
+            the bootstrap standard errors.
+
+        Returns
+        -------
+        conf_int : array
+            lower and upper limits of the intervals in the two columns
+        """
+        params = np.ravel(self.results.params, order='F')
+        if kind == 'normal':
+            q = stats.norm.ppf(1 - alpha / 2.)
+            return np.column_stack((params - q * self.bse,
+                                    params + q * self.bse))
+        lower, upper = [np.array([stats.scoreatpercentile(col, per)
+                                  for col in self.params.T])
+                        for per in (50. * alpha, 100 - 50. * alpha)]
+        if kind == 'percentile':
+            return np.column_stack((lower, upper))
+        elif kind == 'basic':
+            return np.column_stack((2 * params - upper, 2 * params - lower))
+        raise ValueError("kind has to be 'percentile', 'basic' or 'normal'")
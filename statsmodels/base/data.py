@@ -51,6 +51,15 @@ def _nan_rows(*arrs):
                              (x_is_boolean_array | _asarray_2d_null_rows(y)))
     return reduce(_nan_row_maybe_two_inputs, arrs).squeeze()
 
+def _column_var(x):
+    """
+    Variance of the columns of a 2d array or scipy.sparse matrix.
+    """
+    if data_util._is_sparse(x):
+        mean = np.asarray(x.mean(0)).ravel()
+        return np.asarray(x.multiply(x).mean(0)).ravel() - mean**2
+    return x.var(0)
+
 class ModelData(object):
     """
     Class responsible for handling input data and extracting metadata into the
@@ -58,6 +67,8 @@ class ModelData(object):
     """
     def __init__(self, endog, exog=None, missing='none', hasconst=None,
                        **kwargs):
+        if missing != 'none' and data_util._is_sparse(exog):
+            raise ValueError("missing has to be 'none' for a sparse exog")
         if missing != 'none':
             arrays, nan_idx = self._handle_missing(endog, exog, missing,
                                                        **kwargs)
@@ -88,7 +99,7 @@ class ModelData(object):
                 self.const_idx = None
         else:
             try: # to detect where the constant is
-                const_idx = np.where(self.exog.var(axis = 0) == 0)[0].squeeze()
+                const_idx = np.where(_column_var(self.exog) == 0)[0].squeeze()
                 self.k_constant = const_idx.size
                 if self.k_constant > 1:
                     raise ValueError("More than one constant detected.")
@@ -239,11 +250,14 @@ class ModelData(object):
     def _get_xarr(self, exog):
         if data_util._is_structured_ndarray(exog):
             exog = data_util.struct_to_ndarray(exog)
+        if data_util._is_sparse(exog):
+            # keep sparse, row slices and products are efficient with csr
+            return exog.tocsr().astype(float)
         return np.asarray(exog)
 
     def _check_integrity(self):
         if self.exog is not None:
-            if len(self.exog) != len(self.endog):
+            if self.exog.shape[0] != len(self.endog):
                 raise ValueError("endog and exog matrices are different sizes")
 
     def wrap_output(self, obj, how='columns'):
@@ -359,7 +373,7 @@ def _make_endog_names(endog):
     return ynames
 
 def _make_exog_names(exog):
-    exog_var = exog.var(0)
+    exog_var = _column_var(exog)
     if (exog_var == 0).any():
         # assumes one constant in first or last position
         # avoid exception if more than one constant
@@ -387,6 +401,8 @@ def handle_data(endog, exog, missing='none', hasconst=None, **kwargs):
         klass = PandasData
     elif data_util._is_using_patsy(endog, exog):
         klass = PatsyData
+    elif data_util._is_using_sparse(endog, exog):
+        klass = ModelData
     # keep this check last
     elif data_util._is_using_ndarray(endog, exog):
         klass = ModelData
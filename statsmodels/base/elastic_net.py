@@ -0,0 +1,231 @@
+"""
+Elastic net estimation of linear regression models and GLM
+
+The estimates minimize
+
+.. math:: \\frac{1}{2n}D(\\beta) + \\alpha\\sum_k w_k\\left(L1_{wt}|\\beta_k|
+          + \\frac{1 - L1_{wt}}{2}\\beta_k^2\\right)
+
+where D is the residual sum of squares of the whitened data for regression
+models and the deviance for GLM, n is the number of observations and the
+weights w_k of the parameters default to one. L1_wt = 1 is the lasso and
+L1_wt = 0 is ridge regression.
+
+The problem is solved with the proximal Newton iterations and coordinate
+descent of statsmodels.base.l1_path. For regression models the loss is a
+quadratic function of the parameters that depends on the data only through
+the cross-products X'X, X'y and y'y of the whitened data. X'X is computed
+once and kept by the model, so that the coordinate descent updates use the
+columns of X'X (covariance updates) and refitting with other alphas or
+along a path does not require a pass over the data. The cross-products of
+the training samples in cross-validation are the ones of all observations
+minus the ones of the test sample. For GLM each iteration is an IRLS step
+with the weighted cross-products X'WX.
+
+References
+----------
+Friedman, J., Hastie, T. and Tibshirani, R. 2010. "Regularization paths for
+    generalized linear models via coordinate descent". Journal of
+    Statistical Software 33(1), pp. 1-22.
+"""
+import numpy as np
+from statsmodels.tools.tools import _is_sparse, _matvec, _rmatvec, _xtwx
+from statsmodels.base.l1_path import _fit_path
+from statsmodels.genmod import families
+
+
+def _deviance(family, endog, mu):
+    """
+    Deviance of the GLM family
+
+    Poisson.deviance leaves out the sum of mu - endog, which is zero only at
+    the maximum likelihood estimate of a model with a constant.
+    """
+    deviance = family.deviance(endog, mu)
+    if isinstance(family, families.Poisson):
+        deviance += 2 * np.sum(mu - endog)
+    return deviance
+
+
+class _GramLoss(object):
+    """
+    Least squares loss |y - X b|**2 / (2 nobs) from the cross-products
+    """
+    def __init__(self, xtx, xty, yty, nobs):
+        if _is_sparse(xtx):
+            xtx = xtx.toarray()
+        self.nobs = nobs
+        self.xtx = xtx / nobs
+        self.xty = xty / nobs
+        self.yty = yty / nobs
+
+    def loglike(self, params):
+        return -(self.yty - 2 * np.dot(params, self.xty) +
+                 np.dot(params, np.dot(self.xtx, params))) / 2.
+
+    def score(self, params):
+        return self.xty - np.dot(self.xtx, params)
+
+    def hessian(self, params):
+        return -self.xtx
+
+
+class _GLMLoss(object):
+    """
+    Deviance / (2 nobs) of a GLM with the expected hessian of IRLS
+    """
+    def __init__(self, family, endog, exog, offset, data_weights):
+        self.family = family
+        self.endog = endog
+        self.exog = exog
+        self.offset = offset
+        self.data_weights = data_weights
+        self.nobs = float(exog.shape[0])
+
+    def _mu(self, params):
+        return self.family.fitted(_matvec(self.exog, params) + self.offset)
+
+    def loglike(self, params):
+        mu = self._mu(params)
+        return -_deviance(self.family, self.endog, mu) / (2 * self.nobs)
+
+    def score(self, params):
+        family = self.family
+        mu = self._mu(params)
+        weights = (self.data_weights * family.weights(mu) *
+                   family.link.deriv(mu))
+        return _rmatvec(self.exog, weights * (self.endog - mu)) / self.nobs
+
+    def hessian(self, params):
+        mu = self._mu(params)
+        weights = self.data_weights * self.family.weights(mu)
+        return -_xtwx(self.exog, weights / self.nobs)
+
+
+def fit_elastic_net(model, alpha, L1_wt=1., penalty_weights=None,
+                    start_params=None, maxiter=100, tol=1e-8):
+    """
+    Solves the elastic net problem of a model for one alpha.
+
+    See RegressionModel.fit_regularized for the parameters.
+
+    Returns
+    -------
+    params : array
+    iterations : int
+        number of proximal Newton iterations
+    converged : bool
+    """
+    if start_params is None:
+        start_params = np.zeros(model.exog.shape[1])
+    loss = model._elastic_net_loss()
+    res = _fit_path(loss, start_params, alphas=[alpha],
+                    penalty_weights=penalty_weights, L1_wt=L1_wt,
+                    maxiter=maxiter, tol=tol, path_tol=0)
+    return res[1][0], res[3][0], res[4][0]
+
+
+def fit_elastic_net_path(model, alphas=None, L1_wt=1., n_alphas=50,
+                         alpha_min_ratio=1e-3, penalty_weights=None,
+                         start_params=None, cv=None, maxiter=100, tol=1e-8,
+                         path_tol=1e-5):
+    """
+    Solves the elastic net problem of a model for a path of alphas.
+
+    See RegressionModel.fit_regularized_path for the parameters.
+
+    Returns
+    -------
+    ElasticNetPathResults instance
+    """
+    if start_params is None:
+        start_params = np.zeros(model.exog.shape[1])
+    loss = model._elastic_net_loss()
+    alphas, params, loglike, iterations, converged, penalty_weights = \
+            _fit_path(loss, start_params, alphas=alphas, n_alphas=n_alphas,
+                      alpha_min_ratio=alpha_min_ratio,
+                      penalty_weights=penalty_weights, L1_wt=L1_wt,
+                      maxiter=maxiter, tol=tol, path_tol=path_tol)
+    res = ElasticNetPathResults(model, alphas, L1_wt, params,
+                                -2 * loss.nobs * loglike, iterations,
+                                converged, penalty_weights)
+    if cv is None:
+        return res
+
+    nobs = model.exog.shape[0]
+    if np.isscalar(cv):
+        n_folds = int(cv)
+        if not 1 < n_folds <= nobs:
+            raise ValueError("the number of folds has to be between 2 and "
+                             "the number of observations")
+        # consecutive blocks of observations as in KFold
+        folds = np.arange(nobs) * n_folds // nobs
+        cv = [(folds != i, folds == i) for i in range(n_folds)]
+    cv_error = []
+    for _, test in cv:
+        test = np.asarray(test)
+        if test.dtype != bool:
+            test_index = test
+            test = np.zeros(nobs, bool)
+            test[test_index] = True
+        fold_loss = model._elastic_net_loss(test)
+        fold_params = _fit_path(fold_loss, start_params, alphas=alphas,
+                                penalty_weights=penalty_weights, L1_wt=L1_wt,
+                                maxiter=maxiter, tol=tol, path_tol=0)[1]
+        cv_error.append(model._elastic_net_cv_error(fold_params, test))
+    cv_error = np.array(cv_error)
+    res.cv_error = cv_error.mean(0)
+    res.cv_std = cv_error.std(0) / np.sqrt(len(cv_error))
+    best = np.argmin(res.cv_error)
+    res.alpha_cv = alphas[best]
+    res.params_cv = params[best]
+    return res
+
+
+class ElasticNetPathResults(object):
+    """
+    Results of an elastic net regularization path
+
+    Attributes
+    ----------
+    alphas : array
+        the alphas of the path, in decreasing order. If the path was stopped
+        early, only the alphas for which the model was fit are included.
+    L1_wt : float
+        weight of the l1 part of the penalty
+    params : array
+        the estimates for each alpha, one row per alpha
+    deviance : array
+        residual sum of squares of the whitened data for regression models
+        and the deviance for GLM at the estimates
+    nnz_params : array
+        number of nonzero parameters for each alpha
+    iterations : array
+        number of proximal Newton iterations for each alpha
+    converged : array
+        bool array, True if the solver converged for the alpha
+    penalty_weights : array
+        weights of the penalty of the parameters
+    cv_error : array
+        Mean over the folds of the deviance per observation of the test
+        samples for each alpha. None if no cross-validation was done.
+    cv_std : array
+        standard error of cv_error
+    alpha_cv : float
+        alpha with the smallest cross-validation error
+    params_cv : array
+        estimate at alpha_cv
+    """
+    def __init__(self, model, alphas, L1_wt, params, deviance, iterations,
+                 converged, penalty_weights):
+        self.model = model
+        self.alphas = alphas
+        self.L1_wt = L1_wt
+        self.params = params
+        self.deviance = deviance
+        self.nnz_params = (params != 0).sum(1)
+        self.iterations = iterations
+        self.converged = converged
+        self.penalty_weights = penalty_weights
+        self.cv_error = self.cv_std = None
+        self.alpha_cv = self.params_cv = None
@@ -0,0 +1,351 @@
+"""
+Holds the l1 regularization path solver for LikelihoodModel, using proximal
+Newton steps with coordinate descent.
+
+For each alpha on a decreasing path we solve
+
+.. math:: \\min_\\beta -\\ln L(\\beta) + \\sum_k\\alpha w_k|\\beta_k|
+
+Each outer iteration minimizes the quadratic approximation of the negative
+loglikelihood at the current estimate plus the l1 penalty by cyclic
+coordinate descent, followed by a backtracking line search on the
+regularized objective. If the loglikelihood is not concave at the current
+estimate, a multiple of the identity matrix is added to the negative hessian
+so that the step is a descent direction. The problem is solved on an active
+set of
+parameters, the parameters that are zero and are not in the active set are
+checked with the optimality conditions after convergence.
+
+For the elastic net, the ridge part of the penalty is smooth and is added
+to the negative loglikelihood, only the l1 part is handled by coordinate
+descent.
+
+The path is solved with warm starts. The active set for the next alpha is
+selected with the sequential strong rule and the optimality conditions of
+the excluded parameters are checked after the fit, see the references.
+
+References
+----------
+Friedman, J., Hastie, T. and Tibshirani, R. 2010. "Regularization paths for
+    generalized linear models via coordinate descent". Journal of
+    Statistical Software 33(1), pp. 1-22.
+Tibshirani, R., Bien, J., Friedman, J., Hastie, T., Simon, N., Taylor, J.
+    and Tibshirani, R. J. 2012. "Strong rules for discarding predictors in
+    lasso-type problems". Journal of the Royal Statistical Society: Series B
+    74(2), pp. 245-266.
+"""
+import numpy as np
+from statsmodels.tools.tools import _is_sparse
+
+
+def _soft_threshold(x, threshold):
+    return np.sign(x) * max(abs(x) - threshold, 0)
+
+
+def _cd_quadratic(grad, hess, params, penalty, active, maxiter=1000,
+                  tol=1e-10):
+    """
+    Coordinate descent for the l1 penalized quadratic approximation.
+
+    Minimizes grad'd + d'hess d / 2 + sum(penalty * |params + d|) over the
+    parameters in active, and returns params + d.
+
+    Coordinate descent can be slow for correlated parameters. Once it has
+    found the nonzero parameters and their signs, the quadratic problem is
+    smooth on these parameters and its solution is computed directly. The
+    solution is used if it has the same signs and the zero parameters are
+    optimal.
+    """
+    new_params = params.copy()
+    # hess d, updated for each coordinate
+    hess_d = np.zeros(len(params))
+    diag = np.diag(hess)
+    for _ in range(maxiter):
+        max_change = 0.
+        for j in active:
+            if diag[j] <= 0:
+                continue
+            old = new_params[j]
+            grad_j = grad[j] + hess_d[j]
+            new = _soft_threshold(old * diag[j] - grad_j, penalty[j]) / diag[j]
+            if new != old:
+                new_params[j] = new
+                # hess is symmetric, rows are contiguous
+                hess_d += hess[j] * (new - old)
+                max_change = max(max_change, diag[j] * (new - old)**2)
+        if max_change <= tol:
+            break
+
+    support = active[new_params[active] != 0]
+    if len(support) == 0:
+        return new_params
+    sign = np.sign(new_params[support])
+    hess_s = hess[support[:,None], support]
+    rhs = (np.dot(hess[support], params) - grad[support] -
+           penalty[support] * sign)
+    try:
+        exact = params.copy()
+        exact[active] = 0
+        exact[support] = np.linalg.solve(hess_s, rhs)
+    except np.linalg.LinAlgError:
+        return new_params
+    grad_q = grad + np.dot(hess, exact - params)
+    zero = active[exact[active] == 0]
+    if (np.all(np.sign(exact[support]) == sign) and
+            np.all(np.abs(grad_q[zero]) <= penalty[zero] * (1 + 1e-8))):
+        return exact
+    return new_params
+
+
+def _make_positive_definite(hess):
+    """
+    Returns hess if it is positive definite, otherwise hess plus a multiple
+    of the identity matrix that makes it positive definite.
+
+    The negative hessian of a loglikelihood that is not concave, for
+    example of NegativeBinomial away from the optimum, can be indefinite.
+    The quadratic approximation then has no minimum and its solution is not
+    a descent direction.
+    """
+    try:
+        np.linalg.cholesky(hess)
+        return hess
+    except np.linalg.LinAlgError:
+        pass
+    eigvals = np.linalg.eigvalsh(hess)
+    shift = -eigvals[0] + 1e-6 * max(np.abs(eigvals).max(), 1e-10)
+    return hess + shift * np.eye(len(hess))
+
+
+def _fit_l1_prox_newton(loglike, score, hessian, params, penalty, active,
+                        maxiter=100, tol=1e-8, check_active=True):
+    """
+    Solves the l1 regularized problem for one penalty vector.
+
+    Parameters
+    ----------
+    loglike, score, hessian : callable
+        loglikelihood and its derivatives
+    params : array
+        starting values
+    penalty : array
+        weight of the absolute value of each parameter
+    active : array
+        bool array of the parameters that are allowed to be nonzero. Others
+        are added if they violate the optimality conditions.
+    maxiter : int
+        maximum number of proximal Newton iterations
+    tol : float
+        convergence tolerance for the relative change of the objective
+    check_active : bool
+        If False, the parameters that are not in active are fixed at zero.
+
+    Returns
+    -------
+    params : array
+    iterations : int
+    converged : bool
+    grad : array
+        gradient of the negative loglikelihood at params
+    """
+    params = params.copy()
+    params[~active] = 0
+    active = active.copy()
+    objective = -loglike(params) + np.dot(penalty, np.abs(params))
+    iterations = 0
+    converged = False
+    grad = -score(params)
+    while iterations < maxiter:
+        hess = -hessian(params)
+        if _is_sparse(hess):
+            hess = hess.toarray()
+        hess = _make_positive_definite(hess)
+        idx = np.nonzero(active)[0]
+        new_params = _cd_quadratic(grad, hess, params, penalty, idx)
+        direction = new_params - params
+        # decrease of the approximation for the Armijo condition
+        decrease = (np.dot(grad, direction) +
+                    np.dot(penalty, np.abs(new_params) - np.abs(params)))
+        step = 1.
+        while True:
+            trial = params + step * direction
+            new_objective = -loglike(trial) + np.dot(penalty, np.abs(trial))
+            if new_objective <= objective + 1e-4 * step * decrease:
+                break
+            if step < 1e-10:
+                if not np.isfinite(new_objective):
+                    # no step is possible, e.g. outside the parameter space
+                    trial, new_objective = params, objective
+                break
+            step *= 0.5
+        iterations += 1
+        params = trial
+        change = objective - new_objective
+        objective = new_objective
+        grad = -score(params)
+        if abs(change) <= tol * (abs(objective) + tol):
+            # optimality conditions of the excluded parameters
+            violators = (~active) & (np.abs(grad) > penalty * (1 + 1e-8))
+            if not check_active or not violators.any():
+                converged = True
+                break
+            active |= violators
+    return params, iterations, converged, grad
+
+
+def _ridge(loss, l2_penalty):
+    """
+    Returns loglike, score and hessian of loss with the ridge penalty
+    sum(l2_penalty * params**2) / 2 subtracted from the loglikelihood.
+    """
+    def loglike(params):
+        return loss.loglike(params) - np.dot(l2_penalty, params**2) / 2.
+    def score(params):
+        return loss.score(params) - l2_penalty * params
+    def hessian(params):
+        hess = loss.hessian(params)
+        if _is_sparse(hess):
+            hess = hess.toarray()
+        return hess - np.diag(l2_penalty)
+    return loglike, score, hessian
+
+
+def _fit_path(loss, start_params, alphas=None, n_alphas=50,
+              alpha_min_ratio=1e-3, penalty_weights=None, L1_wt=1.,
+              maxiter=100, tol=1e-8, path_tol=1e-5):
+    """
+    Solves the penalized problem for a path of alphas.
+
+    loss has the methods loglike, score and hessian, for example a model.
+    The penalty of a parameter is alpha * w * (L1_wt * |b| +
+    (1 - L1_wt) * b**2 / 2).
+
+    Returns
+    -------
+    alphas, params, loglike, iterations, converged, penalty_weights : arrays
+        loglike is the value of loss.loglike without the penalty
+    """
+    params = np.asarray(start_params, dtype=float).ravel('F')
+    k_params = len(params)
+    if penalty_weights is None:
+        penalty_weights = np.ones(k_params)
+    else:
+        penalty_weights = np.asarray(penalty_weights,
+                                     dtype=float).ravel('F')
+        penalty_weights = penalty_weights * np.ones(k_params)
+    if penalty_weights.min() < 0:
+        raise ValueError("penalty_weights have to be non-negative")
+    if not 0 <= L1_wt <= 1:
+        raise ValueError("L1_wt has to be between 0 and 1")
+    unpenalized = penalty_weights == 0
+
+    if alphas is None:
+        # the smallest alpha for which all penalized parameters are zero,
+        # for a small L1_wt this is the one of L1_wt = 1e-3
+        params, _, _, grad = _fit_l1_prox_newton(loss.loglike, loss.score,
+                loss.hessian, params, np.zeros(k_params), unpenalized,
+                maxiter=maxiter, tol=tol, check_active=False)
+        penalized = ~unpenalized
+        if not penalized.any():
+            raise ValueError("all penalty_weights are zero")
+        alpha_max = (np.abs(grad[penalized]) /
+                     penalty_weights[penalized]).max() / max(L1_wt, 1e-3)
+        alphas = alpha_max * np.logspace(0, np.log10(alpha_min_ratio),
+                                         n_alphas)
+    else:
+        alphas = np.asarray(alphas, dtype=float).ravel()
+        if alphas.min() < 0:
+            raise ValueError("alphas have to be non-negative")
+        if np.any(np.diff(alphas) > 0):
+            raise ValueError("alphas have to be in decreasing order")
+        grad = -loss.score(params)
+
+    path_params = []
+    loglike = []
+    iterations = []
+    converged = []
+    alpha_old = None
+    for alpha in alphas:
+        penalty = alpha * L1_wt * penalty_weights
+        if L1_wt < 1:
+            funcs = _ridge(loss, alpha * (1 - L1_wt) * penalty_weights)
+        else:
+            funcs = loss.loglike, loss.score, loss.hessian
+        # sequential strong rule, the ridge penalty does not change the
+        # gradient of zero parameters
+        active = unpenalized | (params != 0)
+        if alpha_old is None:
+            active |= np.abs(grad) > penalty
+        else:
+            active |= (np.abs(grad) >=
+                       L1_wt * penalty_weights * (2*alpha - alpha_old))
+        params, n_iter, conv, grad = _fit_l1_prox_newton(*funcs,
+                params=params, penalty=penalty, active=active,
+                maxiter=maxiter, tol=tol)
+        path_params.append(params)
+        loglike.append(loss.loglike(params))
+        iterations.append(n_iter)
+        converged.append(conv)
+        alpha_old = alpha
+        # stop if the fit does not improve anymore
+        if (len(loglike) > 1 and
+                abs(loglike[-1] - loglike[-2]) <= path_tol * abs(loglike[-1])):
+            break
+
+    return (alphas[:len(loglike)], np.array(path_params), np.array(loglike),
+            np.array(iterations), np.array(converged), penalty_weights)
+
+
+def fit_l1_path(model, start_params, alphas=None, n_alphas=50,
+                alpha_min_ratio=1e-3, penalty_weights=None, maxiter=100,
+                tol=1e-8, path_tol=1e-5):
+    """
+    Solves the l1 regularized problem for a path of alphas.
+
+    See DiscreteModel.fit_regularized_path for the parameters. The
+    parameters are flattened in Fortran order as in fit_regularized.
+
+    Returns
+    -------
+    L1PathResults instance
+    """
+    res = _fit_path(model, start_params, alphas=alphas, n_alphas=n_alphas,
+                    alpha_min_ratio=alpha_min_ratio,
+                    penalty_weights=penalty_weights, maxiter=maxiter,
+                    tol=tol, path_tol=path_tol)
+    return L1PathResults(model, *res)
+
+
+class L1PathResults(object):
+    """
+    Results of an l1 regularization path
+
+    Attributes
+    ----------
+    alphas : array
+        the alphas of the path, in decreasing order. If the path was stopped
+        early, only the alphas for which the model was fit are included.
+    params : array
+        The estimates for each alpha, one row per alpha. For MNLogit each
+        row is a K x (J-1) array as in the results of fit.
+    llf : array
+        loglikelihood at the estimates
+    nnz_params : array
+        number of nonzero parameters for each alpha
+    iterations : array
+        number of proximal Newton iterations for each alpha
+    converged : array
+        bool array, True if the solver converged for the alpha
+    penalty_weights : array
+        weights of the penalty of the parameters
+    """
+    def __init__(self, model, alphas, params, llf, iterations, converged,
+                 penalty_weights):
+        self.model = model
+        self.alphas = alphas
+        self.params = params
+        self.llf = llf
+        self.nnz_params = (params != 0).sum(1)
+        self.iterations = iterations
+        self.converged = converged
+        self.penalty_weights = penalty_weights
@@ -1,7 +1,8 @@
 import numpy as np
 from scipy import optimize, stats
 from statsmodels.base.data import handle_data
-from statsmodels.tools.tools import recipr, nan_dot
+from statsmodels.tools.tools import (recipr, nan_dot, _is_sparse, _solve,
+                                     _inv, _DeferredInverse)
 from statsmodels.stats.contrast import ContrastResults
 from statsmodels.tools.decorators import (resettable_cache,
                                                   cache_readonly)
@@ -126,6 +127,16 @@ class Model(object):
         """
         raise NotImplementedError
 
+    def _get_init_kwds(self):
+        """
+        Keyword arguments of __init__, other than endog and exog, to create
+        the same model for other data, for example a bootstrap sample.
+
+        Arrays with one element per observation are resampled with the
+        observations.
+        """
+        return {}
+
 
 class LikelihoodModel(Model):
     """
@@ -362,10 +373,17 @@ class LikelihoodModel(Model):
         elif cov_params_func:
             Hinv = cov_params_func(self, xopt, retvals)
         elif method == 'newton' and full_output:
-            Hinv = np.linalg.inv(-retvals['Hessian']) / nobs
+            if _is_sparse(retvals['Hessian']):
+                Hinv = _DeferredInverse(-retvals['Hessian'] * nobs)
+            else:
+                Hinv = _inv(-retvals['Hessian']) / nobs
         else:
             try:
-                Hinv = np.linalg.inv(-1 * self.hessian(xopt))
+                H = self.hessian(xopt)
+                if _is_sparse(H):
+                    Hinv = _DeferredInverse(-H)
+                else:
+                    Hinv = _inv(-1 * H)
             except:
                 #might want custom warning ResultsWarning? NumericalWarning?
                 from warnings import warn
@@ -402,8 +420,11 @@ def _fit_mle_newton(f, score, start_params, fargs, kwargs, disp=True,
             oldparams) > tol)):
         H = hess(newparams)
         oldparams = newparams
-        newparams = oldparams - np.dot(np.linalg.inv(H),
-                score(oldparams))
+        if _is_sparse(H):
+            newparams = oldparams - _solve(H, score(oldparams))
+        else:
+            newparams = oldparams - np.dot(np.linalg.inv(H),
+                    score(oldparams))
         if retall:
             history.append(newparams)
         if callback is not None:
@@ -646,6 +667,11 @@ class GenericLikelihoodModel(LikelihoodModel):
     Hessian is not positive definite the covariance matrix of the parameter
     estimates based on the outer product of the Jacobian might still be valid.
 
+    A subclass can define `loglike_batch(params)`, which takes a 2d array with
+    one parameter vector in each row and returns the log-likelihood for each
+    row. The numerical score and Hessian then evaluate all perturbed
+    parameters in one call instead of calling loglike for each of them.
+
 
     Examples
     --------
@@ -775,7 +801,9 @@ class GenericLikelihoodModel(LikelihoodModel):
         '''
         kwds = {}
         kwds.setdefault('centered', True)
-        return approx_fprime(params, self.loglike, **kwds).ravel()
+        loglike, batch_kwds = self._numdiff_loglike()
+        kwds.update(batch_kwds)
+        return approx_fprime(params, loglike, **kwds).ravel()
 
     def jac(self, params, **kwds):
         '''
@@ -792,7 +820,14 @@ class GenericLikelihoodModel(LikelihoodModel):
         '''
         from statsmodels.tools.numdiff import approx_hess
         # need options for hess (epsilon)
-        return approx_hess(params, self.loglike)
+        loglike, kwds = self._numdiff_loglike()
+        return approx_hess(params, loglike, **kwds)
+
+    def _numdiff_loglike(self):
+        # loglike for the numerical derivatives, batched if available
+        if getattr(self, 'loglike_batch', None) is not None:
+            return self.loglike_batch, {'vectorized' : True}
+        return self.loglike, {}
 
     def fit(self, start_params=None, method='nm', maxiter=500, full_output=1,
             disp=1, callback=None, retall=0, **kwargs):
@@ -1025,8 +1060,20 @@ class LikelihoodModelResults(Results):
         self.normalized_cov_params = normalized_cov_params
         self.scale = scale
 
-    def normalized_cov_params(self):
-        raise NotImplementedError
+    def _get_normalized_cov_params(self):
+        value = self._normalized_cov_params
+        if isinstance(value, _DeferredInverse):
+            # the inverse for a sparse exog is computed when it is used
+            value = self._normalized_cov_params = value.inv()
+        return value
+
+    def _set_normalized_cov_params(self, value):
+        self._normalized_cov_params = value
+
+    normalized_cov_params = property(_get_normalized_cov_params,
+                                     _set_normalized_cov_params,
+                                     doc="The covariance of params is "
+                                         "scale times normalized_cov_params")
 
     @cache_readonly
     def llf(self):
@@ -1442,6 +1489,55 @@ class LikelihoodModelResults(Results):
             upper = self.params[cols] + q * bse[cols]
         return np.asarray(zip(lower, upper))
 
+    def get_bootstrap(self, nrep=100, method='pairs', groups=None,
+                      block_length=None, wild_dist='rademacher', seed=None,
+                      n_jobs=1, fit_kwds=None, vectorized=True):
+        """
+        Bootstrap distribution of the parameter estimates
+
+        Parameters
+        ----------
+        nrep : int
+            number of bootstrap replications
+        method : str
+            The resampling scheme, 'pairs', 'cluster', 'block', 'residual'
+            or 'wild'. 'residual' and 'wild' are only available for linear
+            models.
+        groups : array-like
+            group labels of the observations, required for method 'cluster'
+        block_length : int
+            number of observations of the blocks, required for method
+            'block'
+        wild_dist : str
+            distribution of the multipliers of the wild bootstrap,
+            'rademacher' or 'mammen'
+        seed : int or None
+            Seed of the random number generator. If None, the seed is drawn
+            from numpy's global random state.
+        n_jobs : int
+            number of processes to use for the replications, -1 uses all
+            cpus
+        fit_kwds : dict
+            Keyword arguments for the fit method of the model. The estimates
+            of this instance are used as start_params if fit accepts them.
+        vectorized : bool
+            If True, the estimates of OLS, WLS and GLS are computed at once
+            for all replications instead of refitting the model.
+
+        Returns
+        -------
+        BootstrapResults instance
+
+        See Also
+        --------
+        statsmodels.base.bootstrap.bootstrap
+        """
+        from statsmodels.base.bootstrap import bootstrap
+        return bootstrap(self, nrep=nrep, method=method, groups=groups,
+                         block_length=block_length, wild_dist=wild_dist,
+                         seed=seed, n_jobs=n_jobs, fit_kwds=fit_kwds,
+                         vectorized=vectorized)
+
     def save(self, fname, remove_data=False):
         '''
         save a pickle of this instance
@@ -1489,6 +1585,45 @@ class LikelihoodModelResults(Results):
         from statsmodels.iolib.smpickle import load_pickle
         return load_pickle(fname)
 
+    def save_compact(self, fname):
+        '''
+        save the estimates in the compact binary format
+
+        Only the parameters, their covariance, scalar statistics, the
+        variable names and the options of the model needed by predict are
+        saved. Loading does not unpickle and memory-maps the arrays.
+
+        Parameters
+        ----------
+        fname : string or filehandle
+            fname can be a string to a file path or filename, or a filehandle.
+
+        See Also
+        --------
+        statsmodels.iolib.compact.load_compact
+        '''
+        from statsmodels.iolib.compact import save_compact
+        save_compact(self, fname)
+
+    @classmethod
+    def load_compact(cls, fname, mmap=True):
+        '''
+        load results saved with save_compact, (class method)
+
+        Parameters
+        ----------
+        fname : string or filehandle
+            fname can be a string to a file path or filename, or a filehandle.
+        mmap : bool
+            If True and fname is a file name, the arrays are memory-mapped.
+
+        Returns
+        -------
+        CompactResults instance
+        '''
+        from statsmodels.iolib.compact import load_compact
+        return load_compact(fname, mmap=mmap)
+
     def remove_data(self):
         '''remove data arrays, all nobs arrays from result and model
 
@@ -1668,25 +1803,12 @@ class ResultMixin(object):
         original endog and exog, and therefore is only correct if observations
         are independently distributed.
 
-        This will be moved to apply only to models with independently
-        distributed observations.
+        The replications start the optimization at the parameter estimates.
+        See get_bootstrap for other resampling schemes.
         '''
-        results = []
-        print self.model.__class__
-        hascloneattr = True if hasattr(self, 'cloneattr') else False
-        for i in xrange(nrep):
-            rvsind = np.random.randint(self.nobs - 1, size=self.nobs)
-            #this needs to set startparam and get other defining attributes
-            #need a clone method on model
-            fitmod = self.model.__class__(self.endog[rvsind],
-                                          self.exog[rvsind, :])
-            if hascloneattr:
-                for attr in self.model.cloneattr:
-                    setattr(fitmod, attr, getattr(self.model, attr))
-
-            fitres = fitmod.fit(method=method, disp=disp)
-            results.append(fitres.params)
-        results = np.array(results)
+        res = self.get_bootstrap(nrep=nrep, method='pairs',
+                                 fit_kwds={'method' : method, 'disp' : disp})
+        results = res.params
         if store:
             self.bootstrap_results = results
         return results.mean(0), results.std(0), results
@@ -0,0 +1,142 @@
+"""
+Tests for the bootstrap of the parameter estimates
+"""
+import numpy as np
+from numpy.testing import (assert_almost_equal, assert_equal, assert_,
+                           assert_raises)
+import statsmodels.api as sm
+from statsmodels.base.bootstrap import _Resampler
+
+
+class CheckVectorized(object):
+    # the vectorized estimates of linear models are the ones of the refit
+
+    def test_methods(self):
+        res = self.res
+        kwds = dict(groups=np.arange(len(res.model.endog)) // 5,
+                    block_length=7)
+        for method in ['pairs', 'cluster', 'block']:
+            boot = res.get_bootstrap(nrep=20, method=method, seed=123,
+                                     **kwds)
+            boot_refit = res.get_bootstrap(nrep=20, method=method, seed=123,
+                                           vectorized=False, **kwds)
+            assert_almost_equal(boot.params, boot_refit.params, 10)
+            assert_equal(boot.params.shape, (20, len(res.params)))
+
+    def test_blocks(self):
+        # the estimates do not depend on the blocks of replications
+        from statsmodels.base import bootstrap
+        res = self.res
+        max_block_size = bootstrap._MAX_BLOCK_SIZE
+        for method in ['pairs', 'residual', 'wild']:
+            boot = res.get_bootstrap(nrep=20, method=method, seed=123)
+            bootstrap._MAX_BLOCK_SIZE = 3 * len(res.model.endog)
+            try:
+                boot_blocks = res.get_bootstrap(nrep=20, method=method,
+                                                seed=123)
+            finally:
+                bootstrap._MAX_BLOCK_SIZE = max_block_size
+            assert_almost_equal(boot_blocks.params, boot.params, 12)
+
+    def test_residual(self):
+        res = self.res
+        for method in ['residual', 'wild']:
+            boot = res.get_bootstrap(nrep=50, method=method, seed=0)
+            # unbiased for linear estimates
+            assert_almost_equal(boot.mean, res.params, 0)
+            assert_(np.all(boot.bse > 0))
+
+
+class TestOLS(CheckVectorized):
+    @classmethod
+    def setupClass(cls):
+        np.random.seed(987)
+        exog = sm.add_constant(np.random.randn(100, 2), prepend=False)
+        endog = np.dot(exog, [1., -1, 2]) + np.random.randn(100)
+        cls.res = sm.OLS(endog, exog).fit()
+
+
+class TestWLS(CheckVectorized):
+    @classmethod
+    def setupClass(cls):
+        np.random.seed(987)
+        exog = sm.add_constant(np.random.randn(100, 2), prepend=False)
+        weights = np.random.uniform(1, 3, size=100)
+        endog = (np.dot(exog, [1., -1, 2]) +
+                 np.random.randn(100) / np.sqrt(weights))
+        cls.res = sm.WLS(endog, exog, weights=weights).fit()
+
+
+class TestGLSDiagonal(CheckVectorized):
+    @classmethod
+    def setupClass(cls):
+        np.random.seed(987)
+        exog = sm.add_constant(np.random.randn(100, 2), prepend=False)
+        sigma = np.random.uniform(1, 3, size=100)
+        endog = np.dot(exog, [1., -1, 2]) + np.random.randn(100) * sigma
+        cls.res = sm.GLS(endog, exog, sigma=sigma**2).fit()
+
+
+def test_gls_full_sigma():
+    np.random.seed(987)
+    exog = sm.add_constant(np.random.randn(50, 2), prepend=False)
+    sigma = .5**np.abs(np.subtract.outer(np.arange(50), np.arange(50)))
+    endog = np.dot(exog, [1., -1, 2]) + np.random.randn(50)
+    res = sm.GLS(endog, exog, sigma=sigma).fit()
+    for method in ['pairs', 'cluster', 'block']:
+        for vectorized in [True, False]:
+            assert_raises(ValueError, res.get_bootstrap, nrep=5,
+                          method=method, groups=np.arange(50) // 5,
+                          block_length=5, vectorized=vectorized)
+    boot = res.get_bootstrap(nrep=5, method='wild', seed=1)
+    assert_equal(boot.params.shape, (5, 3))
+
+
+def test_resampler():
+    rs = np.random.RandomState(0)
+    groups = np.repeat(np.arange(10), np.arange(1, 11))
+    resampler = _Resampler('cluster', len(groups), groups=groups)
+    rows = resampler.draw(rs)
+    # every group is drawn with all its observations
+    counts = np.bincount(groups[rows], minlength=10)
+    assert_equal(counts % np.arange(1, 11), 0)
+    assert_equal(len(rows), counts.sum())
+
+    resampler = _Resampler('block', 50, block_length=8)
+    rows = resampler.draw(rs)
+    assert_equal(len(rows), 50)
+    assert_(rows.min() >= 0 and rows.max() < 50)
+    assert_equal(np.diff(rows[:8]), 1)
+
+    assert_raises(ValueError, _Resampler, 'cluster', 10)
+    assert_raises(ValueError, _Resampler, 'block', 10, block_length=11)
+    assert_raises(ValueError, _Resampler, 'jackknife', 10)
+
+
+def test_refit():
+    np.random.seed(12)
+    exog = sm.add_constant(np.random.randn(200, 2), prepend=False)
+    endog = np.random.poisson(np.exp(np.dot(exog, [.2, -.3, 1])))
+    res = sm.Poisson(endog, exog).fit(disp=0)
+    boot = res.get_bootstrap(nrep=10, seed=1)
+    assert_equal(boot.params.shape, (10, 3))
+    # the replications only depend on the seed
+    boot2 = res.get_bootstrap(nrep=10, seed=1)
+    assert_equal(boot.params, boot2.params)
+    boot_glm = sm.GLM(endog, exog, family=sm.families.Poisson()).fit(
+                      ).get_bootstrap(nrep=10, seed=1)
+    assert_almost_equal(boot_glm.params, boot.params, 5)
+    conf_int = boot.conf_int()
+    assert_(np.all(conf_int[:,0] < conf_int[:,1]))
+    assert_raises(ValueError, res.get_bootstrap, nrep=10, method='wild')
+
+
+def test_parallel():
+    # runs sequentially if joblib is not available
+    np.random.seed(12)
+    exog = sm.add_constant(np.random.randn(100, 2), prepend=False)
+    endog = (np.dot(exog, [.2, -.3, 1]) + np.random.randn(100) > 0) * 1.
+    res = sm.Logit(endog, exog).fit(disp=0)
+    boot = res.get_bootstrap(nrep=8, seed=3)
+    boot_parallel = res.get_bootstrap(nrep=8, seed=3, n_jobs=2)
+    assert_almost_equal(boot_parallel.params, boot.params, 12)
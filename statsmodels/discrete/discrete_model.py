@@ -22,6 +22,7 @@ import numpy as np
 from scipy.special import gammaln
 from scipy import stats, special, optimize  # opt just for nbin
 import statsmodels.tools.tools as tools
+from statsmodels.tools.tools import _is_sparse, _matvec, _rmatvec, _xtwx
 from statsmodels.tools.decorators import (resettable_cache,
         cache_readonly)
 from statsmodels.regression.linear_model import OLS
@@ -29,7 +30,7 @@ from scipy import stats, special, optimize  # opt just for nbin
 from scipy.stats import nbinom
 from statsmodels.tools.sm_exceptions import PerfectSeparationError
 from statsmodels.tools.numdiff import (approx_fprime, approx_hess,
-                                       approx_hess_cs, approx_fprime_cs)
+                                       approx_hess_cs)
 import statsmodels.base.model as base
 import statsmodels.regression.linear_model as lm
 import statsmodels.base.wrapper as wrap
@@ -112,7 +113,14 @@ class DiscreteModel(base.LikelihoodModel):
     This class does not do anything itself but lays out the methods and
     call signature expected of child classes in addition to those of
     statsmodels.model.LikelihoodModel.
+
+    The attribute `memory_limit` is an approximate upper bound in bytes for
+    the temporary arrays of the analytic hessians of models that support it.
+    If it is not None, the hessian is accumulated over blocks of
+    observations.
     """
+    memory_limit = None
+
     def __init__(self, endog, exog, **kwargs):
         super(DiscreteModel, self).__init__(endog, exog, **kwargs)
         self.raise_on_perfect_prediction = True
@@ -123,8 +131,13 @@ class DiscreteModel(base.LikelihoodModel):
         statsmodels.model.LikelihoodModel.__init__
         and should contain any preprocessing that needs to be done for a model.
         """
-        self.df_model = float(tools.rank(self.exog) - 1)  # assumes constant
-        self.df_resid = float(self.exog.shape[0] - tools.rank(self.exog))
+        if _is_sparse(self.exog):
+            # a sparse design is assumed to be of full column rank
+            rank = self.exog.shape[1]
+        else:
+            rank = tools.rank(self.exog)
+        self.df_model = float(rank - 1)  # assumes constant
+        self.df_resid = float(self.exog.shape[0] - rank)
 
     def cdf(self, X):
         """
@@ -138,9 +151,38 @@ class DiscreteModel(base.LikelihoodModel):
         """
         raise NotImplementedError
 
+    def _iter_obs_blocks(self, ncols):
+        """
+        Slices of observations in blocks bounded by memory_limit
+
+        ncols is the number of float columns of the temporary arrays per
+        observation.
+        """
+        nobs = self.exog.shape[0]
+        if self.memory_limit is None:
+            blocksize = nobs
+        else:
+            blocksize = max(1, int(self.memory_limit // (8 * ncols)))
+        for start in range(0, nobs, blocksize):
+            yield slice(start, min(start + blocksize, nobs))
+
+    def _xtwx(self, weights):
+        """
+        Returns exog' diag(weights) exog, accumulated in blocks
+        """
+        exog = self.exog
+        if _is_sparse(exog):
+            return _xtwx(exog, weights)
+        k_vars = exog.shape[1]
+        xtwx = np.zeros((k_vars, k_vars))
+        for sl in self._iter_obs_blocks(k_vars):
+            x = exog[sl]
+            xtwx += np.dot(x.T * weights[sl], x)
+        return xtwx
+
     def _check_perfect_pred(self, params, *args):
         endog = self.endog
-        fittedvalues = self.cdf(np.dot(self.exog, params[:self.exog.shape[1]]))
+        fittedvalues = self.cdf(_matvec(self.exog, params[:self.exog.shape[1]]))
         if (self.raise_on_perfect_prediction and
                 np.allclose(fittedvalues - endog, 0)):
             msg = "Perfect separation detected, results not available"
@@ -313,6 +355,73 @@ class DiscreteModel(base.LikelihoodModel):
 
         return mlefit # up to subclasses to wrap results
 
+    def fit_regularized_path(self, alphas=None, n_alphas=50,
+            alpha_min_ratio=1e-3, penalty_weights=None, start_params=None,
+            maxiter=100, tol=1e-8, path_tol=1e-5):
+        """
+        Fit the l1 regularized model for a decreasing path of alphas.
+
+        Parameters
+        ----------
+        alphas : array-like, optional
+            Decreasing sequence of non-negative weights of the l1 penalty
+            term, on the same scale as `alpha` in fit_regularized. If None,
+            `n_alphas` values are used that are log-spaced from the smallest
+            alpha for which all penalized parameters are zero to
+            `alpha_min_ratio` times this alpha.
+        n_alphas : int
+            Number of alphas if `alphas` is None.
+        alpha_min_ratio : float
+            Ratio of the smallest to the largest alpha if `alphas` is None.
+        penalty_weights : array-like, optional
+            Non-negative weight of each parameter in the penalty, with the
+            shape of params. The penalty of a parameter is alpha times its
+            weight, parameters with weight zero, e.g. the constant, are not
+            penalized. The default is one for all parameters.
+        start_params : array-like, optional
+            Starting values for the first alpha. The default is zeros.
+        maxiter : int
+            Maximum number of proximal Newton iterations for each alpha.
+        tol : float
+            Convergence tolerance for the relative change of the penalized
+            negative loglikelihood.
+        path_tol : float
+            The path is stopped early if the relative change of the
+            loglikelihood from one alpha to the next is less than
+            `path_tol`. Use 0 to fit all alphas.
+
+        Returns
+        -------
+        statsmodels.base.l1_path.L1PathResults instance
+
+        Notes
+        -----
+        The problem
+
+        .. math:: \\min_\\beta -\\ln L(\\beta) + \\sum_k\\alpha w_k|\\beta_k|
+
+        is solved for each alpha with proximal Newton iterations, where the
+        l1 penalized quadratic approximation is minimized by coordinate
+        descent. The solution for an alpha is the starting value for the
+        next one, and only the parameters selected by the sequential strong
+        rule are updated; the optimality conditions of all other parameters
+        are checked after convergence. Unlike fit_regularized the problem is
+        not transformed into a constrained problem with twice as many
+        variables, and zero parameters are exactly zero, so no trimming is
+        needed.
+
+        The estimates at one alpha can be refit with fit_regularized to get a
+        results instance with the covariance of the nonzero parameters.
+        """
+        from statsmodels.base.l1_path import fit_l1_path
+        if start_params is None:
+            start_params = np.zeros(self.exog.shape[1])
+        return fit_l1_path(self, start_params, alphas=alphas,
+                           n_alphas=n_alphas,
+                           alpha_min_ratio=alpha_min_ratio,
+                           penalty_weights=penalty_weights, maxiter=maxiter,
+                           tol=tol, path_tol=path_tol)
+
     def cov_params_func_l1(self, likelihood_model, xopt, retvals):
         """
         Computes cov_params on a reduced parameter space
@@ -375,9 +484,9 @@ class BinaryModel(DiscreteModel):
         if exog is None:
             exog = self.exog
         if not linear:
-            return self.cdf(np.dot(exog, params))
+            return self.cdf(_matvec(exog, params))
         else:
-            return np.dot(exog, params)
+            return _matvec(exog, params)
 
     def fit_regularized(self, start_params=None, method='l1',
             maxiter='defined_by_method', full_output=1, disp=1, callback=None,
@@ -534,6 +643,23 @@ class MultinomialModel(BinaryModel):
         return L1MultinomialResultsWrapper(mnfit)
     fit_regularized.__doc__ = DiscreteModel.fit_regularized.__doc__
 
+    def fit_regularized_path(self, alphas=None, n_alphas=50,
+            alpha_min_ratio=1e-3, penalty_weights=None, start_params=None,
+            maxiter=100, tol=1e-8, path_tol=1e-5):
+        if start_params is None:
+            start_params = np.zeros(int(self.K * (self.J-1)))
+        res = DiscreteModel.fit_regularized_path(self, alphas=alphas,
+                n_alphas=n_alphas, alpha_min_ratio=alpha_min_ratio,
+                penalty_weights=penalty_weights, start_params=start_params,
+                maxiter=maxiter, tol=tol, path_tol=path_tol)
+        # each row of params is flattened in Fortran order from K x (J-1)
+        K = int(self.K)
+        res.params = res.params.reshape(len(res.alphas), -1,
+                                        K).transpose(0, 2, 1)
+        res.penalty_weights = res.penalty_weights.reshape(K, -1, order='F')
+        return res
+    fit_regularized_path.__doc__ = DiscreteModel.fit_regularized_path.__doc__
+
 
     def _derivative_predict(self, params, exog=None, transform='dydx'):
         """
@@ -640,6 +766,15 @@ class CountModel(DiscreteModel):
         if exposure is None:
             delattr(self, 'exposure')
 
+    def _get_init_kwds(self):
+        kwds = {}
+        if hasattr(self, 'offset'):
+            kwds['offset'] = self.offset
+        if hasattr(self, 'exposure'):
+            # exposure is kept as its log
+            kwds['exposure'] = np.exp(self.exposure)
+        return kwds
+
     def _check_inputs(self, offset, exposure, endog):
         if offset is not None:
             offset = np.asarray(offset)
@@ -679,9 +814,9 @@ class CountModel(DiscreteModel):
                 offset = 0
 
         if not linear:
-            return np.exp(np.dot(exog, params[:exog.shape[1]]) + exposure + offset) # not cdf
+            return np.exp(_matvec(exog, params[:exog.shape[1]]) + exposure + offset) # not cdf
         else:
-            return np.dot(exog, params[:exog.shape[1]]) + exposure + offset
+            return _matvec(exog, params[:exog.shape[1]]) + exposure + offset
 
     def _derivative_predict(self, params, exog=None, transform='dydx'):
         """
@@ -863,7 +998,7 @@ class Poisson(CountModel):
         """
         offset = getattr(self, "offset", 0)
         exposure = getattr(self, "exposure", 0)
-        XB = np.dot(self.exog, params) + offset + exposure
+        XB = _matvec(self.exog, params) + offset + exposure
         endog = self.endog
         return np.sum(-np.exp(XB) +  endog*XB - gammaln(endog+1))
 
@@ -891,7 +1026,7 @@ class Poisson(CountModel):
         """
         offset = getattr(self, "offset", 0)
         exposure = getattr(self, "exposure", 0)
-        XB = np.dot(self.exog, params) + offset + exposure
+        XB = _matvec(self.exog, params) + offset + exposure
         endog = self.endog
         #np.sum(stats.poisson.logpmf(endog, np.exp(XB)))
         return -np.exp(XB) +  endog*XB - gammaln(endog+1)
@@ -924,8 +1059,8 @@ class Poisson(CountModel):
         offset = getattr(self, "offset", 0)
         exposure = getattr(self, "exposure", 0)
         X = self.exog
-        L = np.exp(np.dot(X,params) + offset + exposure)
-        return np.dot(self.endog - L, X)
+        L = np.exp(_matvec(X, params) + offset + exposure)
+        return _rmatvec(X, self.endog - L)
 
     def jac(self, params):
         """
@@ -984,8 +1119,8 @@ class Poisson(CountModel):
         offset = getattr(self, "offset", 0)
         exposure = getattr(self, "exposure", 0)
         X = self.exog
-        L = np.exp(np.dot(X,params) + exposure + offset)
-        return -np.dot(L*X.T, X)
+        L = np.exp(_matvec(X, params) + exposure + offset)
+        return -self._xtwx(L)
 
 class Logit(BinaryModel):
     __doc__ = """
@@ -1073,7 +1208,7 @@ class Logit(BinaryModel):
         """
         q = 2*self.endog - 1
         X = self.exog
-        return np.sum(np.log(self.cdf(q*np.dot(X,params))))
+        return np.sum(np.log(self.cdf(q*_matvec(X, params))))
 
     def loglikeobs(self, params):
         """
@@ -1101,7 +1236,7 @@ class Logit(BinaryModel):
         """
         q = 2*self.endog - 1
         X = self.exog
-        return np.log(self.cdf(q*np.dot(X,params)))
+        return np.log(self.cdf(q*_matvec(X, params)))
 
     def score(self, params):
         """
@@ -1125,8 +1260,8 @@ class Logit(BinaryModel):
 
         y = self.endog
         X = self.exog
-        L = self.cdf(np.dot(X,params))
-        return np.dot(y - L,X)
+        L = self.cdf(_matvec(X, params))
+        return _rmatvec(X, y - L)
 
     def jac(self, params):
         """
@@ -1176,8 +1311,8 @@ class Logit(BinaryModel):
         .. math:: \\frac{\\partial^{2}\\ln L}{\\partial\\beta\\partial\\beta^{\\prime}}=-\\sum_{i}\\Lambda_{i}\\left(1-\\Lambda_{i}\\right)x_{i}x_{i}^{\\prime}
         """
         X = self.exog
-        L = self.cdf(np.dot(X,params))
-        return -np.dot(L*(1-L)*X.T,X)
+        L = self.cdf(_matvec(X, params))
+        return -self._xtwx(L*(1-L))
 
     def fit(self, start_params=None, method='newton', maxiter=35,
             full_output=1, disp=1, callback=None, **kwargs):
@@ -1444,6 +1579,12 @@ class MNLogit(MultinomialModel):
         Each column of j is a dummy variable indicating the category of
         each observation. See `names` for a dictionary mapping each column to
         its category.
+    memory_limit : int or None
+        Approximate upper bound in bytes for the temporary arrays of the
+        hessian. If not None, the hessian is accumulated over blocks of
+        observations. Default is None. This is a class attribute that is
+        not an argument of the model, set it on the instance before fit,
+        for example ``mod.memory_limit = 2**27``.
 
     Notes
     -----
@@ -1622,25 +1763,26 @@ class MNLogit(MultinomialModel):
         The actual Hessian matrix has J**2 * K x K elements. Our Hessian
         is reshaped to be square (J*K, J*K) so that the solvers can use it.
 
-        This implementation does not take advantage of the symmetry of
-        the Hessian and could probably be refactored for speed.
+        The Hessian is the block diagonal matrix with the blocks
+        X' diag(p_j) X minus Z'Z, where the columns of Z are p_j x_i for all
+        j, multiplied by -1. If `memory_limit` is set, the sums are
+        accumulated over blocks of observations.
         """
         params = params.reshape(self.K, -1, order='F')
         X = self.exog
-        pr = self.cdf(np.dot(X,params))
-        partials = []
         J = self.wendog.shape[1] - 1
         K = self.exog.shape[1]
-        for i in range(J):
-            for j in range(J): # this loop assumes we drop the first col.
-                if i == j:
-                    partials.append(\
-                        -np.dot(((pr[:,i+1]*(1-pr[:,j+1]))[:,None]*X).T,X))
-                else:
-                    partials.append(-np.dot(((pr[:,i+1]*-pr[:,j+1])[:,None]*X).T,X))
-        H = np.array(partials)
-        # the developer's notes on multinomial should clear this math up
-        H = np.transpose(H.reshape(J,J,K,K), (0,2,1,3)).reshape(J*K,J*K)
+        xpx = np.zeros((J * K, K))
+        zz = np.zeros((J * K, J * K))
+        for sl in self._iter_obs_blocks(J * K + J + 1):
+            x = X[sl]
+            pr = self.cdf(np.dot(x, params))[:,1:]
+            z = (pr[:,:,None] * x[:,None,:]).reshape(-1, J * K)
+            xpx += np.dot(z.T, x)
+            zz += np.dot(z.T, z)
+        H = zz
+        for j in range(J):
+            H[j*K:(j+1)*K, j*K:(j+1)*K] -= xpx[j*K:(j+1)*K]
         return H
 
 
@@ -1716,6 +1858,12 @@ class NegativeBinomial(CountModel):
         A reference to the endogenous response variable
     exog : array
         A reference to the exogenous design.
+    memory_limit : int or None
+        Approximate upper bound in bytes for the temporary arrays of the
+        hessian. If not None, the hessian is accumulated over blocks of
+        observations. Default is None. This is a class attribute that is
+        not an argument of the model, set it on the instance before fit,
+        for example ``mod.memory_limit = 2**27``.
 
     References
     ----------
@@ -1746,20 +1894,28 @@ class NegativeBinomial(CountModel):
         if loglike_method in ['nb2', 'nb1']:
             self.exog_names.append('alpha')
 
+    def _get_init_kwds(self):
+        kwds = super(NegativeBinomial, self)._get_init_kwds()
+        kwds['loglike_method'] = self.loglike_method
+        return kwds
+
     def _initialize(self):
         if self.loglike_method == 'nb2':
             self.hessian = self._hessian_nb2
             self.score = self._score_nbin
+            self.jac = self._jac_nbin
             self.loglikeobs = self._ll_nb2
             self._transparams = True # transform lnalpha -> alpha in fit
         elif self.loglike_method == 'nb1':
             self.hessian = self._hessian_nb1
             self.score = self._score_nb1
+            self.jac = self._jac_nb1
             self.loglikeobs = self._ll_nb1
             self._transparams = True # transform lnalpha -> alpha in fit
         elif self.loglike_method == 'geometric':
             self.hessian = self._hessian_geom
             self.score = self._score_geom
+            self.jac = self._jac_geom
             self.loglikeobs = self._ll_geometric
         else:
             raise NotImplementedError("Likelihood type must nb1, nb2 or "
@@ -1770,6 +1926,7 @@ class NegativeBinomial(CountModel):
         odict = self.__dict__.copy() # copy the dict since we change it
         del odict['hessian']
         del odict['score']
+        del odict['jac']
         del odict['loglikeobs']
         return odict
 
@@ -1888,22 +2045,12 @@ class NegativeBinomial(CountModel):
 
     def _hessian_geom(self, params):
         exog = self.exog
-        y = self.endog[:,None]
-        mu = np.exp(np.dot(exog, params))[:,None]
+        y = self.endog
+        mu = np.exp(np.dot(exog, params))
 
         # for dl/dparams dparams
-        dim = exog.shape[1]
-        hess_arr = np.empty((dim, dim))
         const_arr = mu*(1+y)/(mu+1)**2
-        for i in range(dim):
-            for j in range(dim):
-                if j > i:
-                    continue
-                hess_arr[i,j] = np.sum(-exog[:,i,None] * exog[:,j,None] *
-                                       const_arr, axis=0)
-        tri_idx = np.triu_indices(dim, k=1)
-        hess_arr[tri_idx] = hess_arr.T[tri_idx]
-        return hess_arr
+        return -self._xtwx(const_arr)
 
 
     def _hessian_nb1(self, params):
@@ -1917,47 +2064,30 @@ class NegativeBinomial(CountModel):
 
         params = params[:-1]
         exog = self.exog
-        y = self.endog[:,None]
-        mu = np.exp(np.dot(exog, params))[:,None]
+        y = self.endog
+        mu = np.exp(np.dot(exog, params))
 
         a1 = mu/alpha
 
         # for dl/dparams dparams
         dim = exog.shape[1]
         hess_arr = np.empty((dim+1,dim+1))
-        #const_arr = a1*mu*(a1+y)/(mu+a1)**2
-        # not all of dparams
-        dparams = exog/alpha*(np.log(1/(alpha + 1)) +
-                              special.digamma(y + mu/alpha) -
-                              special.digamma(mu/alpha))
-
-        dmudb = exog*mu
-        xmu_alpha = exog*mu/alpha
-        trigamma = (special.polygamma(1, mu/alpha + y) -
-                    special.polygamma(1, mu/alpha))
-        for i in range(dim):
-            for j in range(dim):
-                if j > i:
-                    continue
-                hess_arr[i,j] = np.sum(dparams[:,i,None] * dmudb[:,j,None] +
-                                 xmu_alpha[:,i,None] * xmu_alpha[:,j,None] *
-                                 trigamma, axis=0)
-        tri_idx = np.triu_indices(dim, k=1)
-        hess_arr[tri_idx] = hess_arr.T[tri_idx]
+        digamma_part = (special.digamma(y + a1) - special.digamma(a1))
+        log_alpha = np.log(1/(alpha+1))
+        # dparams is exog * dparams_w, dmudb is exog * mu
+        dparams_w = (log_alpha + digamma_part)/alpha
+        trigamma = (special.polygamma(1, a1 + y) -
+                    special.polygamma(1, a1))
+        hess_arr[:-1,:-1] = self._xtwx(dparams_w*mu + a1**2 * trigamma)
 
         # for dl/dparams dalpha
-        da1 = -alpha**-2
-        dldpda = np.sum(-mu/alpha * dparams + exog*mu/alpha *
-                        (-trigamma*mu/alpha**2 - 1/(alpha+1)), axis=0)
+        dldpda = np.dot(-a1 * dparams_w + a1 *
+                        (-trigamma*mu/alpha**2 - 1/(alpha+1)), exog)
 
         hess_arr[-1,:-1] = dldpda
         hess_arr[:-1,-1] = dldpda
 
         # for dl/dalpha dalpha
-        digamma_part = (special.digamma(y + mu/alpha) -
-                        special.digamma(mu/alpha))
-
-        log_alpha = np.log(1/(alpha+1))
         alpha3 = alpha**3
         alpha2 = alpha**2
         mu2 = mu**2
@@ -1984,25 +2114,18 @@ class NegativeBinomial(CountModel):
         params = params[:-1]
 
         exog = self.exog
-        y = self.endog[:,None]
-        mu = np.exp(np.dot(exog, params))[:,None]
+        y = self.endog
+        mu = np.exp(np.dot(exog, params))
 
         # for dl/dparams dparams
         dim = exog.shape[1]
         hess_arr = np.empty((dim+1,dim+1))
         const_arr = a1*mu*(a1+y)/(mu+a1)**2
-        for i in range(dim):
-            for j in range(dim):
-                if j > i:
-                    continue
-                hess_arr[i,j] = np.sum(-exog[:,i,None] * exog[:,j,None] *
-                                       const_arr, axis=0)
-        tri_idx = np.triu_indices(dim, k=1)
-        hess_arr[tri_idx] = hess_arr.T[tri_idx]
+        hess_arr[:-1,:-1] = -self._xtwx(const_arr)
 
         # for dl/dparams dalpha
         da1 = -alpha**-2
-        dldpda = np.sum(mu*exog*(y-mu)*da1/(mu+a1)**2 , axis=0)
+        dldpda = np.dot(mu*(y-mu)*da1/(mu+a1)**2, exog)
         hess_arr[-1,:-1] = dldpda
         hess_arr[:-1,-1] = dldpda
 
@@ -2018,10 +2141,62 @@ class NegativeBinomial(CountModel):
 
         return hess_arr
 
-    #TODO: replace this with analytic where is it used?
+    def _jac_geom(self, params):
+        exog = self.exog
+        y = self.endog
+        mu = np.exp(np.dot(exog, params))
+        return exog * ((y-mu)/(mu+1))[:,None]
+
+    def _jac_nbin(self, params, Q=0):
+        """
+        Derivative of the loglikelihood of each observation for NB2 and NB1
+        """
+        if self._transparams: # lnalpha came in during fit
+            alpha = np.exp(params[-1])
+        else:
+            alpha = params[-1]
+        params = params[:-1]
+        exog = self.exog
+        y = self.endog
+        mu = np.exp(np.dot(exog, params))
+        if Q: # nb1
+            a1 = mu/alpha
+            log_alpha = np.log(1/(alpha + 1))
+            digamma_part = special.digamma(y + a1) - special.digamma(a1)
+            dparams = a1*(log_alpha + digamma_part)
+            dalpha = ((alpha*(y - mu*log_alpha - mu*(digamma_part + 1)) -
+                       mu*(log_alpha + digamma_part))/
+                      (alpha**2*(alpha + 1)))
+        else: # nb2
+            a1 = 1/alpha
+            dparams = a1 * (y-mu)/(mu+a1)
+            dalpha = -alpha**-2 * (special.digamma(a1+y) -
+                        special.digamma(a1) + np.log(a1) - np.log(a1+mu) -
+                        (a1+y)/(a1+mu) + 1)
+        if self._transparams:
+            # derivative with respect to lnalpha as in loglikeobs
+            dalpha = dalpha * alpha
+        return np.column_stack((exog * dparams[:,None], dalpha))
+
+    def _jac_nb1(self, params):
+        return self._jac_nbin(params, Q=1)
+
     def scoreobs(self, params):
-        sc = approx_fprime_cs(params, self.loglikeobs)
-        return sc
+        """
+        Score of the loglikelihood of each observation
+
+        Parameters
+        ----------
+        params : array-like
+            The parameters of the model, including the ancillary parameter
+            for nb1 and nb2.
+
+        Returns
+        -------
+        scoreobs : ndarray, (nobs, k_vars)
+            The derivatives of `loglikeobs` with respect to the parameters.
+        """
+        return self.jac(params)
 
     def fit(self, start_params=None, method='bfgs', maxiter=35,
             full_output=1, disp=1, callback=None, **kwargs):
@@ -2053,6 +2228,86 @@ class NegativeBinomial(CountModel):
         else:
             return mlefit
 
+    def fit_regularized_path(self, alphas=None, n_alphas=50,
+            alpha_min_ratio=1e-3, penalty_weights=None, start_params=None,
+            maxiter=100, tol=1e-8, path_tol=1e-5):
+        if not self.loglike_method.startswith('nb'):
+            return super(NegativeBinomial, self).fit_regularized_path(
+                    alphas=alphas, n_alphas=n_alphas,
+                    alpha_min_ratio=alpha_min_ratio,
+                    penalty_weights=penalty_weights,
+                    start_params=start_params, maxiter=maxiter, tol=tol,
+                    path_tol=path_tol)
+        from statsmodels.base.l1_path import _fit_path, L1PathResults
+        k_exog = self.exog.shape[1]
+        if start_params is None:
+            start_params = np.append(np.zeros(k_exog), 0.1)
+        start_params = np.array(start_params, dtype=float)
+        if start_params[-1] <= 0:
+            raise ValueError("the starting value of alpha has to be positive")
+        start_params[-1] = np.log(start_params[-1])
+        if penalty_weights is None:
+            penalty_weights = np.append(np.ones(k_exog), 0)
+        else:
+            penalty_weights = (np.asarray(penalty_weights, dtype=float) *
+                               np.ones(k_exog + 1))
+            if penalty_weights[-1] != 0:
+                raise ValueError("alpha is not penalized, its penalty weight "
+                                 "has to be zero")
+
+        # the path is fit in log(alpha), so that alpha stays positive
+        transparams = self._transparams
+        self._transparams = False
+        try:
+            (alphas, params, llf, iterations, converged,
+             penalty_weights) = _fit_path(_NegativeBinomialLogAlpha(self),
+                    start_params, alphas=alphas, n_alphas=n_alphas,
+                    alpha_min_ratio=alpha_min_ratio,
+                    penalty_weights=penalty_weights, maxiter=maxiter,
+                    tol=tol, path_tol=path_tol)
+        finally:
+            self._transparams = transparams
+        params[:,-1] = np.exp(params[:,-1])
+        return L1PathResults(self, alphas, params, llf, iterations,
+                             converged, penalty_weights)
+    fit_regularized_path.__doc__ = (
+        DiscreteModel.fit_regularized_path.__doc__ + """
+        For nb1 and nb2 the last parameter is the heterogeneity parameter
+        alpha, which is not penalized and is fit in logs. Its starting value
+        is 0.1 if start_params is None.
+        """)
+
+
+class _NegativeBinomialLogAlpha(object):
+    """
+    The loglikelihood of a NegativeBinomial model and its derivatives as
+    functions of log(alpha) instead of alpha. The model must not transform
+    the parameters, i.e. _transparams is False.
+    """
+    def __init__(self, model):
+        self.model = model
+
+    def _params(self, params):
+        return np.r_[params[:-1], np.exp(params[-1])]
+
+    def loglike(self, params):
+        return self.model.loglike(self._params(params))
+
+    def score(self, params):
+        score = self.model.score(self._params(params))
+        score[-1] *= np.exp(params[-1])
+        return score
+
+    def hessian(self, params):
+        alpha = np.exp(params[-1])
+        params = self._params(params)
+        hess = self.model.hessian(params).copy()
+        hess[-1,:-1] *= alpha
+        hess[:-1,-1] *= alpha
+        hess[-1,-1] = (alpha**2 * hess[-1,-1] +
+                       alpha * self.model.score(params)[-1])
+        return hess
+
 ### Results Class ###
 
 class DiscreteResults(base.LikelihoodModelResults):
@@ -2099,7 +2354,8 @@ class DiscreteResults(base.LikelihoodModelResults):
 
     @cache_readonly
     def fittedvalues(self):
-        return np.dot(self.model.exog, self.params[:self.model.exog.shape[1]])
+        return _matvec(self.model.exog,
+                       self.params[:self.model.exog.shape[1]])
 
     @cache_readonly
     def aic(self):
@@ -12,7 +12,8 @@ tests.
 import os
 import numpy as np
 from numpy.testing import (assert_, assert_raises, assert_almost_equal,
-                           assert_equal, assert_array_equal)
+                           assert_equal, assert_array_equal,
+                           assert_array_less)
 
 from statsmodels.discrete.discrete_model import (Logit, Probit, MNLogit,
                                                  Poisson, NegativeBinomial)
@@ -1239,6 +1240,136 @@ def test_issue_341():
     np.testing.assert_equal(res1.predict(x).shape, (1,7))
     np.testing.assert_equal(res1.predict(x[None]).shape, (1,7))
 
+def test_mnlogit_hessian_memory_limit():
+    from statsmodels.tools.numdiff import approx_hess
+    data = sm.datasets.anes96.load()
+    exog = sm.add_constant(data.exog[:,:3], prepend=True)
+    mod = MNLogit(data.endog, exog)
+    params = np.random.RandomState(5).randn(mod.K * (mod.J - 1)) * 0.05
+    hess = mod.hessian(params)
+    assert_almost_equal(hess, approx_hess(params, mod.loglike), DECIMAL_2)
+    mod.memory_limit = 8 * 50 * 30
+    assert_almost_equal(mod.hessian(params), hess, DECIMAL_9)
+    res1 = MNLogit(data.endog, exog).fit(method="newton", disp=0)
+    res2 = mod.fit(method="newton", disp=0)
+    assert_almost_equal(res2.params, res1.params, DECIMAL_10)
+
+def test_negativebinomial_analytic_derivatives():
+    from statsmodels.tools.numdiff import approx_fprime, approx_hess
+    data = sm.datasets.randhie.load()
+    exog = sm.add_constant(data.exog, prepend=False)
+    for method in ['nb2', 'nb1', 'geometric']:
+        mod = NegativeBinomial(data.endog, exog, loglike_method=method)
+        params = np.r_[np.zeros(exog.shape[1] - 1), 0.5]
+        if method != 'geometric':
+            params = np.r_[params, 0.7]
+        for transparams in [False, True]:
+            mod._transparams = transparams
+            jac = mod.jac(params)
+            assert_almost_equal(jac, approx_fprime(params, mod.loglikeobs,
+                                                   centered=True), DECIMAL_4)
+            assert_almost_equal(mod.scoreobs(params), jac, DECIMAL_14)
+        mod._transparams = False
+        hess = mod.hessian(params)
+        assert_almost_equal(hess / np.abs(hess).max(),
+                approx_hess(params, mod.loglike) / np.abs(hess).max(),
+                DECIMAL_4)
+        mod.memory_limit = 8 * 1000 * exog.shape[1]
+        assert_almost_equal(mod.hessian(params) / np.abs(hess).max(),
+                            hess / np.abs(hess).max(), DECIMAL_14)
+
+def test_sparse_exog():
+    from scipy import sparse
+    from statsmodels.tools.grouputils import dummy_sparse
+    np.random.seed(12345)
+    groups = np.random.randint(0, 20, size=500)
+    x = np.random.randn(500)
+    exog = sparse.hstack((dummy_sparse(groups), sparse.csr_matrix(x[:,None])))
+    linpred = groups / 20. - 0.5 + 0.3 * x
+    endog_binary = (np.random.rand(500) < 1 / (1 + np.exp(-linpred)))
+    endog_count = np.random.poisson(np.exp(linpred))
+    for model, endog in [(Logit, endog_binary * 1.), (Poisson, endog_count)]:
+        res1 = model(endog, exog.toarray()).fit(disp=0)
+        res2 = model(endog, exog).fit(disp=0)
+        assert_(sparse.issparse(res2.model.hessian(res2.params)))
+        assert_almost_equal(res2.params, res1.params, DECIMAL_10)
+        assert_almost_equal(res2.bse, res1.bse, DECIMAL_10)
+        assert_almost_equal(res2.llf, res1.llf, DECIMAL_10)
+        assert_almost_equal(res2.fittedvalues, res1.fittedvalues, DECIMAL_10)
+        assert_equal(res2.df_resid, res1.df_resid)
+
+def test_fit_regularized_path():
+    data = sm.datasets.spector.load()
+    exog = sm.add_constant(data.exog, prepend=True)
+    weights = np.array([0., 1, 1, 1])
+    for model in [Logit, Probit]:
+        mod = model(data.endog, exog)
+        res = mod.fit_regularized_path(penalty_weights=weights, n_alphas=8,
+                                       path_tol=0, tol=1e-12)
+        assert_(res.converged.all())
+        assert_equal(res.params.shape, (8, 4))
+        # all penalized parameters are zero at the largest alpha
+        assert_equal(res.nnz_params[0], 1)
+        assert_equal(res.nnz_params[-1], 4)
+        for i in [2, 5]:
+            res2 = mod.fit_regularized(alpha=res.alphas[i] * weights, disp=0,
+                                       trim_mode='size', acc=1e-12)
+            assert_almost_equal(res.params[i], res2.params, DECIMAL_4)
+            assert_almost_equal(res.llf[i], res2.llf, DECIMAL_4)
+    # early stopping when the loglikelihood does not change anymore
+    res3 = mod.fit_regularized_path(penalty_weights=weights, n_alphas=50,
+                                    alpha_min_ratio=1e-6, path_tol=1e-3)
+    assert_(len(res3.alphas) < 50)
+    assert_equal(res3.params.shape, (len(res3.alphas), 4))
+    assert_raises(ValueError, mod.fit_regularized_path, alphas=[1., 2.])
+
+    data = sm.datasets.anes96.load()
+    exog = sm.add_constant(data.exog[:,:3], prepend=False)
+    mod = MNLogit(data.endog, exog)
+    weights = np.ones((mod.K, mod.J - 1))
+    weights[-1] = 0
+    res = mod.fit_regularized_path(alphas=[20., 5.], penalty_weights=weights,
+                                   path_tol=0, tol=1e-12)
+    assert_equal(res.params.shape, (2, mod.K, mod.J - 1))
+    res2 = mod.fit_regularized(alpha=5. * weights, disp=0, trim_mode='size',
+                               acc=1e-12)
+    assert_almost_equal(res.params[-1], res2.params, DECIMAL_4)
+
+def test_fit_regularized_path_negbin():
+    np.random.seed(12345)
+    nobs = 300
+    exog = sm.add_constant(np.random.randn(nobs, 4), prepend=True)
+    mu = np.exp(np.dot(exog, [.5, .5, -.25, 0, 0]))
+    endog = np.random.negative_binomial(2., 2. / (2. + mu))
+    weights = np.array([0., 1, 1, 1, 1, 0])
+    for loglike_method in ['nb2', 'nb1']:
+        mod = NegativeBinomial(endog, exog, loglike_method=loglike_method)
+        res = mod.fit_regularized_path(alphas=[50., 5., 0.],
+                                       penalty_weights=weights, path_tol=0,
+                                       tol=1e-12)
+        assert_(res.converged.all())
+        assert_equal(res.params.shape, (3, 6))
+        assert_((res.params[:,-1] > 0).all())
+        # alpha is not penalized
+        res_mle = mod.fit(method='newton', disp=0, maxiter=100)
+        assert_almost_equal(res.params[-1], res_mle.params, DECIMAL_4)
+        assert_almost_equal(res.llf[-1], res_mle.llf, DECIMAL_4)
+        # optimality conditions
+        mod._transparams = False
+        score = mod.score(res.params[1])
+        nonzero = (res.params[1] != 0) & (weights != 0)
+        assert_almost_equal(score[nonzero],
+                            5. * np.sign(res.params[1][nonzero]), DECIMAL_4)
+        assert_array_less(np.abs(score[res.params[1] == 0]), 5.)
+        assert_almost_equal(score[weights == 0], 0, DECIMAL_4)
+
+        # the default penalizes all parameters except alpha
+        res = mod.fit_regularized_path(n_alphas=5)
+        assert_equal(res.nnz_params[0], 1)
+        assert_(res.params[0,-1] > 0)
+        assert_raises(ValueError, mod.fit_regularized_path,
+                      penalty_weights=np.ones(6))
+
 def test_iscount():
     X = np.random.random((50, 10))
     X[:,2] = np.random.randint(1, 10, size=50)
@@ -0,0 +1,467 @@
+"""
+Batched estimation of many generalized linear models of the same family
+
+BatchedGLM fits a separate GLM for each group of observations, for example
+thousands of small regional Poisson regressions. IRLS runs for all groups
+simultaneously. In each iteration the weighted normal equations of all
+groups that have not converged yet are summed by group and solved with a
+Cholesky decomposition that is vectorized over the groups, instead of
+creating a WLS model and results instance per group and iteration.
+
+The iterations and the convergence criterion for each group are the same as
+in GLM.fit, so the results agree with fitting GLM to each group separately.
+"""
+
+import numpy as np
+from scipy import stats, special
+import families
+from statsmodels.tools.tools import stacked_cholesky_inv
+from statsmodels.tools.decorators import (cache_readonly,
+        resettable_cache)
+
+__all__ = ['BatchedGLM', 'BatchedGLMResults']
+
+
+class BatchedGLM(object):
+    """
+    Generalized linear models for many groups with the same family
+
+    Parameters
+    ----------
+    endog : array-like
+        1d array of the endogenous response variable, or a n_groups x
+        nobs_group array if exog is 3d.
+    exog : array-like
+        nobs x k design matrix, or a n_groups x nobs_group x k stack of
+        design matrices. An intercept is not included by default.
+    groups : array-like, optional
+        1d array of group labels of the observations. Required if exog is 2d.
+        The groups do not need to have the same number of observations.
+    family : family class instance
+        The default is Gaussian. See statsmodels.genmod.families.
+    offset : array-like, optional
+        Offset with the same shape as endog.
+    exposure : array-like, optional
+        Exposure with the same shape as endog. log(exposure) is added to the
+        offset.
+
+    Attributes
+    ----------
+    group_labels : array
+        Sorted unique group labels. The results have one row per group in
+        this order.
+    n_groups : int
+        Number of groups.
+    nobs : array
+        Number of observations in each group.
+    df_model : float
+        k - 1
+    df_resid : array
+        Residual degrees of freedom of each group.
+
+    Notes
+    -----
+    Only a 1d endog is supported, a Binomial model with (successes, failures)
+    as endog is not available.
+
+    The estimates of groups for which the design is not of full rank are
+    nan, and these groups are not converged.
+
+    Examples
+    --------
+    >>> import statsmodels.api as sm
+    >>> from statsmodels.genmod.batched import BatchedGLM
+    >>> mod = BatchedGLM(endog, exog, groups=region,
+    ...                  family=sm.families.Poisson())
+    >>> res = mod.fit()
+    >>> res.params[res.converged]
+    """
+
+    def __init__(self, endog, exog, groups=None, family=None, offset=None,
+                 exposure=None):
+        endog = np.asarray(endog, dtype=float)
+        exog = np.asarray(exog, dtype=float)
+        if family is None:
+            family = families.Gaussian()
+        self.family = family
+
+        offset_total = np.zeros(endog.shape)
+        if offset is not None:
+            offset = np.asarray(offset)
+            if offset.shape != endog.shape:
+                raise ValueError("offset is not the same shape as endog")
+            offset_total = offset_total + offset
+        if exposure is not None:
+            exposure = np.asarray(exposure)
+            if exposure.shape != endog.shape:
+                raise ValueError("exposure is not the same shape as endog")
+            offset_total = offset_total + np.log(exposure)
+
+        self._shape = endog.shape
+        if exog.ndim == 3:
+            if groups is not None:
+                raise ValueError("groups cannot be given if exog is 3d")
+            n_groups, nobs_group, k_vars = exog.shape
+            if endog.shape != (n_groups, nobs_group):
+                raise ValueError("endog has to be n_groups x nobs_group if "
+                                 "exog is 3d")
+            groups = np.repeat(np.arange(n_groups), nobs_group)
+            endog = endog.ravel()
+            exog = exog.reshape(-1, k_vars)
+            offset_total = offset_total.ravel()
+        elif exog.ndim == 2:
+            if groups is None:
+                raise ValueError("groups is required if exog is 2d")
+            if endog.ndim != 1:
+                raise ValueError("endog has to be 1d")
+            groups = np.asarray(groups)
+            if len(groups) != len(endog) or len(exog) != len(endog):
+                raise ValueError("endog, exog and groups need to have the "
+                                 "same number of observations")
+        else:
+            raise ValueError("exog has to be 2d or 3d")
+
+        group_labels, group_idx = np.unique(groups, return_inverse=True)
+        # sort the observations by group, the groups are contiguous slices
+        self._sort_idx = np.argsort(group_idx, kind='mergesort')
+        self.endog = endog[self._sort_idx]
+        self.exog = exog[self._sort_idx]
+        self.offset = offset_total[self._sort_idx]
+        self.group_labels = group_labels
+        self.n_groups = len(group_labels)
+        self.nobs = np.bincount(group_idx)
+        self._group_stop = np.cumsum(self.nobs)
+        self._group_start = self._group_stop - self.nobs
+        self.k_vars = self.exog.shape[1]
+        self.df_model = self.k_vars - 1.
+        self.df_resid = self.nobs - float(self.k_vars)
+
+    def _group_slices(self, groups):
+        return [slice(start, stop) for start, stop in
+                zip(self._group_start[groups], self._group_stop[groups])]
+
+    def _group_deviance(self, endog, mu, groups=None):
+        """
+        Deviance of each group.
+
+        If groups is an index of a subset of groups, endog and mu contain
+        only the observations of these groups.
+        """
+        dev = _deviance_obs(self.family, endog, mu)
+        if dev is not None:
+            return self._group_sum(dev, groups)
+        # the deviance of the family is not a known sum over observations
+        if groups is None:
+            groups = np.arange(self.n_groups)
+        nobs = self.nobs[groups]
+        stops = np.cumsum(nobs)
+        deviance = self.family.deviance
+        return np.array([deviance(endog[stop - n:stop], mu[stop - n:stop])
+                         for n, stop in zip(nobs, stops)])
+
+    def _group_sum(self, values, groups=None):
+        """
+        Sums of values over the observations of each group.
+
+        If groups is an index of a subset of groups, values contains only the
+        observations of these groups.
+        """
+        if groups is None:
+            nobs = self.nobs
+        else:
+            nobs = self.nobs[groups]
+        starts = np.cumsum(nobs) - nobs
+        return np.add.reduceat(values, starts, axis=0)
+
+    def estimate_scale(self, mu, scale=None):
+        """
+        Estimates the dispersion/scale of each group.
+
+        Parameters
+        ----------
+        mu : array
+            mean response of all observations, sorted by group
+        scale : None, string or float
+            see fit
+
+        Returns
+        -------
+        scale : array
+            scale of each group
+        """
+        scale_ones = np.ones(self.n_groups)
+        if scale is None:
+            if isinstance(self.family, (families.Binomial,
+                                        families.Poisson)):
+                return scale_ones
+            scale = 'x2'
+        if isinstance(scale, float):
+            return scale * scale_ones
+        if isinstance(scale, str):
+            if scale.lower() == 'x2':
+                resid = self.endog - mu
+                chi2 = self._group_sum(resid**2 / self.family.variance(mu))
+                return chi2 / self.df_resid
+            elif scale.lower() == 'dev':
+                return self._group_deviance(self.endog, mu) / self.df_resid
+        raise ValueError("Scale %s with type %s not understood" %
+                         (scale, type(scale)))
+
+    def fit(self, maxiter=100, tol=1e-8, scale=None):
+        """
+        Fits the generalized linear model of each group with IRLS.
+
+        Parameters
+        ----------
+        maxiter : int, optional
+            Maximum number of iterations for each group. Default is 100.
+        tol : float
+            Convergence tolerance for the change in the deviance of a group.
+            Default is 1e-8.
+        scale : string or float, optional
+            `scale` can be 'X2', 'dev', or a float, see GLM.fit.
+
+        Returns
+        -------
+        BatchedGLMResults instance
+        """
+        family = self.family
+        endog, exog, offset = self.endog, self.exog, self.offset
+        n_groups, k_vars = self.n_groups, self.k_vars
+        all_groups = np.arange(n_groups)
+
+        # starting_mu can depend on the mean of endog, e.g. Poisson
+        mu = np.concatenate([family.starting_mu(endog[sl]) for sl in
+                             self._group_slices(all_groups)])
+        eta = family.predict(mu)
+        deviance = self._group_deviance(endog, mu)
+        if np.isnan(deviance).any():
+            raise ValueError("The first guess on the deviance function "
+                             "returned a nan.  This could be a boundary "
+                             " problem and should be reported.")
+        deviance_old = np.empty(n_groups)
+        deviance_old.fill(np.inf)
+
+        params = np.empty((n_groups, k_vars))
+        params.fill(np.nan)
+        normalized_cov_params = np.empty((n_groups, k_vars, k_vars))
+        normalized_cov_params.fill(np.nan)
+        iterations = np.zeros(n_groups, int)
+        converged = np.zeros(n_groups, bool)
+        active = np.ones(n_groups, bool)
+        obs_group = np.repeat(all_groups, self.nobs)
+        while active.any():
+            groups = all_groups[active]
+            obs = active[obs_group]
+            # position of the observations in the active groups
+            obs_active = np.repeat(np.arange(len(groups)), self.nobs[groups])
+            mu_a, x = mu[obs], exog[obs]
+            weights = family.weights(mu_a)
+            wlsendog = (eta[obs] + family.link.deriv(mu_a) *
+                        (endog[obs] - mu_a) - offset[obs])
+            wx = weights[:,None] * x
+            xtwx = self._group_sum(wx[:,:,None] * x[:,None,:], groups)
+            xtwz = self._group_sum(wx * wlsendog[:,None], groups)
+            xtwx_inv = stacked_cholesky_inv(xtwx)
+            beta = (xtwx_inv * xtwz[:,None,:]).sum(2)
+            params[groups] = beta
+            normalized_cov_params[groups] = xtwx_inv
+
+            eta[obs] = (x * beta[obs_active]).sum(1) + offset[obs]
+            mu[obs] = family.fitted(eta[obs])
+            iterations[groups] += 1
+            # GLM.fit compares the deviances of the previous two iterations
+            change = np.abs(deviance[groups] - deviance_old[groups])
+            deviance_old[groups] = deviance[groups]
+            deviance[groups] = self._group_deviance(endog[obs], mu[obs],
+                                                    groups)
+            # nan estimates also stop
+            done = ~((change > tol) & (iterations[groups] <= maxiter))
+            converged[groups[done]] = change[done] <= tol
+            active[groups[done]] = False
+
+        scale = self.estimate_scale(mu, scale)
+        return BatchedGLMResults(self, params, normalized_cov_params, scale,
+                                 mu, deviance, converged, iterations)
+
+
+class BatchedGLMResults(object):
+    """
+    Results of a BatchedGLM
+
+    All attributes have one row per group, in the order of
+    model.group_labels.
+
+    Attributes
+    ----------
+    params : array
+        n_groups x k array of parameter estimates
+    normalized_cov_params : array
+        n_groups x k x k array
+    bse, tvalues, pvalues : array
+        n_groups x k arrays. The pvalues are based on the normal
+        distribution.
+    scale : array
+        scale of each group
+    deviance, pearson_chi2, llf, aic, bic : array
+        see GLMResults, one value per group
+    converged : array
+        bool array, True if IRLS converged for the group
+    iterations : array
+        number of IRLS iterations of each group
+    fittedvalues : array
+        mean response of the observations, in the order and shape of the
+        endog given to the model
+    nobs, df_resid : array
+        number of observations and residual degrees of freedom of each group
+    """
+
+    def __init__(self, model, params, normalized_cov_params, scale, mu,
+                 deviance, converged, iterations):
+        self.model = model
+        self.family = model.family
+        self.params = params
+        self.normalized_cov_params = normalized_cov_params
+        self.scale = scale
+        self.deviance = deviance
+        self.converged = converged
+        self.iterations = iterations
+        self.nobs = model.nobs
+        self.df_model = model.df_model
+        self.df_resid = model.df_resid
+        self.group_labels = model.group_labels
+        self._mu = mu
+        self._cache = resettable_cache()
+
+    @cache_readonly
+    def bse(self):
+        k = self.model.k_vars
+        cov_diag = self.normalized_cov_params.reshape(-1, k * k)[:,::k+1]
+        return np.sqrt(cov_diag * self.scale[:,None])
+
+    @cache_readonly
+    def tvalues(self):
+        return self.params / self.bse
+
+    @cache_readonly
+    def pvalues(self):
+        return stats.norm.sf(np.abs(self.tvalues)) * 2
+
+    @cache_readonly
+    def fittedvalues(self):
+        mu = np.empty_like(self._mu)
+        mu[self.model._sort_idx] = self._mu
+        return mu.reshape(self.model._shape)
+
+    @cache_readonly
+    def pearson_chi2(self):
+        model = self.model
+        chi2 = (model.endog - self._mu)**2 / self.family.variance(self._mu)
+        return model._group_sum(chi2)
+
+    @cache_readonly
+    def llf(self):
+        model = self.model
+        family = self.family
+        endog, mu = model.endog, self._mu
+        if (isinstance(family, families.Gaussian) and
+                isinstance(family.link, families.links.Power) and
+                family.link.power == 1):
+            # the loglikelihood of OLS, see Gaussian.loglike
+            ssr = model._group_sum((endog - mu)**2)
+            nobs2 = model.nobs / 2.
+            return -np.log(ssr) * nobs2 - (1 + np.log(np.pi / nobs2)) * nobs2
+        scale = np.repeat(self.scale, model.nobs)
+        if isinstance(family, families.NegativeBinomial):
+            linpred = (model.exog *
+                       np.repeat(self.params, model.nobs, axis=0)).sum(1)
+        else:
+            linpred = None
+        llf = _loglike_obs(family, endog, mu, scale, linpred)
+        if llf is not None:
+            return model._group_sum(llf)
+        # the loglikelihood of the family is not a known sum over
+        # observations
+        groups = np.arange(model.n_groups)
+        return np.array([family.loglike(endog[sl], mu[sl],
+                                        scale=self.scale[g])
+                         for g, sl in zip(groups, model._group_slices(groups))])
+
+    @cache_readonly
+    def aic(self):
+        return -2 * self.llf + 2*(self.df_model+1)
+
+    @cache_readonly
+    def bic(self):
+        return self.deviance - self.df_resid*np.log(self.nobs)
+
+
+def _deviance_obs(family, endog, mu):
+    """
+    Contributions of the observations to family.deviance(endog, mu)
+
+    Returns None if the deviance of the family is not known as a sum over
+    the observations.
+    """
+    if isinstance(family, families.Poisson):
+        iszero = endog == 0
+        endog_mu = np.where(iszero, 1., endog / mu)
+        return np.where(iszero, 0., 2 * endog * np.log(endog_mu))
+    elif isinstance(family, families.Gaussian):
+        return (endog - mu)**2
+    elif isinstance(family, families.Gamma):
+        endog_mu = family._clean(endog / mu)
+        return 2 * ((endog - mu) / mu - np.log(endog_mu))
+    elif isinstance(family, families.Binomial):
+        if np.shape(family.n) != () or family.n != 1:
+            return None
+        one = np.equal(endog, 1)
+        return -2 * (one * np.log(mu + 1e-200) +
+                     (1 - one) * np.log(1 - mu + 1e-200))
+    elif isinstance(family, families.InverseGaussian):
+        return (endog - mu)**2 / (endog * mu**2)
+    elif isinstance(family, families.NegativeBinomial):
+        alpha = family.alpha
+        iszero = np.equal(endog, 0)
+        endog_mu = family._clean(endog / mu)
+        return (iszero * 2 * np.log(1 + alpha * mu) / alpha +
+                (1 - iszero) * (2 * endog * np.log(endog_mu) - 2 / alpha *
+                                (1 + alpha * endog) *
+                                np.log((1 + alpha * endog) / (1 + alpha * mu))))
+    return None
+
+
+def _loglike_obs(family, endog, mu, scale, linpred=None):
+    """
+    Contributions of the observations to family.loglike(endog, mu, scale)
+
+    scale has one value per observation. linpred is the linear predictor
+    without offset, which is used instead of mu by NegativeBinomial.
+    Returns None if the loglikelihood of the family is not known as a sum
+    over the observations.
+    """
+    if isinstance(family, families.Poisson):
+        return scale * (-mu + endog * np.log(mu) - special.gammaln(endog + 1))
+    elif isinstance(family, families.Gaussian):
+        return ((endog * mu - mu**2 / 2) / scale - endog**2 / (2 * scale) -
+                .5 * np.log(2 * np.pi * scale))
+    elif isinstance(family, families.Gamma):
+        return -1. / scale * (endog / mu + np.log(mu) +
+                              (scale - 1) * np.log(endog) + np.log(scale) +
+                              scale * special.gammaln(1. / scale))
+    elif isinstance(family, families.Binomial):
+        if np.shape(family.n) != () or family.n != 1:
+            return None
+        return scale * (endog * np.log(mu / (1 - mu) + 1e-200) +
+                        np.log(1 - mu))
+    elif isinstance(family, families.InverseGaussian):
+        return -.5 * ((endog - mu)**2 / (endog * mu**2 * scale) +
+                      np.log(scale * endog**3) + np.log(2 * np.pi))
+    elif isinstance(family, families.NegativeBinomial):
+        alpha = family.alpha
+        constant = (special.gammaln(endog + 1 / alpha) -
+                    special.gammaln(endog + 1) - special.gammaln(1 / alpha))
+        return (endog * np.log(alpha * np.exp(linpred) /
+                               (1 + alpha * np.exp(linpred))) -
+                np.log(1 + alpha * np.exp(linpred)) / alpha + constant)
+    return None
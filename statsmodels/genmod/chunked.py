@@ -0,0 +1,368 @@
+"""
+Generalized linear models estimated out-of-core from chunked data
+
+Each IRLS iteration is one pass over the data source. For every chunk the
+weighted cross-products X'WX and X'Wz of the working regression are
+accumulated together with the deviance of the current estimate, so only one
+chunk is in memory at a time. The iterations, the convergence rule and the
+covariance of the parameters are the same as in GLM.fit.
+
+The deviance and Pearson's chi-square of the final estimate require one
+more pass, the loglikelihood and the null deviance are computed with
+additional passes when they are requested.
+"""
+
+import copy
+import numpy as np
+from scipy.linalg import cho_factor, cho_solve
+import families
+from statsmodels.base.data import handle_data
+from statsmodels.tools.tools import rank
+from statsmodels.tools.decorators import cache_readonly, resettable_cache
+from statsmodels.tools.sm_exceptions import PerfectSeparationError
+from statsmodels.regression.incremental import _iter_chunks, _is_reiterable
+import statsmodels.base.model as base
+from generalized_linear_model import GLMResults, GLMResultsWrapper
+
+__all__ = ['ChunkedGLM', 'ChunkedGLMResults']
+
+
+def _solve_normal_equations(xtx, xty):
+    """
+    Returns params and normalized_cov_params of the normal equations.
+
+    A Cholesky decomposition is used if xtx is numerically positive definite,
+    otherwise the pinv of xtx.
+    """
+    try:
+        factor = cho_factor(xtx)
+        diag = np.abs(np.diag(factor[0]))
+        if not diag.min() > 1e-7 * diag.max():
+            raise np.linalg.LinAlgError
+    except np.linalg.LinAlgError:
+        xtx_inv = np.linalg.pinv(xtx)
+        return np.dot(xtx_inv, xty), xtx_inv
+    return cho_solve(factor, xty), cho_solve(factor, np.eye(len(xty)))
+
+
+class ChunkedGLM(object):
+    """
+    Generalized linear model estimated from a chunked data source
+
+    Parameters
+    ----------
+    chunks : sequence or callable
+        Each element is a tuple (endog, exog) or (endog, exog, offset). If
+        `chunks` is a callable, it is called without arguments to get a new
+        iterator over the chunks, e.g. a function that reads the chunks of a
+        file. The data source is iterated over once per IRLS iteration, so a
+        one-shot iterator like a generator is not allowed.
+    family : family class instance
+        The default is Gaussian, see GLM.
+
+    Attributes
+    ----------
+    nobs : float
+        number of observations
+    k_vars : int
+        number of regressors
+    df_model, df_resid : float
+        see GLM
+
+    Notes
+    -----
+    The exposure has to be included in the offset as log(exposure). For the
+    Binomial family, endog in a chunk can be 1d or (successes, failures) as
+    in GLM.
+
+    The results are the same as the ones of GLM fitted with all the data,
+    except that statistics that have the length of the data like the
+    residuals and fittedvalues are not available.
+
+    Examples
+    --------
+    >>> import statsmodels.api as sm
+    >>> def chunks():
+    ...     for start in range(0, nobs, 10000):
+    ...         yield endog[start:start+10000], exog[start:start+10000]
+    >>> mod = sm.GLM.from_chunks(chunks, family=sm.families.Poisson())
+    >>> res = mod.fit()
+    """
+
+    def __init__(self, chunks, family=None):
+        if not _is_reiterable(chunks):
+            raise ValueError("chunks has to be a sequence or a callable, the "
+                             "data is used in several passes")
+        if family is None:
+            family = families.Gaussian()
+        self.family = family
+        self._chunks = chunks
+        self._data_attr = []
+        self.data = None
+        self._initialize()
+
+    def _convert_chunk(self, chunk):
+        """
+        Returns endog, exog, offset, data_weights and the family of a chunk.
+
+        For the Binomial family endog is the proportion of successes. If endog
+        is (successes, failures), the family of the chunk is a copy of the
+        family of the model with the number of trials of the chunk, the family
+        of the model is not changed.
+        """
+        endog, exog = chunk[:2]
+        exog = np.asarray(exog, dtype=float)
+        if exog.ndim == 1:
+            exog = exog[:,None]
+        endog = np.asarray(endog, dtype=float)
+        if len(chunk) > 2 and chunk[2] is not None:
+            offset = np.asarray(chunk[2], dtype=float)
+        else:
+            offset = 0
+        if endog.ndim > 1 and endog.shape[1] == 2:
+            data_weights = endog.sum(1)
+        else:
+            data_weights = np.ones(endog.shape[0])
+            endog = endog.ravel()
+        family = self.family
+        if isinstance(family, families.Binomial) and endog.ndim > 1:
+            family = copy.copy(family)
+            endog = family.initialize(endog)
+        if endog.shape[0] != exog.shape[0]:
+            raise ValueError("endog and exog matrices are different sizes")
+        return endog, exog, offset, data_weights, family
+
+    def _initialize(self):
+        """
+        First pass over the data for the number of observations, the rank of
+        exog and the mean of endog.
+        """
+        nobs = 0
+        sum_endog = 0.
+        R = None
+        for chunk in _iter_chunks(self._chunks):
+            if self.data is None:
+                # keep only the names, not the chunk itself
+                data = handle_data(chunk[0], chunk[1], 'none', None)
+                data.ynames, data.xnames
+                data.endog = data.exog = None
+                data.orig_endog = data.orig_exog = None
+                self.data = data
+            endog, exog = self._convert_chunk(chunk)[:2]
+            if R is None:
+                R = np.zeros((exog.shape[1], exog.shape[1]))
+            R = np.linalg.qr(np.vstack((R, exog)), mode='r')
+            nobs += len(endog)
+            sum_endog += endog.sum()
+        if not nobs:
+            raise ValueError("the data source does not contain observations")
+        self.nobs = float(nobs)
+        self.k_vars = R.shape[1]
+        self._endog_mean = sum_endog / nobs
+        self.rank = rank(R)
+        self.df_model = self.rank - 1
+        self.df_resid = self.nobs - self.rank
+
+    @property
+    def endog_names(self):
+        return self.data.ynames
+
+    @property
+    def exog_names(self):
+        return self.data.xnames
+
+    def _starting_mu(self, endog):
+        if isinstance(self.family, families.Binomial):
+            return self.family.starting_mu(endog)
+        # Family.starting_mu with the mean over all chunks
+        return (endog + self._endog_mean) / 2.
+
+    def _irls_pass(self, params):
+        """
+        One pass over the data at params, or at the starting values if params
+        is None.
+
+        Returns the deviance at params, the cross-products X'WX and X'Wz of
+        the working regression, and the maximum absolute difference between
+        endog and the mean.
+        """
+        k_vars = self.k_vars
+        xtx = np.zeros((k_vars, k_vars))
+        xtz = np.zeros(k_vars)
+        deviance = 0.
+        max_diff = 0.
+        for chunk in _iter_chunks(self._chunks):
+            (endog, exog, offset, data_weights,
+             family) = self._convert_chunk(chunk)
+            if params is None:
+                mu = self._starting_mu(endog)
+                eta = family.predict(mu)
+            else:
+                eta = np.dot(exog, params) + offset
+                mu = family.fitted(eta)
+            deviance += family.deviance(endog, mu)
+            max_diff = max(max_diff, np.abs(mu - endog).max())
+            weights = data_weights * family.weights(mu)
+            wlsendog = eta + family.link.deriv(mu) * (endog - mu) - offset
+            # whitened as in _irls_wls of GLM.fit
+            sqrt_w = np.sqrt(weights)
+            wexog = exog * sqrt_w[:,None]
+            xtx += np.dot(wexog.T, wexog)
+            xtz += np.dot(wexog.T, wlsendog * sqrt_w)
+        return deviance, xtx, xtz, max_diff
+
+    def _final_pass(self, params):
+        """
+        Returns deviance, Pearson's chi-square with and without the data
+        weights at params.
+        """
+        deviance = chi2 = chi2_unweighted = 0.
+        for chunk in _iter_chunks(self._chunks):
+            (endog, exog, offset, data_weights,
+             family) = self._convert_chunk(chunk)
+            mu = family.fitted(np.dot(exog, params) + offset)
+            deviance += family.deviance(endog, mu)
+            chi2_i = (endog - mu)**2 / family.variance(mu)
+            chi2_unweighted += chi2_i.sum()
+            chi2 += np.dot(chi2_i, data_weights)
+        return deviance, chi2, chi2_unweighted
+
+    def loglike(self, params, scale=1.):
+        """
+        Loglikelihood at params, computed in a pass over the data.
+
+        See GLMResults.llf
+        """
+        llf = 0.
+        for chunk in _iter_chunks(self._chunks):
+            endog, exog, offset, _, family = self._convert_chunk(chunk)
+            if isinstance(family, families.NegativeBinomial):
+                llf += family.loglike(endog,
+                                      fittedvalues=np.dot(exog, params))
+            else:
+                mu = family.fitted(np.dot(exog, params) + offset)
+                llf += family.loglike(endog, mu, scale=scale)
+        return llf
+
+    def predict(self, params, exog=None, offset=0, linear=False):
+        """
+        Return predicted values for a design matrix
+
+        exog is required since the model does not keep the data, see
+        GLM.predict.
+        """
+        if exog is None:
+            raise ValueError("exog is required, the data is not stored")
+        eta = np.dot(exog, params) + offset
+        if linear:
+            return eta
+        return self.family.fitted(eta)
+
+    def fit(self, maxiter=100, tol=1e-8, scale=None, start_params=None):
+        """
+        Fits the generalized linear model with IRLS, one pass per iteration.
+
+        Parameters
+        ----------
+        maxiter : int, optional
+            Default is 100.
+        tol : float
+            Convergence tolerance.  Default is 1e-8.
+        scale : string or float, optional
+            `scale` can be 'X2', 'dev', or a float, see GLM.fit.
+        start_params : array-like, optional
+            Starting values for the parameters, see GLM.fit.
+
+        Returns
+        -------
+        GLMResultsWrapper of a ChunkedGLMResults instance
+        """
+        params = start_params
+        history = dict(params=[None, None], deviance=[np.inf])
+        iteration = 0
+        converged = False
+        while not converged:
+            # deviance of the previous estimate and the working regression
+            dev, xtx, xtz, max_diff = self._irls_pass(params)
+            if iteration == 0 and np.isnan(dev):
+                raise ValueError("The first guess on the deviance function "
+                                 "returned a nan.  This could be a boundary "
+                                 " problem and should be reported.")
+            if iteration > 0 and max_diff <= 1e-8:
+                msg = "Perfect separation detected, results not available"
+                raise PerfectSeparationError(msg)
+            history['deviance'].append(dev)
+            params, normalized_cov_params = _solve_normal_equations(xtx, xtz)
+            history['params'].append(params)
+            iteration += 1
+            # same rule as GLM.fit, the deviances of the previous two
+            # iterations are compared
+            criterion = history['deviance']
+            converged = not ((np.fabs(criterion[-1] - criterion[-2]) > tol)
+                             and iteration <= maxiter)
+
+        deviance, pearson_chi2, chi2 = self._final_pass(params)
+        history['deviance'].append(deviance)
+        history['iteration'] = iteration
+        self.scaletype = scale
+        if scale is None:
+            if isinstance(self.family, (families.Binomial,
+                                        families.Poisson)):
+                scale = 1.
+            else:
+                scale = chi2 / self.df_resid
+        elif isinstance(scale, str) and scale.lower() == 'x2':
+            scale = chi2 / self.df_resid
+        elif isinstance(scale, str) and scale.lower() == 'dev':
+            scale = deviance / self.df_resid
+        elif not isinstance(scale, float):
+            raise ValueError("Scale %s with type %s not understood" %
+                             (scale, type(scale)))
+        self.scale = scale
+        self.normalized_cov_params = normalized_cov_params
+
+        res = ChunkedGLMResults(self, params, normalized_cov_params, scale,
+                                deviance, pearson_chi2)
+        res.fit_history = history
+        return GLMResultsWrapper(res)
+
+
+class ChunkedGLMResults(GLMResults):
+    """
+    Results of a ChunkedGLM
+
+    The attributes are the same as for GLMResults. Results that have the
+    length of the data, like `mu`, `fittedvalues` and the residuals, are
+    not available. `llf` and `null_deviance` require additional passes over
+    the data.
+
+    See Also
+    --------
+    GLMResults
+    """
+
+    def __init__(self, model, params, normalized_cov_params, scale, deviance,
+                 pearson_chi2):
+        base.LikelihoodModelResults.__init__(self, model, params,
+                normalized_cov_params=normalized_cov_params, scale=scale)
+        self.family = model.family
+        self.nobs = model.nobs
+        self.df_resid = model.df_resid
+        self.df_model = model.df_model
+        self._cache = resettable_cache()
+        self._cache['deviance'] = deviance
+        self._cache['pearson_chi2'] = pearson_chi2
+
+    @cache_readonly
+    def llf(self):
+        return self.model.loglike(self.params, scale=self.scale)
+
+    @cache_readonly
+    def null_deviance(self):
+        def null_chunks():
+            for chunk in _iter_chunks(self.model._chunks):
+                chunk = list(chunk)
+                chunk[1] = np.ones((len(chunk[1]), 1))
+                yield tuple(chunk)
+        null_model = ChunkedGLM(null_chunks, family=self.family)
+        return null_model.fit().deviance
@@ -19,8 +19,10 @@ McCullagh, P. and Nelder, J.A.  1989.  "Generalized Linear Models." 2nd ed.
 """
 
 import numpy as np
+from scipy.linalg import cho_factor, cho_solve
 import families
-from statsmodels.tools.tools import rank
+from statsmodels.tools.tools import (rank, _is_sparse, _matvec, _rmatvec,
+                                     _xtwx, _solve, _DeferredInverse)
 from statsmodels.tools.decorators import (cache_readonly,
         resettable_cache)
 
@@ -33,9 +35,64 @@ from statsmodels.tools.sm_exceptions import PerfectSeparationError
 __all__ = ['GLM']
 
 def _check_convergence(criterion, iteration, tol, maxiter):
-    return not ((np.fabs(criterion[iteration] - criterion[iteration-1]) > tol)
+    # criterion[-1] is the deviance of the current iteration, the deviances
+    # of the two previous iterations are compared
+    return not ((np.fabs(criterion[-2] - criterion[-3]) > tol)
             and iteration <= maxiter)
 
+def _irls_wls(exog, wlsendog, weights, wexog):
+    """
+    Weighted least squares step of IRLS
+
+    Parameters
+    ----------
+    exog : array
+        design matrix
+    wlsendog : array
+        working response, overwritten with the whitened response
+    weights : array
+        IRLS weights
+    wexog : array
+        buffer with the shape of exog, overwritten with the whitened design.
+        Not used if exog is sparse.
+
+    Returns
+    -------
+    params : array
+        weighted least squares estimate
+    factor : tuple
+        Cholesky factor of wexog'wexog as returned by cho_factor, or
+        (None, normalized_cov_params) if the pinv of wexog was used, or
+        (xtx, None) with the sparse matrix wexog'wexog if exog is sparse.
+
+    Notes
+    -----
+    The normal equations are solved with a Cholesky decomposition. If the
+    whitened design is not of full rank or is badly conditioned, the pinv
+    of the whitened design is used as in WLS.
+
+    If exog is a scipy.sparse matrix, the weighted cross-products are sparse
+    and the normal equations are solved with a sparse LU decomposition.
+    """
+    if _is_sparse(exog):
+        xtx = _xtwx(exog, weights)
+        return _solve(xtx, _rmatvec(exog, weights * wlsendog)), (xtx, None)
+    sqrt_w = np.sqrt(weights)
+    np.multiply(exog, sqrt_w[:,None], wexog)
+    wlsendog *= sqrt_w
+    xtx = np.dot(wexog.T, wexog)
+    xty = np.dot(wexog.T, wlsendog)
+    try:
+        factor = cho_factor(xtx, overwrite_a=True)
+        diag = np.abs(np.diag(factor[0]))
+        if not diag.min() > 1e-7 * diag.max():
+            raise np.linalg.LinAlgError
+    except np.linalg.LinAlgError:
+        pinv_wexog = np.linalg.pinv(wexog)
+        params = np.dot(pinv_wexog, wlsendog)
+        return params, (None, np.dot(pinv_wexog, pinv_wexog.T))
+    return cho_solve(factor, xty), factor
+
 class GLM(base.LikelihoodModel):
     __doc__ = '''
     Generalized Linear Models class
@@ -197,6 +254,42 @@ class GLM(base.LikelihoodModel):
         self._data_attr.extend(['weights', 'pinv_wexog', 'mu', 'data_weights',
                                 ])
 
+    def _get_init_kwds(self):
+        kwds = {'family' : self.family}
+        if hasattr(self, 'offset'):
+            kwds['offset'] = self.offset
+        if hasattr(self, 'exposure'):
+            # exposure is kept as its log
+            kwds['exposure'] = np.exp(self.exposure)
+        return kwds
+
+    @classmethod
+    def from_chunks(cls, chunks, family=None):
+        """
+        Create a model that is estimated from a chunked data source.
+
+        Parameters
+        ----------
+        chunks : sequence or callable
+            Each element is a tuple (endog, exog) or (endog, exog, offset).
+            If `chunks` is a callable, it is called without arguments to get
+            a new iterator over the chunks.
+        family : family class instance
+            The default is Gaussian.
+
+        Returns
+        -------
+        model : ChunkedGLM instance
+            Its fit method runs IRLS with one pass over the data source per
+            iteration, without holding all the data in memory.
+
+        See Also
+        --------
+        statsmodels.genmod.chunked.ChunkedGLM
+        """
+        from statsmodels.genmod.chunked import ChunkedGLM
+        return ChunkedGLM(chunks, family=family)
+
     def initialize(self):
         """
         Initialize a generalized linear model.
@@ -206,12 +299,18 @@ class GLM(base.LikelihoodModel):
                         'params' : [np.inf],
                         'deviance' : [np.inf]}
 
-        self.pinv_wexog = np.linalg.pinv(self.exog)
-        self.normalized_cov_params = np.dot(self.pinv_wexog,
-                                        np.transpose(self.pinv_wexog))
+        if _is_sparse(self.exog):
+            # a sparse design is assumed to be of full column rank
+            self.pinv_wexog = None
+            exog_rank = self.exog.shape[1]
+        else:
+            self.pinv_wexog = np.linalg.pinv(self.exog)
+            self.normalized_cov_params = np.dot(self.pinv_wexog,
+                                            np.transpose(self.pinv_wexog))
+            exog_rank = rank(self.exog)
 
-        self.df_model = rank(self.exog)-1
-        self.df_resid = self.exog.shape[0] - rank(self.exog)
+        self.df_model = exog_rank - 1
+        self.df_resid = self.exog.shape[0] - exog_rank
 
     def _check_inputs(self, family, offset, exposure, endog):
         if family is None:
@@ -251,12 +350,18 @@ class GLM(base.LikelihoodModel):
         """
         raise NotImplementedError
 
-    def _update_history(self, tmp_result, mu, history):
+    def _update_history(self, params, mu, history, store_history=True):
         """
         Helper method to update history during iterative fit.
+
+        If store_history is False, only the last params and the last three
+        deviances, which are needed for the convergence check, are kept.
         """
-        history['params'].append(tmp_result.params)
+        history['params'].append(params)
         history['deviance'].append(self.family.deviance(self.endog, mu))
+        if not store_history:
+            del history['params'][:-1]
+            del history['deviance'][:-3]
         return history
 
     def estimate_scale(self, mu):
@@ -333,12 +438,42 @@ class GLM(base.LikelihoodModel):
         if exog is None:
             exog = self.exog
         if linear:
-            return np.dot(exog, params) + offset + exposure
+            return _matvec(exog, params) + offset + exposure
         else:
-            return self.family.fitted(np.dot(exog, params) + exposure + \
+            return self.family.fitted(_matvec(exog, params) + exposure + \
                                                              offset)
 
-    def fit(self, maxiter=100, method='IRLS', tol=1e-8, scale=None):
+    def _setup_fit(self):
+        """
+        Sets data_weights, initializes endog for the Binomial family and
+        returns the offset.
+        """
+        endog = self.endog
+        if endog.ndim > 1 and endog.shape[1] == 2:
+            data_weights = endog.sum(1) # weights are total trials
+        else:
+            data_weights = np.ones((endog.shape[0]))
+        self.data_weights = data_weights
+        if np.shape(self.data_weights) == () and self.data_weights>1:
+            self.data_weights = self.data_weights *\
+                    np.ones((endog.shape[0]))
+        if isinstance(self.family, families.Binomial):
+        # this checks what kind of data is given for Binomial.
+        # family will need a reference to endog if this is to be removed from
+        # preprocessing
+            self.endog = self.family.initialize(self.endog)
+
+        if hasattr(self, 'offset'):
+            offset = self.offset
+        elif hasattr(self, 'exposure'):
+            offset = self.exposure
+        else:
+            offset = 0
+        #TODO: would there ever be both and exposure and an offset?
+        return offset
+
+    def fit(self, maxiter=100, method='IRLS', tol=1e-8, scale=None,
+            start_params=None, store_history=True):
         '''
         Fits a generalized linear model for a given family.
 
@@ -358,34 +493,42 @@ class GLM(base.LikelihoodModel):
             `dev` is the deviance divided by df_resid
         tol : float
             Convergence tolerance.  Default is 1e-8.
+        start_params : array-like, optional
+            Starting values for the parameters, for example the estimates of
+            a previous fit. The default uses the starting values of the mean,
+            `family.starting_mu`. Refitting after a small change in the data
+            usually converges in two iterations.
+        store_history : bool
+            If True (default), the params and deviance of all iterations are
+            stored in `fit_history`. If False, only the values of the last
+            iterations are kept.
+
+        Notes
+        -----
+        Each iteration solves the weighted least squares problem with a
+        Cholesky decomposition of the weighted normal equations, the whitened
+        design is kept in a buffer that is reused in all iterations. The
+        scale is estimated once after convergence.
+
+        If exog is a scipy.sparse matrix, the weighted cross-products are
+        sparse and solved with a sparse LU decomposition, so that the memory
+        in the iterations is proportional to the number of nonzero elements.
+        The design is assumed to be of full rank. The dense k x k
+        normalized_cov_params is only computed when it is used, for example
+        by bse or cov_params.
         '''
         endog = self.endog
-        if endog.ndim > 1 and endog.shape[1] == 2:
-            data_weights = endog.sum(1) # weights are total trials
-        else:
-            data_weights = np.ones((endog.shape[0]))
-        self.data_weights = data_weights
-        if np.shape(self.data_weights) == () and self.data_weights>1:
-            self.data_weights = self.data_weights *\
-                    np.ones((endog.shape[0]))
         self.scaletype = scale
-        if isinstance(self.family, families.Binomial):
-        # this checks what kind of data is given for Binomial.
-        # family will need a reference to endog if this is to be removed from
-        # preprocessing
-            self.endog = self.family.initialize(self.endog)
+        offset = self._setup_fit()
+        data_weights = self.data_weights
 
-        if hasattr(self, 'offset'):
-            offset = self.offset
-        elif hasattr(self, 'exposure'):
-            offset = self.exposure
+        exog = self.exog
+        if start_params is None:
+            mu = self.family.starting_mu(self.endog)
+            eta = self.family.predict(mu)
         else:
-            offset = 0
-        #TODO: would there ever be both and exposure and an offset?
-
-        mu = self.family.starting_mu(self.endog)
-        wlsexog = self.exog
-        eta = self.family.predict(mu)
+            eta = _matvec(exog, start_params) + offset
+            mu = self.family.fitted(eta)
         dev = self.family.deviance(self.endog, mu)
         if np.isnan(dev):
             raise ValueError("The first guess on the deviance function "
@@ -399,15 +542,19 @@ class GLM(base.LikelihoodModel):
         iteration = 0
         converged = 0
         criterion = history['deviance']
+        if _is_sparse(exog):
+            wexog = None
+        else:
+            wexog = np.empty(exog.shape)
         while not converged:
             self.weights = data_weights*self.family.weights(mu)
             wlsendog = eta + self.family.link.deriv(mu) * (self.endog-mu) \
                 - offset
-            wls_results = lm.WLS(wlsendog, wlsexog, self.weights).fit()
-            eta = np.dot(self.exog, wls_results.params) + offset
+            params, factor = _irls_wls(exog, wlsendog, self.weights, wexog)
+            eta = _matvec(exog, params) + offset
             mu = self.family.fitted(eta)
-            history = self._update_history(wls_results, mu, history)
-            self.scale = self.estimate_scale(mu)
+            history = self._update_history(params, mu, history,
+                                           store_history)
             iteration += 1
             if endog.squeeze().ndim == 1 and np.allclose(mu - endog, 0):
                 msg = "Perfect separation detected, results not available"
@@ -415,13 +562,147 @@ class GLM(base.LikelihoodModel):
             converged = _check_convergence(criterion, iteration, tol,
                                             maxiter)
         self.mu = mu
-        glm_results = GLMResults(self, wls_results.params,
-                                 wls_results.normalized_cov_params,
+        self.scale = self.estimate_scale(mu)
+        if factor[0] is None:
+            normalized_cov_params = factor[1]
+        elif factor[1] is None:
+            normalized_cov_params = _DeferredInverse(factor[0])
+        else:
+            normalized_cov_params = cho_solve(factor, np.eye(len(params)))
+        glm_results = GLMResults(self, params, normalized_cov_params,
                                  self.scale)
         history['iteration'] = iteration
         glm_results.fit_history = history
         return GLMResultsWrapper(glm_results)
 
+    def fit_regularized(self, alpha=0., L1_wt=1., penalty_weights=None,
+                        start_params=None, maxiter=100, tol=1e-8,
+                        scale=None):
+        """
+        Fit the model with an elastic net penalty.
+
+        Parameters
+        ----------
+        alpha : float
+            Non-negative weight of the penalty.
+        L1_wt : float
+            Weight of the l1 part of the penalty, between 0 and 1. 1 is the
+            lasso and 0 is ridge regression.
+        penalty_weights : array-like, optional
+            Non-negative weight of each parameter in the penalty. Parameters
+            with weight zero, e.g. the constant, are not penalized. The
+            default is one for all parameters.
+        start_params : array-like, optional
+            Starting values for the parameters. The default is zeros.
+        maxiter : int
+            Maximum number of proximal Newton iterations.
+        tol : float
+            Convergence tolerance for the relative change of the penalized
+            objective.
+        scale : string or float, optional
+            The scale of the results, see fit.
+
+        Returns
+        -------
+        A GLMResults class instance without the covariance of the
+        parameters. `fit_history` contains the number of iterations and
+        whether the solver converged.
+
+        Notes
+        -----
+        The estimates minimize
+
+        .. math:: \\frac{1}{2n}D(\\beta) +
+                  \\alpha\\sum_k w_k\\left(L1_{wt}|\\beta_k| +
+                  \\frac{1 - L1_{wt}}{2}\\beta_k^2\\right)
+
+        where D is the deviance and n is the number of observations. For
+        the Gaussian family with the identity link the estimates are the
+        ones of OLS.fit_regularized.
+
+        Each iteration minimizes the penalized quadratic approximation of
+        IRLS by coordinate descent, see statsmodels.base.elastic_net.
+        """
+        from statsmodels.base.elastic_net import fit_elastic_net
+        self._setup_fit()
+        params, iteration, converged = fit_elastic_net(self, alpha,
+                L1_wt=L1_wt, penalty_weights=penalty_weights,
+                start_params=start_params, maxiter=maxiter, tol=tol)
+        self.mu = self.predict(params)
+        self.scaletype = scale
+        self.scale = self.estimate_scale(self.mu)
+        glm_results = GLMResults(self, params, None, self.scale)
+        glm_results.fit_history = dict(iteration=iteration,
+                                       converged=converged)
+        return GLMResultsWrapper(glm_results)
+
+    def fit_regularized_path(self, alphas=None, L1_wt=1., n_alphas=50,
+                             alpha_min_ratio=1e-3, penalty_weights=None,
+                             start_params=None, cv=None, maxiter=100,
+                             tol=1e-8, path_tol=1e-5):
+        """
+        Fit the model with an elastic net penalty for a path of alphas.
+
+        See statsmodels.regression.linear_model.RegressionModel.
+        fit_regularized_path for the parameters. The path is stopped early
+        if the relative change of the deviance is less than `path_tol`, and
+        the cross-validation error is the deviance per observation of the
+        test samples.
+
+        Returns
+        -------
+        statsmodels.base.elastic_net.ElasticNetPathResults instance
+
+        Notes
+        -----
+        Cross-validation is not available for the Binomial family with the
+        number of trials in endog.
+        """
+        from statsmodels.base.elastic_net import fit_elastic_net_path
+        self._setup_fit()
+        if cv is not None and np.shape(getattr(self.family, 'n', 1)) != ():
+            raise ValueError("cross-validation is not available for the "
+                             "Binomial family with the number of trials")
+        return fit_elastic_net_path(self, alphas=alphas, L1_wt=L1_wt,
+                n_alphas=n_alphas, alpha_min_ratio=alpha_min_ratio,
+                penalty_weights=penalty_weights, start_params=start_params,
+                cv=cv, maxiter=maxiter, tol=tol, path_tol=path_tol)
+
+    def _offset(self):
+        # offset and exposure as in predict
+        return getattr(self, 'offset', 0) + getattr(self, 'exposure', 0)
+
+    def _elastic_net_loss(self, test=None):
+        """
+        Deviance loss without the observations in the boolean index test.
+        """
+        from statsmodels.base.elastic_net import _GLMLoss
+        endog, exog = self.endog, self.exog
+        offset, data_weights = self._offset(), self.data_weights
+        if test is not None:
+            train = np.nonzero(~test)[0]
+            endog, exog, data_weights = (endog[train], exog[train],
+                                         data_weights[train])
+            if np.shape(offset) != ():
+                offset = offset[train]
+        return _GLMLoss(self.family, endog, exog, offset, data_weights)
+
+    def _elastic_net_cv_error(self, params, test):
+        """
+        Deviance per observation of the observations in test for each row
+        of params.
+        """
+        from statsmodels.base.elastic_net import _deviance
+        test = np.nonzero(test)[0]
+        endog, exog = self.endog[test], self.exog[test]
+        offset = self._offset()
+        if np.shape(offset) != ():
+            offset = offset[test]
+        eta = _matvec(exog, params.T) + np.reshape(offset, (-1, 1))
+        mu = self.family.fitted(eta)
+        return np.array([_deviance(self.family, endog, mu[:,i])
+                         for i in range(len(params))]) / len(test)
+
 class GLMResults(base.LikelihoodModelResults):
     '''
     Class to contain GLM results.
@@ -587,7 +868,7 @@ class GLMResults(base.LikelihoodModelResults):
         _modelfamily = self.family
         if isinstance(_modelfamily, families.NegativeBinomial):
             val = _modelfamily.loglike(self.model.endog,
-                        fittedvalues = np.dot(self.model.exog,self.params))
+                        fittedvalues = _matvec(self.model.exog, self.params))
         else:
             val = _modelfamily.loglike(self._endog, self.mu,
                                     scale=self.scale)
@@ -0,0 +1,137 @@
+"""
+Tests for BatchedGLM against GLM fitted to each group
+"""
+import numpy as np
+from numpy.testing import (assert_allclose, assert_equal, assert_raises,
+                           assert_)
+import statsmodels.api as sm
+from statsmodels.genmod.generalized_linear_model import GLM
+from statsmodels.genmod.batched import BatchedGLM
+
+
+class CheckBatchedGLM(object):
+
+    def test_groups(self):
+        res1 = self.res1
+        assert_(res1.converged.all())
+        for g, (endog, exog, kwds) in enumerate(self.group_data):
+            res2 = GLM(endog, exog, family=self.family, **kwds).fit()
+            assert_allclose(res1.params[g], res2.params, rtol=1e-7)
+            assert_allclose(res1.bse[g], res2.bse, rtol=1e-7)
+            assert_allclose(res1.normalized_cov_params[g],
+                            res2.normalized_cov_params, rtol=1e-7)
+            for attr in ['scale', 'deviance', 'llf', 'aic', 'bic',
+                         'pearson_chi2']:
+                assert_allclose(getattr(res1, attr)[g], getattr(res2, attr),
+                                rtol=1e-7, err_msg=attr)
+            assert_equal(res1.iterations[g], res2.fit_history['iteration'])
+            assert_equal(res1.df_resid[g], res2.df_resid)
+
+
+class TestBatchedPoisson(CheckBatchedGLM):
+    @classmethod
+    def setupClass(cls):
+        np.random.seed(9876789)
+        nobs = 400
+        groups = np.random.randint(0, 7, size=nobs) * 10
+        exog = sm.add_constant(np.random.uniform(-1, 1, size=(nobs, 2)))
+        exposure = np.random.uniform(1, 3, size=nobs)
+        mu = exposure * np.exp(np.dot(exog, [0.5, 1., -0.5]) + groups / 50.)
+        endog = np.random.poisson(mu)
+        cls.family = sm.families.Poisson()
+        cls.res1 = BatchedGLM(endog, exog, groups=groups, family=cls.family,
+                              exposure=exposure).fit()
+        cls.group_data = [(endog[groups == g], exog[groups == g],
+                           dict(exposure=exposure[groups == g]))
+                          for g in np.unique(groups)]
+
+    def test_fittedvalues(self):
+        res1 = self.res1
+        for g, (endog, exog, kwds) in enumerate(self.group_data):
+            mask = self.res1.model._sort_idx[res1.model._group_start[g]:
+                                             res1.model._group_stop[g]]
+            res2 = GLM(endog, exog, family=self.family, **kwds).fit()
+            assert_allclose(np.sort(res1.fittedvalues[mask]),
+                            np.sort(res2.fittedvalues), rtol=1e-7)
+
+
+class TestBatchedGammaStack(CheckBatchedGLM):
+    @classmethod
+    def setupClass(cls):
+        np.random.seed(12345)
+        n_groups, nobs = 5, 60
+        exog = np.random.uniform(0, 1, size=(n_groups, nobs, 2))
+        exog[:,:,0] = 1
+        mu = np.exp(np.dot(exog, [1., 0.5]))
+        endog = np.random.gamma(2, mu / 2.)
+        cls.family = sm.families.Gamma(link=sm.families.links.log)
+        cls.res1 = BatchedGLM(endog, exog, family=cls.family).fit()
+        cls.group_data = [(endog[g], exog[g], {}) for g in range(n_groups)]
+
+
+class TestBatchedBinomial(CheckBatchedGLM):
+    @classmethod
+    def setupClass(cls):
+        np.random.seed(54321)
+        nobs = 300
+        groups = np.random.randint(0, 4, size=nobs)
+        exog = sm.add_constant(np.random.randn(nobs, 2))
+        prob = 1 / (1 + np.exp(-np.dot(exog, [0.2, 1., -1.])))
+        endog = (np.random.uniform(size=nobs) < prob).astype(float)
+        cls.family = sm.families.Binomial()
+        cls.res1 = BatchedGLM(endog, exog, groups=groups,
+                              family=cls.family).fit()
+        cls.group_data = [(endog[groups == g], exog[groups == g], {})
+                          for g in range(4)]
+
+
+class TestBatchedGaussian(CheckBatchedGLM):
+    @classmethod
+    def setupClass(cls):
+        np.random.seed(2468)
+        nobs = 200
+        groups = np.random.randint(0, 5, size=nobs)
+        exog = sm.add_constant(np.random.randn(nobs, 2))
+        endog = np.dot(exog, [1., 0.5, -0.5]) + groups + np.random.randn(nobs)
+        cls.family = sm.families.Gaussian()
+        cls.res1 = BatchedGLM(endog, exog, groups=groups,
+                              family=cls.family).fit()
+        cls.group_data = [(endog[groups == g], exog[groups == g], {})
+                          for g in range(5)]
+
+
+class TestBatchedNegativeBinomial(CheckBatchedGLM):
+    @classmethod
+    def setupClass(cls):
+        np.random.seed(13579)
+        nobs = 300
+        groups = np.random.randint(0, 3, size=nobs)
+        exog = sm.add_constant(np.random.uniform(-1, 1, size=(nobs, 1)))
+        mu = np.exp(np.dot(exog, [1., 0.5]))
+        endog = np.random.negative_binomial(2, 2. / (2 + mu))
+        cls.family = sm.families.NegativeBinomial(alpha=0.5)
+        cls.res1 = BatchedGLM(endog, exog, groups=groups,
+                              family=cls.family).fit()
+        cls.group_data = [(endog[groups == g], exog[groups == g], {})
+                          for g in range(3)]
+
+
+def test_singular_group():
+    np.random.seed(987)
+    exog = sm.add_constant(np.random.randn(40, 1))
+    groups = np.repeat([0, 1], 20)
+    # second regressor constant within group 1
+    exog[20:, 1] = 2.
+    endog = np.dot(exog, [1., 2.]) + np.random.randn(40)
+    res = BatchedGLM(endog, exog, groups=groups).fit()
+    assert_equal(res.converged, [True, False])
+    assert_(np.isnan(res.params[1]).all())
+    res2 = GLM(endog[:20], exog[:20]).fit()
+    assert_allclose(res.params[0], res2.params, rtol=1e-10)
+
+
+def test_invalid():
+    exog = np.ones((10, 2))
+    endog = np.ones(10)
+    assert_raises(ValueError, BatchedGLM, endog, exog)
+    assert_raises(ValueError, BatchedGLM, endog, exog[None], groups=endog)
@@ -0,0 +1,107 @@
+"""
+Tests for GLM estimated from chunked data
+"""
+import numpy as np
+from numpy.testing import (assert_allclose, assert_equal, assert_raises,
+                           assert_)
+import statsmodels.api as sm
+from statsmodels.genmod.generalized_linear_model import GLM
+
+
+def _chunked(step, *arrs):
+    nobs = len(arrs[0])
+    return [tuple(arr[i:i+step] for arr in arrs) for i in range(0, nobs, step)]
+
+
+class CheckChunkedGLM(object):
+
+    def test_params(self):
+        assert_allclose(self.res1.params, self.res2.params, rtol=1e-8)
+
+    def test_bse(self):
+        assert_allclose(self.res1.bse, self.res2.bse, rtol=1e-8)
+        assert_allclose(self.res1.normalized_cov_params,
+                        self.res2.normalized_cov_params, rtol=1e-6)
+
+    def test_fit_stats(self):
+        res1, res2 = self.res1, self.res2
+        for attr in ['scale', 'deviance', 'pearson_chi2', 'llf', 'aic',
+                     'bic', 'null_deviance']:
+            assert_allclose(getattr(res1, attr), getattr(res2, attr),
+                            rtol=1e-7, err_msg=attr)
+        for attr in ['nobs', 'df_model', 'df_resid']:
+            assert_equal(getattr(res1, attr), getattr(res2, attr))
+        assert_equal(res1.fit_history['iteration'],
+                     res2.fit_history['iteration'])
+        assert_allclose(res1.fit_history['deviance'][1:],
+                        res2.fit_history['deviance'][1:], rtol=1e-8)
+
+    def test_conf_int(self):
+        # The endpoints are params -+ q * bse. An endpoint close to zero has
+        # no relative accuracy, so the difference is measured relative to
+        # the half-width of the interval, with the precision of params and
+        # bse.
+        conf_int1 = np.asarray(self.res1.conf_int())
+        conf_int2 = np.asarray(self.res2.conf_int())
+        half_width = (conf_int2[:,1] - conf_int2[:,0])[:,None] / 2.
+        assert_allclose((conf_int1 - conf_int2) / half_width, 0, atol=1e-8)
+
+
+class TestChunkedPoisson(CheckChunkedGLM):
+    @classmethod
+    def setupClass(cls):
+        np.random.seed(9876789)
+        nobs = 1000
+        exog = sm.add_constant(np.random.uniform(-1, 1, size=(nobs, 2)))
+        offset = np.log(np.random.uniform(1, 3, size=nobs))
+        endog = np.random.poisson(np.exp(np.dot(exog, [0.5, 1., -0.5]) +
+                                         offset))
+        family = sm.families.Poisson()
+        chunks = _chunked(128, endog, exog, offset)
+        cls.res1 = GLM.from_chunks(chunks, family=family).fit()
+        cls.res2 = GLM(endog, exog, family=family, offset=offset).fit()
+
+
+class TestChunkedGamma(CheckChunkedGLM):
+    @classmethod
+    def setupClass(cls):
+        data = sm.datasets.scotland.load()
+        exog = sm.add_constant(data.exog, prepend=False)
+        chunks = lambda: iter(_chunked(7, data.endog, exog))
+        family = sm.families.Gamma()
+        cls.res1 = GLM.from_chunks(chunks, family=family).fit()
+        cls.res2 = GLM(data.endog, exog, family=family).fit()
+
+
+class TestChunkedBinomial(CheckChunkedGLM):
+    @classmethod
+    def setupClass(cls):
+        data = sm.datasets.star98.load()
+        exog = sm.add_constant(data.exog, prepend=False)
+        chunks = _chunked(50, data.endog, exog)
+        cls.res1 = GLM.from_chunks(chunks,
+                                   family=sm.families.Binomial()).fit()
+        cls.res2 = GLM(data.endog, exog, family=sm.families.Binomial()).fit()
+
+    def test_family_unchanged(self):
+        # the number of trials of the chunks is not kept in the family
+        assert_equal(self.res1.model.family.n, 1)
+
+
+def test_pandas_names():
+    import pandas
+    data = sm.datasets.scotland.load_pandas()
+    exog = sm.add_constant(data.exog, prepend=False)
+    chunks = _chunked(8, data.endog, exog)
+    res1 = GLM.from_chunks(chunks, family=sm.families.Gamma()).fit()
+    res2 = GLM(data.endog, exog, family=sm.families.Gamma()).fit()
+    assert_(isinstance(res1.params, pandas.Series))
+    assert_equal(list(res1.params.index), list(res2.params.index))
+    assert_allclose(res1.bse, res2.bse, rtol=1e-8)
+
+
+def test_generator_invalid():
+    endog = np.ones(10)
+    exog = np.ones((10, 1))
+    chunks = (chunk for chunk in _chunked(5, endog, exog))
+    assert_raises(ValueError, GLM.from_chunks, chunks)
@@ -4,7 +4,8 @@ Test functions for models.GLM
 """
 import os
 import numpy as np
-from numpy.testing import assert_almost_equal, assert_equal, assert_raises
+from numpy.testing import (assert_almost_equal, assert_equal, assert_raises,
+                           assert_)
 from scipy import stats
 import statsmodels.api as sm
 from statsmodels.genmod.generalized_linear_model import GLM
@@ -521,6 +522,108 @@ def test_attribute_writable_resettable():
     glm_model2 = sm.GLM(endog, exog)
     assert_equal(glm_model2.family.link.power, 1.0)
 
+def test_start_params_history():
+    data = sm.datasets.scotland.load()
+    exog = add_constant(data.exog, prepend=False)
+    mod = GLM(data.endog, exog, family=sm.families.Gamma())
+    res1 = mod.fit()
+    assert_equal(len(res1.fit_history['deviance']),
+                 res1.fit_history['iteration'] + 2)
+
+    # warm start at the solution
+    res2 = mod.fit(start_params=res1.params)
+    assert_equal(res2.fit_history['iteration'], 2)
+    assert_almost_equal(res2.params, res1.params, 10)
+    assert_almost_equal(res2.bse, res1.bse, 10)
+    assert_almost_equal(res2.scale, res1.scale, 10)
+
+    # refit after a small change in the data
+    endog = data.endog.copy()
+    endog[0] *= 1.01
+    res3 = GLM(endog, exog, family=sm.families.Gamma()).fit()
+    res4 = GLM(endog, exog, family=sm.families.Gamma()).fit(
+                                            start_params=res1.params)
+    assert_(res4.fit_history['iteration'] < res3.fit_history['iteration'])
+    assert_almost_equal(res4.params, res3.params, 8)
+
+    res5 = mod.fit(store_history=False)
+    assert_equal(res5.fit_history['iteration'],
+                 res1.fit_history['iteration'])
+    assert_equal(len(res5.fit_history['deviance']), 3)
+    assert_equal(len(res5.fit_history['params']), 1)
+    assert_almost_equal(res5.params, res1.params, 14)
+
+
+def test_irls_rank_deficient():
+    # the pinv of the whitened design is used if it is singular
+    np.random.seed(12345)
+    exog = add_constant(np.random.randn(50, 2), prepend=False)
+    exog = np.column_stack((exog, exog[:,0] + exog[:,1]))
+    endog = np.random.poisson(np.exp(np.dot(exog[:,:3], [0.2, -0.2, 1.])))
+    res1 = GLM(endog, exog, family=sm.families.Poisson()).fit()
+    res2 = GLM(endog, exog[:,:3], family=sm.families.Poisson()).fit()
+    assert_almost_equal(res1.fittedvalues, res2.fittedvalues, 8)
+    assert_almost_equal(res1.deviance, res2.deviance, 8)
+
+def test_sparse_exog():
+    from scipy import sparse
+    from statsmodels.tools.grouputils import dummy_sparse
+    from statsmodels.tools.tools import _DeferredInverse
+    np.random.seed(12345)
+    groups = np.random.randint(0, 20, size=300)
+    x = np.random.randn(300)
+    exog = sparse.hstack((dummy_sparse(groups), sparse.csr_matrix(x[:,None])))
+    endog = np.random.poisson(np.exp(groups / 20. + 0.3 * x))
+    res1 = GLM(endog, exog.toarray(), family=sm.families.Poisson()).fit()
+    res2 = GLM(endog, exog, family=sm.families.Poisson()).fit()
+    # the dense inverse is not computed in fit
+    assert_(isinstance(res2._results._normalized_cov_params,
+                       _DeferredInverse))
+    assert_almost_equal(res2.params, res1.params, 12)
+    assert_almost_equal(res2.bse, res1.bse, 12)
+    assert_almost_equal(res2.deviance, res1.deviance, 10)
+    assert_almost_equal(res2.llf, res1.llf, 10)
+    assert_equal(res2.fit_history['iteration'],
+                 res1.fit_history['iteration'])
+
+def test_fit_regularized():
+    np.random.seed(12345)
+    nobs = 300
+    exog = add_constant(np.random.randn(nobs, 5), prepend=True)
+    linpred = np.dot(exog, [0.5, 0.5, -0.3, 0.2, 0, 0])
+    weights = np.array([0., 1, 1, 1, 1, 1])
+    # Gaussian GLM is OLS
+    endog = linpred + np.random.randn(nobs)
+    res1 = GLM(endog, exog).fit_regularized(alpha=0.1, L1_wt=0.5,
+                                            penalty_weights=weights)
+    res2 = sm.OLS(endog, exog).fit_regularized(alpha=0.1, L1_wt=0.5,
+                                               penalty_weights=weights)
+    assert_almost_equal(res1.params, res2.params, 12)
+    # the lasso of Logit has alpha on the scale of the loglikelihood
+    endog = (np.random.rand(nobs) < 1 / (1 + np.exp(-linpred))) * 1.
+    res1 = GLM(endog, exog, family=sm.families.Binomial()).fit_regularized(
+            alpha=0.02, penalty_weights=weights, tol=1e-12)
+    res2 = sm.Logit(endog, exog).fit_regularized(alpha=0.02 * nobs * weights,
+            disp=0, trim_mode='size', acc=1e-12)
+    assert_almost_equal(res1.params, res2.params, DECIMAL_4)
+    assert_(res1.fit_history['converged'])
+    # without penalty the estimates are the ones of fit
+    endog = np.random.poisson(np.exp(linpred))
+    offset = np.random.uniform(0, 0.1, size=nobs)
+    model = GLM(endog, exog, family=sm.families.Poisson(), offset=offset)
+    res1 = model.fit_regularized(alpha=0, tol=1e-12)
+    res2 = model.fit()
+    assert_almost_equal(res1.params, res2.params, 10)
+    assert_almost_equal(res1.deviance, res2.deviance, 8)
+    res = model.fit_regularized_path(penalty_weights=weights, n_alphas=10,
+                                     path_tol=0, cv=3)
+    assert_(res.converged.all())
+    assert_equal(res.nnz_params[0], 1)
+    assert_almost_equal(res.params[5], model.fit_regularized(
+            alpha=res.alphas[5], penalty_weights=weights).params, 8)
+    assert_equal(res.cv_error.shape, (10,))
+    assert_equal(res.alpha_cv, res.alphas[np.argmin(res.cv_error)])
+
 if __name__=="__main__":
     #run_module_suite()
     #taken from Fernando Perez:
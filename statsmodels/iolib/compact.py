@@ -0,0 +1,383 @@
+"""
+Compact binary format for fitted results
+
+The file stores only what is needed for inference on the parameters and for
+prediction with new exog: the parameters, their covariance matrix, scalar
+statistics, the names of the variables and the options of the model that
+predict uses, for example the family of a GLM. Data arrays, cached
+attributes and wrappers are not stored.
+
+Layout of the file
+
+==========  ==========================================================
+magic       8 bytes, ``\\x93SMCMPCT``
+version     2 unsigned bytes, major and minor format version
+header_len  4 byte little-endian unsigned int
+header      JSON, padded with spaces so that the arrays are aligned
+arrays      C-contiguous little-endian arrays, each starting at a
+            multiple of 64 bytes, at the offsets listed in the header
+==========  ==========================================================
+
+The header holds the dtype, shape and offset of each array, so the arrays
+can be memory-mapped and loading does not read them. Objects of the model
+options are stored as the class name and the attributes, only statsmodels
+classes are created when loading. The distributions of scipy.stats, for
+example of the probit link, are stored by name. Options that cannot be stored
+raise an exception when saving. Readers ignore header entries they do not
+know, a new major version is used for incompatible changes.
+"""
+import json
+import struct
+import numpy as np
+from scipy import stats
+from statsmodels.tools.decorators import cache_readonly
+
+_MAGIC = b'\x93SMCMPCT'
+FORMAT_VERSION = (1, 0)
+_PREAMBLE = struct.Struct('<BBI')
+_ALIGN = 64
+
+
+def _padding(size):
+    return -size % _ALIGN
+
+
+def _encode(value, nobs):
+    """
+    JSON representation of an option of the model. Returns None for arrays
+    with one element per observation, these are data and are not stored.
+    Raises ValueError for values that cannot be stored.
+    """
+    if value is None or isinstance(value, (bool, int, long, float,
+                                           basestring)):
+        return value
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        if value.ndim > 0 and value.shape[0] == nobs:
+            return None
+        if value.dtype.kind not in 'biuf':
+            raise ValueError("arrays of dtype %s cannot be stored" %
+                             value.dtype)
+        return {'__ndarray__' : value.tolist(), 'dtype' : value.dtype.str}
+    if isinstance(value, (list, tuple)):
+        return [_encode(item, nobs) for item in value]
+    if (isinstance(value, (stats.rv_continuous, stats.rv_discrete)) and
+            getattr(stats, value.name, None) is value):
+        return {'__scipy_dist__' : value.name}
+    cls = value.__class__
+    if cls.__module__.startswith('statsmodels.') and hasattr(value,
+                                                             '__dict__'):
+        state = {}
+        for key, item in value.__dict__.iteritems():
+            encoded = _encode(item, nobs)
+            if encoded is not None or item is None:
+                state[key] = encoded
+        return {'__class__' : cls.__module__ + '.' + cls.__name__,
+                'state' : state}
+    raise ValueError("%s instances cannot be stored in the compact format" %
+                     cls.__name__)
+
+
+def _import_class(name):
+    module, cls = name.rsplit('.', 1)
+    if not module.startswith('statsmodels.'):
+        raise ValueError("%s is not a statsmodels class" % name)
+    return getattr(__import__(module, fromlist=[cls]), cls)
+
+
+def _decode(value):
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if '__ndarray__' in value:
+        return np.array(value['__ndarray__'], dtype=value['dtype'])
+    if '__scipy_dist__' in value:
+        dist = getattr(stats, value['__scipy_dist__'], None)
+        if not isinstance(dist, (stats.rv_continuous, stats.rv_discrete)):
+            raise ValueError("%s is not a scipy.stats distribution" %
+                             value['__scipy_dist__'])
+        return dist
+    obj = object.__new__(_import_class(value['__class__']))
+    for key, item in value['state'].iteritems():
+        setattr(obj, str(key), _decode(item))
+    return obj
+
+
+def _scalar(results, name):
+    try:
+        value = getattr(results, name)
+    except Exception:
+        return None
+    if np.isscalar(value) or (isinstance(value, np.ndarray) and
+                              value.ndim == 0):
+        value = float(value)
+        if np.isfinite(value):
+            return value
+    return None
+
+
+def save_compact(results, fname):
+    """
+    Save the estimates of fitted results in the compact format
+
+    Parameters
+    ----------
+    results : LikelihoodModelResults instance
+    fname : str or file handle
+        name of the file or a file handle opened in binary mode
+
+    Raises
+    ------
+    ValueError
+        If an option of the model that predict may need cannot be stored,
+        for example a link function with a frozen scipy.stats distribution.
+
+    See Also
+    --------
+    load_compact
+    """
+    from statsmodels.regression.linear_model import RegressionResults
+    from statsmodels.iolib.smpickle import _get_file_obj
+    results = getattr(results, '_results', results)
+    model = results.model
+    if getattr(model, 'endog', None) is not None:
+        nobs = len(model.endog)
+    else:
+        nobs = int(getattr(results, 'nobs', -1))
+
+    arrays = {'params' : np.asarray(results.params)}
+    try:
+        arrays['cov_params'] = np.asarray(results.cov_params())
+        # some results, for example RLM, use another covariance for bse
+        arrays['bse'] = np.ravel(results.bse, order='F')
+    except Exception:
+        # no covariance, for example for regularized fits
+        pass
+
+    attrs = {}
+    for name in ['nobs', 'df_model', 'df_resid', 'scale', 'llf']:
+        value = _scalar(results, name)
+        if value is not None:
+            attrs[name] = value
+    attrs['use_t'] = isinstance(results, RegressionResults)
+
+    options = {}
+    for key, value in model._get_init_kwds().iteritems():
+        encoded = _encode(value, nobs)
+        if encoded is not None:
+            options[key] = encoded
+
+    cls = model.__class__
+    header = {'model_class' : cls.__module__ + '.' + cls.__name__,
+              'results_class' : results.__class__.__name__,
+              'exog_names' : model.exog_names,
+              'endog_names' : model.endog_names,
+              'attrs' : attrs,
+              'model_options' : options,
+              'arrays' : {}}
+
+    offset = 0
+    for name in sorted(arrays):
+        arr = np.ascontiguousarray(arrays[name])
+        arr = arr.astype(arr.dtype.newbyteorder('<'))
+        arrays[name] = arr
+        header['arrays'][name] = {'dtype' : arr.dtype.str,
+                                  'shape' : list(arr.shape),
+                                  'offset' : offset}
+        offset += arr.nbytes + _padding(arr.nbytes)
+
+    header = json.dumps(header, sort_keys=True).encode('ascii')
+    start = len(_MAGIC) + _PREAMBLE.size + len(header)
+    header += b' ' * _padding(start)
+
+    fh = _get_file_obj(fname, 'wb')
+    try:
+        fh.write(_MAGIC)
+        fh.write(_PREAMBLE.pack(FORMAT_VERSION[0], FORMAT_VERSION[1],
+                                len(header)))
+        fh.write(header)
+        for name in sorted(arrays):
+            arr = arrays[name]
+            fh.write(arr.data)
+            fh.write(b'\0' * _padding(arr.nbytes))
+    finally:
+        if fh is not fname:
+            fh.close()
+
+
+def load_compact(fname, mmap=True):
+    """
+    Load results saved in the compact format
+
+    Parameters
+    ----------
+    fname : str or file handle
+        name of the file or a file handle opened in binary mode
+    mmap : bool
+        If True and fname is a file name, the arrays are memory-mapped
+        read-only and are only read from disk when they are used.
+
+    Returns
+    -------
+    CompactResults instance
+
+    See Also
+    --------
+    save_compact
+    """
+    from statsmodels.iolib.smpickle import _get_file_obj
+    fh = _get_file_obj(fname, 'rb')
+    try:
+        if fh.read(len(_MAGIC)) != _MAGIC:
+            raise ValueError("not a file in the compact results format")
+        major, minor, header_len = _PREAMBLE.unpack(
+                                        fh.read(_PREAMBLE.size))
+        if major > FORMAT_VERSION[0]:
+            raise ValueError("format version %d.%d is not supported, the "
+                             "latest supported version is %d.%d" %
+                             ((major, minor) + FORMAT_VERSION))
+        header = json.loads(fh.read(header_len).decode('ascii'))
+        start = len(_MAGIC) + _PREAMBLE.size + header_len
+        use_mmap = mmap and fh is not fname
+        if not use_mmap:
+            data = fh.read()
+    finally:
+        if fh is not fname:
+            fh.close()
+
+    arrays = {}
+    for name, info in header['arrays'].iteritems():
+        dtype = np.dtype(str(info['dtype']))
+        shape = tuple(info['shape'])
+        if use_mmap:
+            arr = np.memmap(fname, dtype=dtype, mode='r', shape=shape,
+                            offset=start + info['offset'])
+        else:
+            count = int(np.prod(shape))
+            arr = np.frombuffer(data, dtype=dtype, count=count,
+                                offset=info['offset']).reshape(shape)
+        arrays[str(name)] = arr
+    return CompactResults(header, arrays)
+
+
+class CompactResults(object):
+    """
+    Fitted results loaded from the compact format
+
+    Attributes
+    ----------
+    params : array
+        the parameter estimates
+    model_class : str
+        module and name of the model class
+    results_class : str
+        name of the class of the saved results
+    exog_names : list
+        names of the explanatory variables
+    endog_names : str
+        name of the dependent variable
+    nobs, df_model, df_resid, scale, llf : float
+        the statistics of the saved results, None if they were not
+        available
+    model : Model instance
+        A model without data that has the options of the saved model. It is
+        used for predict and created when it is first used.
+
+    Notes
+    -----
+    The inference uses the t distribution with df_resid degrees of freedom
+    for regression models and the normal distribution otherwise, as the
+    results classes do.
+    """
+    def __init__(self, header, arrays):
+        self.model_class = header['model_class']
+        self.results_class = header['results_class']
+        self.exog_names = header['exog_names']
+        self.endog_names = header['endog_names']
+        self._options = header['model_options']
+        attrs = header['attrs']
+        for name in ['nobs', 'df_model', 'df_resid', 'scale', 'llf']:
+            setattr(self, name, attrs.get(name))
+        self.use_t = attrs.get('use_t', False)
+        self.params = arrays['params']
+        self._cov_params = arrays.get('cov_params')
+        self._bse = arrays.get('bse')
+
+    @cache_readonly
+    def model(self):
+        model = object.__new__(_import_class(self.model_class))
+        for key, value in self._options.iteritems():
+            setattr(model, str(key), _decode(value))
+        model.exog = model.endog = None
+        return model
+
+    def cov_params(self):
+        """
+        Covariance matrix of the parameter estimates
+        """
+        if self._cov_params is None:
+            raise ValueError("the covariance of the estimates was not saved")
+        return self._cov_params
+
+    @cache_readonly
+    def bse(self):
+        if self._bse is not None:
+            return self._bse
+        return np.sqrt(np.diag(self.cov_params()))
+
+    @cache_readonly
+    def tvalues(self):
+        return np.ravel(self.params, order='F') / self.bse
+
+    def _dist(self):
+        from scipy import stats
+        if self.use_t:
+            return stats.t(self.df_resid)
+        return stats.norm
+
+    @cache_readonly
+    def pvalues(self):
+        return 2 * self._dist().sf(np.abs(self.tvalues))
+
+    def conf_int(self, alpha=.05):
+        """
+        Confidence intervals of the parameters
+
+        Parameters
+        ----------
+        alpha : float
+            The intervals have coverage 1 - alpha.
+
+        Returns
+        -------
+        conf_int : array
+            lower and upper limits of the intervals in the two columns
+        """
+        q = self._dist().ppf(1 - alpha / 2.)
+        params = np.ravel(self.params, order='F')
+        return np.column_stack((params - q * self.bse, params + q * self.bse))
+
+    def predict(self, exog, *args, **kwargs):
+        """
+        Predicted values of the model for exog
+
+        Parameters
+        ----------
+        exog : array-like
+            The design matrix of the observations, with the columns in the
+            order of exog_names. Formulas are not applied.
+        args, kwargs
+            Further arguments of the predict method of the model, for
+            example offset or linear.
+
+        Returns
+        -------
+        predicted values : array
+        """
+        exog = np.asarray(exog)
+        if exog.ndim == 1 and len(self.exog_names) > 1:
+            exog = exog[None,:]
+        return self.model.predict(np.asarray(self.params), exog, *args,
+                                  **kwargs)
@@ -0,0 +1,136 @@
+"""
+Tests for the compact results format
+"""
+import os
+import tempfile
+import numpy as np
+from scipy import stats
+from numpy.testing import (assert_almost_equal, assert_equal, assert_,
+                           assert_raises)
+import statsmodels.api as sm
+from statsmodels.compatnp.py3k import BytesIO
+from statsmodels.iolib.compact import load_compact, save_compact
+
+
+def roundtrip(results):
+    fh = BytesIO()
+    results.save_compact(fh)
+    fh.seek(0)
+    return load_compact(fh)
+
+
+def check_results(res, res_compact, exog, predicted=None):
+    assert_equal(res_compact.params, res.params)
+    assert_almost_equal(res_compact.bse, np.ravel(res.bse, order='F'), 14)
+    assert_almost_equal(res_compact.pvalues,
+                        np.ravel(res.pvalues, order='F'), 14)
+    assert_almost_equal(res_compact.conf_int(),
+                        np.asarray(res.conf_int()).reshape(-1, 2), 14)
+    assert_equal(res_compact.exog_names, res.model.exog_names)
+    if predicted is None:
+        predicted = res.model.predict(res.params, exog)
+    assert_almost_equal(res_compact.predict(exog), predicted, 14)
+
+
+class TestCompact(object):
+    @classmethod
+    def setupClass(cls):
+        np.random.seed(98)
+        nobs = 200
+        exog = sm.add_constant(np.random.randn(nobs, 2), prepend=False)
+        cls.exog = exog
+        cls.exog_new = sm.add_constant(np.random.randn(10, 2), prepend=False)
+        linpred = np.dot(exog, [.5, -.5, .2])
+        cls.endog_normal = linpred + np.random.randn(nobs)
+        cls.endog_binary = (linpred + np.random.logistic(size=nobs) >
+                            0) * 1.
+        cls.endog_count = np.random.poisson(np.exp(linpred))
+
+    def test_ols(self):
+        res = sm.OLS(self.endog_normal, self.exog).fit()
+        res_compact = roundtrip(res)
+        check_results(res, res_compact, self.exog_new)
+        assert_equal(res_compact.df_resid, res.df_resid)
+        assert_almost_equal(res_compact.llf, res.llf, 12)
+        assert_(res_compact.use_t)
+
+    def test_wls(self):
+        weights = np.random.uniform(1, 2, size=len(self.endog_normal))
+        res = sm.WLS(self.endog_normal, self.exog, weights=weights).fit()
+        check_results(res, roundtrip(res), self.exog_new)
+
+    def test_glm(self):
+        offset = np.random.uniform(size=len(self.endog_count))
+        res = sm.GLM(self.endog_count, self.exog,
+                     family=sm.families.Poisson(), offset=offset).fit()
+        res_compact = roundtrip(res)
+        # the offset of the estimation sample is not used for new exog
+        check_results(res, res_compact, self.exog_new,
+                      np.exp(np.dot(self.exog_new, res.params)))
+        assert_(isinstance(res_compact.model.family, sm.families.Poisson))
+        assert_(not hasattr(res_compact.model, 'offset'))
+        assert_(not res_compact.use_t)
+
+    def test_glm_probit(self):
+        links = sm.families.links
+        res = sm.GLM(self.endog_binary, self.exog,
+                     family=sm.families.Binomial(links.probit)).fit()
+        res_compact = roundtrip(res)
+        check_results(res, res_compact, self.exog_new)
+        assert_(res_compact.model.family.link.dbn is stats.norm)
+
+        # a frozen distribution is not stored by name
+        class scaled_probit(links.probit):
+            def __init__(self):
+                self.dbn = stats.norm(scale=2.)
+        res = sm.GLM(self.endog_binary, self.exog,
+                     family=sm.families.Binomial(scaled_probit)).fit()
+        assert_raises(ValueError, res.save_compact, BytesIO())
+
+    def test_logit(self):
+        res = sm.Logit(self.endog_binary, self.exog).fit(disp=0)
+        check_results(res, roundtrip(res), self.exog_new)
+
+    def test_mnlogit(self):
+        endog = self.endog_binary + (self.endog_normal > 1)
+        res = sm.MNLogit(endog, self.exog).fit(disp=0)
+        check_results(res, roundtrip(res), self.exog_new)
+
+    def test_negativebinomial(self):
+        res = sm.NegativeBinomial(self.endog_count, self.exog).fit(disp=0)
+        res_compact = roundtrip(res)
+        assert_equal(res_compact.model.loglike_method, 'nb2')
+        check_results(res, res_compact, self.exog_new)
+
+    def test_rlm(self):
+        res = sm.RLM(self.endog_normal, self.exog).fit()
+        check_results(res, roundtrip(res), self.exog_new)
+
+    def test_file(self):
+        res = sm.OLS(self.endog_normal, self.exog).fit()
+        tmpdir = tempfile.mkdtemp(prefix='compact')
+        fname = os.path.join(tmpdir, 'res.smc')
+        res.save_compact(fname)
+        res_compact = res.load_compact(fname)
+        assert_(isinstance(res_compact.params, np.memmap))
+        check_results(res, res_compact, self.exog_new)
+        res_compact = load_compact(fname, mmap=False)
+        check_results(res, res_compact, self.exog_new)
+        del res_compact
+        try:
+            os.remove(fname)
+            os.rmdir(tmpdir)
+        except (OSError, IOError):
+            pass
+
+
+def test_version():
+    np.random.seed(0)
+    res = sm.OLS(np.random.randn(20), np.ones(20)).fit()
+    fh = BytesIO()
+    save_compact(res, fh)
+    data = bytearray(fh.getvalue())
+    # a later major version
+    data[8] += 1
+    assert_raises(ValueError, load_compact, BytesIO(bytes(data)))
+    assert_raises(ValueError, load_compact, BytesIO(b'not compact'))
@@ -149,3 +149,34 @@ class TestMyParetoRestriction(CheckGenericMixin):
 
         # Note: loc is fixed, no problems with parameters close to min data
         self.skip_bsejac = False
+
+
+class MyNormal(GenericLikelihoodModel):
+    # params are mean and log of the standard deviation
+
+    def nloglikeobs(self, params):
+        return -stats.norm.logpdf(self.endog, loc=params[0],
+                                  scale=np.exp(params[1]))
+
+
+class MyNormalBatch(MyNormal):
+
+    def loglike_batch(self, params):
+        return stats.norm.logpdf(self.endog[:,None], loc=params[:,0],
+                                 scale=np.exp(params[:,1])).sum(0)
+
+
+def test_loglike_batch():
+    np.random.seed(1234)
+    endog = 1 + 2 * np.random.randn(100)
+    params = np.array([.8, .6])
+    mod = MyNormal(endog)
+    mod_batch = MyNormalBatch(endog)
+    assert_allclose(mod_batch.score(params), mod.score(params), rtol=1e-6)
+    assert_allclose(mod_batch.hessian(params), mod.hessian(params),
+                    rtol=1e-5)
+    start_params = np.array([0., 0.])
+    res = mod.fit(start_params=start_params, disp=0)
+    res_batch = mod_batch.fit(start_params=start_params, disp=0)
+    assert_allclose(res_batch.params, res.params)
+    assert_allclose(res_batch.bse, res.bse, rtol=1e-5)
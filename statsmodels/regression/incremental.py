@@ -0,0 +1,412 @@
+"""
+Linear regression estimated from sufficient statistics
+
+The data are processed in chunks and folded into the triangular factor of
+the QR decomposition of the augmented whitened data [wexog, wendog] (a
+running, or tall-skinny, QR) and a few sums, so the full design matrix is
+never held in memory. The parameter estimates, their covariance and the
+goodness of fit statistics only depend on these sufficient statistics.
+Heteroscedasticity robust covariances need the residuals and are computed in
+a second pass over the data if the data source can be iterated over again.
+
+The memory requirement is O(k^2) and the work per chunk is
+O(nobs_chunk * k^2). Since X'X is never formed, the condition number of
+the problem is the one of the design and not its square.
+"""
+
+import numpy as np
+from statsmodels.base.data import handle_data
+from statsmodels.tools.tools import rank
+from statsmodels.tools.decorators import cache_readonly, cache_writable
+from statsmodels.regression.linear_model import (RegressionResults,
+                                                 RegressionResultsWrapper)
+
+__all__ = ['IncrementalRegression', 'IncrementalRegressionResults']
+
+
+def _iter_chunks(chunks):
+    """
+    Returns an iterator over chunks, calling chunks first if it is callable.
+    """
+    if callable(chunks):
+        return iter(chunks())
+    return iter(chunks)
+
+
+def _is_reiterable(chunks):
+    """
+    True if the data source can be iterated over more than once.
+    """
+    if callable(chunks):
+        return True
+    # an iterator returns itself and is exhausted after one pass
+    return iter(chunks) is not chunks
+
+
+class IncrementalRegression(object):
+    """
+    Linear regression estimated from sufficient statistics of data chunks
+
+    Parameters
+    ----------
+    weighted : bool
+        If True, then weights can be given for the observations as in WLS.
+        Default is False which corresponds to OLS.
+    hasconst : None or bool
+        Indicates whether the design includes a user-supplied constant. If
+        None, a column that is constant over all chunks is treated as the
+        constant.
+
+    Attributes
+    ----------
+    nobs : float
+        The number of observations added so far.
+    R : array
+        (k+1) x (k+1) upper triangular factor of the QR decomposition of
+        the whitened data [wexog, wendog]
+    xtx : array
+        k x k cross-product of the whitened design, X'WX
+    xty : array
+        cross-product of the whitened design and the whitened response, X'Wy
+    yty : float
+        sum of squares of the whitened response, y'Wy
+    sum_w : float
+        sum of the weights
+    sum_wy : float
+        weighted sum of the response
+
+    Notes
+    -----
+    Use `partial_fit` to add the observations chunk by chunk and `fit` to
+    get a results instance. `from_chunks`, which is also available as
+    `OLS.from_chunks` and `WLS.from_chunks`, does the accumulation from a
+    data source. Statistics that have the length of the data, like `resid`
+    or `fittedvalues`, are not available in the results.
+
+    Examples
+    --------
+    >>> import statsmodels.api as sm
+    >>> from statsmodels.regression.incremental import IncrementalRegression
+    >>> data = sm.datasets.longley.load()
+    >>> exog = sm.add_constant(data.exog, prepend=False)
+    >>> mod = IncrementalRegression()
+    >>> for start in range(0, 16, 4):
+    ...     mod = mod.partial_fit(data.endog[start:start+4],
+    ...                           exog[start:start+4])
+    >>> res = mod.fit()
+
+    `res.params` are the same as the ones of OLS(data.endog, exog).fit().
+    """
+    def __init__(self, weighted=False, hasconst=None):
+        self.weighted = weighted
+        self.hasconst = hasconst
+        self.nobs = 0.
+        self.k_vars = None
+        self.R = None
+        self.yty = 0.
+        self.sum_w = 0.
+        self.sum_wy = 0.
+        self.data = None
+        self._chunks = None
+        self._exog_min = None
+        self._exog_max = None
+        self._data_attr = []
+
+    @classmethod
+    def from_chunks(cls, chunks, weighted=False, hasconst=None):
+        """
+        Create a model from the chunks of a data source.
+
+        Parameters
+        ----------
+        chunks : iterable or callable
+            Each element is a tuple (endog, exog) or, if `weighted` is True,
+            (endog, exog, weights). If `chunks` is a callable, it is called
+            without arguments to get a new iterator over the chunks.
+        weighted : bool
+            If True, the chunks can include the weights of the observations.
+        hasconst : None or bool
+            See IncrementalRegression
+
+        Returns
+        -------
+        model : IncrementalRegression instance
+
+        Notes
+        -----
+        If `chunks` is a sequence or a callable, then the data source is
+        kept with the model and the heteroscedasticity robust standard
+        errors, `HC0_se` to `HC3_se`, are available in the results.
+        A one-shot iterator, e.g. a generator, is only used for the
+        accumulation.
+        """
+        mod = cls(weighted=weighted, hasconst=hasconst)
+        for chunk in _iter_chunks(chunks):
+            mod.partial_fit(*chunk)
+        if _is_reiterable(chunks):
+            mod._chunks = chunks
+        return mod
+
+    def _convert_chunk(self, endog, exog, weights=None):
+        """
+        Returns float arrays endog, exog and weights for a chunk.
+        """
+        exog = np.asarray(exog, dtype=float)
+        if exog.ndim == 1:
+            exog = exog[:,None]
+        endog = np.asarray(endog, dtype=float).ravel()
+        if len(endog) != exog.shape[0]:
+            raise ValueError("endog and exog matrices are different sizes")
+        if weights is None:
+            weights = np.ones(len(endog))
+        elif not self.weighted:
+            raise ValueError("weights are only allowed if weighted is True")
+        else:
+            weights = np.asarray(weights, dtype=float).ravel()
+            if weights.size == 1:
+                weights = np.repeat(weights, len(endog))
+            elif len(weights) != len(endog):
+                raise ValueError('Weights must be scalar or same length as '
+                                 'design')
+        return endog, exog, weights
+
+    def partial_fit(self, endog, exog, weights=None):
+        """
+        Add a chunk of observations to the sufficient statistics.
+
+        Parameters
+        ----------
+        endog : array-like
+            1d response variable of the chunk
+        exog : array-like
+            nobs_chunk x k design matrix of the chunk
+        weights : array-like, optional
+            1d weights of the chunk, only if the model is weighted
+
+        Returns
+        -------
+        self : IncrementalRegression instance
+        """
+        if self.data is None:
+            # keep only the names, not the chunk itself
+            data = handle_data(endog, exog, 'none', self.hasconst)
+            data.ynames, data.xnames  # cached before the chunk is dropped
+            data.endog = data.exog = None
+            data.orig_endog = data.orig_exog = None
+            self.data = data
+
+        endog, exog, weights = self._convert_chunk(endog, exog, weights)
+        if self.R is None:
+            self.k_vars = k_vars = exog.shape[1]
+            self.R = np.zeros((k_vars + 1, k_vars + 1))
+            self._exog_min = np.empty(k_vars)
+            self._exog_min.fill(np.inf)
+            self._exog_max = -self._exog_min
+        elif exog.shape[1] != self.k_vars:
+            raise ValueError("chunk has %d columns, expected %d" %
+                             (exog.shape[1], self.k_vars))
+        if len(endog) == 0:
+            return self
+
+        sqrt_w = np.sqrt(weights)
+        wdata = np.column_stack((sqrt_w[:,None] * exog, sqrt_w * endog))
+        self.R = np.linalg.qr(np.vstack((self.R, wdata)), mode='r')
+        self.yty += np.dot(wdata[:,-1], wdata[:,-1])
+        self.sum_w += weights.sum()
+        self.sum_wy += np.dot(weights, endog)
+        self.nobs += len(endog)
+        self._exog_min = np.minimum(self._exog_min, exog.min(0))
+        self._exog_max = np.maximum(self._exog_max, exog.max(0))
+        return self
+
+    @property
+    def xtx(self):
+        R_exog = self.R[:-1,:-1]
+        return np.dot(R_exog.T, R_exog)
+
+    @property
+    def xty(self):
+        return np.dot(self.R[:-1,:-1].T, self.R[:-1,-1])
+
+    @property
+    def endog_names(self):
+        return self.data.ynames
+
+    @property
+    def exog_names(self):
+        return self.data.xnames
+
+    def _get_k_constant(self):
+        if self.hasconst is not None:
+            return int(self.hasconst)
+        k_constant = (self._exog_min == self._exog_max).sum()
+        if k_constant > 1:
+            raise ValueError("More than one constant detected.")
+        return int(k_constant)
+
+    def fit(self):
+        """
+        Fit the model from the accumulated sufficient statistics.
+
+        Returns
+        -------
+        A RegressionResultsWrapper of an IncrementalRegressionResults
+        instance.
+        """
+        if not self.nobs:
+            raise ValueError("no observations have been added, use "
+                             "partial_fit first")
+        self.k_constant = self._get_k_constant()
+        R_exog = self.R[:-1,:-1]
+        # R has the same singular values as the whitened design
+        self.rank = rank(R_exog)
+        self.df_model = float(self.rank - self.k_constant)
+        self.df_resid = self.nobs - self.rank
+        pinv_R = np.linalg.pinv(R_exog)
+        self.normalized_cov_params = np.dot(pinv_R, pinv_R.T)
+        params = np.dot(pinv_R, self.R[:-1,-1])
+        lfit = IncrementalRegressionResults(self, params,
+                       normalized_cov_params=self.normalized_cov_params)
+        return RegressionResultsWrapper(lfit)
+
+    def ssr(self, params):
+        """
+        Sum of squared whitened residuals at params.
+        """
+        # ||wy - wX b||^2 = ||Q'wy - R b||^2 + ssr of the least squares fit
+        resid = self.R[:,-1] - np.dot(self.R[:,:-1], params)
+        return np.dot(resid, resid)
+
+    def loglike(self, params):
+        """
+        The gaussian loglikelihood function at params, see WLS.loglike
+        """
+        nobs2 = self.nobs / 2.0
+        llf = -np.log(self.ssr(params)) * nobs2      # concentrated likelihood
+        llf -= (1+np.log(np.pi/nobs2))*nobs2  # with constant
+        return llf
+
+    def predict(self, params, exog=None):
+        """
+        Return linear predicted values from a design matrix.
+
+        Parameters
+        ----------
+        params : array-like
+            Parameters of a linear model
+        exog : array-like
+            Design / exogenous data. Required since the model does not keep
+            the data.
+
+        Returns
+        -------
+        An array of fitted values
+        """
+        if exog is None:
+            raise ValueError("exog is required, the data is not stored")
+        return np.dot(exog, params)
+
+    def _het_meat(self, params, hc_type):
+        """
+        Middle matrix of the heteroscedasticity robust sandwich.
+
+        This requires a second pass over the data. It is the sum over
+        observations of het_scale * wx'wx with het_scale as defined for
+        RegressionResults.HC0_se to HC3_se.
+        """
+        if self._chunks is None:
+            raise ValueError("robust covariances need a second pass over the "
+                             "data, use from_chunks with a sequence or a "
+                             "callable as data source")
+        meat = np.zeros((self.k_vars, self.k_vars))
+        for chunk in _iter_chunks(self._chunks):
+            endog, exog, weights = self._convert_chunk(*chunk)
+            het_scale = (endog - np.dot(exog, params))**2
+            if hc_type in (2, 3):
+                h = (np.dot(exog, self.normalized_cov_params) * exog).sum(1)
+                het_scale /= (1 - h)**(hc_type - 1)
+            wexog = np.sqrt(weights)[:,None] * exog
+            meat += np.dot(wexog.T * het_scale, wexog)
+        return meat
+
+
+class IncrementalRegressionResults(RegressionResults):
+    """
+    Results of a linear regression estimated from sufficient statistics
+
+    The attributes are the same as for RegressionResults and are computed
+    from the sufficient statistics of the model. Observation-wise results
+    like `resid`, `wresid` and `fittedvalues` and the summary which
+    includes residual diagnostics are not available.
+    The heteroscedasticity robust standard errors require a second pass over
+    the data, see IncrementalRegression.from_chunks.
+
+    See Also
+    --------
+    RegressionResults
+    """
+    @cache_readonly
+    def nobs(self):
+        return self.model.nobs
+
+    @cache_writable()
+    def scale(self):
+        return self.ssr / self.df_resid
+
+    @cache_readonly
+    def ssr(self):
+        return self.model.ssr(self.params)
+
+    @cache_readonly
+    def centered_tss(self):
+        model = self.model
+        return model.yty - model.sum_wy**2 / model.sum_w
+
+    @cache_readonly
+    def uncentered_tss(self):
+        return self.model.yty
+
+    def _HCCM_chunks(self, hc_type):
+        cov_p = self.normalized_cov_params
+        meat = self.model._het_meat(self.params, hc_type)
+        return np.dot(cov_p, np.dot(meat, cov_p))
+
+    @property
+    def HC0_se(self):
+        """
+        See statsmodels.RegressionResults
+        """
+        if self._HC0_se is None:
+            self.cov_HC0 = self._HCCM_chunks(0)
+            self._HC0_se = np.sqrt(np.diag(self.cov_HC0))
+        return self._HC0_se
+
+    @property
+    def HC1_se(self):
+        """
+        See statsmodels.RegressionResults
+        """
+        if self._HC1_se is None:
+            self.cov_HC1 = self.nobs/(self.df_resid) * self._HCCM_chunks(1)
+            self._HC1_se = np.sqrt(np.diag(self.cov_HC1))
+        return self._HC1_se
+
+    @property
+    def HC2_se(self):
+        """
+        See statsmodels.RegressionResults
+        """
+        if self._HC2_se is None:
+            self.cov_HC2 = self._HCCM_chunks(2)
+            self._HC2_se = np.sqrt(np.diag(self.cov_HC2))
+        return self._HC2_se
+
+    @property
+    def HC3_se(self):
+        """
+        See statsmodels.RegressionResults
+        """
+        if self._HC3_se is None:
+            self.cov_HC3 = self._HCCM_chunks(3)
+            self._HC3_se = np.sqrt(np.diag(self.cov_HC3))
+        return self._HC3_se
@@ -30,17 +30,21 @@ __docformat__ = 'restructuredtext en'
 
 __all__ = ['GLS', 'WLS', 'OLS', 'GLSAR']
 
+import hashlib
 import numpy as np
-from scipy.linalg import toeplitz
+from scipy.linalg import toeplitz, cho_solve
 from scipy import stats
 from scipy.stats.stats import ss
 from statsmodels.tools.tools import (add_constant, rank,
                                              recipr, chain_dot)
+from statsmodels.tools.tools import (_is_sparse, _matvec, _rmatvec, _xtwx,
+                                     _solve, _DeferredInverse)
 from statsmodels.tools.decorators import (resettable_cache,
         cache_readonly, cache_writable)
 import statsmodels.base.model as base
 import statsmodels.base.wrapper as wrap
 from statsmodels.emplike.elregress import _ELRegOpts
+from statsmodels.compatnp.collections import OrderedDict
 from scipy import optimize
 from scipy.stats import chi2
 
@@ -69,6 +73,131 @@ def _get_sigma(sigma, nobs):
 
     return sigma, cholsigmainv
 
+def _factorize(wexog, method):
+    """
+    Returns the factorization of the whitened design used by `method`.
+
+    For "pinv" this is (pinv_wexog, normalized_cov_params), for "qr"
+    (Q, R, normalized_cov_params) and for "cholesky" (xtx, L,
+    normalized_cov_params) where L is the lower triangular Cholesky factor
+    of xtx = wexog.T wexog.
+    """
+    if method == "pinv":
+        pinv_wexog = np.linalg.pinv(wexog)
+        return pinv_wexog, np.dot(pinv_wexog, np.transpose(pinv_wexog))
+    elif method == "qr":
+        Q, R = np.linalg.qr(wexog)
+        return Q, R, np.linalg.inv(np.dot(R.T, R))
+    elif method == "cholesky":
+        xtx = np.dot(wexog.T, wexog)
+        L = np.linalg.cholesky(xtx)
+        return xtx, L, cho_solve((L, True), np.eye(xtx.shape[0]))
+    else:
+        raise ValueError('method has to be "pinv", "qr" or "cholesky"')
+
+
+class FactorizationCache(object):
+    """
+    Least recently used cache for factorizations of whitened designs
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of factorizations that are kept. If the cache is full,
+        the least recently used factorization is dropped.
+
+    Attributes
+    ----------
+    hits : int
+        Number of factorizations that were found in the cache.
+    misses : int
+        Number of factorizations that had to be computed.
+
+    Notes
+    -----
+    The cache is opt-in. Pass the same instance as the `cache` argument of
+    the fit method of OLS, WLS, GLS or QuantReg, and models with the same
+    whitened design reuse the pseudoinverse, QR or Cholesky factorization
+    instead of recomputing it, for example in a bootstrap that only
+    resamples endog, in permutation tests or for identical rolling windows.
+
+    The key is a hash of the data, shape and dtype of the whitened design, so
+    a design that was changed in place is not mistaken for the cached one.
+    Hashing is O(nobs * k) compared to O(nobs * k**2) for the
+    factorization. The cached arrays are shared by all models that use them
+    and are therefore read-only.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import statsmodels.api as sm
+    >>> from statsmodels.regression.linear_model import FactorizationCache
+    >>> data = sm.datasets.longley.load()
+    >>> exog = sm.add_constant(data.exog, prepend=False)
+    >>> cache = FactorizationCache()
+    >>> for i in range(100):
+    ...     endog = np.random.permutation(data.endog)
+    ...     res = sm.OLS(endog, exog).fit(cache=cache)
+    >>> cache.hits, cache.misses
+    (99, 1)
+    """
+    def __init__(self, maxsize=8):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._store = OrderedDict()
+
+    @staticmethod
+    def fingerprint(wexog):
+        """
+        Returns the key of a whitened design.
+        """
+        wexog = np.ascontiguousarray(wexog)
+        return (hashlib.sha1(wexog).hexdigest(), wexog.shape,
+                wexog.dtype.str)
+
+    def get(self, wexog, method):
+        """
+        Returns the factorization of wexog for method, computing it if
+        necessary.
+
+        Parameters
+        ----------
+        wexog : array
+            whitened design matrix
+        method : str
+            "pinv", "qr" or "cholesky", see RegressionModel.fit
+
+        Returns
+        -------
+        factorization : tuple of arrays
+            The last element is always normalized_cov_params.
+        """
+        key = (self.fingerprint(wexog), method)
+        try:
+            # pop and reinsert to mark it as most recently used
+            value = self._store.pop(key)
+            self.hits += 1
+        except KeyError:
+            value = _factorize(wexog, method)
+            for arr in value:
+                arr.flags.writeable = False
+            self.misses += 1
+        self._store[key] = value
+        while len(self._store) > self.maxsize:
+            self._store.popitem(last=False)
+        return value
+
+    def clear(self):
+        """
+        Removes all factorizations from the cache.
+        """
+        self._store.clear()
+
+    def __len__(self):
+        return len(self._store)
+
+
 class RegressionModel(base.LikelihoodModel):
     """
     Base class for linear regression models not used by users.
@@ -85,12 +214,17 @@ class RegressionModel(base.LikelihoodModel):
         self.wendog = self.whiten(self.endog)
         # overwrite nobs from class Model:
         self.nobs = float(self.wexog.shape[0])
-        self.rank = rank(self.exog)
+        if _is_sparse(self.exog):
+            # a sparse design is assumed to be of full column rank
+            self.rank = self.exog.shape[1]
+        else:
+            self.rank = rank(self.exog)
         self.df_model = float(self.rank - self.k_constant)
         self.df_resid = self.nobs - self.rank
-        self.df_model = float(rank(self.exog) - self.k_constant)
+        # wexog'wexog for fit_regularized, computed when needed
+        self._wexog_xtx = None
 
-    def fit(self, method="pinv", **kwargs):
+    def fit(self, method="pinv", cache=None, **kwargs):
         """
         Full fit of the model.
 
@@ -100,13 +234,21 @@ class RegressionModel(base.LikelihoodModel):
         Parameters
         ----------
         method : str
-            Can be "pinv", "qr".  "pinv" uses the Moore-Penrose pseudoinverse
-            to solve the least squares problem. "qr" uses the QR
-            factorization.
+            Can be "pinv", "qr" or "cholesky".  "pinv" uses the Moore-Penrose
+            pseudoinverse to solve the least squares problem. "qr" uses the QR
+            factorization. "cholesky" solves the normal equations with the
+            Cholesky factorization of wexog.T wexog, this requires a design
+            of full rank.
+        cache : FactorizationCache instance, optional
+            If given, the factorization of the whitened design is looked up
+            in and stored in the cache, so that it can be shared with other
+            models that have the same whitened design.
 
         Returns
         -------
-        A RegressionResults class instance.
+        A RegressionResults class instance. If endog is 2-d, then a
+        MultiResponseRegressionResults instance with the results for all
+        columns of endog.
 
         See Also
         ---------
@@ -116,25 +258,45 @@ class RegressionModel(base.LikelihoodModel):
         -----
         The fit method uses the pseudoinverse of the design/exogenous variables
         to solve the least squares minimization.
+
+        A 2-d endog is treated as several response variables with the same
+        design. The pseudoinverse or QR decomposition is computed only once
+        and used for all of them.
+
+        If exog is a scipy.sparse matrix, the normal equations are solved
+        with a sparse LU decomposition for all methods and the design is
+        assumed to be of full rank. The memory for the design and the
+        cross-products is proportional to the number of nonzero elements.
+        normalized_cov_params is a dense k x k array that is only computed
+        when it is used, for example by bse or cov_params.
         """
         exog = self.wexog
         endog = self.wendog
 
-        if method == "pinv":
+        if cache is not None:
+            factorize = cache.get
+        else:
+            factorize = _factorize
+
+        if _is_sparse(exog):
+            if not hasattr(self, 'normalized_cov_params'):
+                self.exog_xtx = _xtwx(exog)
+                self.normalized_cov_params = _DeferredInverse(self.exog_xtx)
+            beta = _solve(self.exog_xtx, _rmatvec(exog, endog))
+
+        elif method == "pinv":
             if ((not hasattr(self, 'pinv_wexog')) or
                 (not hasattr(self, 'normalized_cov_params'))):
                 #print "recalculating pinv"   #for debugging
-                self.pinv_wexog = pinv_wexog = np.linalg.pinv(self.wexog)
-                self.normalized_cov_params = np.dot(pinv_wexog,
-                                                 np.transpose(pinv_wexog))
+                self.pinv_wexog, self.normalized_cov_params = factorize(exog,
+                                                                 method)
             beta = np.dot(self.pinv_wexog, endog)
 
         elif method == "qr":
             if ((not hasattr(self, 'exog_Q')) or
                 (not hasattr(self, 'normalized_cov_params'))):
-                Q, R = np.linalg.qr(exog)
+                Q, R, self.normalized_cov_params = factorize(exog, method)
                 self.exog_Q, self.exog_R = Q, R
-                self.normalized_cov_params = np.linalg.inv(np.dot(R.T, R))
             else:
                 Q, R = self.exog_Q, self.exog_R
 
@@ -143,6 +305,24 @@ class RegressionModel(base.LikelihoodModel):
             beta = np.linalg.solve(R, effects)
 
             # no upper triangular solve routine in numpy/scipy?
+
+        elif method == "cholesky":
+            if ((not hasattr(self, 'exog_L')) or
+                (not hasattr(self, 'normalized_cov_params'))):
+                _, self.exog_L, self.normalized_cov_params = factorize(exog,
+                                                                 method)
+            beta = cho_solve((self.exog_L, True), np.dot(exog.T, endog))
+
+        else:
+            raise ValueError('method has to be "pinv", "qr" or "cholesky"')
+
+        if endog.ndim == 2:
+            normalized_cov_params = self.normalized_cov_params
+            if isinstance(normalized_cov_params, _DeferredInverse):
+                normalized_cov_params = normalized_cov_params.inv()
+            lfit = MultiResponseRegressionResults(self, beta,
+                       normalized_cov_params=normalized_cov_params)
+            return MultiResponseRegressionResultsWrapper(lfit)
         if isinstance(self, OLS):
             lfit = OLSResults(self, beta,
                        normalized_cov_params=self.normalized_cov_params)
@@ -151,6 +331,166 @@ class RegressionModel(base.LikelihoodModel):
                        normalized_cov_params=self.normalized_cov_params)
         return RegressionResultsWrapper(lfit)
 
+    def fit_regularized(self, alpha=0., L1_wt=1., penalty_weights=None,
+                        start_params=None, maxiter=100, tol=1e-8):
+        """
+        Fit the model with an elastic net penalty.
+
+        Parameters
+        ----------
+        alpha : float
+            Non-negative weight of the penalty.
+        L1_wt : float
+            Weight of the l1 part of the penalty, between 0 and 1. 1 is the
+            lasso and 0 is ridge regression.
+        penalty_weights : array-like, optional
+            Non-negative weight of each parameter in the penalty. Parameters
+            with weight zero, e.g. the constant, are not penalized. The
+            default is one for all parameters.
+        start_params : array-like, optional
+            Starting values for the parameters. The default is zeros.
+        maxiter : int
+            Maximum number of proximal Newton iterations.
+        tol : float
+            Convergence tolerance for the relative change of the penalized
+            objective.
+
+        Returns
+        -------
+        A RegressionResults class instance without the covariance of the
+        parameters. `fit_history` contains the number of iterations and
+        whether the solver converged.
+
+        See Also
+        --------
+        fit_regularized_path
+
+        Notes
+        -----
+        The estimates minimize
+
+        .. math:: \\frac{1}{2n}\\|y - X\\beta\\|^2 +
+                  \\alpha\\sum_k w_k\\left(L1_{wt}|\\beta_k| +
+                  \\frac{1 - L1_{wt}}{2}\\beta_k^2\\right)
+
+        where y and X are the whitened endog and exog and n is the number
+        of observations. The variables are not standardized, the penalty
+        depends on the scale of the columns of exog.
+
+        The problem is solved by coordinate descent with covariance updates.
+        wexog'wexog is computed once and kept by the model, so that fitting
+        the model again with other alphas does not require a pass over the
+        data, see statsmodels.base.elastic_net.
+        """
+        from statsmodels.base.elastic_net import fit_elastic_net
+        if self.wendog.ndim > 1:
+            raise ValueError("fit_regularized requires a 1d endog")
+        params, iteration, converged = fit_elastic_net(self, alpha,
+                L1_wt=L1_wt, penalty_weights=penalty_weights,
+                start_params=start_params, maxiter=maxiter, tol=tol)
+        lfit = RegressionResults(self, params)
+        lfit.fit_history = dict(iteration=iteration, converged=converged)
+        return RegressionResultsWrapper(lfit)
+
+    def fit_regularized_path(self, alphas=None, L1_wt=1., n_alphas=50,
+                             alpha_min_ratio=1e-3, penalty_weights=None,
+                             start_params=None, cv=None, maxiter=100,
+                             tol=1e-8, path_tol=1e-5):
+        """
+        Fit the model with an elastic net penalty for a path of alphas.
+
+        Parameters
+        ----------
+        alphas : array-like, optional
+            Decreasing sequence of non-negative weights of the penalty. If
+            None, `n_alphas` values are used that are log-spaced from the
+            smallest alpha for which all penalized parameters are zero to
+            `alpha_min_ratio` times this alpha. For L1_wt < 1e-3 the largest
+            alpha is the one of L1_wt = 1e-3.
+        L1_wt : float
+            Weight of the l1 part of the penalty, see fit_regularized.
+        n_alphas : int
+            Number of alphas if `alphas` is None.
+        alpha_min_ratio : float
+            Ratio of the smallest to the largest alpha if `alphas` is None.
+        penalty_weights : array-like, optional
+            Non-negative weight of each parameter in the penalty, see
+            fit_regularized.
+        start_params : array-like, optional
+            Starting values for the first alpha. The default is zeros.
+        cv : int or iterable, optional
+            If not None, the alphas are evaluated by cross-validation. An int
+            is the number of folds of consecutive observations. Otherwise an
+            iterable of (train, test) pairs of boolean or integer index
+            arrays, the training sample is the complement of the test
+            sample.
+        maxiter : int
+            Maximum number of proximal Newton iterations for each alpha.
+        tol : float
+            Convergence tolerance for the relative change of the penalized
+            objective.
+        path_tol : float
+            The path is stopped early if the relative change of the residual
+            sum of squares from one alpha to the next is less than
+            `path_tol`. Use 0 to fit all alphas.
+
+        Returns
+        -------
+        statsmodels.base.elastic_net.ElasticNetPathResults instance
+
+        Notes
+        -----
+        The solution of an alpha is the starting value of the next one, and
+        only the parameters selected by the sequential strong rule are
+        updated; the optimality conditions of all other parameters are
+        checked after convergence.
+
+        The training samples of the cross-validation are fit with the
+        alphas of the path. Their cross-products are the ones of all
+        observations minus the ones of the test sample, so each fold
+        requires only a pass over its test sample. The cross-validation
+        error is the mean squared whitened residual of the test samples.
+        """
+        from statsmodels.base.elastic_net import fit_elastic_net_path
+        if self.wendog.ndim > 1:
+            raise ValueError("fit_regularized_path requires a 1d endog")
+        return fit_elastic_net_path(self, alphas=alphas, L1_wt=L1_wt,
+                n_alphas=n_alphas, alpha_min_ratio=alpha_min_ratio,
+                penalty_weights=penalty_weights, start_params=start_params,
+                cv=cv, maxiter=maxiter, tol=tol, path_tol=path_tol)
+
+    def _elastic_net_loss(self, test=None):
+        """
+        Least squares loss of the whitened data without the observations in
+        the boolean index test.
+        """
+        from statsmodels.base.elastic_net import _GramLoss
+        exog, endog = self.wexog, self.wendog
+        if self._wexog_xtx is None:
+            self._wexog_xtx = _xtwx(exog)
+        xtx = self._wexog_xtx
+        xty = _rmatvec(exog, endog)
+        yty = np.dot(endog, endog)
+        nobs = self.nobs
+        if test is not None:
+            test = np.nonzero(test)[0]
+            exog, endog = exog[test], endog[test]
+            xtx = xtx - _xtwx(exog)
+            xty = xty - _rmatvec(exog, endog)
+            yty = yty - np.dot(endog, endog)
+            nobs = nobs - len(test)
+        return _GramLoss(xtx, xty, yty, nobs)
+
+    def _elastic_net_cv_error(self, params, test):
+        """
+        Mean squared whitened residual of the observations in test for each
+        row of params.
+        """
+        test = np.nonzero(test)[0]
+        exog, endog = self.wexog[test], self.wendog[test]
+        resid = endog[:,None] - _matvec(exog, params.T)
+        return (resid**2).mean(0)
+
     def predict(self, params, exog=None):
         """
         Return linear predicted values from a design matrix.
@@ -174,7 +514,7 @@ class RegressionModel(base.LikelihoodModel):
         #SS: it needs its own predict method
         if exog is None:
             exog = self.exog
-        return np.dot(exog, params)
+        return _matvec(exog, params)
 
 class GLS(RegressionModel):
     __doc__ = """
@@ -262,6 +602,9 @@ class GLS(RegressionModel):
         #store attribute names for data arrays
         self._data_attr.extend(['sigma', 'cholsigmainv'])
 
+    def _get_init_kwds(self):
+        return {'sigma' : self.sigma}
+
 
     def whiten(self, X):
         """
@@ -384,6 +727,38 @@ class WLS(RegressionModel):
         if len(weights) != nobs and weights.size == nobs:
             raise ValueError('Weights must be scalar or same length as design')
 
+    def _get_init_kwds(self):
+        return {'weights' : self.weights}
+
+    @classmethod
+    def from_chunks(cls, chunks, hasconst=None):
+        """
+        Create a model from sufficient statistics accumulated over chunks.
+
+        Parameters
+        ----------
+        chunks : iterable or callable
+            Each element is a tuple (endog, exog) or, for WLS,
+            (endog, exog, weights). If `chunks` is a callable, it is called
+            without arguments to get a new iterator over the chunks.
+        hasconst : None or bool
+            Indicates whether the design includes a user-supplied constant.
+
+        Returns
+        -------
+        model : IncrementalRegression instance
+            Its fit method returns the results without holding the full
+            design matrix in memory.
+
+        See Also
+        --------
+        statsmodels.regression.incremental.IncrementalRegression
+        """
+        from statsmodels.regression.incremental import IncrementalRegression
+        return IncrementalRegression.from_chunks(chunks,
+                                   weighted=not issubclass(cls, OLS),
+                                   hasconst=hasconst)
+
     def whiten(self, X):
         """
         Whitener for WLS model, multiplies each column by sqrt(self.weights)
@@ -398,6 +773,8 @@ class WLS(RegressionModel):
         sqrt(weights)*X
         """
         #print self.weights.var()
+        if _is_sparse(X):
+            return X.multiply(np.sqrt(self.weights)[:,None]).tocsr()
         X = np.asarray(X)
         if X.ndim == 1:
             return X * np.sqrt(self.weights)
@@ -478,6 +855,9 @@ class OLS(WLS):
         super(OLS, self).__init__(endog, exog, missing=missing,
                                   hasconst=hasconst)
 
+    def _get_init_kwds(self):
+        return {}
+
     def loglike(self, params):
         '''
         The likelihood function for the clasical OLS model.
@@ -494,8 +874,8 @@ class OLS(WLS):
         nobs2 = self.nobs/2.
         return -nobs2*np.log(2*np.pi)-nobs2*np.log(1/(2*nobs2) *\
                 np.dot(np.transpose(self.endog -
-                    np.dot(self.exog, params)),
-                    (self.endog - np.dot(self.exog,params)))) -\
+                    _matvec(self.exog, params)),
+                    (self.endog - _matvec(self.exog, params)))) -\
                     nobs2
 
     def whiten(self, Y):
@@ -577,6 +957,9 @@ class GLSAR(GLS):
         else:
             super(GLSAR, self).__init__(endog, exog, missing=missing)
 
+    def _get_init_kwds(self):
+        return {'rho' : self.rho}
+
     def iterative_fit(self, maxiter=3):
         """
         Perform an iterative two-stage procedure to estimate a GLS model.
@@ -1392,10 +1775,16 @@ class OLSResults(RegressionResults):
 
     """
 
-    def get_influence(self):
+    def get_influence(self, memory_limit=None):
         """
         get an instance of Influence with influence and outlier measures
 
+        Parameters
+        ----------
+        memory_limit : int or None
+            Approximate upper bound in bytes for the temporary arrays of the
+            leave-one-observation-out calculations. See OLSInfluence.
+
         Returns
         -------
         infl : Influence instance
@@ -1404,7 +1793,7 @@ class OLSResults(RegressionResults):
 
         """
         from statsmodels.stats.outliers_influence import OLSInfluence
-        return OLSInfluence(self)
+        return OLSInfluence(self, memory_limit=memory_limit)
 
     def outlier_test(self, method='bonf', alpha=.05):
         """
@@ -1619,6 +2008,148 @@ class OLSResults(RegressionResults):
         return (lowerl, upperl)
 
 
+class MultiResponseRegressionResults(base.Results):
+    """
+    Results of a linear regression with several response variables.
+
+    The model is fit separately for each column of a 2-d endog with the same
+    design matrix. The results are arrays with one entry or column for each
+    response variable, they are computed in a vectorized way and only when
+    they are accessed.
+
+    Attributes
+    ----------
+    params : array
+        k x n_endog array of the parameter estimates, one column for each
+        response variable.
+    normalized_cov_params : array
+        k x k array that is common to all response variables
+    bse, tvalues, pvalues : array
+        k x n_endog arrays
+    scale, ssr, ess, centered_tss, uncentered_tss : array
+        1-d arrays of length n_endog
+    rsquared, rsquared_adj, fvalue, f_pvalue, llf, aic, bic : array
+        1-d arrays of length n_endog
+    wresid, resid, fittedvalues : array
+        nobs x n_endog arrays
+
+    See Also
+    --------
+    RegressionResults : for the definitions of the statistics
+    """
+    def __init__(self, model, params, normalized_cov_params=None):
+        super(MultiResponseRegressionResults, self).__init__(model, params)
+        self.normalized_cov_params = normalized_cov_params
+        self._cache = resettable_cache()
+
+    @cache_readonly
+    def nobs(self):
+        return float(self.model.wexog.shape[0])
+
+    @cache_readonly
+    def df_resid(self):
+        return self.model.df_resid
+
+    @cache_readonly
+    def df_model(self):
+        return self.model.df_model
+
+    @cache_readonly
+    def fittedvalues(self):
+        return self.model.predict(self.params, self.model.exog)
+
+    @cache_readonly
+    def wresid(self):
+        return self.model.wendog - self.model.predict(self.params,
+                self.model.wexog)
+
+    @cache_readonly
+    def resid(self):
+        return self.model.endog - self.fittedvalues
+
+    @cache_readonly
+    def ssr(self):
+        return (self.wresid**2).sum(0)
+
+    @cache_readonly
+    def scale(self):
+        return self.ssr / self.df_resid
+
+    @cache_readonly
+    def bse(self):
+        return np.sqrt(np.outer(np.diag(self.normalized_cov_params),
+                                self.scale))
+
+    @cache_readonly
+    def tvalues(self):
+        return self.params / self.bse
+
+    @cache_readonly
+    def pvalues(self):
+        return stats.t.sf(np.abs(self.tvalues), self.df_resid)*2
+
+    @cache_readonly
+    def centered_tss(self):
+        model = self.model
+        weights = getattr(model, 'weights', None)
+        if weights is not None:
+            mean = np.dot(weights, model.endog) / weights.sum()
+            return np.dot(weights, (model.endog - mean)**2)
+        else:
+            centered_endog = model.wendog - model.wendog.mean(0)
+            return (centered_endog**2).sum(0)
+
+    @cache_readonly
+    def uncentered_tss(self):
+        return (self.model.wendog**2).sum(0)
+
+    @cache_readonly
+    def ess(self):
+        if self.k_constant:
+            return self.centered_tss - self.ssr
+        else:
+            return self.uncentered_tss - self.ssr
+
+    @cache_readonly
+    def rsquared(self):
+        if self.k_constant:
+            return 1 - self.ssr/self.centered_tss
+        else:
+            return 1 - self.ssr/self.uncentered_tss
+
+    @cache_readonly
+    def rsquared_adj(self):
+        return 1 - np.divide(self.nobs - self.k_constant, self.df_resid) * (1 - self.rsquared)
+
+    @cache_readonly
+    def fvalue(self):
+        return (self.ess / self.df_model) / (self.ssr / self.df_resid)
+
+    @cache_readonly
+    def f_pvalue(self):
+        return stats.f.sf(self.fvalue, self.df_model, self.df_resid)
+
+    @cache_readonly
+    def llf(self):
+        # vectorized version of GLS.loglike
+        nobs2 = self.nobs / 2.0
+        llf = -np.log(self.ssr) * nobs2      # concentrated likelihood
+        llf -= (1+np.log(np.pi/nobs2))*nobs2  # with likelihood constant
+        sigma = getattr(self.model, 'sigma', None)
+        if np.any(sigma) and sigma.ndim == 2:
+            llf -= .5*np.log(np.linalg.det(sigma))
+        return llf
+
+    @cache_readonly
+    def aic(self):
+        return -2 * self.llf + 2 * (self.df_model + self.k_constant)
+
+    @cache_readonly
+    def bic(self):
+        return (-2 * self.llf + np.log(self.nobs) * (self.df_model +
+                                                     self.k_constant))
+
+
 class RegressionResultsWrapper(wrap.ResultsWrapper):
 
     _attrs = {
@@ -1648,6 +2179,23 @@ wrap.populate_wrapper(RegressionResultsWrapper,
                       RegressionResults)
 
 
+class MultiResponseRegressionResultsWrapper(wrap.ResultsWrapper):
+
+    _wrap_attrs = {
+        'params' : 'columns_eq',
+        'bse' : 'columns_eq',
+        'tvalues' : 'columns_eq',
+        'pvalues' : 'columns_eq',
+        'normalized_cov_params' : 'cov',
+        'fittedvalues' : 'rows',
+        'wresid' : 'rows',
+        'resid' : 'rows',
+    }
+    _wrap_methods = {}
+wrap.populate_wrapper(MultiResponseRegressionResultsWrapper,
+                      MultiResponseRegressionResults)
+
+
 if __name__ == "__main__":
     import statsmodels.api as sm
     data = sm.datasets.longley.load()
@@ -3,8 +3,9 @@
 '''
 Quantile regression model
 
-Model parameters are estimated using iterated reweighted least squares. The
-asymptotic covariance matrix estimated using kernel density estimation.
+Model parameters are estimated using iterated reweighted least squares or
+the interior point (Frisch-Newton) algorithm of Portnoy and Koenker (1997).
+The asymptotic covariance matrix estimated using kernel density estimation.
 
 Author: Vincent Arel-Bundock
 License: BSD-3
@@ -20,20 +21,21 @@ Prinoth (christian at prinoth dot name).
 import numpy as np
 import warnings
 import scipy.stats as stats
-from scipy.linalg import pinv
+from scipy.linalg import pinv, cho_factor, cho_solve
 from scipy.stats import norm
 from statsmodels.tools.tools import chain_dot
 from statsmodels.tools.decorators import cache_readonly
 from statsmodels.regression.linear_model import (RegressionModel,
                                                  RegressionResults,
-                                                 RegressionResultsWrapper)
+                                                 RegressionResultsWrapper,
+                                                 FactorizationCache)
 
 
 class QuantReg(RegressionModel):
     '''Quantile Regression
 
     Estimate a quantile regression model using iterative reweighted least
-    squares.
+    squares or an interior point algorithm.
 
     Parameters
     ----------
@@ -51,6 +53,12 @@ class QuantReg(RegressionModel):
     Greene (2008, p.407-408), using either the logistic or gaussian kernels
     (kernel argument of the fit method).
 
+    The interior point method solves the linear program of the quantile
+    regression with the Frisch-Newton algorithm of Portnoy and Koenker
+    (1997). Each iteration requires one Cholesky decomposition of a
+    weighted X'X, and the algorithm usually converges in a few dozen
+    iterations independently of the number of observations.
+
     References
     ----------
     General:
@@ -59,6 +67,9 @@ class QuantReg(RegressionModel):
     * Green,W. H. (2008). Econometric Analysis. Sixth Edition. International Student Edition.
     * Koenker, R. (2005). Quantile Regression. New York: Cambridge University Press.
     * LeSage, J. P.(1999). Applied Econometrics Using MATLAB,
+    * Portnoy, S. and R. Koenker (1997). The Gaussian hare and the Laplacian
+      tortoise: computability of squared-error versus absolute-error
+      estimators. Statistical Science 12: 279-300.
 
     Kernels (used by the fit method):
 
@@ -84,13 +95,15 @@ class QuantReg(RegressionModel):
         return data
 
     def fit(self, q=.5, vcov='robust', kernel='epa', bandwidth='hsheather',
-            max_iter=1000, p_tol=1e-6, **kwargs):
-        '''Solve by Iterative Weighted Least Squares
+            max_iter=1000, p_tol=1e-6, cache=None, method='irls',
+            start_params=None, **kwargs):
+        '''Solve by Iterative Weighted Least Squares or interior point
 
         Parameters
         ----------
         q : float
-            Quantile must be between 0 and 1
+            Quantile must be between 0 and 1, and strictly between 0 and 1
+            for method 'interior_point'
         vcov : string, method used to calculate the variance-covariance matrix
             of the parameters. Default is ``robust``:
 
@@ -113,10 +126,37 @@ class QuantReg(RegressionModel):
             - hsheather: Hall-Sheather (1988)
             - bofinger: Bofinger (1975)
             - chamberlain: Chamberlain (1994)
+
+        cache : FactorizationCache instance, optional
+            If given, the pseudoinverse of exog for the starting OLS estimate
+            and the covariance is shared with other models through the cache.
+            See statsmodels.regression.linear_model.FactorizationCache
+        method : string
+            - irls : iteratively reweighted least squares (default)
+            - interior_point : Frisch-Newton interior point algorithm, see
+              Notes
+
+        start_params : array-like, optional
+            Starting values for the parameters, e.g. the estimates of a
+            neighbouring quantile. The default is the OLS estimate.
+
+        Notes
+        -----
+        For method 'irls', `p_tol` is the tolerance for the largest change
+        of the parameters. For method 'interior_point', it is the
+        tolerance for the duality gap relative to the sum of absolute
+        residuals, and `max_iter` is the maximum number of interior point
+        iterations.
         '''
 
         if q < 0 or q > 1:
             raise Exception('p must be between 0 and 1')
+        if method not in ['irls', 'interior_point']:
+            raise ValueError("method must be 'irls' or 'interior_point'")
+        if method == 'interior_point' and not 0 < q < 1:
+            # the starting point of the dual is on the boundary
+            raise ValueError("q must be strictly between 0 and 1 for "
+                             "method 'interior_point'")
 
         kern_names = ['biw', 'cos', 'epa', 'gau', 'par']
         if kernel not in kern_names:
@@ -135,7 +175,6 @@ class QuantReg(RegressionModel):
 
         endog = self.endog
         exog = self.exog
-        nobs = self.nobs
         rank = self.rank
         n_iter = 0
         xstar = exog
@@ -153,6 +192,25 @@ class QuantReg(RegressionModel):
 #            # start with OLS
 #            beta = np.dot(np.linalg.pinv(exog), endog)
 
+        # pinv(X'X) is needed for the starting OLS and for the covariance
+        xtxi = None
+        if cache is not None:
+            pinv_exog, xtxi = cache.get(exog, 'pinv')
+
+        if method == 'interior_point':
+            if start_params is None:
+                if xtxi is not None:
+                    start_params = np.dot(pinv_exog, endog)
+                else:
+                    start_params = np.linalg.lstsq(exog, endog)[0]
+            beta, n_iter, history = _interior_point(exog, endog, q,
+                    start_params, max_iter=max_iter, tol=p_tol)
+            if n_iter == max_iter:
+                warnings.warn("Maximum number of iterations (%d) reached."
+                              % max_iter)
+            return self._fit_results(beta, q, vcov, kernel, bandwidth, xtxi,
+                                     n_iter, history)
+
         diff = 10
         cycle = False
 
@@ -160,9 +218,15 @@ class QuantReg(RegressionModel):
         while n_iter < max_iter and diff > p_tol and not cycle:
             n_iter += 1
             beta0 = beta
-            xtx = np.dot(xstar.T, exog)
-            xty = np.dot(xstar.T, endog)
-            beta = np.dot(pinv(xtx), xty)
+            if n_iter == 1 and start_params is not None:
+                beta = np.asarray(start_params, dtype=float)
+            elif n_iter == 1 and xtxi is not None:
+                # first iteration is OLS
+                beta = np.dot(pinv_exog, endog)
+            else:
+                xtx = np.dot(xstar.T, exog)
+                xty = np.dot(xstar.T, endog)
+                beta = np.dot(pinv(xtx), xty)
             resid = endog - np.dot(exog, beta)
 
             mask = np.abs(resid) < .000001
@@ -185,6 +249,17 @@ class QuantReg(RegressionModel):
         if n_iter == max_iter:
             warnings.warn("Maximum number of iterations (1000) reached.")
 
+        return self._fit_results(beta, q, vcov, kernel, bandwidth, xtxi,
+                                 n_iter, history)
+
+    def _fit_results(self, beta, q, vcov, kernel, bandwidth, xtxi, n_iter,
+                     history):
+        '''
+        Returns the results with the kernel estimate of the covariance.
+        '''
+        endog = self.endog
+        exog = self.exog
+        nobs = self.nobs
         e = endog - np.dot(exog, beta)
         # Greene (2008, p.407) writes that Stata 6 uses this bandwidth:
         # h = 0.9 * np.std(e) / (nobs**0.2)
@@ -196,13 +271,14 @@ class QuantReg(RegressionModel):
 
         fhat0 = 1. / (nobs * h) * np.sum(kernel(e / h))
 
+        if xtxi is None and vcov in ['robust', 'iid']:
+            xtxi = pinv(np.dot(exog.T, exog))
         if vcov == 'robust':
             d = np.where(e > 0, (q/fhat0)**2, ((1-q)/fhat0)**2)
-            xtxi = pinv(np.dot(exog.T, exog))
             xtdx = np.dot(exog.T * d[np.newaxis, :], exog)
             vcov = chain_dot(xtxi, xtdx, xtxi)
         elif vcov == 'iid':
-            vcov = (1. / fhat0)**2 * q * (1 - q) * pinv(np.dot(exog.T, exog))
+            vcov = (1. / fhat0)**2 * q * (1 - q) * xtxi
         else:
             raise Exception("vcov must be 'robust' or 'iid'")
 
@@ -216,6 +292,153 @@ class QuantReg(RegressionModel):
 
         return RegressionResultsWrapper(lfit)
 
+    def fit_quantiles(self, qs, vcov='robust', kernel='epa',
+                      bandwidth='hsheather', max_iter=1000, p_tol=1e-6,
+                      cache=None, method='interior_point'):
+        '''Estimate the model for a sequence of quantiles
+
+        Parameters
+        ----------
+        qs : array-like
+            Quantiles, each between 0 and 1
+        vcov, kernel, bandwidth, max_iter, p_tol : see fit
+        cache : FactorizationCache instance, optional
+            Cache for the pseudoinverse of exog. If None, a cache is created
+            for the quantiles, so that the pseudoinverse is computed only
+            once.
+        method : string
+            'interior_point' (default) or 'irls', see fit
+
+        Returns
+        -------
+        QuantRegProcessResults instance
+
+        Notes
+        -----
+        The quantiles are estimated in order of their distance from the
+        median, outward on both sides. The estimate of a quantile is the
+        starting value of the next quantile on the same side of the median,
+        and the first estimate is the starting value on both sides. The
+        results are returned in the order of qs.
+        '''
+        qs = np.asarray(qs, dtype=float).ravel()
+        if cache is None:
+            cache = FactorizationCache(maxsize=1)
+        order = np.argsort(np.abs(qs - .5), kind='mergesort')
+        results = [None] * len(qs)
+        # the estimates of the neighbours on each side of the median
+        start = {}
+        for i in order:
+            q = qs[i]
+            side = q >= .5
+            res = self.fit(q=q, vcov=vcov, kernel=kernel, bandwidth=bandwidth,
+                           max_iter=max_iter, p_tol=p_tol, cache=cache,
+                           method=method, start_params=start.get(side))
+            start.setdefault(not side, res.params)
+            start[side] = res.params
+            results[i] = res
+        return QuantRegProcessResults(self, qs, results)
+
+
+def _bound(x, dx):
+    # largest step in direction dx that keeps x non-negative
+    neg = dx < 0
+    if not neg.any():
+        return 1e20
+    return (-x[neg] / dx[neg]).min()
+
+
+def _interior_point(exog, endog, q, start_params, max_iter=1000, tol=1e-6):
+    '''
+    Frisch-Newton interior point algorithm for quantile regression
+
+    Solves the dual linear program
+
+        max endog'a  s.t.  exog'a = (1 - q) exog'1,  0 <= a <= 1
+
+    with Mehrotra's predictor-corrector steps, see Portnoy and Koenker
+    (1997). The estimates are the negative of the Lagrange multipliers of
+    the equality constraints. This is a translation of lp_fnm of the Matlab
+    and R implementations of Roger Koenker.
+
+    Returns
+    -------
+    params : array
+    n_iter : int
+        number of iterations
+    history : dict
+        params and duality gap of each iteration
+    '''
+    nobs = exog.shape[0]
+    # column major for the products with vectors, and a buffer for the
+    # weighted exog of each iteration
+    exog = np.asfortranarray(exog)
+    wexog = np.empty(exog.shape, order='F')
+    beta = 0.9995
+    c = -endog
+    x = (1 - q) * np.ones(nobs)
+    b = np.dot(exog.T, x)
+    s = 1 - x
+    y = -np.asarray(start_params, dtype=float)
+    r = c - np.dot(exog, y)
+    r += 0.001 * (r == 0)
+    z = np.where(r > 0, r, 0)
+    w = z - r
+    gap = np.dot(c, x) - np.dot(y, b) + w.sum()
+    history = dict(params=[], gap=[])
+    n_iter = 0
+    # the gap is relative to the sum of absolute residuals at the start
+    scale = max(np.abs(r).sum(), 1.)
+    while gap > tol * scale and n_iter < max_iter:
+        n_iter += 1
+        # affine step
+        qq = 1. / (z / x + w / s)
+        r = z - w
+        np.multiply(exog, np.sqrt(qq)[:,None], wexog)
+        xqx = np.dot(wexog.T, wexog)
+        try:
+            factor = cho_factor(xqx)
+            solve = lambda v: cho_solve(factor, v)
+        except np.linalg.LinAlgError:
+            xqx_inv = pinv(xqx)
+            solve = lambda v: np.dot(xqx_inv, v)
+        rhs = qq * r
+        dy = solve(np.dot(exog.T, rhs))
+        dx = qq * (np.dot(exog, dy) - r)
+        ds = -dx
+        dz = -z * (dx / x) - z
+        dw = -w * (ds / s) - w
+        fp = min(beta * min(_bound(x, dx), _bound(s, ds)), 1)
+        fd = min(beta * min(_bound(w, dw), _bound(z, dz)), 1)
+        if min(fp, fd) < 1:
+            # centering and corrector step with the same factorization
+            mu = np.dot(z, x) + np.dot(w, s)
+            g = (np.dot(z + fd * dz, x + fp * dx) +
+                 np.dot(w + fd * dw, s + fp * ds))
+            mu = mu * (g / mu)**3 / (2 * nobs)
+            dxdz = dx * dz
+            dsdw = ds * dw
+            xinv = 1. / x
+            sinv = 1. / s
+            xi = mu * (xinv - sinv)
+            rhs += qq * (dxdz - dsdw - xi)
+            dy = solve(np.dot(exog.T, rhs))
+            dx = qq * (np.dot(exog, dy) + xi - r - dxdz + dsdw)
+            ds = -dx
+            dz = mu * xinv - z - xinv * z * dx - dxdz
+            dw = mu * sinv - w - sinv * w * ds - dsdw
+            fp = min(beta * min(_bound(x, dx), _bound(s, ds)), 1)
+            fd = min(beta * min(_bound(w, dw), _bound(z, dz)), 1)
+        x += fp * dx
+        s += fp * ds
+        y += fd * dy
+        w += fd * dw
+        z += fd * dz
+        gap = np.dot(c, x) - np.dot(y, b) + w.sum()
+        history['params'].append(-y)
+        history['gap'].append(gap)
+    return -y, n_iter, history
+
 
 def _parzen(u):
     z = np.where(np.abs(u) <= .5, 4./3 - 8. * u**2 + 8. * np.abs(u)**3,
@@ -440,3 +663,41 @@ class QuantRegResults(RegressionResults):
             smry.add_extra_txt(etext)
 
         return smry
+
+
+class QuantRegProcessResults(object):
+    '''Results of QuantReg.fit_quantiles
+
+    Attributes
+    ----------
+    qs : array
+        the quantiles
+    results : list
+        QuantRegResults instance of each quantile
+    params : array
+        the estimates, one row per quantile
+    bse : array
+        the standard errors of the estimates, one row per quantile
+    iterations : array
+        number of iterations of each quantile
+    '''
+
+    def __init__(self, model, qs, results):
+        self.model = model
+        self.qs = qs
+        self.results = results
+        self.params = np.array([np.asarray(res.params) for res in results])
+        self.bse = np.array([np.asarray(res.bse) for res in results])
+        self.iterations = np.array([res.iterations for res in results])
+
+    def conf_int(self, alpha=.05):
+        '''
+        Returns the confidence intervals of the quantile process.
+
+        Returns
+        -------
+        conf_int : array
+            lower and upper bounds, shape (len(qs), k_vars, 2)
+        '''
+        return np.array([np.asarray(res.conf_int(alpha))
+                         for res in self.results])
@@ -0,0 +1,375 @@
+"""
+Rolling and expanding window linear regression
+
+The least squares estimates for all windows are computed together from
+windowed sums of the cross-products of the whitened data. The windowed sums
+are prefix sums within blocks of window length combined with suffix sums of
+the previous block, so each sum has at most `window` terms and there is no
+cancellation from subtracting observations that leave the window. The
+normal equations of all windows are then solved with a Cholesky
+decomposition that is vectorized over the windows, only the loops over the
+k regressors are in Python. The residual and total sums of squares are
+accumulated in a second pass around the estimates and the mean of one window
+of each block, so they do not lose precision when the level of endog is large
+relative to the residuals.
+
+The work is O(nobs * k**2) for the sums plus O(nobs * k**3) for the
+solves, and the memory is O(window * k**2) in addition to the results.
+"""
+
+import numpy as np
+from scipy import stats
+from statsmodels.tools.decorators import resettable_cache, cache_readonly
+from statsmodels.tools.tools import stacked_cholesky_inv
+import statsmodels.base.model as base
+
+__all__ = ['RollingWLS', 'RollingOLS', 'RollingRegressionResults']
+
+
+class RollingWLS(base.Model):
+    __doc__ = """
+    Weighted least squares for rolling or expanding windows
+
+    %(params)s
+    window : int, optional
+        Number of observations in each window. Required unless `expanding`
+        is True.
+    weights : array-like, optional
+        1d array of weights as in WLS.
+    min_nobs : int, optional
+        Minimum number of observations in a window for the estimates to be
+        computed. The default is `window` for rolling windows, i.e. only full
+        windows, and k + 1 for expanding windows.
+    expanding : bool
+        If True, all windows start at the first observation and the window
+        ending at observation t contains the observations 0 to t.
+    %(extra_params)s
+
+    Notes
+    -----
+    The results are aligned with the last observation of each window. The
+    window that ends at observation t contains the observations
+    max(0, t - window + 1) to t.
+
+    Windows with fewer than `min_nobs` observations or with a design that is
+    not of full rank have nan results.
+
+    Examples
+    --------
+    >>> import statsmodels.api as sm
+    >>> from statsmodels.regression.rolling import RollingOLS
+    >>> data = sm.datasets.macrodata.load()
+    >>> exog = sm.add_constant(data.exog[:,[1,2]], prepend=False)
+    >>> res = RollingOLS(data.exog[:,0], exog, window=40).fit()
+
+    res.params[t] are the same as the params of
+    OLS(endog[t-39:t+1], exog[t-39:t+1]).fit()
+    """ % {'params' : base._model_params_doc,
+           'extra_params' : base._missing_param_doc + base._extra_param_doc}
+
+    def __init__(self, endog, exog, window=None, weights=1., min_nobs=None,
+                 expanding=False, missing='none', hasconst=None):
+        weights = np.array(weights)
+        if weights.shape == ():
+            weights = np.repeat(weights, len(endog))
+        weights = weights.squeeze()
+        super(RollingWLS, self).__init__(endog, exog, missing=missing,
+                                         weights=weights, hasconst=hasconst)
+        nobs, k_vars = self.exog.shape
+        if len(self.weights) != nobs:
+            raise ValueError('Weights must be scalar or same length as design')
+        if not expanding:
+            if window is None or window < 1:
+                raise ValueError("window has to be a positive integer if "
+                                 "expanding is False")
+            window = int(window)
+        if min_nobs is None:
+            min_nobs = k_vars + 1 if expanding else window
+        if min_nobs <= k_vars:
+            raise ValueError("min_nobs has to be larger than the number of "
+                             "regressors")
+        self.window = window
+        self.min_nobs = min_nobs
+        self.expanding = expanding
+        self.nobs = float(nobs)
+        self.k_vars = k_vars
+        self.df_model = float(k_vars - self.k_constant)
+
+    def whiten(self, X):
+        """
+        Whitener for WLS model, multiplies each column by sqrt(self.weights)
+        """
+        X = np.asarray(X)
+        if X.ndim == 1:
+            return X * np.sqrt(self.weights)
+        elif X.ndim == 2:
+            return np.sqrt(self.weights)[:,None]*X
+
+    def _cross_products(self, start, stop):
+        """
+        Returns the cross-products of observations start to stop.
+
+        Each row contains the flattened wexog_i wexog_i', wexog_i wendog_i,
+        wendog_i**2, weights_i * endog_i and weights_i.
+        """
+        weights = self.weights[start:stop]
+        endog = self.endog[start:stop]
+        sqrt_w = np.sqrt(weights)
+        wexog = sqrt_w[:,None] * self.exog[start:stop]
+        wendog = sqrt_w * endog
+        nobs, k = wexog.shape
+        xx = (wexog[:,:,None] * wexog[:,None,:]).reshape(nobs, k * k)
+        return np.column_stack((xx, wexog * wendog[:,None], wendog**2,
+                                weights * endog, weights))
+
+    def _resid_products(self, start, stop, shift, level):
+        """
+        Returns the cross-products of observations start to stop with the
+        residuals of a reference fit.
+
+        With e_i = wendog_i - wexog_i'shift and d_i = endog_i - level each
+        row contains wexog_i e_i, e_i**2, weights_i * d_i and
+        weights_i * d_i**2.
+        """
+        weights = self.weights[start:stop]
+        sqrt_w = np.sqrt(weights)
+        wexog = sqrt_w[:,None] * self.exog[start:stop]
+        resid = sqrt_w * self.endog[start:stop] - np.dot(wexog, shift)
+        dev = self.endog[start:stop] - level
+        return np.column_stack((wexog * resid[:,None], resid**2,
+                                weights * dev, weights * dev**2))
+
+    def _window_sums(self):
+        """
+        Yields (start, stop, sums) with the sums of the cross-products for the
+        windows ending at the observations start to stop.
+        """
+        nobs = int(self.nobs)
+        window = self.window
+        if self.expanding:
+            blocksize = window or max(self.min_nobs, 1024)
+        else:
+            blocksize = window
+        prev_block = None
+        for start in range(0, nobs, blocksize):
+            stop = min(start + blocksize, nobs)
+            block = self._cross_products(start, stop)
+            sums = block.cumsum(0)
+            if self.expanding:
+                if prev_block is not None:
+                    sums += prev_block
+                prev_block = sums[-1]
+            else:
+                if prev_block is not None:
+                    # window ending at start + i includes prev_block[i+1:]
+                    suffix = prev_block[::-1].cumsum(0)[::-1]
+                    n_prev = min(stop - start, window - 1)
+                    sums[:n_prev] += suffix[1:n_prev+1]
+                prev_block = block
+            yield start, stop, sums
+
+    def fit(self):
+        """
+        Fit the regression for all windows.
+
+        Returns
+        -------
+        RollingRegressionResults instance
+        """
+        nobs = int(self.nobs)
+        k = self.k_vars
+        params = np.empty((nobs, k))
+        params.fill(np.nan)
+        cov_diag = params.copy()
+        ssr = np.empty(nobs)
+        ssr.fill(np.nan)
+        centered_tss = ssr.copy()
+        uncentered_tss = ssr.copy()
+
+        nobs_win = np.arange(1., nobs + 1)
+        if not self.expanding:
+            nobs_win = np.minimum(nobs_win, self.window)
+        valid = nobs_win >= self.min_nobs
+
+        # The sums of squares are accumulated around the estimates and the
+        # weighted mean of a reference window of each block, which are
+        # close to those of the other windows of the block. Computing ssr as
+        # y'y - b'X'y instead cancels catastrophically if y is large
+        # relative to the residuals.
+        shift, level = np.zeros(k), 0.
+        prev_shift, prev_level = shift, level
+        carry = None
+        for start, stop, sums in self._window_sums():
+            total = sums[-1]
+            sel = valid[start:stop]
+            idx = np.arange(start, stop)[sel]
+            if len(idx) > 0:
+                sums = sums[sel]
+                xtx = sums[:,:k*k].reshape(-1, k, k)
+                xty = sums[:,k*k:k*k+k]
+                yty, sum_wy, sum_w = sums[:,-3], sums[:,-2], sums[:,-1]
+
+                xtxi = stacked_cholesky_inv(xtx)
+                beta = (xtxi * xty[:,None,:]).sum(2)
+                params[idx] = beta
+                cov_diag[idx] = xtxi.reshape(-1, k * k)[:,::k+1]
+                uncentered_tss[idx] = yty
+                finite = np.isfinite(beta).all(1)
+                if finite.any():
+                    ref = np.nonzero(finite)[0][-1]
+                    shift, level = beta[ref], sum_wy[ref] / sum_w[ref]
+
+            esums = self._resid_products(start, stop, shift, level).cumsum(0)
+            if self.expanding:
+                if carry is not None:
+                    # move the sums of the previous blocks to the new
+                    # reference, the differences of the references are small
+                    prev_xtx, prev_sum_w, prev_esums = carry
+                    d = shift - prev_shift
+                    d_level = level - prev_level
+                    xtxd = np.dot(prev_xtx, d)
+                    xe, ee = prev_esums[:k], prev_esums[k]
+                    s1, s2 = prev_esums[k+1], prev_esums[k+2]
+                    esums += np.r_[xe - xtxd,
+                                   ee - 2 * np.dot(d, xe) + np.dot(d, xtxd),
+                                   s1 - d_level * prev_sum_w,
+                                   s2 - 2 * d_level * s1 +
+                                   d_level**2 * prev_sum_w]
+                carry = total[:k*k].reshape(k, k), total[-1], esums[-1]
+            elif start > 0:
+                prev_block = self._resid_products(start - self.window, start,
+                                                  shift, level)
+                suffix = prev_block[::-1].cumsum(0)[::-1]
+                n_prev = min(stop - start, self.window - 1)
+                esums[:n_prev] += suffix[1:n_prev+1]
+            prev_shift, prev_level = shift, level
+            if len(idx) == 0:
+                continue
+
+            esums = esums[sel]
+            # ssr = e'e - 2 b'X'e + b'X'X b with e, b relative to the reference
+            delta = beta - shift
+            xe, ee = esums[:,:k], esums[:,k]
+            ssr[idx] = np.maximum(ee - 2 * (delta * xe).sum(1) +
+                                  (delta * (xtx * delta[:,None,:]).sum(2)
+                                   ).sum(1), 0)
+            s1, s2 = esums[:,k+1], esums[:,k+2]
+            centered_tss[idx] = s2 - s1**2 / sum_w
+
+        return RollingRegressionResults(self, params, cov_diag, ssr,
+                                        centered_tss, uncentered_tss,
+                                        nobs_win)
+
+
+class RollingOLS(RollingWLS):
+    __doc__ = """
+    Ordinary least squares for rolling or expanding windows
+
+    %(params)s
+    window : int, optional
+        Number of observations in each window. Required unless `expanding`
+        is True.
+    min_nobs : int, optional
+        Minimum number of observations in a window for the estimates to be
+        computed. The default is `window` for rolling windows, i.e. only full
+        windows, and k + 1 for expanding windows.
+    expanding : bool
+        If True, all windows start at the first observation.
+    %(extra_params)s
+
+    See RollingWLS
+    """ % {'params' : base._model_params_doc,
+           'extra_params' : base._missing_param_doc + base._extra_param_doc}
+
+    def __init__(self, endog, exog, window=None, min_nobs=None,
+                 expanding=False, missing='none', hasconst=None):
+        super(RollingOLS, self).__init__(endog, exog, window=window,
+                                         min_nobs=min_nobs,
+                                         expanding=expanding,
+                                         missing=missing, hasconst=hasconst)
+
+    def whiten(self, X):
+        """
+        OLS model whitener does nothing: returns X.
+        """
+        return np.asarray(X)
+
+
+class RollingRegressionResults(object):
+    """
+    Results of a rolling or expanding window regression
+
+    All attributes are arrays with one row for each window, aligned with
+    the last observation of the window. Windows without estimates are nan.
+
+    Attributes
+    ----------
+    params : array
+        nobs x k array of parameter estimates
+    bse : array
+        nobs x k array of standard errors of the parameter estimates
+    tvalues, pvalues : array
+        nobs x k arrays
+    nobs : array
+        number of observations in each window
+    df_resid : array
+        residual degrees of freedom of each window
+    ssr, scale, centered_tss, uncentered_tss, ess : array
+        sums of squares and the residual variance of each window
+    rsquared, rsquared_adj : array
+        R-squared and adjusted R-squared of each window
+
+    See Also
+    --------
+    statsmodels.regression.linear_model.RegressionResults
+    """
+    def __init__(self, model, params, cov_diag, ssr, centered_tss,
+                 uncentered_tss, nobs):
+        self.model = model
+        self.params = params
+        self.ssr = ssr
+        self.centered_tss = centered_tss
+        self.uncentered_tss = uncentered_tss
+        self.nobs = nobs
+        self.k_constant = model.k_constant
+        self.df_model = model.df_model
+        self._cov_diag = cov_diag
+        self._cache = resettable_cache()
+
+    @cache_readonly
+    def df_resid(self):
+        return self.nobs - self.model.k_vars
+
+    @cache_readonly
+    def scale(self):
+        return self.ssr / self.df_resid
+
+    @cache_readonly
+    def bse(self):
+        return np.sqrt(self._cov_diag * self.scale[:,None])
+
+    @cache_readonly
+    def tvalues(self):
+        return self.params / self.bse
+
+    @cache_readonly
+    def pvalues(self):
+        return stats.t.sf(np.abs(self.tvalues), self.df_resid[:,None])*2
+
+    @cache_readonly
+    def ess(self):
+        if self.k_constant:
+            return self.centered_tss - self.ssr
+        else:
+            return self.uncentered_tss - self.ssr
+
+    @cache_readonly
+    def rsquared(self):
+        if self.k_constant:
+            return 1 - self.ssr/self.centered_tss
+        else:
+            return 1 - self.ssr/self.uncentered_tss
+
+    @cache_readonly
+    def rsquared_adj(self):
+        return 1 - np.divide(self.nobs - self.k_constant, self.df_resid) * (1 - self.rsquared)
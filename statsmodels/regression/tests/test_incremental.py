@@ -0,0 +1,97 @@
+"""
+Tests for regression from sufficient statistics accumulated over chunks
+"""
+import numpy as np
+from numpy.testing import (assert_allclose, assert_equal, assert_raises,
+                           assert_)
+from statsmodels.tools.tools import add_constant
+from statsmodels.regression.linear_model import OLS, WLS
+from statsmodels.regression.incremental import IncrementalRegression
+from statsmodels.datasets import longley
+
+
+def _chunked(step, *arrs):
+    nobs = len(arrs[0])
+    return [tuple(arr[i:i+step] for arr in arrs) for i in range(0, nobs, step)]
+
+
+class CheckIncremental(object):
+
+    def test_params(self):
+        assert_allclose(self.res1.params, self.res2.params, rtol=1e-8)
+
+    def test_bse(self):
+        assert_allclose(self.res1.bse, self.res2.bse, rtol=1e-8)
+
+    def test_fit_stats(self):
+        res1, res2 = self.res1, self.res2
+        for attr in ['rsquared', 'rsquared_adj', 'fvalue', 'f_pvalue',
+                     'llf', 'aic', 'bic', 'ssr', 'scale', 'centered_tss',
+                     'uncentered_tss']:
+            assert_allclose(getattr(res1, attr), getattr(res2, attr),
+                            rtol=1e-8, err_msg=attr)
+        assert_equal(res1.nobs, res2.nobs)
+        assert_equal(res1.df_model, res2.df_model)
+        assert_equal(res1.df_resid, res2.df_resid)
+
+    def test_HC_errors(self):
+        for attr in ['HC0_se', 'HC1_se', 'HC2_se', 'HC3_se']:
+            assert_allclose(getattr(self.res1, attr),
+                            getattr(self.res2, attr), rtol=1e-6,
+                            err_msg=attr)
+
+    def test_conf_int(self):
+        assert_allclose(self.res1.conf_int(), self.res2.conf_int(), rtol=1e-8)
+
+
+class TestIncrementalOLS(CheckIncremental):
+    @classmethod
+    def setupClass(cls):
+        data = longley.load()
+        exog = add_constant(data.exog, prepend=False)
+        cls.res1 = OLS.from_chunks(_chunked(5, data.endog, exog)).fit()
+        cls.res2 = OLS(data.endog, exog).fit()
+
+
+class TestIncrementalWLS(CheckIncremental):
+    @classmethod
+    def setupClass(cls):
+        np.random.seed(987125)
+        nobs = 500
+        exog = add_constant(np.random.randn(nobs, 3), prepend=False)
+        endog = (np.dot(exog, [1., -0.5, 0.25, 2.]) +
+                 (1 + np.abs(exog[:,0])) * np.random.randn(nobs))
+        weights = np.random.uniform(0.5, 2, size=nobs)
+        chunks = lambda: iter(_chunked(77, endog, exog, weights))
+        cls.res1 = WLS.from_chunks(chunks).fit()
+        cls.res2 = WLS(endog, exog, weights=weights).fit()
+
+
+def test_partial_fit():
+    data = longley.load()
+    exog = add_constant(data.exog, prepend=False)
+    mod = IncrementalRegression()
+    for endog_chunk, exog_chunk in _chunked(3, data.endog, exog):
+        mod.partial_fit(endog_chunk, exog_chunk)
+    res1 = mod.fit()
+    res2 = OLS(data.endog, exog).fit()
+    assert_allclose(res1.params, res2.params, rtol=1e-8)
+    assert_equal(mod.k_constant, 1)
+    assert_allclose(mod.xtx, np.dot(exog.T, exog), rtol=1e-10)
+    # no second pass possible without the data source
+    assert_raises(ValueError, getattr, res1, 'HC0_se')
+    # weights are only allowed for WLS
+    assert_raises(ValueError, mod.partial_fit, data.endog, exog,
+                  np.ones(len(data.endog)))
+
+
+def test_generator_pandas():
+    import pandas
+    data = longley.load_pandas()
+    exog = add_constant(data.exog, prepend=False)
+    chunks = ((data.endog[i:i+4], exog[i:i+4]) for i in range(0, 16, 4))
+    res1 = OLS.from_chunks(chunks).fit()
+    res2 = OLS(data.endog, exog).fit()
+    assert_(isinstance(res1.params, pandas.Series))
+    assert_equal(list(res1.params.index), list(res2.params.index))
+    assert_allclose(res1.bse, res2.bse, rtol=1e-8)
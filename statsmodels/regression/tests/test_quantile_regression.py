@@ -2,7 +2,8 @@
 import scipy.stats
 import numpy as np
 import statsmodels.api as sm
-from numpy.testing import assert_allclose, assert_equal, assert_almost_equal
+from numpy.testing import (assert_allclose, assert_equal, assert_almost_equal,
+                           assert_raises)
 from patsy import dmatrices   # pylint: disable=E0611
 from statsmodels.regression.quantile_regression import QuantReg
 from results_quantile_regression import (
@@ -109,6 +110,51 @@ def test_fitted_residuals():
     assert_almost_equal(np.array(res.predict()), Rquantreg.fittedvalues, 5)
     assert_almost_equal(np.array(res.resid), Rquantreg.residuals, 5)
 
+def test_factorization_cache():
+    from statsmodels.regression.linear_model import FactorizationCache
+    data = sm.datasets.engel.load_pandas().data
+    y, X = dmatrices('foodexp ~ income', data, return_type='dataframe')
+    res1 = QuantReg(y, X).fit(q=.25)
+    cache = FactorizationCache()
+    res2 = QuantReg(y, X).fit(q=.25, cache=cache)
+    QuantReg(y, X).fit(q=.75, vcov='iid', cache=cache)
+    assert_equal((cache.hits, cache.misses), (1, 1))
+    assert_allclose(res2.params, res1.params, rtol=1e-6)
+    assert_allclose(res2.bse, res1.bse, rtol=1e-6)
+
+def test_interior_point():
+    data = sm.datasets.engel.load_pandas().data
+    y, X = dmatrices('foodexp ~ income', data, return_type='dataframe')
+    res = QuantReg(y, X).fit(q=.1, method='interior_point')
+    assert_almost_equal(np.array(res.fittedvalues), Rquantreg.fittedvalues, 5)
+    for q in [.25, .5, .75]:
+        res1 = QuantReg(y, X).fit(q=q, vcov='iid')
+        res2 = QuantReg(y, X).fit(q=q, vcov='iid', method='interior_point')
+        assert_allclose(res2.params, res1.params, rtol=1e-4)
+        assert_allclose(res2.bse, res1.bse, rtol=1e-4)
+        assert_equal(len(res2.history['params']), res2.iterations)
+    for q in [0, 1]:
+        assert_raises(ValueError, QuantReg(y, X).fit, q=q,
+                      method='interior_point')
+
+def test_fit_quantiles():
+    from statsmodels.regression.linear_model import FactorizationCache
+    data = sm.datasets.engel.load_pandas().data
+    y, X = dmatrices('foodexp ~ income', data, return_type='dataframe')
+    qs = [.1, .25, .5, .75, .9]
+    cache = FactorizationCache()
+    res = QuantReg(y, X).fit_quantiles(qs, vcov='iid', cache=cache)
+    assert_equal((cache.hits, cache.misses), (4, 1))
+    assert_equal(res.params.shape, (5, 2))
+    assert_equal(res.bse.shape, (5, 2))
+    assert_equal(res.conf_int().shape, (5, 2, 2))
+    for i, q in enumerate(qs):
+        res1 = QuantReg(y, X).fit(q=q, vcov='iid', method='interior_point')
+        assert_equal(res.results[i].q, q)
+        assert_allclose(res.params[i], res1.params, rtol=1e-4)
+        assert_allclose(res.bse[i], res1.bse, rtol=1e-4)
+        assert_allclose(res.conf_int()[i], res1.conf_int(), rtol=1e-4)
+
 
 class TestEpanechnikovHsheatherQ75(CheckModelResultsMixin):
     # Vincent Arel-Bundock also spot-checked q=.1
@@ -5,7 +5,7 @@ import warnings
 import pandas
 import numpy as np
 from numpy.testing import (assert_almost_equal, assert_approx_equal,
-                            assert_raises, assert_equal)
+                            assert_raises, assert_equal, assert_)
 from scipy.linalg import toeplitz
 from statsmodels.tools.tools import add_constant, categorical
 from statsmodels.regression.linear_model import OLS, WLS, GLS, yule_walker
@@ -645,6 +645,103 @@ def test_const_indicator():
     mod = OLS(y, X, hasconst=True).fit()
     assert_almost_equal(modc.rsquared, mod.rsquared, 12)
 
+class TestMultiResponse(object):
+    @classmethod
+    def setupClass(cls):
+        np.random.seed(9876)
+        nobs = 50
+        cls.exog = add_constant(np.random.randn(nobs, 2), prepend=False)
+        cls.endog = (np.dot(cls.exog, np.random.randn(3, 4)) +
+                     np.random.randn(nobs, 4))
+        cls.weights = np.random.uniform(0.5, 2, size=nobs)
+
+    def check_columns(self, res_multi, fit_single):
+        for j in range(self.endog.shape[1]):
+            res = fit_single(self.endog[:,j])
+            for attr in ['params', 'bse', 'tvalues', 'pvalues']:
+                assert_almost_equal(getattr(res_multi, attr)[:,j],
+                                    getattr(res, attr), DECIMAL_7)
+            for attr in ['ssr', 'scale', 'rsquared', 'rsquared_adj',
+                         'fvalue', 'f_pvalue', 'llf', 'aic', 'bic']:
+                assert_approx_equal(getattr(res_multi, attr)[j],
+                                    getattr(res, attr), 10)
+            assert_almost_equal(res_multi.resid[:,j], res.resid, DECIMAL_7)
+
+    def test_ols(self):
+        exog = self.exog
+        for method in ['pinv', 'qr']:
+            res_multi = OLS(self.endog, exog).fit(method=method)
+            self.check_columns(res_multi, lambda y: OLS(y, exog).fit())
+
+    def test_wls(self):
+        exog, weights = self.exog, self.weights
+        res_multi = WLS(self.endog, exog, weights=weights).fit()
+        self.check_columns(res_multi,
+                           lambda y: WLS(y, exog, weights=weights).fit())
+
+    def test_pandas(self):
+        endog = pandas.DataFrame(self.endog, columns=list('abcd'))
+        exog = pandas.DataFrame(self.exog, columns=['x1', 'x2', 'const'])
+        res = OLS(endog, exog).fit()
+        np.testing.assert_(isinstance(res.params, pandas.DataFrame))
+        assert_equal(list(res.params.columns), list('abcd'))
+        assert_equal(list(res.params.index), ['x1', 'x2', 'const'])
+
+
+class TestFactorizationCache(object):
+    @classmethod
+    def setupClass(cls):
+        # longley is too badly conditioned for the normal equations
+        np.random.seed(54321)
+        cls.exog = add_constant(np.random.randn(40, 4), prepend=False)
+        cls.endog = np.dot(cls.exog, [1., 2., 3., 4., 5.])
+        cls.endog += np.random.randn(40)
+        cls.res = OLS(cls.endog, cls.exog).fit()
+
+    def test_cholesky(self):
+        res = OLS(self.endog, self.exog).fit(method="cholesky")
+        assert_almost_equal(res.params, self.res.params, DECIMAL_7)
+        assert_almost_equal(res.bse, self.res.bse, DECIMAL_7)
+
+    def test_shared(self):
+        from statsmodels.regression.linear_model import FactorizationCache
+        cache = FactorizationCache()
+        np.random.seed(12345)
+        for method in ["pinv", "qr", "cholesky"]:
+            for i in range(3):
+                endog = np.random.permutation(self.endog)
+                res = OLS(endog, self.exog).fit(method=method, cache=cache)
+                res2 = OLS(endog, self.exog).fit(method=method)
+                assert_almost_equal(res.params, res2.params, DECIMAL_7)
+                assert_almost_equal(res.bse, res2.bse, DECIMAL_7)
+        assert_equal((cache.hits, cache.misses), (6, 3))
+        # GLS and WLS with identity weighting have the same whitened design
+        res = WLS(self.endog, self.exog).fit(cache=cache)
+        GLS(self.endog, self.exog).fit(cache=cache)
+        assert_equal(cache.hits, 8)
+        assert_almost_equal(res.params, self.res.params, DECIMAL_7)
+        # cached arrays are shared and must not be changed
+        assert_(not res.normalized_cov_params.flags.writeable)
+
+    def test_lru(self):
+        from statsmodels.regression.linear_model import FactorizationCache
+        cache = FactorizationCache(maxsize=2)
+        exog2 = self.exog[:,1:]
+        OLS(self.endog, self.exog).fit(cache=cache)
+        OLS(self.endog, exog2).fit(cache=cache)
+        OLS(self.endog, self.exog).fit(cache=cache)
+        OLS(self.endog, self.exog[:,2:]).fit(cache=cache)  # evicts exog2
+        assert_equal(len(cache), 2)
+        OLS(self.endog, self.exog).fit(cache=cache)
+        assert_equal((cache.hits, cache.misses), (2, 3))
+        OLS(self.endog, exog2).fit(cache=cache)
+        assert_equal(cache.misses, 4)
+
+    def test_invalid_method(self):
+        assert_raises(ValueError, OLS(self.endog, self.exog).fit,
+                      method="svd")
+
+
 def test_706():
     # make sure one regressor pandas Series gets passed to DataFrame
     # for conf_int.
@@ -655,6 +752,104 @@ def test_706():
     np.testing.assert_equal(conf_int.shape, (1, 2))
     np.testing.assert_(isinstance(conf_int, pandas.DataFrame))
 
+def test_sparse_exog():
+    from scipy import sparse
+    from statsmodels.tools.grouputils import dummy_sparse
+    from statsmodels.tools.tools import _DeferredInverse
+    np.random.seed(12345)
+    groups = np.random.randint(0, 20, size=200)
+    exog = sparse.hstack((dummy_sparse(groups),
+                          sparse.csr_matrix(np.random.randn(200, 1))))
+    endog = groups / 10. + np.random.randn(200)
+    weights = np.random.uniform(0.5, 2, size=200)
+    for res1, res2 in [(OLS(endog, exog.toarray()).fit(),
+                        OLS(endog, exog).fit()),
+                       (WLS(endog, exog.toarray(), weights=weights).fit(),
+                        WLS(endog, exog, weights=weights).fit())]:
+        assert_(sparse.issparse(res2.model.exog))
+        # the dense inverse is not computed in fit
+        assert_(isinstance(res2._results._normalized_cov_params,
+                           _DeferredInverse))
+        assert_almost_equal(res2.params, res1.params, 12)
+        assert_almost_equal(res2.bse, res1.bse, 12)
+        assert_almost_equal(res2.resid, res1.resid, 12)
+        assert_almost_equal(res2.rsquared, res1.rsquared, 12)
+        assert_equal(res2.df_resid, res1.df_resid)
+
+def test_fit_regularized():
+    np.random.seed(12345)
+    nobs = 200
+    exog = add_constant(np.random.randn(nobs, 6), prepend=True)
+    endog = (np.dot(exog, [1., 2, -1, 0.5, 0, 0, 0]) +
+             np.random.randn(nobs))
+    weights = np.array([0., 1, 1, 1, 1, 1, 1])
+    model = OLS(endog, exog)
+    # ridge regression has a closed form solution
+    res = model.fit_regularized(alpha=0.3, L1_wt=0, penalty_weights=weights)
+    xtx = np.dot(exog.T, exog) / nobs
+    params = np.linalg.solve(xtx + 0.3 * np.diag(weights),
+                             np.dot(exog.T, endog) / nobs)
+    assert_almost_equal(res.params, params, 12)
+    assert_(res.fit_history['converged'])
+    # optimality conditions of the elastic net
+    for L1_wt in [1., 0.5]:
+        alpha = 0.2
+        res = model.fit_regularized(alpha=alpha, L1_wt=L1_wt,
+                                    penalty_weights=weights)
+        grad = (np.dot(exog.T, res.resid) / nobs -
+                alpha * (1 - L1_wt) * weights * res.params)
+        nonzero = res.params != 0
+        assert_(0 < nonzero.sum() < 7)
+        assert_almost_equal(grad[nonzero], alpha * L1_wt * weights[nonzero] *
+                            np.sign(res.params[nonzero]), 12)
+        assert_(np.all(np.abs(grad[~nonzero]) <=
+                       alpha * L1_wt * weights[~nonzero] + 1e-12))
+    # WLS is OLS of the whitened data
+    wts = np.random.uniform(0.5, 2, size=nobs)
+    res1 = WLS(endog, exog, weights=wts).fit_regularized(alpha=0.1,
+                                                         L1_wt=0.5)
+    res2 = OLS(endog * np.sqrt(wts), exog * np.sqrt(wts)[:,None]
+               ).fit_regularized(alpha=0.1, L1_wt=0.5)
+    assert_almost_equal(res1.params, res2.params, 12)
+
+def test_fit_regularized_path():
+    np.random.seed(12345)
+    nobs = 200
+    exog = add_constant(np.random.randn(nobs, 6), prepend=True)
+    endog = (np.dot(exog, [1., 2, -1, 0.5, 0, 0, 0]) +
+             np.random.randn(nobs))
+    weights = np.array([0., 1, 1, 1, 1, 1, 1])
+    model = OLS(endog, exog)
+    res = model.fit_regularized_path(penalty_weights=weights, n_alphas=20,
+                                     L1_wt=0.5, path_tol=0, cv=4)
+    assert_equal(res.params.shape, (20, 7))
+    assert_(res.converged.all())
+    assert_equal(res.nnz_params[0], 1)
+    assert_(res.nnz_params[-1] >= 4)
+    for i in [3, 10]:
+        res1 = model.fit_regularized(alpha=res.alphas[i], L1_wt=0.5,
+                                     penalty_weights=weights)
+        assert_almost_equal(res.params[i], res1.params, 10)
+        assert_almost_equal(res.deviance[i], res1.ssr, 8)
+    # the cross-products of the training samples are computed by
+    # subtracting the ones of the test sample
+    train = np.arange(nobs) >= 50
+    res_train = OLS(endog[train], exog[train]).fit_regularized_path(
+            alphas=res.alphas, L1_wt=0.5, penalty_weights=weights,
+            path_tol=0)
+    resid = endog[~train, None] - np.dot(exog[~train], res_train.params.T)
+    cv_error = [(resid**2).mean(0)]
+    for start in [50, 100, 150]:
+        test = (np.arange(nobs) >= start) & (np.arange(nobs) < start + 50)
+        res_train = OLS(endog[~test], exog[~test]).fit_regularized_path(
+                alphas=res.alphas, L1_wt=0.5, penalty_weights=weights,
+                path_tol=0)
+        resid = endog[test, None] - np.dot(exog[test], res_train.params.T)
+        cv_error.append((resid**2).mean(0))
+    assert_almost_equal(res.cv_error, np.mean(cv_error, 0), 10)
+    assert_equal(res.alpha_cv, res.alphas[np.argmin(res.cv_error)])
+    assert_raises(ValueError, model.fit_regularized_path, alphas=[1., 2.])
+
 def test_summary():
     # test 734
     import re
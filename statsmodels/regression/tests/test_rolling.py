@@ -0,0 +1,136 @@
+"""
+Tests for rolling and expanding window regression
+"""
+import numpy as np
+from numpy.testing import assert_allclose, assert_equal, assert_raises, assert_
+from statsmodels.tools.tools import add_constant
+from statsmodels.regression.linear_model import OLS, WLS
+from statsmodels.regression.rolling import RollingOLS, RollingWLS
+from statsmodels.datasets.longley import load as load_longley
+
+
+class CheckRolling(object):
+
+    def _windows(self):
+        nobs = len(self.endog)
+        for t in range(nobs):
+            if self.expanding:
+                start = 0
+            else:
+                start = max(0, t - self.window + 1)
+            yield t, start
+
+    def _fit_window(self, start, stop):
+        return OLS(self.endog[start:stop], self.exog[start:stop]).fit()
+
+    def test_windows(self):
+        res1 = self.res1
+        for t, start in self._windows():
+            if t + 1 - start < self.min_nobs:
+                assert_(np.isnan(res1.params[t]).all())
+                assert_(np.isnan(res1.ssr[t]))
+                continue
+            res2 = self._fit_window(start, t + 1)
+            assert_allclose(res1.params[t], res2.params, rtol=1e-8)
+            assert_allclose(res1.bse[t], res2.bse, rtol=1e-8)
+            assert_allclose(res1.tvalues[t], res2.tvalues, rtol=1e-8)
+            assert_allclose(res1.pvalues[t], res2.pvalues, rtol=1e-7)
+            for attr in ['ssr', 'scale', 'rsquared', 'rsquared_adj',
+                         'centered_tss', 'uncentered_tss', 'ess',
+                         'df_resid']:
+                assert_allclose(getattr(res1, attr)[t],
+                                getattr(res2, attr), rtol=1e-8,
+                                err_msg=attr)
+            assert_equal(res1.nobs[t], res2.nobs)
+
+
+class TestRollingOLS(CheckRolling):
+    @classmethod
+    def setupClass(cls):
+        np.random.seed(9876789)
+        nobs = 103
+        cls.exog = add_constant(np.random.randn(nobs, 3), prepend=False)
+        cls.endog = (np.dot(cls.exog, [1., -0.5, 0.25, 2.]) +
+                     np.random.randn(nobs))
+        cls.window = 20
+        cls.min_nobs = 20
+        cls.expanding = False
+        cls.res1 = RollingOLS(cls.endog, cls.exog, window=20).fit()
+
+
+class TestRollingOLSMinNobs(TestRollingOLS):
+    @classmethod
+    def setupClass(cls):
+        super(TestRollingOLSMinNobs, cls).setupClass()
+        cls.min_nobs = 7
+        cls.res1 = RollingOLS(cls.endog, cls.exog, window=20,
+                              min_nobs=7).fit()
+
+
+class TestExpandingOLS(TestRollingOLS):
+    @classmethod
+    def setupClass(cls):
+        super(TestExpandingOLS, cls).setupClass()
+        cls.min_nobs = 5
+        cls.expanding = True
+        cls.res1 = RollingOLS(cls.endog, cls.exog, expanding=True).fit()
+
+
+class TestRollingWLS(TestRollingOLS):
+    @classmethod
+    def setupClass(cls):
+        super(TestRollingWLS, cls).setupClass()
+        cls.weights = np.random.uniform(0.5, 2, size=len(cls.endog))
+        cls.window = 15
+        cls.min_nobs = 10
+        cls.res1 = RollingWLS(cls.endog, cls.exog, window=15,
+                              weights=cls.weights, min_nobs=10).fit()
+
+    def _fit_window(self, start, stop):
+        return WLS(self.endog[start:stop], self.exog[start:stop],
+                   weights=self.weights[start:stop]).fit()
+
+
+def test_rank_deficient_window():
+    np.random.seed(12345)
+    nobs = 60
+    exog = add_constant(np.random.randn(nobs, 2), prepend=False)
+    # dummy that is zero in the first 30 observations
+    dummy = np.zeros(nobs)
+    dummy[30:] = np.random.randn(30)
+    exog = np.column_stack((exog, dummy))
+    endog = np.dot(exog, [1., 2., 3., 4.]) + np.random.randn(nobs)
+    res = RollingOLS(endog, exog, window=10).fit()
+    assert_(np.isnan(res.params[:30]).all())
+    assert_(np.isfinite(res.params[30:]).all())
+    res2 = OLS(endog[40:50], exog[40:50]).fit()
+    assert_allclose(res.params[49], res2.params, rtol=1e-8)
+
+
+def test_ill_conditioned():
+    # a large level relative to the residuals cancels in y'y - b'X'y
+    np.random.seed(987125)
+    nobs = 200
+    exog = add_constant(np.random.randn(nobs, 2), prepend=False)
+    endog = (1e6 + np.dot(exog, [1., 2., 0.]) +
+             1e-3 * np.random.randn(nobs))
+    longley = load_longley()
+    longley_exog = add_constant(longley.exog, prepend=False)
+    for y, x, window in [(endog, exog, 50), (longley.endog, longley_exog, 12)]:
+        for expanding in [False, True]:
+            res = RollingOLS(y, x, window=window, expanding=expanding).fit()
+            for t in range(window - 1, len(y)):
+                start = 0 if expanding else t - window + 1
+                res2 = OLS(y[start:t+1], x[start:t+1]).fit()
+                assert_allclose(res.ssr[t], res2.ssr, rtol=1e-5)
+                assert_allclose(res.bse[t], res2.bse, rtol=1e-5)
+                assert_allclose(res.centered_tss[t], res2.centered_tss,
+                                rtol=1e-10)
+                assert_allclose(res.rsquared[t], res2.rsquared, rtol=1e-8)
+
+
+def test_invalid():
+    endog = np.random.randn(20)
+    exog = add_constant(np.random.randn(20, 2), prepend=False)
+    assert_raises(ValueError, RollingOLS, endog, exog)
+    assert_raises(ValueError, RollingOLS, endog, exog, window=10, min_nobs=3)
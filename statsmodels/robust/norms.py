@@ -76,6 +76,17 @@ class RobustNorm(object):
         '''
         raise NotImplementedError
 
+    def weights_psi_rho(self, z):
+        """
+        Returns weights(z), psi(z) and rho(z)
+
+        Used in the IRLS iterations of RLM, which need the weights for the
+        next iteration and rho for the convergence check at the same z.
+        Subclasses compute the three functions in one pass over z, sharing
+        the intermediate arrays.
+        """
+        return self.weights(z), self.psi(z), self.rho(z)
+
     def __call__(self, z):
         """
         Returns the value of estimator rho applied to an input
@@ -265,6 +276,17 @@ class HuberT(RobustNorm):
         """
         return np.less_equal(np.fabs(z), self.t)
 
+    def weights_psi_rho(self, z):
+        """
+        Returns weights(z), psi(z) and rho(z) of Huber's t in one pass
+        """
+        t = self.t
+        absz = np.fabs(z)
+        weights = t / np.maximum(absz, t)
+        psi = weights * z
+        rho = np.where(absz <= t, 0.5 * z**2, absz * t - 0.5 * t**2)
+        return weights, psi, rho
+
 #TODO: untested, but looks right.  RamsayE not available in R or SAS?
 class RamsayE(RobustNorm):
     """
@@ -461,6 +483,17 @@ class AndrewWave(RobustNorm):
         test = self._subset(z)
         return test*np.cos(z / self.a)/self.a
 
+    def weights_psi_rho(self, z):
+        """
+        Returns weights(z), psi(z) and rho(z) of Andrew's wave in one pass
+        """
+        a = self.a
+        z = np.asarray(z)
+        za = z / a
+        test = np.fabs(za) <= np.pi
+        sin = np.sin(za) * test
+        return sin / za, sin, np.where(test, a * (1 - np.cos(za)), 2 * a)
+
 #TODO: this is untested
 class TrimmedMean(RobustNorm):
     """
@@ -657,8 +690,8 @@ class Hampel(RobustNorm):
         s = np.sign(z)
         z = np.fabs(z)
         v = s * (t1 * z +
-                 t2 * a*s +
-                 t3 * a*s * (c - z) / (c - b))
+                 t2 * a +
+                 t3 * a * (c - z) / (c - b))
         return v
 
     def weights(self, z):
@@ -697,6 +730,29 @@ class Hampel(RobustNorm):
         t1, t2, t3 = self._subset(z)
         return t1 + t3 * (self.a*np.sign(z)*z)/(np.fabs(z)*(self.c-self.b))
 
+    def weights_psi_rho(self, z):
+        """
+        Returns weights(z), psi(z) and rho(z) of Hampel's function in one
+        pass
+        """
+        z = np.asarray(z)
+        a = self.a; b = self.b; c = self.c
+        absz = np.fabs(z)
+        t1 = absz <= a
+        t2 = (absz <= b) & ~t1
+        t3 = (absz <= c) & ~(t1 | t2)
+        # absz where weights are computed by division
+        safe = np.where(t1, 1., absz)
+        weights = np.where(t1, 1., 0.)
+        weights[t2] = a / safe[t2]
+        weights[t3] = a * (c - safe[t3]) / (safe[t3] * (c - b))
+        psi = weights * z
+        rho = (t1 * z**2 * 0.5 +
+               t2 * (a * absz - a**2 * 0.5) +
+               t3 * (a * (c * absz - z**2 * 0.5) / (c - b) - 7 * a**2 / 6.) +
+               (1 - t1 + t2 + t3) * a * (b + c - a))
+        return weights, psi, rho
+
 class TukeyBiweight(RobustNorm):
     """
 
@@ -800,6 +856,19 @@ class TukeyBiweight(RobustNorm):
         return subset*((1 - (z/self.c)**2)**2 - (4*z**2/self.c**2) *\
                     (1-(z/self.c)**2))
 
+    def weights_psi_rho(self, z):
+        """
+        Returns weights(z), psi(z) and rho(z) of Tukey's biweight in one
+        pass
+        """
+        z = np.asarray(z)
+        u = 1 - (z / self.c)**2
+        subset = np.fabs(z) <= self.c
+        u *= subset
+        weights = u**2
+        return (weights, z * weights,
+                -u * weights * self.c**2 / 6.)
+
 def estimate_location(a, scale, norm=None, axis=0, initial=None,
                       maxiter=30, tol=1.0e-06):
     """
@@ -115,7 +115,10 @@ class RLM(base.LikelihoodModel):
                 missing=missing)
         self._initialize()
         #things to remove_data
-        self._data_attr.extend(['weights', 'pinv_wexog'])
+        self._data_attr.extend(['weights', 'pinv_wexog', 'exog_Q'])
+
+    def _get_init_kwds(self):
+        return {'M' : self.M}
 
     def _initialize(self):
         """
@@ -170,17 +173,52 @@ class RLM(base.LikelihoodModel):
         return self.M((self.endog - tmp_results.fittedvalues) /
                           tmp_results.scale).sum()
 
-    def _update_history(self, tmp_results, history, conv):
-        history['params'].append(tmp_results.params)
-        history['scale'].append(tmp_results.scale)
+    def _update_history(self, history, params, scale, sresid, rho, weights,
+                        conv):
+        history['params'].append(params)
+        history['scale'].append(scale)
         if conv == 'dev':
-            history['deviance'].append(self.deviance(tmp_results))
+            history['deviance'].append(rho.sum())
         elif conv == 'sresid':
-            history['sresid'].append(tmp_results.resid/tmp_results.scale)
+            history['sresid'].append(sresid)
         elif conv == 'weights':
-            history['weights'].append(tmp_results.model.weights)
+            history['weights'].append(weights)
         return history
 
+    def _wls(self, weights, buffers):
+        """
+        Weighted least squares estimate for the IRLS iterations.
+
+        For a design of full rank, exog = QR is factorized once and the
+        estimate is R^{-1} (Q'WQ)^{-1} Q'W endog. Q'WQ does not have the
+        squared condition number of exog'W exog, and WQ is written into the
+        same buffer in each iteration. If Q'WQ is singular, for example
+        because too many weights are zero, the pseudoinverse of the weighted
+        design is used as in WLS.
+        """
+        from scipy.linalg import cho_solve, solve_triangular
+        endog = self.endog
+        if self.df_model + 1 == self.exog.shape[1]:
+            if not hasattr(self, 'exog_Q'):
+                self.exog_Q, self.exog_R = np.linalg.qr(self.exog)
+            Q = self.exog_Q
+            if 'wQ' not in buffers:
+                buffers['wQ'] = np.empty_like(Q)
+            wQ = np.multiply(Q, weights[:,None], buffers['wQ'])
+            try:
+                L = np.linalg.cholesky(np.dot(Q.T, wQ))
+                return solve_triangular(self.exog_R,
+                                        cho_solve((L, True),
+                                                  np.dot(wQ.T, endog)))
+            except np.linalg.LinAlgError:
+                pass
+        if 'wexog' not in buffers:
+            buffers['wexog'] = np.empty_like(self.exog, dtype=float)
+        sqrt_weights = np.sqrt(weights)
+        wexog = np.multiply(self.exog, sqrt_weights[:,None],
+                            buffers['wexog'])
+        return np.dot(np.linalg.pinv(wexog), sqrt_weights * endog)
+
     def _estimate_scale(self, resid):
         """
         Estimates the scale based on the option provided to the fit method.
@@ -196,7 +234,7 @@ class RLM(base.LikelihoodModel):
             return scale.scale_est(self, resid)**2
 
     def fit(self, maxiter=50, tol=1e-8, scale_est='mad', init=None, cov='H1',
-            update_scale=True, conv='dev'):
+            update_scale=True, conv='dev', start_params=None):
         """
         Fits the model using iteratively reweighted least squares.
 
@@ -237,6 +275,10 @@ class RLM(base.LikelihoodModel):
             If `update_scale` is False then the scale estimate for the
             weights is held constant over the iteration.  Otherwise, it
             is updated for each fit in the iteration.  Default is True.
+        start_params : array-like, optional
+            Starting values of the parameters, for example the estimates of
+            a previous fit with other options or of a similar data set. The
+            default is None, which uses the least squares estimate.
 
         Returns
         -------
@@ -252,9 +294,16 @@ class RLM(base.LikelihoodModel):
             raise ValueError("Convergence argument %s not understood" \
                 % conv)
         self.scale_est = scale_est
-        wls_results = lm.WLS(self.endog, self.exog).fit()
+        if start_params is None:
+            params = np.dot(self.pinv_wexog, self.endog)
+        else:
+            params = np.asarray(start_params, dtype=float)
+            if params.shape != (self.exog.shape[1],):
+                raise ValueError("start_params has to have one element per "
+                                 "column of exog")
+        resid = self.endog - np.dot(self.exog, params)
         if not init:
-            self.scale = self._estimate_scale(wls_results.resid)
+            self.scale = self._estimate_scale(resid)
 
         history = dict(params = [np.inf], scale = [])
         if conv == 'coefs':
@@ -269,20 +318,29 @@ class RLM(base.LikelihoodModel):
             history.update(dict(weights = [np.inf]))
             criterion = history['weights']
 
+        # the weights for the next iteration and rho for the deviance are
+        # computed together from the standardized residuals
+        sresid = resid / self.scale
+        weights, _, rho = self.M.weights_psi_rho(sresid)
         # done one iteration so update
-        history = self._update_history(wls_results, history, conv)
+        history = self._update_history(history, params, self.scale, sresid,
+                                       rho, np.ones_like(resid), conv)
         iteration = 1
         converged = 0
+        buffers = {}
         while not converged:
-            self.weights = self.M.weights(wls_results.resid/self.scale)
-            wls_results = lm.WLS(self.endog, self.exog,
-                                 weights=self.weights).fit()
+            self.weights = weights
+            params = self._wls(weights, buffers)
+            resid = self.endog - np.dot(self.exog, params)
             if update_scale is True:
-                self.scale = self._estimate_scale(wls_results.resid)
-            history = self._update_history(wls_results, history, conv)
+                self.scale = self._estimate_scale(resid)
+            sresid = resid / self.scale
+            weights, _, rho = self.M.weights_psi_rho(sresid)
+            history = self._update_history(history, params, self.scale,
+                                           sresid, rho, self.weights, conv)
             iteration += 1
             converged = _check_convergence(criterion, iteration, tol, maxiter)
-        results = RLMResults(self, wls_results.params,
+        results = RLMResults(self, params,
                             self.normalized_cov_params, self.scale)
 
         history['iteration'] = iteration
@@ -14,6 +14,19 @@ from scipy.stats import norm as Gaussian
 import norms
 from statsmodels.tools import tools
 
+def _median(a, axis=0):
+    """
+    Median along axis by selection of the middle elements, O(n) instead of
+    the sort of np.median.
+    """
+    a = np.asarray(a)
+    if not hasattr(np, 'partition') or a.ndim == 0 or a.shape[axis] == 0:
+        return np.median(a, axis=axis)
+    n = a.shape[axis]
+    kth = [(n - 1) // 2, n // 2]
+    middle = np.partition(a, kth, axis=axis).take(kth, axis=axis)
+    return middle.mean(axis)
+
 def mad(a, c=Gaussian.ppf(3/4.), axis=0):  # c \approx .6745
     """
     The Median Absolute Deviation along given axis of an array
@@ -34,7 +47,7 @@ def mad(a, c=Gaussian.ppf(3/4.), axis=0):  # c \approx .6745
         `mad` = median(abs(`a`))/`c`
     """
     a = np.asarray(a)
-    return np.median((np.fabs(a))/c, axis=axis)
+    return _median(np.fabs(a), axis=axis) / c
 
 def stand_mad(a, c=Gaussian.ppf(3/4.), axis=0):
     """
@@ -57,9 +70,9 @@ def stand_mad(a, c=Gaussian.ppf(3/4.), axis=0):
     """
 
     a = np.asarray(a)
-    d = np.median(a, axis = axis)
+    d = _median(a, axis=axis)
     d = tools.unsqueeze(d, axis, a.shape)
-    return np.median(np.fabs(a - d)/c, axis = axis)
+    return _median(np.fabs(a - d), axis=axis) / c
 
 class Huber(object):
     """
@@ -130,7 +143,7 @@ class Huber(object):
         a = np.asarray(a)
         if mu is None:
             n = a.shape[0] - 1
-            mu = np.median(a, axis=axis)
+            mu = _median(a, axis=axis)
             est_mu = True
         else:
             n = a.shape[0]
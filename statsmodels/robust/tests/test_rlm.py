@@ -3,7 +3,7 @@ Test functions for sm.rlm
 """
 
 import numpy as np
-from numpy.testing import assert_almost_equal, assert_allclose
+from numpy.testing import assert_almost_equal, assert_allclose, assert_
 from scipy import stats
 import statsmodels.api as sm
 from statsmodels.robust.robust_linear_model import RLM
@@ -305,3 +305,35 @@ class TestRlmSresid(CheckRlmResultsMixin):
 #                        r.rlm, psi="psi.huber")
         from results.results_rlm import Huber
         self.res2 = Huber()
+
+
+def test_weights_psi_rho():
+    # the fused evaluation agrees with the separate functions
+    z = np.linspace(-12, 12, 241) + 0.01
+    norms = sm.robust.norms
+    for norm in [norms.LeastSquares(), norms.HuberT(), norms.RamsayE(),
+                 norms.AndrewWave(), norms.TrimmedMean(), norms.Hampel(),
+                 norms.TukeyBiweight()]:
+        weights, psi, rho = norm.weights_psi_rho(z)
+        assert_allclose(weights, norm.weights(z), rtol=1e-13, atol=1e-15)
+        assert_allclose(rho, norm.rho(z), rtol=1e-13, atol=1e-15)
+        assert_allclose(psi, norm.psi(z), rtol=1e-13, atol=1e-15)
+        # psi is odd
+        assert_allclose(norm.psi(-z), -norm.psi(z), rtol=1e-13, atol=1e-15)
+
+
+def test_start_params():
+    from statsmodels.datasets.stackloss import load
+    data = load()
+    exog = sm.add_constant(data.exog, prepend=False)
+    for norm in [sm.robust.norms.HuberT(), sm.robust.norms.TukeyBiweight()]:
+        model = RLM(data.endog, exog, M=norm)
+        res = model.fit()
+        res_warm = model.fit(start_params=res.params)
+        assert_allclose(res_warm.params, res.params, rtol=1e-6)
+        assert_allclose(res_warm.scale, res.scale, rtol=1e-6)
+        assert_(res_warm.fit_history['iteration'] <
+                res.fit_history['iteration'])
+        # the irls estimate is the one of WLS with the final weights
+        res_wls = sm.WLS(data.endog, exog, weights=model.weights).fit()
+        assert_allclose(res_warm.params, res_wls.params, rtol=1e-12)
@@ -112,5 +112,17 @@ class TestHuberAxes(object):
         m, s = self.h(self.X, axis=-1)
         assert_equal(m.shape, (40,10))
 
+def test_median():
+    # the selection median is the median
+    np.random.seed(4)
+    for shape in [(1,), (10,), (11,), (7, 4)]:
+        x = np.random.randn(*shape)
+        for axis in range(len(shape)):
+            assert_equal(scale._median(x, axis=axis),
+                         np.median(x, axis=axis))
+    x = np.random.randn(40, 10, 30)
+    assert_almost_equal(scale.mad(x, axis=2),
+                        np.median(np.fabs(x), axis=2) / 0.6744897501960817, 14)
+
 if __name__=="__main__":
     run_module_suite()
@@ -176,19 +176,30 @@ class OLSInfluence(object):
     results : Regression Results instance
         currently assumes the results are from an OLS regression
 
+    memory_limit : int or None
+        Approximate upper bound in bytes for the temporary arrays used in the
+        calculation of the hat matrix diagonal and the leave-one-observation-
+        out results. The observations are then processed in blocks. If None,
+        all observations are processed at once.
+
     Notes
     -----
     One part of the results can be calculated without any auxiliary regression
     (some of which have the `_internal` postfix in the name. Other statistics
-    require leave-one-observation-out (LOOO) auxiliary regression, and will be
-    slower (mainly results with `_external` postfix in the name).
-    The auxiliary LOOO regression only the required results are stored.
+    are based on the leave-one-observation-out (LOOO) auxiliary regressions
+    (mainly results with `_external` postfix in the name).
+
+    The LOOO results are not calculated by refitting the model nobs times.
+    They are obtained in closed form from the full sample results with the
+    Sherman-Morrison update of the inverse of X'X, using the thin QR
+    decomposition of exog, X = QR. With h_i the i-th diagonal element of the
+    hat matrix and e_i the residual ::
 
-    Using the LOO measures is currently only recommended if the data set
-    is not too large. One possible approach for LOOO measures would be to
-    identify possible problem observations with the _internal measures, and
-    then run the leave-one-observation-out only with observations that are
-    possible outliers. (However, this is not yet available in an automized way.)
+        params_(i) = params - pinv(X'X) x_i e_i / (1 - h_i)
+        ssr_(i) = ssr - e_i**2 / (1 - h_i)
+        det(X'X - x_i x_i') = det(X'X) (1 - h_i)
+
+    so that the cost is O(nobs k**2) instead of O(nobs**2 k**2).
 
     This should be extended to general least squares.
 
@@ -197,9 +208,10 @@ class OLSInfluence(object):
 
     '''
 
-    def __init__(self, results):
+    def __init__(self, results, memory_limit=None):
         #check which model is allowed
         self.results = maybe_unwrap_results(results)
+        self.memory_limit = memory_limit
         self.nobs, self.k_vars = results.model.exog.shape
         self.endog = results.model.endog
         self.exog = results.model.exog
@@ -217,8 +229,38 @@ class OLSInfluence(object):
         Notes
         -----
         temporarily calculated here, this should go to model class
+
+        h_i = ||q_i||**2, where q_i is the i-th row of Q in the thin QR
+        decomposition of exog
+        '''
+        hii = np.empty(self.nobs)
+        for sl in self._iter_blocks():
+            hii[sl] = (np.dot(self.exog[sl], self._pinv_exog_r)**2).sum(1)
+        return hii
+
+    @cache_readonly
+    def _pinv_exog_r(self):
+        '''pinv of R from the thin QR decomposition of exog
+
+        exog_i pinv(R) are the rows of Q, and pinv(R) pinv(R)' = pinv(X'X).
         '''
-        return (self.exog * self.results.model.pinv_wexog.T).sum(1)
+        R = np.linalg.qr(self.exog, mode='r')
+        return np.linalg.pinv(R)
+
+    def _iter_blocks(self, ncols=None):
+        '''slices of observations in blocks bounded by memory_limit
+
+        ncols is the number of float columns of the temporary arrays per
+        observation, default is 2 * k_vars.
+        '''
+        if ncols is None:
+            ncols = 2 * self.k_vars
+        if self.memory_limit is None:
+            blocksize = self.nobs
+        else:
+            blocksize = max(1, int(self.memory_limit // (8 * ncols)))
+        for start in range(0, self.nobs, blocksize):
+            yield slice(start, min(start + blocksize, self.nobs))
 
     @cache_readonly
     def resid_press(self):
@@ -270,7 +312,7 @@ class OLSInfluence(object):
 
         this uses sigma from leave-one-out estimates
 
-        requires leave one out loop for observations
+        uses the leave-one-observation-out results
         '''
         sigma_looo = np.sqrt(self.sigma2_not_obsi)
         return self.get_resid_studentized_external(sigma=sigma_looo)
@@ -329,7 +371,7 @@ class OLSInfluence(object):
         '''(cached attribute) dffits measure for influence of an observation
 
         based on resid_studentized_external,
-        uses results from leave-one-observation-out loop
+        uses the leave-one-observation-out results
 
         It is recommended that observations with dffits large than a
         threshold of 2 sqrt{k / n} where k is the number of parameters, should
@@ -357,7 +399,7 @@ class OLSInfluence(object):
     def dfbetas(self):
         '''(cached attribute) dfbetas
 
-        uses results from leave-one-observation-out loop
+        uses the leave-one-observation-out results
         '''
         dfbetas = self.results.params - self.params_not_obsi#[None,:]
         dfbetas /= np.sqrt(self.sigma2_not_obsi[:,None])
@@ -370,7 +412,7 @@ class OLSInfluence(object):
 
         This is 'mse_resid' from each auxiliary regression.
 
-        uses results from leave-one-observation-out loop
+        uses the leave-one-observation-out results
         '''
         return np.asarray(self._res_looo['mse_resid'])
 
@@ -378,7 +420,7 @@ class OLSInfluence(object):
     def params_not_obsi(self):
         '''(cached attribute) parameter estimates for all LOOO regressions
 
-        uses results from leave-one-observation-out loop
+        uses the leave-one-observation-out results
         '''
         return np.asarray(self._res_looo['params'])
 
@@ -386,7 +428,7 @@ class OLSInfluence(object):
     def det_cov_params_not_obsi(self):
         '''(cached attribute) determinant of cov_params of all LOOO regressions
 
-        uses results from leave-one-observation-out loop
+        uses the leave-one-observation-out results
         '''
         return np.asarray(self._res_looo['det_cov_params'])
 
@@ -415,7 +457,7 @@ class OLSInfluence(object):
 
         This uses determinant of the estimate of the parameter covariance
         from leave-one-out estimates.
-        requires leave one out loop for observations
+        uses the leave-one-observation-out results
 
         '''
         #don't use inplace division / because then we change original
@@ -504,7 +546,9 @@ class OLSInfluence(object):
     def _get_drop_vari(self, attributes):
         '''regress endog on exog without one of the variables
 
-        This uses a k_vars loop, only attributes of the OLS instance are stored.
+        Only attributes of the OLS instance are stored. 'params', 'ssr' and
+        'mse_resid' are obtained in closed form from the full regression,
+        other attributes require a k_vars loop of auxiliary regressions.
 
         Parameters
         ----------
@@ -512,49 +556,75 @@ class OLSInfluence(object):
            These are the names of the attributes of the auxiliary OLS results
            instance that are stored and returned.
 
+        Notes
+        -----
+        Dropping variable j changes the other parameters by
+        - ncp[:, j] / ncp[j, j] * params[j] and increases the ssr by
+        params[j]**2 / ncp[j, j], where ncp is the normalized_cov_params of
+        the full regression.
+
         not yet used
         '''
-        from statsmodels.sandbox.tools.cross_val import LeaveOneOut
-
         endog = self.results.model.endog
         exog = self.exog
-
-        cv_iter = LeaveOneOut(self.k_vars)
+        k_vars = self.k_vars
         res_loo = defaultdict(list)
+
+        closed_form = set(['params', 'ssr', 'mse_resid'])
+        if closed_form.issuperset(attributes):
+            params = self.results.params
+            ncp = self.results.normalized_cov_params
+            ssr = self.results.ssr
+            df_resid = self.results.df_resid + 1
+            for j in range(k_vars):
+                mask = np.arange(k_vars) != j
+                ssr_j = ssr + params[j]**2 / ncp[j, j]
+                values = dict(params=(params - ncp[:, j] / ncp[j, j] *
+                                      params[j])[mask],
+                              ssr=ssr_j, mse_resid=ssr_j / df_resid)
+                for att in attributes:
+                    res_loo[att].append(values[att])
+            return res_loo
+
+        from statsmodels.sandbox.tools.cross_val import LeaveOneOut
+        cv_iter = LeaveOneOut(k_vars)
         for inidx, outidx in cv_iter:
+            res_i = self.model_class(endog, exog[:,inidx]).fit()
             for att in attributes:
-                res_i = self.model_class(endog, exog[:,inidx]).fit()
                 res_loo[att].append(getattr(res_i, att))
 
         return res_loo
 
     @cache_readonly
     def _res_looo(self):
-        '''collect required results from the LOOO loop
+        '''collect required results from the LOOO regressions
 
         all results will be attached.
         currently only 'params', 'mse_resid', 'det_cov_params' are stored
 
-        regresses endog on exog dropping one observation at a time
-
-        this uses a nobs loop, only attributes of the OLS instance are stored.
+        The results of regressing endog on exog dropping one observation at
+        a time are computed in closed form, in blocks of observations, see
+        Notes in the class docstring.
         '''
-        from statsmodels.sandbox.tools.cross_val import LeaveOneOut
-        get_det_cov_params = lambda res: np.linalg.det(res.cov_params())
-
-        endog = self.endog
+        results = self.results
+        resid = results.resid
+        hii = self.hat_matrix_diag
+        pinv_r = self._pinv_exog_r
         exog = self.exog
 
-        params = np.zeros_like(exog)
-        mse_resid = np.zeros_like(endog)
-        det_cov_params = np.zeros_like(endog)
-
-        cv_iter = LeaveOneOut(self.nobs)
-        for inidx, outidx in cv_iter:
-            res_i = self.model_class(endog[inidx], exog[inidx]).fit()
-            params[outidx] = res_i.params
-            mse_resid[outidx] = res_i.mse_resid
-            det_cov_params[outidx] = get_det_cov_params(res_i)
+        params = np.empty_like(exog)
+        # resid_i / (1 - h_i), PRESS residuals
+        resid_press = resid / (1 - hii)
+        for sl in self._iter_blocks():
+            # pinv(X'X) x_i = pinv(R) q_i'
+            xtxi_x = np.dot(np.dot(exog[sl], pinv_r), pinv_r.T)
+            params[sl] = results.params - xtxi_x * resid_press[sl][:,None]
+
+        df_resid = results.df_resid - 1
+        mse_resid = (results.ssr - resid * resid_press) / df_resid
+        # det(cov_(i)) = mse_resid_(i)**k det(pinv(X'X)) / (1 - h_i)
+        det_ncp = np.linalg.det(results.normalized_cov_params)
+        det_cov_params = mse_resid**self.k_vars * det_ncp / (1 - hii)
 
         return dict(params=params, mse_resid=mse_resid,
                        det_cov_params=det_cov_params)
@@ -102,13 +102,14 @@ Statistics 90, no. 3 (2008): 414–427.
 
 """
 
+from itertools import combinations
+
 import numpy as np
 
-from statsmodels.tools.grouputils import Group
 from statsmodels.stats.moment_helpers import se_cov
 
 __all__ = ['cov_cluster', 'cov_cluster_2groups', 'cov_hac', 'cov_nw_panel',
-           'cov_white_simple',
+           'cov_white_simple', 'ClusterGroups',
            'cov_hc0', 'cov_hc1', 'cov_hc2', 'cov_hc3',
            'se_cov', 'weights_bartlett', 'weights_uniform']
 
@@ -480,6 +481,8 @@ def cov_cluster(results, group, use_correction=True):
     results : result instance
        result of a regression, uses results.model.exog and results.resid
        TODO: this should use wexog instead
+    group : array_like
+       cluster label of each observation
     use_correction : bool
        If true (default), then the small sample correction factor is used.
 
@@ -492,20 +495,14 @@ def cov_cluster(results, group, use_correction=True):
     -----
     same result as Stata in UCLA example and same as Peterson
 
-    '''
-    #TODO: currently used version of groupsums requires 2d resid
-    xu = results.model.exog * results.resid[:, None]
-    scale = S_crosssection(xu, group)
-
-    nobs, k_vars = results.model.exog.shape
-    n_groups = len(np.unique(group)) #replace with stored group attributes if available
-
-    cov_c = _HCCM2(results, scale)
-
-    if use_correction:
-        cov_c *= n_groups / (n_groups - 1.) * ((nobs-1.) / float(nobs - k_vars))
+    See Also
+    --------
+    ClusterGroups : precomputed cluster codes for several results and
+        multiway clustering
 
-    return cov_c
+    '''
+    return ClusterGroups(group).cov_cluster(results,
+                                           use_correction=use_correction)
 
 def cov_cluster_2groups(results, group, group2=None, use_correction=True):
     '''cluster robust covariance matrix for two groups/clusters
@@ -545,18 +542,14 @@ def cov_cluster_2groups(results, group, group2=None, use_correction=True):
     else:
         group0 = group
         group1 = group2
-        group = (group0, group1)
-
 
-    cov0 = cov_cluster(results, group0, use_correction=use_correction)
-    #[0] because we get still also returns bse
-    cov1 = cov_cluster(results, group1, use_correction=use_correction)
 
-    group_intersection = Group(group)
+    groups = ClusterGroups([group0, group1])
+    xu = groups._xu(results)
+    cov0 = groups._cov_clusters(results, (0,), use_correction, xu)
+    cov1 = groups._cov_clusters(results, (1,), use_correction, xu)
     #cov of cluster formed by intersection of two groups
-    cov01 = cov_cluster(results,
-                        group_intersection.group_int,
-                        use_correction=use_correction)
+    cov01 = groups._cov_clusters(results, (0, 1), use_correction, xu)
 
     #robust cov matrix for union of groups
     cov_both = cov0 + cov1 - cov01
@@ -685,14 +678,10 @@ def S_nw_panel(xw, weights, groupidx):
 
     no reference for this, just accounting for time indices
     '''
-    nlags = len(weights)-1
-
-    S = weights[0] * np.dot(xw.T, xw)  #weights just for completeness
-    for lag in range(1, nlags+1):
-        xw0, xwlag = lagged_groups(xw, lag, groupidx)
-        s = np.dot(xw0.T, xwlag)
-        S += weights[lag] * (s + s.T)
-    return S
+    group = -np.ones(xw.shape[0], np.intp)
+    for i, (l, u) in enumerate(groupidx):
+        group[l:u] = i
+    return _S_nw_sorted(xw, weights, group)
 
 
 def cov_nw_panel(results, nlags, groupidx, weights_func=weights_bartlett,
@@ -841,3 +830,242 @@ def cov_nw_groupsum(results, nlags, time, weights_func=weights_bartlett,
     return cov_hac
 
 
+
+
+#---------------------- precomputed group indexes for large panels
+
+def _factorize(labels):
+    '''codes in range(n_groups) for the labels and the number of groups
+
+    The codes follow the sort order of the labels. Integer labels with a
+    range that is not larger than the number of observations are coded with
+    bincount, other labels by sorting.
+    '''
+    labels = np.asarray(labels)
+    if labels.ndim != 1:
+        raise ValueError('group labels need to be one-dimensional')
+    if labels.dtype.kind in 'iub' and len(labels) > 0:
+        labels = labels.astype(np.intp)
+        shifted = labels - labels.min()
+        if shifted.max() <= max(len(labels), 1024):
+            present = np.bincount(shifted) > 0
+            mapping = np.cumsum(present) - 1
+            return mapping[shifted], int(present.sum())
+    levels, codes = np.unique(labels, return_inverse=True)
+    return codes, len(levels)
+
+
+def _S_nw_sorted(xw, weights, group):
+    '''inner covariance matrix for panel HAC with xw sorted by group and time
+
+    lags are taken only between rows of the same group, rows with negative
+    group codes do not belong to any group
+    '''
+    nlags = len(weights) - 1
+    S = weights[0] * np.dot(xw.T, xw)
+    for lag in range(1, nlags+1):
+        same = (group[lag:] == group[:-lag]) & (group[lag:] >= 0)
+        if not same.any():
+            raise ValueError('all groups are empty taking lags')
+        s = np.dot(xw[lag:].T, xw[:-lag] * same[:,None])
+        S += weights[lag] * (s + s.T)
+    return S
+
+
+class ClusterGroups(object):
+    '''Precomputed group indexes for cluster and panel robust covariances
+
+    The integer codes of the clusters, of their intersections and of the
+    time periods are computed once, so that the covariance matrices for
+    several results on the same panel only need group sums with bincount.
+    The covariances take O(nobs * k_vars + n_groups * k_vars**2) operations.
+
+    Parameters
+    ----------
+    groups : array_like or list of array_like, optional
+        cluster labels, either one label per observation, a 2d array with
+        one column for each cluster dimension or a list of 1d arrays. The
+        labels can be any sortable values.
+    time : array_like, optional
+        time period of each observation, integers for equal spaced periods.
+        This is required for cov_nw_groupsum and cov_nw_panel.
+
+    Attributes
+    ----------
+    codes : list of ndarray
+        codes in range(n_groups) for each cluster dimension
+    n_groups : list of int
+        number of clusters in each dimension
+    time_codes : ndarray or None
+        codes of the time periods
+    n_periods : int or None
+        number of time periods
+
+    Notes
+    -----
+    The multiway cluster covariance follows Cameron, Gelbach and Miller
+    (2011). It is the sum of the one-way cluster covariances over all
+    combinations of the cluster dimensions, where the clusters of a
+    combination are the intersections of the clusters, with sign -1 for an
+    even number of dimensions. The small sample correction is applied to
+    each term, as in cov_cluster_2groups.
+
+    Examples
+    --------
+    >>> groups = ClusterGroups([firm, industry], time=year)
+    >>> cov_2way = groups.cov_cluster(res)
+    >>> cov_dk = groups.cov_nw_groupsum(res, 4)
+    '''
+
+    def __init__(self, groups=None, time=None):
+        if groups is None:
+            groups = []
+        elif isinstance(groups, (list, tuple)):
+            groups = [np.asarray(g) for g in groups]
+        else:
+            groups = np.asarray(groups)
+            groups = [groups] if groups.ndim == 1 else list(groups.T)
+        factorized = [_factorize(g) for g in groups]
+        lengths = [len(g) for g in groups]
+        if time is not None:
+            lengths.append(len(time))
+        if len(set(lengths)) > 1:
+            raise ValueError('groups and time need to have the same length')
+        self.nobs = lengths[0] if lengths else None
+        self.codes = [codes for codes, _ in factorized]
+        self.n_groups = [n_groups for _, n_groups in factorized]
+
+        # intersections of all combinations of the cluster dimensions
+        self._combinations = {}
+        for n_dims in range(1, len(groups) + 1):
+            for dims in combinations(range(len(groups)), n_dims):
+                if n_dims == 1:
+                    codes, n_groups = factorized[dims[0]]
+                else:
+                    codes0 = self._combinations[dims[:-1]][0]
+                    key = codes0 * self.n_groups[dims[-1]] + \
+                          self.codes[dims[-1]]
+                    codes, n_groups = _factorize(key)
+                self._combinations[dims] = (codes, n_groups)
+
+        if time is not None:
+            self.time_codes, self.n_periods = _factorize(time)
+        else:
+            self.time_codes = self.n_periods = None
+        self._panel_order = None
+
+    def _xu(self, results):
+        xu = results.model.exog * results.resid[:, None]
+        if self.nobs is not None and len(xu) != self.nobs:
+            raise ValueError('results and groups have a different number '
+                             'of observations')
+        return xu
+
+    def _check_time(self):
+        if self.time_codes is None:
+            raise ValueError('time is required for panel HAC')
+
+    def group_sums(self, x, codes, n_groups):
+        '''sums of the columns of x for each group, (n_groups, k_vars)'''
+        if x.ndim == 1:
+            x = x[:, None]
+        return np.column_stack([np.bincount(codes, weights=x[:, col],
+                                            minlength=n_groups)
+                                for col in range(x.shape[1])])
+
+    def _cov_clusters(self, results, dims, use_correction, xu):
+        codes, n_groups = self._combinations[dims]
+        scale = S_white_simple(self.group_sums(xu, codes, n_groups))
+        cov_c = _HCCM2(results, scale)
+        if use_correction:
+            nobs, k_vars = results.model.exog.shape
+            cov_c *= n_groups / (n_groups - 1.) * ((nobs-1.) /
+                                                   float(nobs - k_vars))
+        return cov_c
+
+    def cov_cluster(self, results, use_correction=True, dims=None):
+        '''multiway cluster robust covariance matrix
+
+        Parameters
+        ----------
+        results : result instance
+           result of a regression, uses results.model.exog and results.resid
+        use_correction : bool
+           If true (default), then the small sample correction factor is
+           used.
+        dims : list of int or None
+           indices of the cluster dimensions that are used, default is all
+
+        Returns
+        -------
+        cov : ndarray, (k_vars, k_vars)
+            cluster robust covariance matrix for parameter estimates
+        '''
+        if dims is None:
+            dims = range(len(self.codes))
+        dims = tuple(sorted(dims))
+        if not dims:
+            raise ValueError('groups are required for cluster covariances')
+        xu = self._xu(results)
+        cov = 0
+        for n_dims in range(1, len(dims) + 1):
+            sign = 1 if n_dims % 2 else -1
+            for subset in combinations(dims, n_dims):
+                cov = cov + sign * self._cov_clusters(results, subset,
+                                                      use_correction, xu)
+        return cov
+
+    def cov_nw_groupsum(self, results, nlags, weights_func=weights_bartlett,
+                        use_correction=0):
+        '''Driscoll and Kraay panel robust covariance matrix
+
+        See cov_nw_groupsum for the parameters, the time periods are the
+        ones of this instance.
+        '''
+        self._check_time()
+        xu = self._xu(results)
+        x_time = self.group_sums(xu, self.time_codes, self.n_periods)
+        S_hac = S_hac_simple(x_time, nlags=nlags, weights_func=weights_func)
+        cov_hac = _HCCM2(results, S_hac)
+        if use_correction:
+            nobs, k_vars = results.model.exog.shape
+            if use_correction == 'hac':
+                cov_hac *= nobs / float(nobs - k_vars)
+            elif use_correction in ['c', 'cluster']:
+                n_groups = self.n_periods
+                cov_hac *= n_groups / (n_groups - 1.)
+                cov_hac *= ((nobs-1.) / float(nobs - k_vars))
+        return cov_hac
+
+    def cov_nw_panel(self, results, nlags, weights_func=weights_bartlett,
+                     use_correction='hac'):
+        '''Panel HAC robust covariance matrix
+
+        HAC within the clusters of the first dimension, see cov_nw_panel for
+        the parameters. The observations do not need to be sorted, the
+        periods within a cluster are assumed to be consecutive.
+        '''
+        self._check_time()
+        if not self.codes:
+            raise ValueError('groups are required for panel HAC')
+        if self._panel_order is None:
+            order = np.lexsort((self.time_codes, self.codes[0]))
+            self._panel_order = order, self.codes[0][order]
+        order, group = self._panel_order
+
+        if nlags == 0: #so we can reproduce HC0 White
+            weights = [1, 0]
+        else:
+            weights = weights_func(nlags)
+        xw = self._xu(results)[order]
+        S_hac = _S_nw_sorted(xw, weights, group)
+        cov_hac = _HCCM2(results, S_hac)
+        if use_correction:
+            nobs, k_vars = results.model.exog.shape
+            if use_correction == 'hac':
+                cov_hac *= nobs / float(nobs - k_vars)
+            elif use_correction in ['c', 'clu', 'cluster']:
+                n_groups = self.n_groups[0]
+                cov_hac *= n_groups / (n_groups - 1.)
+                cov_hac *= ((nobs-1.) / float(nobs - k_vars))
+        return cov_hac
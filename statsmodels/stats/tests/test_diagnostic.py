@@ -699,6 +699,37 @@ def test_outlier_influence_funcs():
     infl = res2.get_influence()
     infl.summary_table()
 
+def test_influence_looo_refit():
+    # closed form leave-one-observation-out results against refitting
+    np.random.seed(987125)
+    x = add_constant(np.random.randn(50, 3))
+    y = x.sum(1) + np.random.randn(50)
+    res = OLS(y, x).fit()
+    params, mse_resid, det_cov = [], [], []
+    for i in range(50):
+        mask = np.arange(50) != i
+        res_i = OLS(y[mask], x[mask]).fit()
+        params.append(res_i.params)
+        mse_resid.append(res_i.mse_resid)
+        det_cov.append(np.linalg.det(res_i.cov_params()))
+
+    # blocks of 6 observations
+    for infl in [res.get_influence(), res.get_influence(memory_limit=400)]:
+        assert_almost_equal(infl.params_not_obsi, params, decimal=12)
+        assert_almost_equal(infl.sigma2_not_obsi, mse_resid, decimal=12)
+        assert_almost_equal(infl.det_cov_params_not_obsi / det_cov, 1,
+                            decimal=10)
+        assert_almost_equal(infl.hat_matrix_diag,
+                            (x * res.model.pinv_wexog.T).sum(1), decimal=13)
+
+    infl = res.get_influence()
+    lovo = infl._get_drop_vari(['params', 'mse_resid'])
+    for j in range(4):
+        res_j = OLS(y, np.delete(x, j, 1)).fit()
+        assert_almost_equal(lovo['params'][j], res_j.params, decimal=12)
+        assert_almost_equal(lovo['mse_resid'][j], res_j.mse_resid,
+                            decimal=12)
+
 def test_influence_wrapped():
     from pandas import DataFrame
     from pandas.util.testing import assert_series_equal
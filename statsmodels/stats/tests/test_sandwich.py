@@ -10,7 +10,8 @@ Created on Sat Dec 17 08:39:16 2011
 Author: Josef Perktold
 """
 import numpy as np
-from numpy.testing import assert_almost_equal
+from numpy.testing import (assert_almost_equal, assert_allclose, assert_equal,
+                           assert_raises)
 
 from statsmodels.regression.linear_model import OLS, GLSAR
 from statsmodels.tools.tools import add_constant
@@ -89,6 +90,63 @@ def test_hac_simple():
     cov4 = sw.cov_hac_simple(res_olsg, nlags=4, use_correction=False)
     assert_almost_equal(cov3, cov4, decimal=14)
 
+def test_cluster_groups():
+    np.random.seed(9876)
+    nobs = 600
+    firm = np.repeat(np.arange(60), 10)
+    time = np.tile(np.arange(10), 60)
+    industry = firm % 7
+    exog = add_constant(np.random.randn(nobs, 2))
+    endog = (np.dot(exog, [1., .5, -.5]) + np.random.randn(60)[firm] +
+             np.random.randn(10)[time] + np.random.randn(nobs))
+    res = OLS(endog, exog).fit()
+    # non-consecutive labels and shuffled observations
+    perm = np.random.permutation(nobs)
+    res_perm = OLS(endog[perm], exog[perm]).fit()
+    firm_labels = 3 * firm[perm] + 100
+
+    groups = sw.ClusterGroups([firm, time, industry], time=time)
+    assert_equal(groups.n_groups, [60, 10, 7])
+
+    # one-way and two-way against the original functions
+    cov = sw.cov_cluster(res, firm)
+    assert_allclose(groups.cov_cluster(res, dims=[0]), cov, rtol=1e-12)
+    assert_allclose(sw.cov_cluster(res_perm, firm_labels), cov, rtol=1e-12)
+    cov_2way = sw.cov_cluster_2groups(res, firm, time)[0]
+    assert_allclose(groups.cov_cluster(res, dims=[0, 1]), cov_2way,
+                    rtol=1e-12)
+
+    # three-way, inclusion-exclusion over the intersections
+    def cov_inter(*dims):
+        labels = np.column_stack([[firm, time, industry][i] for i in dims])
+        labels = np.dot(labels, 1000**np.arange(len(dims)))
+        return sw.cov_cluster(res, labels)
+    cov_3way = (cov_inter(0) + cov_inter(1) + cov_inter(2) -
+                cov_inter(0, 1) - cov_inter(0, 2) - cov_inter(1, 2) +
+                cov_inter(0, 1, 2))
+    assert_allclose(groups.cov_cluster(res), cov_3way, rtol=1e-12)
+
+    # Driscoll-Kraay and panel HAC
+    for nlags in [0, 2]:
+        assert_allclose(groups.cov_nw_groupsum(res, nlags),
+                        sw.cov_nw_groupsum(res, nlags, time), rtol=1e-12)
+        groupidx = [(i*10, (i+1)*10) for i in range(60)]
+        for use_correction in ['hac', 'cluster']:
+            cov_panel = sw.cov_nw_panel(res, nlags, groupidx,
+                                        use_correction=use_correction)
+            assert_allclose(groups.cov_nw_panel(res, nlags,
+                                use_correction=use_correction),
+                            cov_panel, rtol=1e-12)
+            groups_perm = sw.ClusterGroups(firm_labels, time=time[perm])
+            assert_allclose(groups_perm.cov_nw_panel(res_perm, nlags,
+                                use_correction=use_correction),
+                            cov_panel, rtol=1e-10)
+
+    assert_raises(ValueError, sw.ClusterGroups(firm).cov_nw_groupsum, res, 1)
+    assert_raises(ValueError, sw.ClusterGroups(time=time).cov_cluster, res)
+    assert_raises(ValueError, sw.ClusterGroups, [firm, time[:-1]])
+
+
 if __name__ == '__main__':
     import nose
     nose.runmodule(argv=[__file__, '-vvs', '-x'], exit=False)
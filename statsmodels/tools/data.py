@@ -105,6 +105,16 @@ def _is_using_ndarray(endog, exog):
     return (isinstance(endog, np.ndarray) and
             (isinstance(exog, np.ndarray) or exog is None))
 
+def _is_sparse(X):
+    """
+    Returns True if X is a scipy.sparse matrix.
+    """
+    from scipy import sparse
+    return sparse.issparse(X)
+
+def _is_using_sparse(endog, exog):
+    return isinstance(endog, np.ndarray) and _is_sparse(exog)
+
 def _is_using_pandas(endog, exog):
     if not have_pandas():
         return False
@@ -53,6 +53,14 @@ _hessian_docs = """
         Arguments for function `f`.
     kwargs : dict
         Keyword arguments for function `f`.
+    vectorized : bool
+        If True, `f` is called with a 2d array that has one parameter vector
+        in each row and returns the values for all rows, so that the
+        perturbed parameters are evaluated in a few calls.
+    n_jobs : int
+        Number of processes that evaluate `f` if `vectorized` is False, -1
+        uses all cpus. `f` needs to be picklable. Requires joblib, see
+        statsmodels.tools.parallel.
     %(extra_params)s
 
     Returns
@@ -77,6 +85,10 @@ _hessian_docs = """
         of numerical differentiation. The American Statistician, 63, 66-74
 """
 
+#maximum number of elements of the array of perturbed parameters that is
+#evaluated at once for the Hessians
+_MAX_POINTS_SIZE = 2**22
+
 def _get_epsilon(x, s, epsilon, n):
     if epsilon is None:
         h = EPS**(1. / s) * np.maximum(np.abs(x), 0.1)
@@ -91,7 +103,92 @@ def _get_epsilon(x, s, epsilon, n):
                         " shape as x.")
     return h
 
-def approx_fprime(x, f, epsilon=None, args=(), kwargs={}, centered=False):
+def _evaluate_rows(f, points, args, kwargs):
+    return np.array([f(*((point,)+args), **kwargs) for point in points])
+
+def _evaluate(f, points, args, kwargs, vectorized=False, n_jobs=1):
+    """
+    Values of f for each row of points, stacked along the first axis
+    """
+    if vectorized:
+        values = np.asarray(f(*((points,)+args), **kwargs))
+        if values.shape[:1] != (len(points),):
+            raise ValueError("a vectorized function needs to return one "
+                             "value for each row of the parameters")
+        return values
+    if n_jobs == 1 or len(points) == 1:
+        return _evaluate_rows(f, points, args, kwargs)
+    from statsmodels.tools.parallel import parallel_func
+    parallel, p_func, n_jobs = parallel_func(_evaluate_rows, n_jobs=n_jobs,
+                                             verbose=0)
+    chunks = np.array_split(points, min(n_jobs, len(points)))
+    return np.concatenate(parallel(p_func(f, chunk, args, kwargs)
+                                   for chunk in chunks))
+
+def _pair_values(f, x, h, signs, args, kwargs, vectorized, n_jobs):
+    """
+    Values of f(x + si*h[i]*e[i] + sj*h[j]*e[j]) for all pairs i <= j
+
+    Returns an array with a row for each (si, sj) in signs and the pairs in
+    the order of np.triu_indices in the columns.
+    """
+    n = len(x)
+    signs = np.asarray(signs)
+    dtype = complex if np.iscomplexobj(signs) else float
+    iu, ju = np.triu_indices(n)
+    step = max(1, _MAX_POINTS_SIZE // (n * len(signs)))
+    values = []
+    for start in range(0, len(iu), step):
+        i, j = iu[start:start+step], ju[start:start+step]
+        rows = np.arange(len(i))
+        points = np.empty((len(signs), len(i), n), dtype)
+        points[:] = x
+        for k, (si, sj) in enumerate(signs):
+            points[k, rows, i] += si * h[i]
+            points[k, rows, j] += sj * h[j]
+        value = _evaluate(f, points.reshape(-1, n), args, kwargs, vectorized,
+                          n_jobs)
+        values.append(value.reshape(len(signs), len(i)))
+    return np.concatenate(values, 1)
+
+def _auto_epsilon(x, f, args, kwargs, centered, vectorized, n_jobs):
+    """
+    Stepsize for each parameter that balances truncation and rounding error
+
+    The second derivative (forward differences) or the third derivative
+    (central differences) d along each coordinate is estimated with a pilot
+    step, the optimal stepsize is then 2*sqrt(EPS*|f|/|d|) or
+    (3*EPS*|f|/|d|)**(1/3), see Gill, Murray and Wright (1981), section
+    8.6. The stepsize is kept within a factor of 100 of the default
+    stepsize, which is also used if the derivative is zero.
+    """
+    n = len(x)
+    default = _get_epsilon(x, 3 if centered else 2, None, n)
+    h0 = EPS**(1. / 5) * np.maximum(np.abs(x), 0.1)
+    ee = np.diag(h0)
+    if centered:
+        points = np.vstack((x[None,:], x + ee, x - ee, x + 2*ee, x - 2*ee))
+    else:
+        points = np.vstack((x[None,:], x + ee, x - ee))
+    values = _evaluate(f, points, args, kwargs, vectorized, n_jobs)
+    values = values.reshape(len(points), -1)
+    f0 = values[0]
+    fp, fm = values[1:n+1], values[n+1:2*n+1]
+    ferr = EPS * np.maximum(np.abs(f0), EPS)
+    if centered:
+        fp2, fm2 = values[2*n+1:3*n+1], values[3*n+1:]
+        d3 = np.abs(fp2 - 2*fp + 2*fm - fm2) / (2 * h0[:,None]**3)
+        h = ((3 * ferr / np.maximum(d3, 1e-300))**(1. / 3)).min(1)
+        nonzero = (d3 > 0).any(1)
+    else:
+        d2 = np.abs(fp - 2*f0 + fm) / h0[:,None]**2
+        h = (2 * np.sqrt(ferr / np.maximum(d2, 1e-300))).min(1)
+        nonzero = (d2 > 0).any(1)
+    h = np.where(nonzero & np.isfinite(h), h, default)
+    return np.clip(h, default / 100., default * 100.)
+
+def approx_fprime(x, f, epsilon=None, args=(), kwargs={}, centered=False,
+                  vectorized=False, n_jobs=1):
     '''
     Gradient of function, or Jacobian if function f returns 1d array
 
@@ -101,9 +198,11 @@ def approx_fprime(x, f, epsilon=None, args=(), kwargs={}, centered=False):
         parameters at which the derivative is evaluated
     f : function
         `f(*((x,)+args), **kwargs)` returning either one value or 1d array
-    epsilon : float, optional
+    epsilon : float, array or 'auto', optional
         Stepsize, if None, optimal stepsize is used. This is EPS**(1/2)*x for
-        `centered` == False and EPS**(1/3)*x for `centered` == True.
+        `centered` == False and EPS**(1/3)*x for `centered` == True. If
+        'auto', the stepsize of each parameter is chosen from an estimate of
+        the higher derivative of f, see Notes.
     args : tuple
         Tuple of additional arguments for function `f`.
     kwargs : dict
@@ -111,6 +210,14 @@ def approx_fprime(x, f, epsilon=None, args=(), kwargs={}, centered=False):
     centered : bool
         Whether central difference should be returned. If not, does forward
         differencing.
+    vectorized : bool
+        If True, `f` is called once with a 2d array that has one parameter
+        vector in each row and returns the values for all rows stacked along
+        the first axis.
+    n_jobs : int
+        Number of processes that evaluate `f` if `vectorized` is False, -1
+        uses all cpus. `f` needs to be picklable. Requires joblib, see
+        statsmodels.tools.parallel.
 
     Returns
     -------
@@ -123,29 +230,38 @@ def approx_fprime(x, f, epsilon=None, args=(), kwargs={}, centered=False):
     by f (e.g., with a value for each observation), it returns a 3d array
     with the Jacobian of each observation with shape xk x nobs x xk. I.e.,
     the Jacobian of the first observation would be [:, 0, :]
+
+    With epsilon='auto', the second derivative for forward differences or
+    the third derivative for central differences along each coordinate is
+    estimated with a pilot step, and the stepsize that minimizes the sum of
+    the truncation and rounding errors is used, Gill, Murray and Wright
+    (1981), Practical Optimization, section 8.6. This requires 2 or 4
+    additional evaluations of f for each parameter.
     '''
+    x = np.asarray(x)
     n = len(x)
-    #TODO:  add scaled stepsize
-    f0 = f(*((x,)+args), **kwargs)
-    dim = np.atleast_1d(f0).shape # it could be a scalar
-    grad = np.zeros((n,) + dim, float)
-    ei = np.zeros((n,), float)
+    if isinstance(epsilon, basestring):
+        if epsilon != 'auto':
+            raise ValueError("epsilon has to be a number, an array or 'auto'")
+        epsilon = _auto_epsilon(x, f, args, kwargs, centered, vectorized,
+                                n_jobs)
     if not centered:
         epsilon = _get_epsilon(x, 2, epsilon, n)
-        for k in range(n):
-            ei[k] = epsilon[k]
-            grad[k,:] = (f(*((x+ei,)+args), **kwargs) - f0)/epsilon[k]
-            ei[k] = 0.0
+        points = np.vstack((x[None,:], x + np.diag(epsilon)))
+        values = _evaluate(f, points, args, kwargs, vectorized, n_jobs)
+        epsilon = epsilon.reshape((n,) + (1,) * (values.ndim - 1))
+        grad = (values[1:] - values[0]) / epsilon
     else:
         epsilon = _get_epsilon(x, 3, epsilon, n) / 2.
-        for k in range(len(x)):
-            ei[k] = epsilon[k]
-            grad[k,:] = (f(*((x+ei,)+args), **kwargs) - \
-                         f(*((x-ei,)+args), **kwargs))/(2 * epsilon[k])
-            ei[k] = 0.0
+        ee = np.diag(epsilon)
+        values = _evaluate(f, np.vstack((x + ee, x - ee)), args, kwargs,
+                           vectorized, n_jobs)
+        epsilon = epsilon.reshape((n,) + (1,) * (values.ndim - 1))
+        grad = (values[:n] - values[n:]) / (2 * epsilon)
     return grad.squeeze().T
 
-def approx_fprime_cs(x, f, epsilon=None, args=(), kwargs={}):
+def approx_fprime_cs(x, f, epsilon=None, args=(), kwargs={}, vectorized=False,
+                     n_jobs=1):
     '''
     Calculate gradient or Jacobian with complex step derivative approximation
 
@@ -162,6 +278,14 @@ def approx_fprime_cs(x, f, epsilon=None, args=(), kwargs={}):
         Tuple of additional arguments for function `f`.
     kwargs : dict
         Dictionary of additional keyword arguments for function `f`.
+    vectorized : bool
+        If True, `f` is called once with a complex 2d array that has one
+        parameter vector in each row and returns the values for all rows
+        stacked along the first axis.
+    n_jobs : int
+        Number of processes that evaluate `f` if `vectorized` is False, -1
+        uses all cpus. `f` needs to be picklable. Requires joblib, see
+        statsmodels.tools.parallel.
 
     Returns
     -------
@@ -181,12 +305,12 @@ def approx_fprime_cs(x, f, epsilon=None, args=(), kwargs={}):
     n = len(x)
     epsilon = _get_epsilon(x, 1, epsilon, n)
     increments = np.identity(n) * 1j * epsilon
-    #TODO: see if this can be vectorized, but usually dim is small
-    partials = [f(x+ih, *args, **kwargs).imag / epsilon[i]
-                for i,ih in enumerate(increments)]
-    return np.array(partials).T
+    values = _evaluate(f, x + increments, args, kwargs, vectorized, n_jobs)
+    partials = values.imag / epsilon.reshape((n,) + (1,) * (values.ndim - 1))
+    return partials.T
 
-def approx_hess_cs(x, f, epsilon=None, args=(), kwargs={}):
+def approx_hess_cs(x, f, epsilon=None, args=(), kwargs={}, vectorized=False,
+                   n_jobs=1):
     '''Calculate Hessian with complex-step derivative approximation
 
     Parameters
@@ -214,17 +338,13 @@ def approx_hess_cs(x, f, epsilon=None, args=(), kwargs={}):
     #TODO: might want to consider lowering the step for pure derivatives
     n = len(x)
     h = _get_epsilon(x, 3, epsilon, n)
-    ee = np.diag(h)
     hess = np.outer(h,h)
+    iu, ju = np.triu_indices(n)
 
-    n = len(x)
-
-    for i in range(n):
-        for j in range(i,n):
-            hess[i,j] = (f(*((x + 1j*ee[i,:] + ee[j,:],)+args), **kwargs)
-                    - f(*((x + 1j*ee[i,:] - ee[j,:],)+args), **kwargs)).imag/\
-                       2./hess[i,j]
-            hess[j,i] = hess[i,j]
+    fplus, fminus = _pair_values(f, x, h, [(1j, 1), (1j, -1)], args, kwargs,
+                                 vectorized, n_jobs)
+    hess[iu, ju] = (fplus - fminus).imag/2./hess[iu, ju]
+    hess[ju, iu] = hess[iu, ju]
 
     return hess
 approx_hess_cs.__doc__ = "Calculate Hessian with complex-step derivative " +\
@@ -236,24 +356,24 @@ equation = """1/(2*d_j*d_k) * imag(f(x + i*d[j]*e[j] + d[k]*e[k]) -
                      f(x + i*d[j]*e[j] - d[k]*e[k]))
 """)
 
-def approx_hess1(x, f, epsilon=None, args=(), kwargs={}, return_grad=False):
+def approx_hess1(x, f, epsilon=None, args=(), kwargs={}, return_grad=False,
+                 vectorized=False, n_jobs=1):
+    x = np.asarray(x)
     n = len(x)
     h = _get_epsilon(x, 3, epsilon, n)
     ee = np.diag(h)
 
-    f0 = f(*((x,)+args), **kwargs)
-    # Compute forward step
-    g = np.zeros(n);
-    for i in range(n):
-        g[i] = f(*((x+ee[i,:],)+args), **kwargs)
+    # Compute f and forward step
+    values = _evaluate(f, np.vstack((x[None,:], x + ee)), args, kwargs,
+                       vectorized, n_jobs).reshape(n + 1)
+    f0, g = values[0], values[1:]
 
     hess = np.outer(h,h) # this is now epsilon**2
+    iu, ju = np.triu_indices(n)
     # Compute "double" forward step
-    for i in range(n):
-        for j in range(i,n):
-            hess[i,j] = (f(*((x + ee[i,:] + ee[j,:],) + args), **kwargs) - \
-                         g[i] - g[j] + f0)/hess[i,j]
-            hess[j,i] = hess[i,j]
+    fpp, = _pair_values(f, x, h, [(1, 1)], args, kwargs, vectorized, n_jobs)
+    hess[iu, ju] = (fpp - g[iu] - g[ju] + f0)/hess[iu, ju]
+    hess[ju, iu] = hess[iu, ju]
     if return_grad:
         grad = (g - f0)/h
         return hess, grad
@@ -271,30 +391,27 @@ equation_number = "7",
 equation = """1/(d_j*d_k) * ((f(x + d[j]*e[j] + d[k]*e[k]) - f(x + d[j]*e[j])))
 """)
 
-def approx_hess2(x, f, epsilon=None, args=(), kwargs={}, return_grad=False):
+def approx_hess2(x, f, epsilon=None, args=(), kwargs={}, return_grad=False,
+                 vectorized=False, n_jobs=1):
     #
+    x = np.asarray(x)
     n = len(x)
     #NOTE: ridout suggesting using eps**(1/4)*theta
     h = _get_epsilon(x, 3, epsilon, n)
     ee = np.diag(h)
-    f0 = f(*((x,)+args), **kwargs)
-    # Compute forward step
-    g = np.zeros(n)
-    gg = np.zeros(n)
-    for i in range(n):
-        g[i] = f(*((x+ee[i,:],)+args), **kwargs)
-        gg[i] = f(*((x-ee[i,:],)+args), **kwargs)
+    # Compute f, forward and backward step
+    values = _evaluate(f, np.vstack((x[None,:], x + ee, x - ee)), args,
+                       kwargs, vectorized, n_jobs).reshape(2 * n + 1)
+    f0, g, gg = values[0], values[1:n+1], values[n+1:]
 
     hess = np.outer(h,h) # this is now epsilon**2
-    # Compute "double" forward step
-    for i in range(n):
-        for j in range(i,n):
-            hess[i,j] = (f(*((x + ee[i,:] + ee[j,:],) + args), **kwargs) - \
-                         g[i] - g[j] + f0 + \
-                         f(*((x - ee[i,:] - ee[j,:],) + args), **kwargs) - \
-                         gg[i] - gg[j] + f0
-                         )/(2*hess[i,j])
-            hess[j,i] = hess[i,j]
+    iu, ju = np.triu_indices(n)
+    # Compute "double" forward and backward step
+    fpp, fmm = _pair_values(f, x, h, [(1, 1), (-1, -1)], args, kwargs,
+                            vectorized, n_jobs)
+    hess[iu, ju] = (fpp - g[iu] - g[ju] + f0 +
+                    fmm - gg[iu] - gg[ju] + f0)/(2*hess[iu, ju])
+    hess[ju, iu] = hess[iu, ju]
     if return_grad:
         grad = (g - f0)/h
         return hess, grad
@@ -314,20 +431,18 @@ equation = """1/(2*d_j*d_k) * ((f(x + d[j]*e[j] + d[k]*e[k]) - f(x + d[j]*e[j]))
                  (f(x - d[k]*e[k]) - f(x)))
 """)
 
-def approx_hess3(x, f, epsilon=None, args=(), kwargs={}):
+def approx_hess3(x, f, epsilon=None, args=(), kwargs={}, vectorized=False,
+                 n_jobs=1):
     n = len(x)
     h = _get_epsilon(x, 4, epsilon, n)
-    ee = np.diag(h)
     hess = np.outer(h,h)
+    iu, ju = np.triu_indices(n)
 
-    for i in range(n):
-        for j in range(i,n):
-            hess[i,j] = (f(*((x + ee[i,:] + ee[j,:],)+args), **kwargs)
-                             - f(*((x + ee[i,:] - ee[j,:],)+args), **kwargs)
-                          - (f(*((x - ee[i,:] + ee[j,:],)+args), **kwargs)
-                          - f(*((x - ee[i,:] - ee[j,:],)+args), **kwargs),)
-                          )/(4.*hess[i,j])
-            hess[j,i] = hess[i,j]
+    fpp, fpm, fmp, fmm = _pair_values(f, x, h,
+                                      [(1, 1), (1, -1), (-1, 1), (-1, -1)],
+                                      args, kwargs, vectorized, n_jobs)
+    hess[iu, ju] = (fpp - fpm - (fmp - fmm))/(4.*hess[iu, ju])
+    hess[ju, iu] = hess[iu, ju]
     return hess
 
 approx_hess3.__doc__ = _hessian_docs % dict(scale="4", extra_params="",
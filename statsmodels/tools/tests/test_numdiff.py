@@ -8,7 +8,8 @@ Should Hessian also work per observation, if fun returns 2d
 '''
 
 import numpy as np
-from numpy.testing import assert_almost_equal, assert_allclose
+from numpy.testing import (assert_almost_equal, assert_allclose,
+                           assert_equal, assert_, assert_raises)
 import statsmodels.api as sm
 from statsmodels.tools import numdiff
 from statsmodels.tools.numdiff import (approx_fprime, approx_fprime_cs,
@@ -285,6 +286,105 @@ class TestDerivativeFun1(CheckDerivativeMixin):
         return (-x*2*(y-np.dot(x, params))[:,None])  #TODO: check shape
 
 
+def fun1_batch(beta, y, x):
+    # fun1 for each row of beta
+    xb = np.dot(x, beta.T)
+    return ((y[:,None] - xb)**2).T
+
+def fun2_batch(beta, y, x):
+    return fun1_batch(beta, y, x).sum(1)
+
+def fun_exp(beta, x):
+    return np.exp(np.dot(x, beta)).sum(0)
+
+
+class TestVectorized(object):
+    @classmethod
+    def setupClass(cls):
+        np.random.seed(187678)
+        cls.x = x = np.random.randn(50, 4)
+        cls.y = np.dot(x, [1., -1, .5, 2]) + np.random.randn(50)
+        cls.params = np.array([.9, -1.1, .4, 2.1])
+        cls.args = (cls.y, cls.x)
+
+    def test_fprime(self):
+        params, args = self.params, self.args
+        for centered in [False, True]:
+            grad = approx_fprime(params, fun2, args=args, centered=centered)
+            grad_batch = approx_fprime(params, fun2_batch, args=args,
+                                       centered=centered, vectorized=True)
+            # the batched sums have different rounding errors
+            assert_allclose(grad_batch, grad, rtol=1e-5)
+            jac = approx_fprime(params, fun1, args=args, centered=centered)
+            jac_batch = approx_fprime(params, fun1_batch, args=args,
+                                      centered=centered, vectorized=True)
+            assert_allclose(jac_batch, jac, rtol=1e-5, atol=1e-6)
+            assert_equal(jac_batch.shape, (50, 4))
+
+        grad = approx_fprime_cs(params, fun2, args=args)
+        grad_batch = approx_fprime_cs(params, fun2_batch, args=args,
+                                      vectorized=True)
+        assert_allclose(grad_batch, grad, rtol=1e-12)
+        jac_batch = approx_fprime_cs(params, fun1_batch, args=args,
+                                     vectorized=True)
+        assert_allclose(jac_batch, approx_fprime_cs(params, fun1, args=args),
+                        rtol=1e-12)
+
+    def test_hess(self):
+        params, args = self.params, self.args
+        hesstrue = 2 * np.dot(self.x.T, self.x)
+        for approx_hess in [numdiff.approx_hess1, numdiff.approx_hess2,
+                            numdiff.approx_hess3, numdiff.approx_hess_cs]:
+            hess = approx_hess(params, fun2, args=args)
+            hess_batch = approx_hess(params, fun2_batch, args=args,
+                                     vectorized=True)
+            assert_allclose(hess_batch, hess, rtol=1e-4, atol=1e-2)
+            assert_allclose(hess_batch, hesstrue, rtol=1e-4, atol=1e-2)
+
+    def test_hess_chunks(self):
+        # pairs are evaluated in several calls for large arrays
+        params, args = self.params, self.args
+        hess = numdiff.approx_hess3(params, fun2_batch, args=args,
+                                    vectorized=True)
+        max_size = numdiff._MAX_POINTS_SIZE
+        numdiff._MAX_POINTS_SIZE = 30
+        try:
+            hess_chunks = numdiff.approx_hess3(params, fun2_batch, args=args,
+                                               vectorized=True)
+        finally:
+            numdiff._MAX_POINTS_SIZE = max_size
+        assert_equal(hess_chunks, hess)
+
+    def test_parallel(self):
+        # runs sequentially if joblib is not available
+        params, args = self.params, self.args
+        grad = approx_fprime(params, fun2, args=args)
+        assert_equal(approx_fprime(params, fun2, args=args, n_jobs=2), grad)
+        hess = numdiff.approx_hess3(params, fun2, args=args)
+        assert_equal(numdiff.approx_hess3(params, fun2, args=args, n_jobs=2),
+                     hess)
+
+    def test_auto_epsilon(self):
+        x = self.x / 2.
+        params = np.array([.3, -.2, .1, .5])
+        gradtrue = (np.exp(np.dot(x, params))[:,None] * x).sum(0)
+        for centered in [False, True]:
+            grad = approx_fprime(params, fun_exp, args=(x,),
+                                 centered=centered)
+            grad_auto = approx_fprime(params, fun_exp, epsilon='auto',
+                                      args=(x,), centered=centered)
+            err = np.abs(grad - gradtrue).max()
+            err_auto = np.abs(grad_auto - gradtrue).max()
+            assert_(err_auto < 5 * err)
+            assert_allclose(grad_auto, gradtrue, rtol=1e-6)
+        assert_raises(ValueError, approx_fprime, params, fun_exp,
+                      epsilon='optimal', args=(x,))
+
+    def test_wrong_shape(self):
+        assert_raises(ValueError, approx_fprime, self.params,
+                      lambda beta: np.ones(3), vectorized=True)
+
+
 if __name__ == '__main__':
 
     epsilon = 1e-6
@@ -9,7 +9,7 @@ from scipy.interpolate import interp1d
 from scipy.linalg import svdvals
 from statsmodels.distributions import (ECDF, monotone_fn_inverter,
                                                StepFunction)
-from statsmodels.tools.data import _is_using_pandas
+from statsmodels.tools.data import _is_using_pandas, _is_sparse
 from statsmodels.compatnp.py3k import asstr2
 from pandas import DataFrame
 
@@ -522,6 +522,119 @@ def nan_dot(A, B):
 
     return C
 
+def stacked_cholesky_inv(xtx):
+    """
+    Returns the inverses of a stack of symmetric positive definite matrices.
+
+    Parameters
+    ----------
+    xtx : array
+        nwindows x k x k stack of matrices
+
+    Returns
+    -------
+    inv : array
+        nwindows x k x k stack of inverses. The entries for matrices that
+        are not numerically positive definite are nan.
+
+    Notes
+    -----
+    The Cholesky decomposition and the inversion of the triangular factor
+    loop over the k columns and are vectorized over the stack.
+    """
+    nwin, k = xtx.shape[:2]
+    L = np.zeros_like(xtx)
+    for j in range(k):
+        s = xtx[:,j,j] - (L[:,j,:j]**2).sum(1)
+        # not positive definite or collinear column, up to rounding
+        s[~(s > 1e-12 * np.abs(xtx[:,j,j]))] = np.nan
+        L[:,j,j] = np.sqrt(s)
+        if j + 1 < k:
+            L[:,j+1:,j] = ((xtx[:,j+1:,j] -
+                           (L[:,j+1:,:j] * L[:,j:j+1,:j]).sum(2)) /
+                           L[:,j,j][:,None])
+    # forward substitution L Linv = I
+    Linv = np.zeros_like(xtx)
+    eye = np.eye(k)
+    for i in range(k):
+        Linv[:,i,:] = ((eye[i] - (L[:,i,:i,None] * Linv[:,:i,:]).sum(1)) /
+                       L[:,i,i][:,None])
+    # inv(xtx) = Linv.T Linv
+    return (Linv[:,:,:,None] * Linv[:,:,None,:]).sum(1)
+
+def _matvec(X, b):
+    """
+    Returns dot(X, b) as ndarray for a dense or scipy.sparse X.
+    """
+    if _is_sparse(X):
+        return np.asarray(X * b)
+    return np.dot(X, b)
+
+def _rmatvec(X, v):
+    """
+    Returns dot(X.T, v) as ndarray for a dense or scipy.sparse X.
+    """
+    if _is_sparse(X):
+        return np.asarray(X.T * v)
+    return np.dot(X.T, v)
+
+def _xtwx(X, weights=None):
+    """
+    Returns X' diag(weights) X.
+
+    The result is a sparse csc matrix if X is a scipy.sparse matrix and an
+    ndarray otherwise.
+    """
+    if _is_sparse(X):
+        from scipy import sparse
+        X = X.tocsr()
+        if weights is None:
+            return (X.T * X).tocsc()
+        W = sparse.spdiags(weights, 0, X.shape[0], X.shape[0])
+        return (X.T * (W * X)).tocsc()
+    if weights is None:
+        return np.dot(X.T, X)
+    return np.dot(X.T * weights, X)
+
+def _solve(A, b):
+    """
+    Returns the solution of A x = b for a dense or scipy.sparse A.
+
+    A sparse A is solved with a sparse LU decomposition, so that the
+    memory is proportional to the nonzero elements of A and its factors.
+    """
+    if _is_sparse(A):
+        from scipy.sparse.linalg import spsolve
+        return np.asarray(spsolve(A.tocsc(), b))
+    return np.linalg.solve(A, b)
+
+def _inv(A):
+    """
+    Returns the inverse of a dense or scipy.sparse A as ndarray.
+    """
+    if _is_sparse(A):
+        from scipy.sparse.linalg import splu
+        return splu(A.tocsc()).solve(np.eye(A.shape[0]))
+    return np.linalg.inv(A)
+
+class _DeferredInverse(object):
+    """
+    The inverse of a scipy.sparse matrix, computed as ndarray when it is
+    first used.
+
+    Models with a sparse exog pass it to the results as
+    normalized_cov_params, so that fit does not compute a dense k x k
+    inverse, see LikelihoodModelResults.normalized_cov_params.
+    """
+    def __init__(self, A):
+        self.A = A
+        self._inverse = None
+
+    def inv(self):
+        if self._inverse is None:
+            self._inverse = _inv(self.A)
+        return self._inverse
+
 def maybe_unwrap_results(results):
     """
     Gets raw results back from wrapped results.
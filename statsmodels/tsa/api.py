@@ -10,5 +10,7 @@ from .tsatools import (add_trend, detrend, lagmat, lagmat2ds, add_lag)
 import interp
 import stattools
 from .stattools import (adfuller, acovf, q_stat, acf, pacf_yw, pacf_ols, pacf,
-                            ccovf, ccf, periodogram, grangercausalitytests)
+                            ccovf, ccf, periodogram, grangercausalitytests,
+                            arma_order_select_ic, adfuller_many, acf_many,
+                            ccf_many)
 from .base import datetools
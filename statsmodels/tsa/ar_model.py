@@ -428,7 +428,21 @@ class AR(tsbase.TimeSeriesModel):
         k = max(1,k) # handle if startlag is 0
         results = {}
 
-        if ic != 't-stat':
+        if ic in ['aic', 'bic', 'hqic'] and method == 'cmle':
+            # all lag lengths from one QR decomposition, the criteria are
+            # the ones of ARResults for the common sample
+            from statsmodels.tsa.stattools import _NestedOLS
+            nobs = len(Y)
+            ssr = _NestedOLS(np.ravel(Y), X).ssr
+            lags = np.arange(k, maxlag+1)
+            df_model = lags + self.k_trend
+            penalty = dict(aic=2., bic=np.log(nobs),
+                           hqic=2 * np.log(np.log(nobs)))[ic]
+            ics = (np.log(ssr[df_model-1] / nobs) +
+                   penalty * (1 + df_model) / nobs)
+            bestlag = int(lags[np.argmin(ics)])
+
+        elif ic != 't-stat':
             for lag in range(k,maxlag+1):
                 # have to reinstantiate the model to keep comparable models
                 endog_tmp = endog[maxlag-lag:]
@@ -827,6 +841,71 @@ class ARResults(tsbase.TimeSeriesModelResults):
     predict.__doc__ = '\n'.join(preddoc[:5] + preddoc[7:20] + extra_doc +
             preddoc[20:])
 
+    def append(self, endog, refit=False, **fit_kwargs):
+        """
+        Results for the sample extended by new observations
+
+        Parameters
+        ----------
+        endog : array-like
+            The new observations.
+        refit : bool, optional
+            If False, the default, the parameters are kept and only the
+            lagged values and the residuals are updated for the new
+            observations. If True, the model is fit to the extended sample
+            with the same lag length.
+        fit_kwargs
+            Keyword arguments for `fit` if `refit` is True. The trend and
+            the method default to those of this fit.
+
+        Returns
+        -------
+        results : ARResults instance
+            The results of the model of the extended sample.
+
+        Notes
+        -----
+        Without refit, only the lagged values and the residuals of the new
+        observations are computed. The new model still holds the whole
+        extended sample, so every call copies the series, the design matrix
+        and the residuals and the cost grows linearly with the length of the
+        sample. The new results keep `sigma2` and the covariance of the
+        parameters of this fit. The new model does not have dates.
+        """
+        model = self.model
+        k_ar, k_trend = self.k_ar, self.k_trend
+        new_obs = np.atleast_1d(np.asarray(endog, dtype=float).squeeze())
+        n_new = len(new_obs)
+        new_model = AR(np.r_[model.endog[:,0], new_obs])
+        if refit:
+            fit_kwargs.setdefault('trend', model.trend)
+            fit_kwargs.setdefault('method', model.method)
+            if fit_kwargs['method'] == 'mle':
+                fit_kwargs.setdefault('start_params', self.params)
+            return new_model.fit(maxlag=k_ar, **fit_kwargs)
+
+        new_model.method = model.method
+        new_model.trend = model.trend
+        new_model.transparams = False
+        new_model.k_ar = k_ar
+        new_model.k_trend = k_trend
+        new_model.exog_names = model.exog_names
+        new_model.nobs = model.nobs + n_new
+        new_model.sigma2 = getattr(model, 'sigma2', self.sigma2)
+        # the rows of the lagged values of the new observations
+        Y = new_model.endog[-n_new:]
+        X = lagmat(new_model.endog[-n_new-k_ar:], maxlag=k_ar, trim='both')
+        if k_trend: # only a constant, a single row would look constant
+            X = np.column_stack((np.ones(n_new), X))
+        new_model.Y = np.r_[model.Y, Y]
+        new_model.X = np.r_[model.X, X]
+
+        params = self.params
+        res = ARResults(new_model, params, self.normalized_cov_params)
+        res._cache['resid'] = np.r_[self.resid, Y[:,0] - dot(X, params)]
+        res._cache['sigma2'] = self.sigma2
+        return ARResultsWrapper(res)
+
 class ARResultsWrapper(wrap.ResultsWrapper):
     _attrs = {}
     _wrap_attrs = wrap.union_dicts(tsbase.TimeSeriesResultsWrapper._wrap_attrs,
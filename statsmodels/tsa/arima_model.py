@@ -6,7 +6,7 @@ from datetime import datetime
 import numpy as np
 from scipy import optimize
 from scipy.stats import t, norm
-from scipy.signal import lfilter
+from scipy.signal import lfilter, lfiltic
 from numpy import (dot, identity, kron, log, zeros, pi, exp, eye, abs, empty,
                    zeros_like)
 from numpy.linalg import inv, pinv
@@ -24,7 +24,7 @@ from statsmodels.tsa.vector_ar import util
 from statsmodels.tsa.ar_model import AR
 from statsmodels.tsa.arima_process import arma2ma
 from statsmodels.tools.numdiff import (approx_fprime, approx_fprime_cs,
-        approx_hess_cs)
+        approx_hess_cs, _get_epsilon)
 from statsmodels.tsa.base.datetools import _index_date
 from statsmodels.tsa.kalmanf import KalmanFilter
 from .kalmanf import kalman_loglike
@@ -333,6 +333,19 @@ def _make_arma_exog(endog, exog, trend):
         k_trend = 0
     return k_trend, exog
 
+def _fit_long_ar(endog, exog=None):
+    """
+    Long autoregression of the Hannan-Rissanen start parameters
+
+    Returns the lag order selected by BIC and the AR coefficients for endog
+    net of the regression on exog, which includes the trend.
+    """
+    if exog is not None:
+        ols_params = GLS(endog, exog).fit().params
+        endog = endog - np.dot(exog, ols_params).squeeze()
+    armod = AR(endog).fit(ic='bic', trend='nc')
+    return armod.k_ar, armod.params
+
 class ARMA(tsbase.TimeSeriesModel):
 
     __doc__ = tsbase._tsa_doc % {"model" : _arma_model,
@@ -396,9 +409,11 @@ class ARMA(tsbase.TimeSeriesModel):
             endog -= np.dot(exog, ols_params).squeeze()
         if q != 0:
             if p != 0:
-                armod = AR(endog).fit(ic='bic', trend='nc')
-                arcoefs_tmp = armod.params
-                p_tmp = armod.k_ar
+                # the long AR can be shared by models of several orders
+                long_ar = getattr(self, '_long_ar', None)
+                if long_ar is None:
+                    long_ar = _fit_long_ar(endog)
+                p_tmp, arcoefs_tmp = long_ar
                 # it's possible in small samples that optimal lag-order
                 # doesn't leave enough obs. No consistent way to fix.
                 if p_tmp + q >= len(endog):
@@ -473,6 +488,9 @@ class ARMA(tsbase.TimeSeriesModel):
         #if self.transparams:
         #    params = self._invtransparams(params)
         #return approx_fprime(params, loglike, epsilon=1e-5)
+        if self.method in ['mle', 'css-mle']:
+            return approx_fprime_cs(params, self.loglike_kalman_batch,
+                                    vectorized=True)
         return approx_fprime_cs(params, loglike)
 
     def hessian(self, params):
@@ -486,6 +504,9 @@ class ARMA(tsbase.TimeSeriesModel):
         loglike = self.loglike
         #if self.transparams:
         #    params = self._invtransparams(params)
+        if self.method in ['mle', 'css-mle']:
+            return approx_hess_cs(params, self.loglike_kalman_batch,
+                                  vectorized=True)
         return approx_hess_cs(params, loglike)
 
     def _transparams(self, params):
@@ -671,6 +692,14 @@ class ARMA(tsbase.TimeSeriesModel):
         """
         return KalmanFilter.loglike(params, self)
 
+    def loglike_kalman_batch(self, params):
+        """
+        Exact loglikelihood for each row of a 2d array of params.
+
+        Used for the numerical derivatives, sigma2 is not changed.
+        """
+        return KalmanFilter.loglike_batch(params, self)
+
     def loglike_css(self, params):
         """
         Conditional Sum of Squares likelihood function.
@@ -700,6 +729,29 @@ class ARMA(tsbase.TimeSeriesModel):
         llf = -nobs/2.*(log(2*pi) + log(sigma2)) - ssr/(2*sigma2)
         return llf
 
+    def _setup_fit(self, trend, method):
+        """
+        Sets the trend, method, nobs and exog used by the loglikelihood
+        """
+        self.method = method = method.lower()
+        endog = self.endog
+        self.nobs = len(endog) # this is overwritten if method is 'css'
+
+        # (re)set trend and handle exogenous variables
+        # always pass original exog
+        k_trend, exog = _make_arma_exog(endog, self.exog, trend)
+
+        self.k_trend = k_trend
+        self.exog = exog    # overwrites original exog from __init__
+
+        # (re)set names for this model
+        self.exog_names = _make_arma_names(self.data, k_trend,
+                                           (self.k_ar, self.k_ma),
+                                           self.exog_names)
+        # adjust nobs for css
+        if method == 'css':
+            self.nobs = len(endog) - self.k_ar
+
     def fit(self, order=None, start_params=None, trend='c', method = "css-mle",
             transparams=True, solver=None, maxiter=35, full_output=1,
             disp=5, callback=None, **kwargs):
@@ -795,30 +847,11 @@ class ARMA(tsbase.TimeSeriesModel):
         # enforce invertibility
         self.transparams = transparams
 
-        self.method = method.lower()
-
-        endog, exog = self.endog, self.exog
-        k_exog = self.k_exog
-        self.nobs = len(endog) # this is overwritten if method is 'css'
-
-        # (re)set trend and handle exogenous variables
-        # always pass original exog
-        k_trend, exog = _make_arma_exog(endog, self.exog, trend)
-
-        self.k_trend = k_trend
-        self.exog = exog    # overwrites original exog from __init__
-
-        # (re)set names for this model
-        self.exog_names = _make_arma_names(self.data, k_trend, (k_ar, k_ma),
-                                           self.exog_names)
-        k = k_trend + k_exog
-
+        self._setup_fit(trend, method)
+        k = self.k_trend + self.k_exog
 
         # choose objective function
         method = method.lower()
-        # adjust nobs for css
-        if method == 'css':
-            self.nobs = len(self.endog) - k_ar
         loglike = lambda params: -self.loglike(params)
 
         if start_params is not None:
@@ -1369,6 +1402,109 @@ class ARMAResults(tsbase.TimeSeriesModelResults):
 
         return forecast, fcasterr, conf_int
 
+    @cache_readonly
+    def _kalman_state(self):
+        # predicted state of the Kalman filter after the last observation
+        return KalmanFilter.filter_state(self.params, self.model)[2]
+
+    def append(self, endog, exog=None, refit=False, **fit_kwargs):
+        """
+        Results for the sample extended by new observations
+
+        Parameters
+        ----------
+        endog : array-like
+            The new observations. For an ARIMA model these are in the
+            levels of the original series.
+        exog : array-like, optional
+            The exogenous variables of the new observations, required if
+            the model has exogenous variables. This should not include the
+            constant.
+        refit : bool, optional
+            If False, the default, the parameters are kept and only the
+            residuals, and the state of the Kalman filter for 'mle' and
+            'css-mle', are updated for the new observations. If True, the
+            model is fit to the extended sample starting from the current
+            parameters.
+        fit_kwargs
+            Keyword arguments for `fit` if `refit` is True. The trend and
+            the method default to those of this fit.
+
+        Returns
+        -------
+        results : ARMAResults or ARIMAResults instance
+            The results of the model of the extended sample.
+
+        Notes
+        -----
+        Without refit, the Kalman filter or the residual recursion only runs
+        over the new observations, starting from the state at the end of
+        these results. The new model still holds the whole extended sample,
+        so every call copies the series and the residuals and the cost grows
+        linearly with the length of the sample. The new results keep
+        `sigma2`, while statistics such as `llf` and `bse` are computed for
+        the extended sample when they are used. The new model does not have
+        dates.
+        """
+        model = self.model
+        k_ar, k_ma = self.k_ar, self.k_ma
+        k_trend, k_exog = self.k_trend, self.k_exog
+        k = k_trend + k_exog
+        endog = np.atleast_1d(np.asarray(endog, dtype=float).squeeze())
+        n_new = len(endog)
+        if k_exog:
+            if exog is None:
+                raise ValueError("The model has exogenous variables, exog "
+                                 "of the new observations is required")
+            exog = np.asarray(exog, dtype=float).reshape(n_new, k_exog)
+            exog = np.r_[model.data.exog.reshape(-1, k_exog), exog]
+        endog = np.r_[model.data.endog, endog]
+        if isinstance(model, ARIMA):
+            new_model = ARIMA(endog, (k_ar, model.k_diff, k_ma), exog)
+        else:
+            new_model = ARMA(endog, (k_ar, k_ma), exog)
+        trend = 'c' if k_trend else 'nc'
+        if refit:
+            fit_kwargs.setdefault('trend', trend)
+            fit_kwargs.setdefault('method', model.method)
+            return new_model.fit(start_params=self.params, **fit_kwargs)
+
+        new_model.transparams = False
+        new_model._setup_fit(trend, model.method)
+        new_model.sigma2 = self.sigma2
+        params = self.params
+        y = new_model.endog[-n_new:]
+        if k > 0:
+            y = y - dot(new_model.exog[-n_new:], params[:k])
+        if 'mle' in model.method:
+            resid, _, state = KalmanFilter.filter_state(params, new_model, y,
+                                                        self._kalman_state)
+        else:
+            # continue the recursion of geterrors from the end of the sample
+            (trendparams, exparams,
+             arparams, maparams) = _unpack_params(params, (k_ar, k_ma),
+                                                  k_trend, k_exog,
+                                                  reverse=False)
+            b, a = np.r_[1, -arparams], np.r_[1, maparams]
+            y_past = model.endog[len(model.endog)-k_ar:]
+            if k > 0:
+                y_past = y_past - dot(model.exog[len(model.exog)-k_ar:],
+                                      params[:k])
+            zi = lfiltic(b, a, self.resid[::-1][:k_ma], y_past[::-1])
+            resid = lfilter(b, a, y, zi=zi)[0]
+
+        if isinstance(model, ARIMA):
+            res = ARIMAResults(new_model, params)
+            res.k_diff = model.k_diff
+            wrapper = ARIMAResultsWrapper
+        else:
+            res = ARMAResults(new_model, params)
+            wrapper = ARMAResultsWrapper
+        res._cache['resid'] = np.r_[self.resid, resid]
+        if 'mle' in model.method:
+            res._cache['_kalman_state'] = state
+        return wrapper(res)
+
     def summary(self, alpha=.05):
         """Summarize the Model
 
@@ -1617,6 +1753,381 @@ class ARIMAResultsWrapper(ARMAResultsWrapper):
 wrap.populate_wrapper(ARIMAResultsWrapper, ARIMAResults)
 
 
+class _ARMABatch(object):
+    """
+    Exact loglikelihood of ARMA models of a common order for many series
+    of the same length
+
+    The selection matrix and the constant parts of the system matrices are
+    set up once. The Kalman filter of all rows of params runs in one call
+    of kalman_loglike.kalman_loglike_batch.
+
+    Parameters
+    ----------
+    y : array, (n_series, nobs)
+        The series, differenced if the models are ARIMA.
+    order : tuple
+        (p, q)
+    k_trend : int
+        1 if the models include a constant, 0 otherwise.
+    """
+
+    def __init__(self, y, order, k_trend):
+        self.y = y
+        self.k_ar, self.k_ma = k_ar, k_ma = order
+        self.k_trend = k_trend
+        self.k_params = k_params = k_trend + k_ar + k_ma
+        self.k_lags = k_lags = max(k_ar, k_ma + 1)
+        zero_params = np.zeros(k_params)
+        self.Z_mat = KalmanFilter.Z(k_lags)
+        self._T_mat = KalmanFilter.T(zero_params, k_lags, k_trend, k_ar)
+        self._R_mat = KalmanFilter.R(zero_params, k_lags, k_trend, k_ma, k_ar)
+
+    def transparams(self, params):
+        """
+        Jones (1980) transformation of each row of params, see
+        ARMA._transparams
+        """
+        k, k_ar, k_ma = self.k_trend, self.k_ar, self.k_ma
+        newparams = params.copy()
+        # the recursions of the transformation work along the first axis
+        if k_ar:
+            newparams[:,k:k+k_ar] = _ar_transparams(
+                                        params[:,k:k+k_ar].T.copy()).T
+        if k_ma:
+            newparams[:,k+k_ar:] = _ma_transparams(
+                                        params[:,k+k_ar:].T.copy()).T
+        return newparams
+
+    def invtransparams(self, params):
+        """
+        Inverse of transparams, see ARMA._invtransparams
+        """
+        k, k_ar, k_ma = self.k_trend, self.k_ar, self.k_ma
+        newparams = params.copy()
+        if k_ar:
+            newparams[:,k:k+k_ar] = _ar_invtransparams(
+                                        params[:,k:k+k_ar].T.copy()).T
+        if k_ma:
+            newparams[:,k+k_ar:] = _ma_invtransparams(
+                                        params[:,k+k_ar:].T.copy()).T
+        return newparams
+
+    def system_matrices(self, params):
+        """
+        R and T of the models of the rows of params
+        """
+        k, k_ar, k_ma = self.k_trend, self.k_ar, self.k_ma
+        n_rows = len(params)
+        T_mat = np.repeat(self._T_mat[None], n_rows, 0).astype(params.dtype)
+        T_mat[:,:k_ar,0] = params[:,k:k+k_ar]
+        R_mat = np.repeat(self._R_mat[None], n_rows, 0).astype(params.dtype)
+        R_mat[:,1:k_ma+1,0] = params[:,k+k_ar:]
+        return R_mat, T_mat
+
+    def loglike(self, params, series):
+        """
+        Loglikelihood and sigma2 of the model of series[i] at params[i]
+
+        params are in the order used by ARMA.loglike, not transformed.
+        """
+        R_mat, T_mat = self.system_matrices(params)
+        y = self.y[series].astype(params.dtype)
+        if self.k_trend:
+            y -= params[:,:1]
+        return kalman_loglike.kalman_loglike_batch(y, self.Z_mat, R_mat,
+                                                   T_mat)
+
+    def loglike_score(self, params, series):
+        """
+        Loglikelihood and its gradient for the transformed params
+
+        The gradient is the complex step derivative. The rows of all
+        series and parameters are filtered in one call, and the real part
+        of the loglikelihood of a row is the loglikelihood at params.
+        """
+        n_rows, k_params = params.shape
+        if k_params == 0:
+            llf = self.loglike(params, series)[0]
+            return llf, np.zeros((n_rows, 0))
+        h = _get_epsilon(params, 1, None, k_params)
+        points = np.repeat(params, k_params, 0).astype(complex)
+        points[np.arange(n_rows * k_params),
+               np.tile(np.arange(k_params), n_rows)] += 1j * h.ravel()
+        llf = self.loglike(self.transparams(points),
+                           np.repeat(series, k_params))[0]
+        llf = llf.reshape(n_rows, k_params)
+        return llf.real[:,0], llf.imag / h
+
+
+def _bfgs_many(batch, params, series, maxiter, tol):
+    """
+    Maximizes the loglikelihood of the models of many series at once
+
+    Each series has its own BFGS approximation of the inverse hessian and
+    its own backtracking line search, the loglikelihood and score of all
+    active series are evaluated together. As for fmin_l_bfgs_b in ARMA.fit,
+    a series is converged if the largest absolute score is at most tol, or
+    if the relative increase of the loglikelihood is at most 1e2 times the
+    machine precision.
+
+    Returns the maximizing transformed params and whether each series
+    converged.
+    """
+    factr = 1e2 * np.finfo(float).eps
+    n_series, k_params = params.shape
+    params = params.copy()
+    llf, score = batch.loglike_score(params, series)
+    if k_params == 0:
+        return params, np.isfinite(llf)
+    converged = np.zeros(n_series, bool)
+    active = np.isfinite(llf) & np.isfinite(score).all(1)
+    converged[active] = np.abs(score[active]).max(1) <= tol
+    active &= ~converged
+    eye_k = np.eye(k_params)
+    hess_inv = np.repeat(eye_k[None], n_series, 0)
+    # the first step along the score has length one
+    restart = np.ones(n_series, bool)
+    for _ in range(maxiter):
+        if not active.any():
+            break
+        idx = np.nonzero(active)[0]
+        direction = (hess_inv[idx] * score[idx,None,:]).sum(2)
+        slope = (direction * score[idx]).sum(1)
+        restart[idx] |= ~(slope > 0)
+        new = idx[restart[idx]]
+        hess_inv[new] = (eye_k[None] / np.sqrt((score[new]**2).sum(1))[:,
+                                                                None, None])
+        direction = (hess_inv[idx] * score[idx,None,:]).sum(2)
+        slope = (direction * score[idx]).sum(1)
+
+        # backtracking line search with the Armijo condition
+        step = np.ones(len(idx))
+        new_params = params[idx].copy()
+        new_llf = llf[idx].copy()
+        new_score = score[idx].copy()
+        pending = np.ones(len(idx), bool)
+        for _ in range(20):
+            trial = np.nonzero(pending)[0]
+            points = (params[idx[trial]] +
+                      step[trial,None] * direction[trial])
+            llf_t, score_t = batch.loglike_score(points, series[idx[trial]])
+            ok = ((llf_t >= llf[idx[trial]] + 1e-4 * step[trial] *
+                   slope[trial]) & np.isfinite(score_t).all(1))
+            accepted = trial[ok]
+            new_params[accepted] = points[ok]
+            new_llf[accepted] = llf_t[ok]
+            new_score[accepted] = score_t[ok]
+            pending[accepted] = False
+            step[trial[~ok]] *= .5
+            if not pending.any():
+                break
+        # no increase along the direction, the series stops
+        active[idx[pending]] = False
+        moved = ~pending
+        change = new_llf[moved] - llf[idx[moved]]
+        idx = idx[moved]
+        new_params, new_llf, new_score = (new_params[moved], new_llf[moved],
+                                          new_score[moved])
+
+        # BFGS update of the inverse hessian of -llf
+        s = new_params - params[idx]
+        yk = score[idx] - new_score
+        sy = (s * yk).sum(1)
+        update = sy > 0
+        first = update & restart[idx]
+        hess_inv[idx[first]] = (eye_k[None] * (sy[first] /
+                                (yk[first]**2).sum(1))[:,None,None])
+        restart[idx[update]] = False
+        rho = 1. / np.where(update, sy, 1.)
+        V = eye_k - rho[:,None,None] * s[:,:,None] * yk[:,None,:]
+        H = np.einsum('nij,njk,nlk->nil', V, hess_inv[idx], V)
+        H += rho[:,None,None] * s[:,:,None] * s[:,None,:]
+        hess_inv[idx[update]] = H[update]
+
+        params[idx] = new_params
+        llf[idx] = new_llf
+        score[idx] = new_score
+        done = ((np.abs(new_score).max(1) <= tol) |
+                (change <= factr * np.maximum(np.abs(new_llf), 1)))
+        converged[idx[done]] = True
+        active[idx[done]] = False
+    return params, converged
+
+
+def _fit_many_group(series, order, trend, steps, method, start_params,
+                    maxiter, tol):
+    """
+    Fits the series of the same length, returns a row of params, sigma2,
+    llf, aic, bic, converged and the forecasts for each series, nan if the
+    fit fails.
+    """
+    k_ar, k_diff, k_ma = order
+    k_trend = int(trend == 'c')
+    k_params = k_trend + k_ar + k_ma
+    n_series = len(series)
+    levels = np.array(series, dtype=float).reshape(n_series, -1)
+    y = np.diff(levels, k_diff, axis=1)
+    nobs = y.shape[1]
+    rows = np.empty((n_series, k_params + 5 + steps))
+    rows.fill(np.nan)
+    rows[:,k_params+4] = 0
+
+    # starting values as in ARMA.fit
+    if start_params is None:
+        start_params = np.empty((n_series, k_params))
+        start_params.fill(np.nan)
+        for i in range(n_series):
+            try:
+                mod = ARMA(y[i], (k_ar, k_ma))
+                mod._setup_fit(trend, method)
+                mod.transparams = True
+                start_params[i] = mod._fit_start_params((k_ar, k_ma,
+                                                         k_trend), method)
+            except Exception:
+                pass
+    fitted = np.nonzero(np.isfinite(start_params).all(1))[0]
+    if not len(fitted):
+        return rows
+
+    batch = _ARMABatch(y, (k_ar, k_ma), k_trend)
+    params, converged = _bfgs_many(batch,
+                                   batch.invtransparams(start_params[fitted]),
+                                   fitted, maxiter, tol)
+    params = batch.transparams(params)
+    llf, sigma2 = batch.loglike(params, fitted)
+    rows[fitted,:k_params] = params
+    rows[fitted,k_params] = sigma2
+    rows[fitted,k_params+1] = llf
+    # see ARMAResults.aic and bic
+    rows[fitted,k_params+2] = -2 * llf + 2 * (k_params + 1)
+    rows[fitted,k_params+3] = -2 * llf + np.log(nobs) * (k_params + 1)
+    rows[fitted,k_params+4] = converged
+    if steps:
+        # see ARMAResults.forecast and ARIMAResults.forecast
+        R_mat, T_mat = batch.system_matrices(params)
+        for j, i in enumerate(fitted):
+            errors = kalman_loglike.kalman_filter_state(
+                        y[i] - params[j,:k_trend].sum(), batch.Z_mat,
+                        R_mat[j], T_mat[j])[0]
+            forecast = np.atleast_1d(_arma_predict_out_of_sample(params[j],
+                                steps, errors, k_ar, k_ma, k_trend, 0, y[i]))
+            for diff in range(k_diff - 1, -1, -1):
+                forecast = (np.diff(levels[i], diff)[-1] +
+                            np.cumsum(forecast))
+            rows[i,k_params+5:] = forecast
+    nan_llf = ~np.isfinite(llf)
+    rows[fitted[nan_llf]] = np.nan
+    rows[fitted[nan_llf],k_params+4] = 0
+    return rows
+
+
+def fit_many(endog, order, trend='c', steps=0, n_jobs=1, method='mle',
+             start_params=None, maxiter=100, tol=1e-8):
+    """
+    Fits an ARIMA model with a common order to many series
+
+    Parameters
+    ----------
+    endog : array-like or list
+        2d array with the series in the columns, or a list of 1d series
+        that can have different lengths. Dates are not used.
+    order : tuple
+        (p, q) or (p, d, q) order of the models.
+    trend : str {'c', 'nc'}
+        Whether to include a constant or not.
+    steps : int
+        Number of out of sample forecasts of each series, in the levels of
+        the series if d > 0.
+    n_jobs : int
+        Number of processes that fit the series, -1 uses all cpus. Requires
+        joblib, see statsmodels.tools.parallel.
+    method : str {'mle', 'css-mle'}
+        The starting values are the Hannan-Rissanen estimates for 'mle' and
+        the conditional sum of squares estimates for 'css-mle', as in
+        ARMA.fit. Both maximize the exact likelihood.
+    start_params : array-like, optional
+        n_series x k_params array of starting values.
+    maxiter : int
+        Maximum number of iterations for each series.
+    tol : float
+        A series is converged if the largest absolute derivative of its
+        loglikelihood with respect to the transformed parameters is at
+        most tol.
+
+    Returns
+    -------
+    res : Bunch
+        Dict-like object with attribute access with the arrays params,
+        n_series x k_params, sigma2, llf, aic, bic and converged, with one
+        value per series, and forecast, n_series x steps. The rows of series
+        whose fit fails are nan and not converged. param_names has the
+        names of the parameters.
+
+    Notes
+    -----
+    The series with the same number of observations are estimated
+    together. The order, trend and the state space form are set up once
+    for them, and every evaluation of the exact loglikelihood of all their
+    models is a single call of the batched Kalman filter,
+    kalman_loglike.kalman_loglike_batch. The score is the complex step
+    derivative, computed in the same call. Each series has its own BFGS
+    iterations and line search on the parameters transformed to
+    stationarity and invertibility, see ARMA.fit, and stops when it is
+    converged.
+
+    The estimates agree with ARIMA(y, order).fit(trend=trend,
+    method=method) up to the tolerance of the optimizers. With n_jobs
+    other than 1 the series of each length are split into one chunk per
+    process.
+    """
+    from statsmodels.tsa.stattools import Bunch
+    if isinstance(endog, np.ndarray) and endog.ndim == 2:
+        series = list(endog.T)
+    else:
+        series = list(endog)
+    if len(order) == 2:
+        order = (order[0], 0, order[1])
+    method = method.lower()
+    if method not in ['mle', 'css-mle']:
+        raise ValueError("method has to be 'mle' or 'css-mle'")
+    n_series = len(series)
+    k_params = sum(order) - order[1] + (trend == 'c')
+    if start_params is not None:
+        start_params = np.asarray(start_params, dtype=float).reshape(
+                                                        n_series, k_params)
+
+    lengths = np.array([len(y) for y in series])
+    tasks = []
+    for length in np.unique(lengths):
+        idx = np.nonzero(lengths == length)[0]
+        n_chunks = 1 if n_jobs == 1 else min(len(idx), max(n_jobs, 1))
+        tasks.extend(np.array_split(idx, n_chunks))
+    args = [([series[i] for i in idx], order, trend, steps, method,
+             None if start_params is None else start_params[idx], maxiter,
+             tol) for idx in tasks]
+    if n_jobs == 1 or len(tasks) < 2:
+        results = [_fit_many_group(*arg) for arg in args]
+    else:
+        from statsmodels.tools.parallel import parallel_func
+        parallel, p_func, n_jobs = parallel_func(_fit_many_group,
+                                                 n_jobs=n_jobs, verbose=0)
+        results = parallel(p_func(*arg) for arg in args)
+    rows = np.empty((n_series, k_params + 5 + steps))
+    for idx, result in zip(tasks, results):
+        rows[idx] = result
+
+    k_trend = int(trend == 'c')
+    param_names = (['const'] * k_trend +
+                   ['ar.L%d' % i for i in range(1, order[0] + 1)] +
+                   ['ma.L%d' % i for i in range(1, order[2] + 1)])
+    return Bunch(params=rows[:,:k_params], sigma2=rows[:,k_params],
+                 llf=rows[:,k_params+1], aic=rows[:,k_params+2],
+                 bic=rows[:,k_params+3],
+                 converged=rows[:,k_params+4].astype(bool),
+                 forecast=rows[:,k_params+5:], param_names=param_names)
+
+
 if __name__ == "__main__":
     import numpy as np
     import statsmodels.api as sm
@@ -1,141 +1,332 @@
-# cython: profile=True
-from numpy cimport float64_t, ndarray, complex128_t, complex64_t
-from numpy import log as nplog
-from numpy import identity, dot, kron, zeros, pi, exp, eye, sum, empty, ones
+"""
+Kalman filter recursions for the exact loglikelihood of ARMA processes
+
+The state dimension of an ARMA model is r = max(p, q + 1), so the matrix
+products of a step are written as loops over typed memoryviews. There are no
+calls into numpy inside the recursions. The same code is used for real
+parameters and for the complex parameters of the complex step derivatives.
+
+When the variance of the state stops changing, the Kalman gain and the
+variance of the forecast errors are constant and the remaining periods only
+update the state.
+"""
+import numpy as np
+from numpy import identity, dot, kron, pi, log
 from numpy.linalg import pinv
 cimport cython
 
-ctypedef float64_t DOUBLE
-ctypedef complex128_t COMPLEX128
-ctypedef complex64_t COMPLEX64
+ctypedef fused numeric:
+    double
+    double complex
+
+# the steady state is reached when no element of the state variance changes
+# by more than this from one period to the next
+STEADY_STATE_TOL = 1e-12
+
+
+cdef inline double _absval(numeric x):
+    if numeric is double:
+        return x if x >= 0 else -x
+    else:
+        return abs(x)
 
-cdef extern from "math.h":
-    double log(double x)
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-def kalman_filter_double(ndarray[DOUBLE, ndim=1] y,
-                   unsigned int k, unsigned int p, unsigned int q,
-                  unsigned int r, unsigned int nobs,
-                   ndarray[DOUBLE, ndim=2] Z_mat,
-                   ndarray[DOUBLE, ndim=2] R_mat,
-                   ndarray[DOUBLE, ndim=2] T_mat):
+def _filter(numeric[::1] y, double[::1] Z, numeric[::1] R,
+            numeric[:, ::1] T, numeric[:, ::1] P, numeric[::1] alpha,
+            numeric[::1] v, numeric[::1] F, double tol):
     """
-    Cython version of the Kalman filter recursions for an ARMA process.
+    Runs the recursions, v and F are filled in place. alpha and P hold the
+    state of the first period and are overwritten with the state of the
+    period after the last.
+
+    Returns the number of periods before the steady state.
     """
-    m = Z_mat.shape[1]
-    # store forecast-errors
-    v = zeros((nobs,1))
-    # store variance of forecast errors
-    F = ones((nobs,1))
-    loglikelihood = zeros((1,1))
-    cdef int i = 0
-    # initial state
-#    cdef np.ndarray[DOUBLE, ndim=2] alpha = zeros((m,1))
-    alpha = zeros((m,1))
-    # initial variance
-    P = dot(pinv(identity(m**2)-kron(T_mat, T_mat)),dot(R_mat,
-            R_mat.T).ravel('F')).reshape(r,r, order='F')
-    F_mat = 0
-    while not F_mat == 1 and i < nobs:
-        # Predict
-        v_mat = y[i] - dot(Z_mat,alpha) # one-step forecast error
-        v[i] = v_mat
-        F_mat = dot(dot(Z_mat, P), Z_mat.T)
-        F[i] = F_mat
-        Finv = 1./F_mat # always scalar for univariate series
-        K = dot(dot(dot(T_mat,P),Z_mat.T),Finv) # Kalman Gain Matrix
+    cdef Py_ssize_t nobs = y.shape[0], m = T.shape[0]
+    cdef Py_ssize_t i = 0, a, b, c, n_transient
+    cdef numeric vi, Fi = 0, tmp
+    cdef double diff
+    if numeric is double:
+        dtype = np.float64
+    else:
+        dtype = np.complex128
+    cdef numeric[::1] alpha_new = np.zeros(m, dtype)
+    cdef numeric[::1] PZ = np.zeros(m, dtype)
+    cdef numeric[::1] K = np.zeros(m, dtype)
+    cdef numeric[:, ::1] TP = np.zeros((m, m), dtype)
+    cdef numeric[:, ::1] P_new = np.zeros((m, m), dtype)
+
+    while i < nobs:
+        # one-step forecast error and its variance
+        tmp = 0
+        for a in range(m):
+            tmp = tmp + Z[a] * alpha[a]
+        vi = y[i] - tmp
+        v[i] = vi
+        for a in range(m):
+            tmp = 0
+            for b in range(m):
+                tmp = tmp + P[a, b] * Z[b]
+            PZ[a] = tmp
+        Fi = 0
+        for a in range(m):
+            Fi = Fi + Z[a] * PZ[a]
+        F[i] = Fi
+        # Kalman gain K = T P Z' / F
+        for a in range(m):
+            tmp = 0
+            for b in range(m):
+                tmp = tmp + T[a, b] * PZ[b]
+            K[a] = tmp / Fi
         # update state
-        alpha = dot(T_mat, alpha) + dot(K,v_mat)
-        L = T_mat - dot(K,Z_mat)
-        P = dot(dot(T_mat, P), L.T) + dot(R_mat, R_mat.T)
-        loglikelihood += log(F_mat)
-        i+=1
-    for i in xrange(i,nobs):
-        v_mat = y[i] - dot(Z_mat,alpha)
-        v[i] = v_mat
-        alpha = dot(T_mat, alpha) + dot(K, v_mat)
-    return v, F, loglikelihood
+        for a in range(m):
+            tmp = 0
+            for b in range(m):
+                tmp = tmp + T[a, b] * alpha[b]
+            alpha_new[a] = tmp + K[a] * vi
+        for a in range(m):
+            alpha[a] = alpha_new[a]
+        # P = T P L' + R R' with L = T - K Z
+        for a in range(m):
+            for b in range(m):
+                tmp = 0
+                for c in range(m):
+                    tmp = tmp + T[a, c] * P[c, b]
+                TP[a, b] = tmp
+        diff = 0
+        for a in range(m):
+            for c in range(m):
+                tmp = 0
+                for b in range(m):
+                    tmp = tmp + TP[a, b] * (T[c, b] - K[c] * Z[b])
+                tmp = tmp + R[a] * R[c]
+                P_new[a, c] = tmp
+                if _absval(tmp - P[a, c]) > diff:
+                    diff = _absval(tmp - P[a, c])
+        P[...] = P_new
+        i += 1
+        if Fi == 1 or diff <= tol:
+            break
 
-@cython.boundscheck(False)
-@cython.wraparound(False)
-@cython.cdivision(True)
-def kalman_filter_complex(ndarray[COMPLEX128, ndim=1] y,
-                   unsigned int k, unsigned int p, unsigned int q,
-                  unsigned int r, unsigned int nobs,
-                   ndarray[DOUBLE, ndim=2] Z_mat,
-                   ndarray[COMPLEX128, ndim=2] R_mat,
-                   ndarray[COMPLEX128, ndim=2] T_mat):
+    n_transient = i
+    # steady state, the gain and the variance of the errors do not change
+    for i in range(n_transient, nobs):
+        tmp = 0
+        for a in range(m):
+            tmp = tmp + Z[a] * alpha[a]
+        vi = y[i] - tmp
+        v[i] = vi
+        F[i] = Fi
+        for a in range(m):
+            tmp = 0
+            for b in range(m):
+                tmp = tmp + T[a, b] * alpha[b]
+            alpha_new[a] = tmp + K[a] * vi
+        for a in range(m):
+            alpha[a] = alpha_new[a]
+    return n_transient
+
+
+def _init_variance(R_mat, T_mat):
     """
-    Cython version of the Kalman filter recursions for an ARMA process.
+    Unconditional variance of the state, the initial variance of the filter
     """
-    m = Z_mat.shape[1]
-    # store forecast-errors
-    v = zeros((nobs,1), dtype=complex)
-    # store variance of forecast errors
-    F = ones((nobs,1), dtype=complex)
-    loglikelihood = zeros((1,1), dtype=complex)
-    cdef int i = 0
-    # initial state
-#    cdef np.ndarray[DOUBLE, ndim=2] alpha = zeros((m,1))
-    alpha = zeros((m,1))
-    # initial variance
-    P = dot(pinv(identity(m**2)-kron(T_mat, T_mat)),dot(R_mat,
-            R_mat.T).ravel('F')).reshape(r,r, order='F')
-    F_mat = 0
-    while not F_mat == 1 and i < nobs:
-        # Predict
-        v_mat = y[i] - dot(Z_mat,alpha) # one-step forecast error
-        v[i] = v_mat
-        F_mat = dot(dot(Z_mat, P), Z_mat.T)
-        F[i] = F_mat
-        Finv = 1./F_mat # always scalar for univariate series
-        K = dot(dot(dot(T_mat,P),Z_mat.T),Finv) # Kalman Gain Matrix
-        # update state
-        alpha = dot(T_mat, alpha) + dot(K,v_mat)
-        L = T_mat - dot(K,Z_mat)
-        P = dot(dot(T_mat, P), L.T) + dot(R_mat, R_mat.T)
-        loglikelihood += nplog(F_mat)
-        i+=1
-    for i in xrange(i,nobs):
-        v_mat = y[i] - dot(Z_mat,alpha)
-        v[i] = v_mat
-        alpha = dot(T_mat, alpha) + dot(K, v_mat)
-    return v,F,loglikelihood
+    r = T_mat.shape[0]
+    return dot(pinv(identity(r**2) - kron(T_mat, T_mat)), dot(R_mat,
+               R_mat.T).ravel('F')).reshape(r, r, order='F')
 
-@cython.boundscheck(False)
-@cython.wraparound(False)
-@cython.cdivision(True)
-def kalman_loglike_double(ndarray[DOUBLE, ndim=1] y,
-                   unsigned int k, unsigned int p, unsigned int q,
-                  unsigned int r, unsigned int nobs,
-                   ndarray[DOUBLE, ndim=2] Z_mat,
-                   ndarray[DOUBLE, ndim=2] R_mat,
-                   ndarray[DOUBLE, ndim=2] T_mat):
+
+def _init_variance_batch(R_mat, T_mat):
     """
-    Cython version of the Kalman filter recursions for an ARMA process.
+    Unconditional variances of the states of several models, solved for
+    all models at once. Falls back to _init_variance for each model if
+    one of the systems is singular.
     """
-    v, F, loglikelihood = kalman_filter_double(y,k,p,q,r,nobs,Z_mat,R_mat,T_mat)
-    sigma2 = 1./nobs * sum(v**2 / F)
+    n_models, r = T_mat.shape[:2]
+    # kron(T, T) of each model
+    TT = np.einsum('nij,nkl->nikjl', T_mat, T_mat).reshape(n_models, r**2,
+                                                          r**2)
+    RR = np.einsum('nia,nja->nji', R_mat, R_mat).reshape(n_models, r**2)
+    try:
+        P = np.linalg.solve(identity(r**2) - TT, RR[:,:,None])
+    except np.linalg.LinAlgError:
+        return np.array([_init_variance(R_mat[j], T_mat[j])
+                         for j in range(n_models)])
+    # the solution is vec(P) in column major order
+    return P.reshape(n_models, r, r).transpose(0, 2, 1)
+
+
+def _kalman_filter(y, nobs, Z_mat, R_mat, T_mat, dtype, tol, P=None):
+    if P is None:
+        P = _init_variance(R_mat, T_mat)
+    P = np.array(P, dtype=dtype, order='C')
+    alpha = np.zeros(P.shape[0], dtype=dtype)
+    v = np.zeros(nobs, dtype=dtype)
+    F = np.ones(nobs, dtype=dtype)
+    _filter(np.ascontiguousarray(y[:nobs], dtype=dtype),
+            np.ascontiguousarray(Z_mat[0], dtype=float),
+            np.ascontiguousarray(R_mat[:, 0], dtype=dtype),
+            np.ascontiguousarray(T_mat, dtype=dtype), P, alpha, v, F, tol)
+    loglikelihood = log(F).sum().reshape(1, 1)
+    return v[:, None], F[:, None], loglikelihood
+
+
+def _loglike(v, F, loglikelihood, nobs):
+    sigma2 = 1./nobs * np.sum(v**2 / F)
     loglike = -.5 *(loglikelihood + nobs*log(sigma2))
     loglike -= nobs/2. * (log(2*pi) + 1)
     return loglike, sigma2
 
-@cython.boundscheck(False)
-@cython.wraparound(False)
-@cython.cdivision(True)
-def kalman_loglike_complex(ndarray[COMPLEX128, ndim=1] y,
-                   unsigned int k, unsigned int p, unsigned int q,
-                  unsigned int r, unsigned int nobs,
-                   ndarray[DOUBLE, ndim=2] Z_mat,
-                   ndarray[COMPLEX128, ndim=2] R_mat,
-                   ndarray[COMPLEX128, ndim=2] T_mat):
+
+def kalman_filter_double(y, unsigned int k, unsigned int p, unsigned int q,
+                         unsigned int r, unsigned int nobs, Z_mat, R_mat,
+                         T_mat, double tol=STEADY_STATE_TOL):
     """
     Cython version of the Kalman filter recursions for an ARMA process.
+
+    Returns the forecast errors v, their variances F and the sum of the
+    log of F, the recursions switch to the steady state when the state
+    variance changes by at most `tol`.
     """
-    v,F,loglikelihood = kalman_filter_complex(y,k,p,q,r,nobs,Z_mat,R_mat,T_mat)
-    sigma2 = 1./nobs * sum(v**2 / F)
-    loglike = -.5 *(loglikelihood + nobs*nplog(sigma2))
-    loglike -= nobs/2. * (log(2*pi) + 1)
+    return _kalman_filter(y, nobs, Z_mat, R_mat, T_mat, np.float64, tol)
+
+
+def kalman_filter_complex(y, unsigned int k, unsigned int p, unsigned int q,
+                          unsigned int r, unsigned int nobs, Z_mat, R_mat,
+                          T_mat, double tol=STEADY_STATE_TOL):
+    """
+    Cython version of the Kalman filter recursions for an ARMA process.
+
+    Complex version of kalman_filter_double.
+    """
+    return _kalman_filter(y, nobs, Z_mat, R_mat, T_mat, np.complex128, tol)
+
+
+def kalman_filter_state(y, Z_mat, R_mat, T_mat, alpha=None, P=None,
+                        double tol=STEADY_STATE_TOL):
+    """
+    Kalman filter recursions for an ARMA process from a given state
+
+    Parameters
+    ----------
+    y : array, (nobs,)
+        The series net of the trend and the exogenous variables.
+    Z_mat, R_mat, T_mat : arrays
+        The system matrices, as for kalman_filter_double.
+    alpha : array, (r,), optional
+        The predicted state of the first period, zero by default.
+    P : array, (r, r), optional
+        The variance of alpha relative to sigma2, the unconditional variance
+        of the state by default.
+    tol : float
+        Tolerance for the steady state of the recursions.
+
+    Returns
+    -------
+    v : array, (nobs,)
+        The one-step forecast errors.
+    F : array, (nobs,)
+        The variances of v relative to sigma2.
+    alpha : array, (r,)
+        The predicted state of the period after the last.
+    P : array, (r, r)
+        The variance of alpha relative to sigma2.
+
+    Notes
+    -----
+    Filtering a series in two parts, starting the second part from the
+    alpha and P returned for the first, gives the forecast errors of
+    filtering it at once, up to the tolerance of the steady state.
+    """
+    R_mat = np.asarray(R_mat, dtype=float)
+    T_mat = np.asarray(T_mat, dtype=float)
+    if alpha is None:
+        alpha = np.zeros(T_mat.shape[0])
+    if P is None:
+        P = _init_variance(R_mat, T_mat)
+    alpha = np.array(alpha, dtype=float)
+    P = np.array(P, dtype=float, order='C')
+    nobs = len(y)
+    v = np.zeros(nobs)
+    F = np.ones(nobs)
+    _filter(np.ascontiguousarray(y, dtype=float),
+            np.ascontiguousarray(Z_mat[0], dtype=float),
+            np.ascontiguousarray(R_mat[:, 0]), np.ascontiguousarray(T_mat),
+            P, alpha, v, F, tol)
+    return v, F, alpha, P
+
+
+def kalman_loglike_double(y, unsigned int k, unsigned int p, unsigned int q,
+                          unsigned int r, unsigned int nobs, Z_mat, R_mat,
+                          T_mat, double tol=STEADY_STATE_TOL):
+    """
+    Cython version of the Kalman filter recursions for an ARMA process.
+
+    Returns the loglikelihood with sigma2 concentrated out, and sigma2.
+    """
+    v, F, loglikelihood = kalman_filter_double(y, k, p, q, r, nobs, Z_mat,
+                                               R_mat, T_mat, tol)
+    return _loglike(v, F, loglikelihood, nobs)
+
+
+def kalman_loglike_complex(y, unsigned int k, unsigned int p, unsigned int q,
+                           unsigned int r, unsigned int nobs, Z_mat, R_mat,
+                           T_mat, double tol=STEADY_STATE_TOL):
+    """
+    Cython version of the Kalman filter recursions for an ARMA process.
+
+    Complex version of kalman_loglike_double.
+    """
+    v, F, loglikelihood = kalman_filter_complex(y, k, p, q, r, nobs, Z_mat,
+                                                R_mat, T_mat, tol)
+    return _loglike(v, F, loglikelihood, nobs)
+
+
+def kalman_loglike_batch(y, Z_mat, R_mat, T_mat,
+                         double tol=STEADY_STATE_TOL):
+    """
+    Loglikelihood of several ARMA processes with the same lag structure
+
+    Parameters
+    ----------
+    y : array, (n_models, nobs)
+        The series, one row per model.
+    Z_mat : array, (1, r)
+        The selection matrix, shared by all models.
+    R_mat : array, (n_models, r, 1)
+    T_mat : array, (n_models, r, r)
+        The system matrices of each model.
+    tol : float
+        Tolerance for the steady state of the recursions.
+
+    Returns
+    -------
+    loglike : array, (n_models,)
+    sigma2 : array, (n_models,)
+
+    Notes
+    -----
+    The arrays are complex if any of the inputs is complex, which is used
+    for complex step derivatives.
+    """
+    y = np.asarray(y)
+    R_mat = np.asarray(R_mat)
+    T_mat = np.asarray(T_mat)
+    n_models, nobs = y.shape
+    if (np.iscomplexobj(y) or np.iscomplexobj(R_mat) or
+            np.iscomplexobj(T_mat)):
+        dtype = np.complex128
+    else:
+        dtype = np.float64
+    loglike = np.empty(n_models, dtype=dtype)
+    sigma2 = np.empty(n_models, dtype=dtype)
+    P = _init_variance_batch(R_mat, T_mat)
+    for j in range(n_models):
+        v, F, loglikelihood = _kalman_filter(y[j], nobs, Z_mat, R_mat[j],
+                                             T_mat[j], dtype, tol, P[j])
+        llf, s2 = _loglike(v, F, loglikelihood, nobs)
+        loglike[j] = llf.item()
+        sigma2[j] = s2
     return loglike, sigma2
@@ -580,6 +580,50 @@ class KalmanFilter(object):
             raise TypeError("dtype %s is not supported "
                             "Please file a bug report" % paramsdtype)
 
+    @classmethod
+    def filter_state(cls, params, arma_model, y=None, state=None):
+        """
+        Runs the recursions from a given state of the filter.
+
+        Parameters
+        ----------
+        params : array
+            The coefficients of the ARMA model, in the order used by
+            `loglike`.
+        arma_model : `statsmodels.tsa.arima.ARMA` instance
+            A reference to the ARMA model instance.
+        y : array, optional
+            The observations net of the trend and the exogenous variables.
+            The default is the sample of `arma_model`.
+        state : tuple, optional
+            The predicted state and its variance for the first observation,
+            as returned for the last observation of a previous call. The
+            default starts the recursions as `loglike` does.
+
+        Returns
+        -------
+        v : array
+            The one-step forecast errors.
+        F : array
+            The variances of the forecast errors relative to sigma2.
+        state : tuple
+            The predicted state and its variance for the observation after
+            the last.
+        """
+        if y is None:
+            y = cls._init_kalman_state(params, arma_model)[0]
+        if arma_model.transparams:
+            params = arma_model._transparams(params)
+        k = arma_model.k_exog + arma_model.k_trend
+        k_ar, k_ma, k_lags = arma_model.k_ar, arma_model.k_ma, arma_model.k_lags
+        Z_mat = cls.Z(k_lags)
+        R_mat = cls.R(params, k_lags, k, k_ma, k_ar)
+        T_mat = cls.T(params, k_lags, k, k_ar)
+        alpha, P = state if state is not None else (None, None)
+        v, F, alpha, P = kalman_loglike.kalman_filter_state(y, Z_mat, R_mat,
+                                                    T_mat, alpha, P)
+        return v, F, (alpha, P)
+
     @classmethod
     def _init_kalman_state(cls, params, arma_model):
         """
@@ -650,6 +694,42 @@ class KalmanFilter(object):
         arma_model.sigma2 = sigma2
         return loglike.item() # return a scalar not a 0d array
 
+    @classmethod
+    def loglike_batch(cls, params, arma_model):
+        """
+        The loglikelihood of an ARMA model for each row of params.
+
+        Parameters
+        ----------
+        params : array, (n_points, k_params)
+            Each row holds coefficients in the order used by `loglike`.
+        arma_model : `statsmodels.tsa.arima.ARMA` instance
+            A reference to the ARMA model instance.
+
+        Returns
+        -------
+        loglike : array, (n_points,)
+
+        Notes
+        -----
+        All rows are filtered in one call into the Cython recursions, this is
+        used for the numerical derivatives. Unlike `loglike`, sigma2 of the
+        model is not changed.
+        """
+        params = np.atleast_2d(params)
+        ys, R_mats, T_mats = [], [], []
+        for row in params:
+            (y, k, nobs, k_ar, k_ma, k_lags, newparams, Z_mat, m, R_mat,
+                    T_mat, paramsdtype) = cls._init_kalman_state(row,
+                                                                 arma_model)
+            ys.append(y)
+            R_mats.append(R_mat)
+            T_mats.append(T_mat)
+        Z_mat = cls.Z(arma_model.k_lags)
+        loglike, sigma2 = kalman_loglike.kalman_loglike_batch(np.array(ys),
+                                Z_mat, np.array(R_mats), np.array(T_mats))
+        return loglike
+
 
 if __name__ == "__main__":
     import numpy as np
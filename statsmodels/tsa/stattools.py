@@ -4,7 +4,7 @@ Statistical tools for time series analysis
 
 import numpy as np
 from scipy import stats, signal
-from statsmodels.regression.linear_model import OLS, yule_walker
+from statsmodels.regression.linear_model import OLS
 from statsmodels.tools.tools import add_constant
 from tsatools import lagmat, lagmat2ds, add_trend
 #from statsmodels.sandbox.tsa import var
@@ -17,6 +17,34 @@ class ResultsStore(object):
     def __str__(self):
         return self._str  # pylint: disable=E1101
 
+class _NestedOLS(object):
+    """
+    OLS fits of the models with the first 1, 2, ..., k columns of exog
+
+    exog is factored once by a QR decomposition. The sum of squared
+    residuals of each nested model follows from the projections of endog on
+    the columns of Q, so no model is fitted separately. The arrays of
+    statistics are indexed by the number of columns minus one.
+    """
+    def __init__(self, endog, exog):
+        nobs, k = exog.shape
+        q, r = np.linalg.qr(exog)
+        qty = np.dot(q.T, endog)
+        ssr_full = np.sum((endog - np.dot(q, qty))**2)
+        # projections on the columns that a nested model leaves out
+        left_out = np.r_[np.cumsum(qty[::-1]**2)[::-1][1:], 0]
+        k_params = np.arange(1, k + 1)
+        self.nobs = nobs
+        self.ssr = ssr_full + left_out
+        self.df_resid = nobs - k_params
+        self.llf = -nobs / 2. * (np.log(2 * np.pi * self.ssr / nobs) + 1)
+        self.aic = -2 * self.llf + 2 * k_params
+        self.bic = -2 * self.llf + np.log(nobs) * k_params
+        # t-statistic of the last included column
+        self.tvalues = (qty * np.sign(np.diag(r)) /
+                        np.sqrt(self.ssr / self.df_resid))
+
+
 def _autolag(mod, endog, exog, startlag, maxlag, method, modargs=(),
         fitargs=(), regresults=False):
     """
@@ -53,33 +81,49 @@ def _autolag(mod, endog, exog, startlag, maxlag, method, modargs=(),
     where i goes from lagstart to lagstart+maxlag+1.  Therefore, lags are
     assumed to be in contiguous columns from low to high lag length with
     the highest lag in the last column.
+
+    If mod is OLS and the regression results are not requested, the nested
+    regressions are not fitted one by one, all of them are computed from a
+    single QR decomposition of exog.
+
+    With "t-stat", the smallest lag length is used if the last lag is not
+    significant for any lag length.
     """
     #TODO: can tcol be replaced by maxlag + 2?
     #TODO: This could be changed to laggedRHS and exog keyword arguments if
     #    this will be more general.
 
-    results = {}
     method = method.lower()
-    for lag in range(startlag, startlag+maxlag+1):
-        mod_instance = mod(endog, exog[:,:lag], *modargs)
-        results[lag] = mod_instance.fit()
-
-    if method == "aic":
-        icbest, bestlag = min((v.aic,k) for k,v in results.iteritems())
-    elif method == "bic":
-        icbest, bestlag = min((v.bic,k) for k,v in results.iteritems())
-    elif method == "t-stat":
-        lags = sorted(results.keys())[::-1]
+    if method not in ["aic", "bic", "t-stat"]:
+        raise ValueError("Information Criterion %s not understood." % method)
+    lags = range(startlag, startlag+maxlag+1)
+    results = {}
+    if mod is OLS and not (modargs or fitargs or regresults):
+        nested = _NestedOLS(endog, exog[:,:lags[-1]])
+        values = dict(aic=nested.aic, bic=nested.bic, tstat=nested.tvalues)
+        values = values[method.replace('-', '')]
+        ics = dict((lag, values[lag-1]) for lag in lags)
+    else:
+        for lag in lags:
+            mod_instance = mod(endog, exog[:,:lag], *modargs)
+            results[lag] = mod_instance.fit()
+        if method == "aic":
+            ics = dict((k, v.aic) for k, v in results.iteritems())
+        elif method == "bic":
+            ics = dict((k, v.bic) for k, v in results.iteritems())
+        else:
+            ics = dict((k, v.tvalues[-1]) for k, v in results.iteritems())
+
+    if method in ["aic", "bic"]:
+        icbest, bestlag = min((v,k) for k,v in ics.iteritems())
+    else:
         #stop = stats.norm.ppf(.95)
         stop = 1.6448536269514722
-        for lag in range(startlag + maxlag, startlag - 1, -1):
-            icbest = np.abs(results[lag].tvalues[-1])
-            if np.abs(icbest) >= stop:
-                bestlag = lag
-                icbest = icbest
+        for lag in lags[::-1]:
+            icbest = np.abs(ics[lag])
+            bestlag = lag
+            if icbest >= stop:
                 break
-    else:
-        raise ValueError("Information Criterion %s not understood.") % method
 
     if not regresults:
         return icbest, bestlag
@@ -269,7 +313,182 @@ def adfuller(x, maxlag=None, regression="c", autolag='AIC',
         else:
             return adfstat, pvalue, usedlag, nobs, critvalues, icbest
 
-def acovf(x, unbiased=False, demean=True, fft=False):
+def _adfuller_columns(x, maxlag, regression, autolag):
+    # adfstat, pvalue, usedlag, nobs, critical values and icbest of columns
+    results = []
+    for i in range(x.shape[1]):
+        res = adfuller(x[:,i], maxlag=maxlag, regression=regression,
+                       autolag=autolag)
+        icbest = res[5] if autolag else np.nan
+        crit = [res[4][level] for level in ["1%", "5%", "10%"]]
+        results.append(res[:4] + tuple(crit) + (icbest,))
+    return np.array(results, dtype=float).reshape(-1, 8)
+
+
+def adfuller_many(x, maxlag=None, regression="c", autolag='AIC', n_jobs=1):
+    """
+    Augmented Dickey-Fuller unit root test for each column of x
+
+    Parameters
+    ----------
+    x : array_like, 2d
+        The series in the columns.
+    maxlag : int
+        Maximum lag which is included in test, default 12*(nobs/100)^{1/4}
+    regression : str {'c','ct','ctt','nc'}
+        Constant and trend order to include in regression, see adfuller.
+    autolag : {'AIC', 'BIC', 't-stat', None}
+        Method to choose the number of lags of each series, see adfuller.
+    n_jobs : int
+        Number of processes that test the columns, -1 uses all cpus.
+        Requires joblib, see statsmodels.tools.parallel.
+
+    Returns
+    -------
+    res : Bunch
+        Dict-like object with attribute access and an array with one value
+        per column for each of adfstat, pvalue, usedlag, nobs and icbest.
+        icbest is nan if autolag is None. critvalues has the critical
+        values at the 1 %, 5 % and 10 % levels in three columns.
+
+    See Also
+    --------
+    adfuller
+
+    Notes
+    -----
+    The tests are the same as the ones of adfuller. The information criteria
+    of all lag lengths of a series are computed from one QR decomposition of
+    the regressors with the maximum lag.
+    """
+    x = np.asarray(x, dtype=float)
+    if x.ndim == 1:
+        x = x[:,None]
+    n_series = x.shape[1]
+    if n_jobs == 1 or n_series < 2:
+        results = _adfuller_columns(x, maxlag, regression, autolag)
+    else:
+        from statsmodels.tools.parallel import parallel_func
+        parallel, p_func, n_jobs = parallel_func(_adfuller_columns,
+                                                 n_jobs=n_jobs, verbose=0)
+        chunks = np.array_split(np.arange(n_series), min(n_jobs, n_series))
+        results = np.concatenate(parallel(p_func(x[:,chunk], maxlag,
+                                                 regression, autolag)
+                                          for chunk in chunks))
+    return Bunch(adfstat=results[:,0], pvalue=results[:,1],
+                 usedlag=results[:,2].astype(int),
+                 nobs=results[:,3].astype(int), critvalues=results[:,4:7],
+                 icbest=results[:,7])
+
+
+# maximum number of elements of the arrays of one chunk of series in the
+# computation of auto- and cross-covariances by FFT
+_COVF_CHUNK_SIZE = 2**17
+# number of elements of the blocks of series of the sums over the lags, the
+# products of a block stay in the cache
+_COVF_BLOCK_SIZE = 2**14
+
+
+def _next_regular(target):
+    """
+    Smallest integer >= target without prime factors other than 2, 3 and 5,
+    these are fast lengths for the FFT.
+    """
+    if target <= 6:
+        return target
+    best = 1 << (target - 1).bit_length()
+    p5 = 1
+    while p5 < best:
+        p35 = p5
+        while p35 < best:
+            # smallest power of 2 with p35 * 2**k >= target
+            quotient = -(-target // p35)
+            p2 = 1 << (quotient - 1).bit_length()
+            best = min(best, p2 * p35)
+            p35 *= 3
+        p5 *= 5
+    return best
+
+
+def _covf_columns(x, y, nlags, unbiased, fft=None, demean=False):
+    """
+    Cross-covariances sum_t x[t+k] * y[t] / d of the columns of x and y
+
+    x and y are 2d arrays, and y is None for the autocovariances of x. If
+    demean is True, the mean of each column is subtracted. Returns the lags 0 to nlags in the rows, with
+    d = nobs - k if unbiased and nobs otherwise. If fft is None, the zero
+    padded FFT is used if it is expected to be faster than the sums over
+    the lags.
+
+    The series are copied in chunks to contiguous rows, so that the
+    transforms and the products run over contiguous memory. A chunk of the
+    FFT has at most _COVF_CHUNK_SIZE elements.
+    """
+    nobs, n_series = x.shape
+    # padding to nobs + nlags avoids the circular wrap up to lag nlags
+    nfft = _next_regular(nobs + nlags)
+    if fft is None:
+        # costs in ns per series fit to timings of both methods, the sums
+        # have an overhead per lag and block of series and both have an
+        # overhead per call
+        rows = min(n_series, max(1, _COVF_BLOCK_SIZE // nobs))
+        cost_sums = ((nlags + 1) * (1.1 * nobs + 3800. / rows) +
+                     11000. / n_series)
+        cost_fft = 2.1 * nfft * np.log2(nfft) + 22000. / n_series
+        fft = cost_fft < cost_sums
+    covf = np.empty((n_series, nlags + 1))
+    if fft:
+        step = max(1, _COVF_CHUNK_SIZE // nfft)
+    else:
+        step = max(1, _COVF_BLOCK_SIZE // nobs)
+    for i in range(0, n_series, step):
+        xi = np.array(x[:,i:i+step].T, dtype=float, order='C')
+        if demean:
+            xi -= xi.mean(1)[:,None]
+        if y is not None:
+            yi = np.array(y[:,i:i+step].T, dtype=float, order='C')
+            if demean:
+                yi -= yi.mean(1)[:,None]
+        if fft:
+            fx = np.fft.rfft(xi, n=nfft)
+            if y is None:
+                prod = fx.real**2 + fx.imag**2
+            else:
+                prod = fx * np.fft.rfft(yi, n=nfft).conj()
+            covf[i:i+step] = np.fft.irfft(prod, n=nfft)[:,:nlags+1]
+        else:
+            if y is None:
+                yi = xi
+            for k in range(nlags + 1):
+                covf[i:i+step,k] = (xi[:,k:] * yi[:,:nobs-k]).sum(1)
+    if unbiased:
+        covf /= nobs - np.arange(nlags + 1.)
+    else:
+        covf /= nobs
+    return covf.T
+
+
+def _levinson_durbin_columns(acov, nlags):
+    """
+    Partial autocorrelations for the autocovariances in the columns of acov
+
+    One Levinson-Durbin recursion for all columns, returns the lags 0 to
+    nlags in the rows.
+    """
+    n_series = acov.shape[1]
+    pacf_ = np.ones((nlags + 1, n_series))
+    arcoefs = np.zeros((nlags, n_series))
+    sigma = acov[0].copy()
+    for k in range(1, nlags + 1):
+        phi = (acov[k] - (arcoefs[:k-1] * acov[k-1:0:-1]).sum(0)) / sigma
+        arcoefs[:k-1] = arcoefs[:k-1] - phi * arcoefs[:k-1][::-1]
+        arcoefs[k-1] = phi
+        sigma = sigma * (1 - phi**2)
+        pacf_[k] = phi
+    return pacf_
+
+
+def acovf(x, unbiased=False, demean=True, fft=None, nlag=None):
     '''
     Autocovariance for 1D
 
@@ -281,9 +500,12 @@ def acovf(x, unbiased=False, demean=True, fft=False):
         If True, then denominators is n-k, otherwise n
     demean : bool
         If True, then subtract the mean x from each element of x
-    fft : bool
+    fft : bool or None
         If True, use FFT convolution.  This method should be preferred
-        for long time series.
+        for long time series. If None, the default, FFT convolution is used
+        if it is faster.
+    nlag : int, optional
+        Largest lag of the autocovariance. The default is all lags, n-1.
 
     Returns
     -------
@@ -294,23 +516,14 @@ def acovf(x, unbiased=False, demean=True, fft=False):
     if x.ndim > 1:
         raise ValueError("x must be 1d. Got %d dims." % x.ndim)
     n = len(x)
-
+    if nlag is None:
+        nlag = n - 1
     if demean:
         xo = x - x.mean()
     else:
         xo = x
-    if unbiased:
-        xi = np.arange(1, n+1)
-        d = np.hstack((xi, xi[:-1][::-1]))
-    else:
-        d = n
-    if fft:
-        nobs = len(xo)
-        Frf = np.fft.fft(xo, n=nobs*2)
-        acov = np.fft.ifft(Frf*np.conjugate(Frf))[:nobs]/d
-        return acov.real
-    else:
-        return (np.correlate(xo, xo, 'full')/d)[n-1:]
+    return _covf_columns(xo[:,None], None, min(nlag, n - 1), unbiased,
+                         fft)[:,0]
 
 
 def q_stat(x,nobs, type="ljungbox"):
@@ -319,6 +532,7 @@ def q_stat(x,nobs, type="ljungbox"):
 
     x : array-like
         Array of autocorrelation coefficients.  Can be obtained from acf.
+        If x is 2d, the columns are the autocorrelations of several series.
     nobs : int
         Number of observations in the entire sample (ie., not just the length
         of the autocorrelation function results.
@@ -335,16 +549,18 @@ def q_stat(x,nobs, type="ljungbox"):
     Written to be used with acf.
     """
     x = np.asarray(x)
+    lags = np.arange(1, len(x)+1)
+    if x.ndim > 1:
+        lags = lags[:,None]
     if type=="ljungbox":
-        ret = nobs*(nobs+2)*np.cumsum((1./(nobs-np.arange(1,
-            len(x)+1)))*x**2)
-    chi2 = stats.chi2.sf(ret,np.arange(1,len(x)+1))
+        ret = nobs*(nobs+2)*np.cumsum((1./(nobs-lags))*x**2, axis=0)
+    chi2 = stats.chi2.sf(ret, lags)
     return ret,chi2
 
 #NOTE: Changed unbiased to False
 #see for example
 # http://www.itl.nist.gov/div898/handbook/eda/section3/autocopl.htm
-def acf(x, unbiased=False, nlags=40, confint=None, qstat=False, fft=False,
+def acf(x, unbiased=False, nlags=40, confint=None, qstat=False, fft=None,
         alpha=None):
     '''
     Autocorrelation function for 1d arrays.
@@ -366,8 +582,9 @@ def acf(x, unbiased=False, nlags=40, confint=None, qstat=False, fft=False,
     qstat : bool, optional
         If True, returns the Ljung-Box q statistic for each autocorrelation
         coefficient.  See q_stat for more information.
-    fft : bool, optional
-        If True, computes the ACF via FFT.
+    fft : bool or None, optional
+        If True, computes the ACF via FFT. If None, the default, FFT is used
+        if it is faster.
     alpha : scalar, optional
         If a number is given, the confidence intervals for the given level are
         returned. For instance if alpha=.05, 95 % confidence intervals are
@@ -390,28 +607,15 @@ def acf(x, unbiased=False, nlags=40, confint=None, qstat=False, fft=False,
     -----
     The acf at lag 0 (ie., 1) is returned.
 
-    This is based np.correlate which does full convolution. For very long time
-    series it is recommended to use fft convolution instead.
+    Only the autocovariances up to nlags are computed, by sums over the
+    lags or by FFT convolution, see `fft`.
 
     If unbiased is true, the denominator for the autocovariance is adjusted
     but the autocorrelation is not an unbiased estimtor.
     '''
     nobs = len(x)
-    d = nobs # changes if unbiased
-    if not fft:
-        avf = acovf(x, unbiased=unbiased, demean=True)
-        #acf = np.take(avf/avf[0], range(1,nlags+1))
-        acf = avf[:nlags+1]/avf[0]
-    else:
-        #JP: move to acovf
-        x0 = x - x.mean()
-        Frf = np.fft.fft(x0, n=nobs*2) # zero-pad for separability
-        if unbiased:
-            d = nobs - np.arange(nobs)
-        acf = np.fft.ifft(Frf * np.conjugate(Frf))[:nobs]/d
-        acf /= acf[0]
-        #acf = np.take(np.real(acf), range(1,nlags+1))
-        acf = np.real(acf[:nlags+1])   #keep lag 0
+    avf = acovf(x, unbiased=unbiased, demean=True, fft=fft, nlag=nlags)
+    acf = avf / avf[0]
     if not (confint or qstat or alpha):
         return acf
     if not confint is None:
@@ -443,7 +647,7 @@ def acf(x, unbiased=False, nlags=40, confint=None, qstat=False, fft=False,
             return acf, qstat, pvalue
 
 def pacf_yw(x, nlags=40, method='unbiased'):
-    '''Partial autocorrelation estimated with non-recursive yule_walker
+    '''Partial autocorrelation estimated with the Yule-Walker equations
 
     Parameters
     ----------
@@ -461,14 +665,14 @@ def pacf_yw(x, nlags=40, method='unbiased'):
 
     Notes
     -----
-    This solves yule_walker for each desired lag and contains
-    currently duplicate calculations.
+    The last coefficients of the yule_walker solutions for all lags are
+    obtained by one Levinson-Durbin recursion on the autocovariances.
     '''
-    xm = x - x.mean()
-    pacf = [1.]
-    for k in range(1, nlags+1):
-        pacf.append(yule_walker(x, k, method=method)[0][-1])
-    return np.array(pacf)
+    method = str(method).lower()
+    if method not in ["unbiased", "mle"]:
+        raise ValueError("ACF estimation method must be 'unbiased' or 'MLE'")
+    acov = acovf(x, unbiased=(method == "unbiased"), nlag=nlags)
+    return _levinson_durbin_columns(acov[:,None], nlags)[:,0]
 
 #NOTE: this is incorrect.
 def pacf_ols(x, nlags=40):
@@ -539,8 +743,8 @@ def pacf(x, nlags=40, method='ywunbiased', alpha=None):
 
     Notes
     -----
-    This solves yule_walker equations or ols for each desired lag
-    and contains currently duplicate calculations.
+    The Yule-Walker and Levinson-Durbin methods use one recursion for all
+    lags, ols solves a regression for each lag.
     '''
 
     if method == 'ols':
@@ -550,12 +754,12 @@ def pacf(x, nlags=40, method='ywunbiased', alpha=None):
     elif method in ['ywm', 'ywmle', 'yw_mle']:
         ret = pacf_yw(x, nlags=nlags, method='mle')
     elif method in ['ld', 'ldu', 'ldunbiase', 'ld_unbiased']:
-        acv = acovf(x, unbiased=True)
+        acv = acovf(x, unbiased=True, nlag=nlags)
         ld_ = levinson_durbin(acv, nlags=nlags, isacov=True)
         #print 'ld', ld_
         ret = ld_[2]
     elif method in ['ldb', 'ldbiased', 'ld_biased']: #inconsistent naming with ywmle
-        acv = acovf(x, unbiased=False)
+        acv = acovf(x, unbiased=False, nlag=nlags)
         ld_ = levinson_durbin(acv, nlags=nlags, isacov=True)
         ret = ld_[2]
     else:
@@ -570,7 +774,7 @@ def pacf(x, nlags=40, method='ywunbiased', alpha=None):
 
 
 
-def ccovf(x, y, unbiased=True, demean=True):
+def ccovf(x, y, unbiased=True, demean=True, fft=None):
     ''' crosscovariance for 1D
 
     Parameters
@@ -579,6 +783,9 @@ def ccovf(x, y, unbiased=True, demean=True):
        time series data
     unbiased : boolean
        if True, then denominators is n-k, otherwise n
+    fft : bool or None
+        If True, use FFT convolution. If None, the default, FFT convolution
+        is used if it is faster.
 
     Returns
     -------
@@ -587,9 +794,10 @@ def ccovf(x, y, unbiased=True, demean=True):
 
     Notes
     -----
-    This uses np.correlate which does full convolution. For very long time
-    series it is recommended to use fft convolution instead.
+    The value at lag k is the covariance of x[t+k] and y[t].
     '''
+    x = np.asarray(x)
+    y = np.asarray(y)
     n = len(x)
     if demean:
         xo = x - x.mean();
@@ -597,14 +805,9 @@ def ccovf(x, y, unbiased=True, demean=True):
     else:
         xo = x
         yo = y
-    if unbiased:
-        xi = np.ones(n);
-        d = np.correlate(xi, xi, 'full')
-    else:
-        d = n
-    return (np.correlate(xo,yo,'full') / d)[n-1:]
+    return _covf_columns(xo[:,None], yo[:,None], n - 1, unbiased, fft)[:,0]
 
-def ccf(x, y, unbiased=True):
+def ccf(x, y, unbiased=True, fft=None):
     '''cross-correlation function for 1d
 
     Parameters
@@ -613,6 +816,9 @@ def ccf(x, y, unbiased=True):
        time series data
     unbiased : boolean
        if True, then denominators for autocovariance is n-k, otherwise n
+    fft : bool or None
+        If True, use FFT convolution. If None, the default, FFT convolution
+        is used if it is faster.
 
     Returns
     -------
@@ -621,17 +827,100 @@ def ccf(x, y, unbiased=True):
 
     Notes
     -----
-    This is based np.correlate which does full convolution. For very long time
-    series it is recommended to use fft convolution instead.
-
     If unbiased is true, the denominator for the autocovariance is adjusted
     but the autocorrelation is not an unbiased estimtor.
 
     '''
-    cvf = ccovf(x, y, unbiased=unbiased, demean=True)
+    cvf = ccovf(x, y, unbiased=unbiased, demean=True, fft=fft)
     return cvf / (np.std(x) * np.std(y))
 
 
+def acf_many(x, nlags=40, unbiased=False, fft=None):
+    '''
+    Autocorrelation and partial autocorrelation functions of many series
+
+    Parameters
+    ----------
+    x : array-like
+        2d array with the series in the columns.
+    nlags : int, optional
+        Largest lag, at most nobs - 1.
+    unbiased : bool
+        If True, then denominators for the autocovariances are n-k,
+        otherwise n.
+    fft : bool or None
+        If True, the autocovariances are computed by FFT convolution, if
+        False by sums over the lags. If None, the default, the faster one
+        is used.
+
+    Returns
+    -------
+    res : Bunch
+        Dict-like object with attribute access with the arrays acovf, acf,
+        pacf, with the lags 0 to nlags in the rows and one column per
+        series, and qstat and pvalues, the Ljung-Box Q statistics and
+        their p-values for the lags 1 to nlags.
+
+    Notes
+    -----
+    The columns give the results of acovf, acf and q_stat for each series.
+    pacf is the Yule-Walker partial autocorrelation for the same
+    autocovariances, pacf(x, method='ldu') if unbiased and method='ldb'
+    otherwise, computed with one Levinson-Durbin recursion for all series.
+    The series are transformed in chunks of columns to bound the memory.
+
+    See Also
+    --------
+    acf, pacf, q_stat
+    '''
+    x = np.asarray(x, dtype=float)
+    if x.ndim == 1:
+        x = x[:,None]
+    nobs = x.shape[0]
+    nlags = min(nlags, nobs - 1)
+    acov = _covf_columns(x, None, nlags, unbiased, fft, demean=True)
+    acf_ = acov / acov[0]
+    qstat, pvalues = q_stat(acf_[1:], nobs)
+    return Bunch(acovf=acov, acf=acf_,
+                 pacf=_levinson_durbin_columns(acov, nlags), qstat=qstat,
+                 pvalues=pvalues)
+
+
+def ccf_many(x, y, nlags=None, unbiased=True, fft=None):
+    '''
+    Cross-correlation functions of the columns of two arrays
+
+    Parameters
+    ----------
+    x, y : array-like
+        2d arrays of the same shape with the series in the columns.
+    nlags : int, optional
+        Largest lag, the default is nobs - 1.
+    unbiased : bool
+        If True, then denominators for the cross-covariances are n-k,
+        otherwise n.
+    fft : bool or None
+        If True, use FFT convolution. If None, the default, FFT convolution
+        is used if it is faster.
+
+    Returns
+    -------
+    ccf : array
+        The cross-correlations of x[:,i] and y[:,i] in column i, with the
+        lags 0 to nlags in the rows, as returned by ccf.
+    '''
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if x.ndim == 1:
+        x, y = x[:,None], y[:,None]
+    nobs = x.shape[0]
+    if nlags is None:
+        nlags = nobs - 1
+    cvf = _covf_columns(x, y, min(nlags, nobs - 1), unbiased, fft,
+                        demean=True)
+    return cvf / (x.std(0) * y.std(0))
+
+
 def periodogram(X):
     """
     Returns the periodogram for the natural frequency of X
@@ -912,8 +1201,200 @@ def coint(y1, y2, regression="c"):
     crit_value = mackinnoncrit(N=1, regression="c", nobs=len(y1))
     return coint_t, pvalue, crit_value
 
+
+class Bunch(dict):
+    """dict whose items can also be accessed as attributes"""
+    def __init__(self, **kwargs):
+        dict.__init__(self, kwargs)
+        self.__dict__ = self
+
+
+def _fit_arma_ics(y, orders, d, trend, long_ar, model_kw, fit_kw):
+    # aic, bic and hqic for each order, nan if the fit fails
+    from statsmodels.tsa.arima_model import ARIMA
+    ics = []
+    for ar, ma in orders:
+        try:
+            mod = ARIMA(y, (ar, d, ma), **model_kw)
+            mod._long_ar = long_ar
+            res = mod.fit(trend=trend, **fit_kw)
+            ics.append((res.aic, res.bic, res.hqic))
+        except Exception:
+            ics.append((np.nan,) * 3)
+    return ics
+
+
+def arma_order_select_ic(y, max_ar=4, max_ma=2, ic='bic', trend='c', d=0,
+                         model_kw={}, fit_kw={}, n_jobs=1, prune=None):
+    """
+    Returns information criteria for many ARMA models
+
+    Parameters
+    ----------
+    y : array-like
+        Time-series data
+    max_ar : int
+        Maximum number of AR lags to use. Default 4.
+    max_ma : int
+        Maximum number of MA lags to use. Default 2.
+    ic : str, list
+        Information criteria to report. Either a single string or a list
+        of different criteria is possible, 'aic', 'bic' and 'hqic'.
+    trend : str
+        The trend to use when fitting the ARMA models, 'c' or 'nc'.
+    d : int
+        Order of differencing, the models are ARIMA(p, d, q) if d > 0.
+    model_kw : dict
+        Keyword arguments to be passed to the ARMA model, for example exog.
+    fit_kw : dict
+        Keyword arguments to be passed to ARMA.fit.
+    n_jobs : int
+        Number of processes that fit the models, -1 uses all cpus. Requires
+        joblib, see statsmodels.tools.parallel.
+    prune : float or None
+        If not None, an order is not fitted if both orders with one lag
+        less have an information criterion that is larger than the best
+        one so far by more than prune, or were not fitted themselves. The
+        first criterion in `ic` is used. Orders that are not fitted have
+        nan in the tables. Pruning is a heuristic and can change the
+        selected order, see Notes.
+
+    Returns
+    -------
+    obj : Bunch
+        Dict-like object with attribute access. Each ic is an attribute
+        with a DataFrame for the results, with the AR order in the rows and
+        the MA order in the columns. The attribute `ic`_min_order holds the
+        (p, q) order with the smallest information criterion.
+
+    Notes
+    -----
+    The models are fitted in order of the number of lags, the models with
+    the same number of lags are fitted in parallel if n_jobs is not 1. Fits
+    that fail have nan as information criteria.
+
+    The long autoregression of the Hannan-Rissanen start parameters, see
+    ARMA._fit_start_params_hr, is computed once and shared by all models.
+
+    The information criterion of an order is not bounded by the ones of the
+    orders with fewer lags, a lag can improve the fit a lot although the
+    smaller models are poor. Pruning therefore does not guarantee that the
+    order with the smallest criterion is found. A larger prune fits more
+    models and is less likely to miss it. An order is always fitted if one
+    of the orders with one lag less failed to fit, because a failed fit
+    says nothing about its neighbours.
+
+    This method can be used to tentatively identify the order of an ARMA
+    process, provided that the time series is stationary and invertible.
+    This function computes the full exact MLE estimate of each model and can
+    be, therefore a little slow.
+
+    Examples
+    --------
+    >>> from statsmodels.tsa.arima_process import arma_generate_sample
+    >>> import statsmodels.api as sm
+    >>> import numpy as np
+
+    >>> arparams = np.r_[1, -np.array([.75, -.25])]
+    >>> maparams = np.r_[1, np.array([.65, .35])]
+    >>> nobs = 250
+    >>> np.random.seed(2014)
+    >>> y = arma_generate_sample(arparams, maparams, nobs)
+    >>> res = sm.tsa.arma_order_select_ic(y, ic=['aic', 'bic'], trend='nc')
+    >>> res.aic_min_order
+    >>> res.bic_min_order
+
+    Pruning fits fewer models, but can miss the best order. With prune=5.
+    ARMA(1, 2) is not fitted, because ARMA(0, 2) was pruned and the BIC of
+    ARMA(1, 1) is larger than the one of ARMA(2, 0) by more than 5, and
+    ARMA(2, 2) is selected. With prune=10. the selection is the same as
+    without pruning.
+
+    >>> res_pruned = sm.tsa.arma_order_select_ic(y, ic='bic', trend='nc',
+    ...                                          prune=10.)
+    >>> res_pruned.bic_min_order
+    """
+    from pandas import DataFrame
+    from statsmodels.tsa.arima_model import ARIMA, _make_arma_exog, \
+                                            _fit_long_ar
+    if isinstance(ic, basestring):
+        ic = [ic]
+    ic = [name.lower() for name in ic]
+    ic_index = dict(aic=0, bic=1, hqic=2)
+    for name in ic:
+        if name not in ic_index:
+            raise ValueError("ic %s not understood" % name)
+    fit_kw = dict(fit_kw)
+    fit_kw.setdefault('disp', -1)
+
+    long_ar = None
+    if max_ar and max_ma:
+        mod = ARIMA(y, (0, d, 0), **model_kw)
+        exog = _make_arma_exog(mod.endog, mod.exog, trend)[1]
+        try:
+            long_ar = _fit_long_ar(mod.endog, exog)
+        except Exception:
+            # each model computes it and fails separately
+            pass
+
+    if n_jobs != 1:
+        from statsmodels.tools.parallel import parallel_func
+        parallel, p_func, n_jobs = parallel_func(_fit_arma_ics,
+                                                 n_jobs=n_jobs, verbose=0)
+
+    results = np.empty((3, max_ar + 1, max_ma + 1))
+    results.fill(np.nan)
+    crit = results[ic_index[ic[0]]]
+    pruned = np.zeros((max_ar + 1, max_ma + 1), bool)
+    best = np.inf
+    for n_lags in range(max_ar + max_ma + 1):
+        orders = []
+        for ar in range(max(0, n_lags - max_ma), min(n_lags, max_ar) + 1):
+            ma = n_lags - ar
+            if prune is not None and n_lags > 0:
+                # pruned orders count as dominated, a failed fit prevents
+                # pruning
+                previous = [(ar-1, ma)] if ar else []
+                previous += [(ar, ma-1)] if ma else []
+                previous = [np.inf if pruned[order] else crit[order]
+                            for order in previous]
+                if min(previous) > best + prune:
+                    pruned[ar, ma] = True
+                    continue
+            orders.append((ar, ma))
+        if not orders:
+            break
+        if n_jobs == 1 or len(orders) == 1:
+            ics = _fit_arma_ics(y, orders, d, trend, long_ar, model_kw,
+                                fit_kw)
+        else:
+            chunks = [orders[i::n_jobs] for i in range(min(n_jobs,
+                                                           len(orders)))]
+            ics = parallel(p_func(y, chunk, d, trend, long_ar, model_kw,
+                                  fit_kw) for chunk in chunks)
+            orders = sum(chunks, [])
+            ics = sum([list(values) for values in ics], [])
+        for (ar, ma), values in zip(orders, ics):
+            results[:, ar, ma] = values
+        if np.isfinite(crit).any():
+            best = np.nanmin(crit)
+
+    res = Bunch()
+    for name in ic:
+        table = results[ic_index[name]]
+        res[name] = DataFrame(table, index=range(max_ar + 1),
+                              columns=range(max_ma + 1))
+        if np.isfinite(table).any():
+            min_order = np.unravel_index(np.nanargmin(table), table.shape)
+            res[name + '_min_order'] = tuple(int(i) for i in min_order)
+        else:
+            res[name + '_min_order'] = None
+    return res
+
+
 __all__ = ['acovf', 'acf', 'pacf', 'pacf_yw', 'pacf_ols', 'ccovf', 'ccf',
-           'periodogram', 'q_stat', 'coint']
+           'periodogram', 'q_stat', 'coint', 'arma_order_select_ic',
+           'adfuller_many', 'acf_many', 'ccf_many']
 
 if __name__=="__main__":
     import statsmodels.api as sm
@@ -47,3 +47,51 @@ def test_adf_autolag():
     adf3 = tsast.adfuller(x, maxlag=0, autolag='aic',
                           regression=tr, store=True, regresults=True)
     assert_equal(len(adf3[-1].autolag_results), 0 + 1)
+
+
+def test_nested_ols():
+    from statsmodels.regression.linear_model import OLS
+    np.random.seed(4321)
+    exog = np.column_stack((np.ones(100), np.random.randn(100, 4)))
+    endog = np.dot(exog[:,:3], [1, .5, -.5]) + np.random.randn(100)
+    nested = tsast._NestedOLS(endog, exog)
+    for k in range(1, 6):
+        res = OLS(endog, exog[:,:k]).fit()
+        assert_almost_equal(nested.ssr[k-1], res.ssr, 10)
+        assert_almost_equal(nested.llf[k-1], res.llf, 10)
+        assert_almost_equal(nested.aic[k-1], res.aic, 10)
+        assert_almost_equal(nested.bic[k-1], res.bic, 10)
+        assert_almost_equal(nested.tvalues[k-1], res.tvalues[-1], 10)
+
+    # same lag choice as the separate regressions
+    x = np.log(macrodata.load().data['realgdp'])
+    for autolag in ['aic', 'bic', 't-stat']:
+        adf = tsast.adfuller(x, autolag=autolag)
+        adf_reg = tsast.adfuller(x, autolag=autolag, regresults=True)
+        assert_equal(adf[2], adf_reg[-1].usedlag)
+        assert_almost_equal(adf[0], adf_reg[0], 10)
+        assert_almost_equal(adf[-1], adf_reg[-1].icbest, 10)
+
+
+def test_adfuller_many():
+    np.random.seed(1234)
+    x = np.cumsum(np.random.randn(200, 4), axis=0)
+    x[:,1] = np.random.randn(200)
+    for autolag in ['AIC', None]:
+        res = tsast.adfuller_many(x, maxlag=6, regression='ct',
+                                  autolag=autolag)
+        res_parallel = tsast.adfuller_many(x, maxlag=6, regression='ct',
+                                           autolag=autolag, n_jobs=2)
+        assert_equal(res_parallel.adfstat, res.adfstat)
+        for i in range(4):
+            adf = tsast.adfuller(x[:,i], maxlag=6, regression='ct',
+                                 autolag=autolag)
+            assert_almost_equal(res.adfstat[i], adf[0], 12)
+            assert_almost_equal(res.pvalue[i], adf[1], 12)
+            assert_equal(res.usedlag[i], adf[2])
+            assert_equal(res.nobs[i], adf[3])
+            assert_almost_equal(res.critvalues[i],
+                                [adf[4]['1%'], adf[4]['5%'], adf[4]['10%']])
+            if autolag:
+                assert_almost_equal(res.icbest[i], adf[5], 12)
+    assert_equal(res.icbest, np.nan)
@@ -281,6 +281,25 @@ def test_ar_series():
     ar = AR(dta).fit(maxlags=15)
     ar.bse
 
+def test_append():
+    data = sm.datasets.sunspots.load()
+    endog = data.endog
+    res = AR(endog[:250]).fit(maxlag=4)
+    res2 = res.append(endog[250:260])
+    for i in range(260, len(endog)):
+        res2 = res2.append(endog[i])
+    res3 = AR(endog).fit(maxlag=4)
+    assert_equal(res2.params, res.params)
+    assert_equal(res2.nobs, res3.nobs)
+    assert_almost_equal(res2.model.X, res3.model.X)
+    assert_almost_equal(res2.resid, res3.model.endog[4:,0] -
+                        res3.model.predict(res.params), 10)
+    assert_almost_equal(res2.predict(len(endog), len(endog) + 4),
+                        res3.model.predict(res.params, len(endog),
+                                           len(endog) + 4), 10)
+    res2 = res.append(endog[250:], refit=True)
+    assert_almost_equal(res2.params, res3.params, 10)
+
 
 #TODO: likelihood for ARX model?
 #class TestAutolagARX(object):
@@ -1,10 +1,11 @@
 import numpy as np
 from numpy.testing import (assert_almost_equal, assert_equal, assert_,
-                           assert_raises, dec)
+                           assert_raises, assert_allclose, dec)
 import statsmodels.sandbox.tsa.fftarma as fa
 from statsmodels.tsa.descriptivestats import TsaDescriptive
 from statsmodels.tsa.arma_mle import Arma
-from statsmodels.tsa.arima_model import ARMA, ARIMA
+from statsmodels.tsa.arima_model import (ARMA, ARIMA,
+                                         _arma_predict_out_of_sample)
 from statsmodels.tsa.base.datetools import dates_from_range
 from results import results_arma, results_arima
 import os
@@ -1822,6 +1823,107 @@ def test_arima_dataframe_integer_name():
     df = pandas.DataFrame(ts)
     mod = sm.tsa.ARIMA(df, (2, 0, 2))
 
+
+def test_kalman_loglike_batch():
+    from statsmodels.tsa.kalmanf.kalmanfilter import KalmanFilter
+    np.random.seed(1234)
+    y = arma_generate_sample([1, -.5, .2], [1, .8], 300) + 2
+    res = ARMA(y, (2, 1)).fit(method='mle', disp=-1)
+    model = res.model
+    params = res.params + np.random.uniform(-.05, .05, size=(5, 4))
+    llf_batch = model.loglike_kalman_batch(params)
+    llf = [model.loglike(p) for p in params]
+    assert_almost_equal(llf_batch, llf, 10)
+    # complex step
+    params_cs = params + 1e-20j
+    assert_almost_equal(model.loglike_kalman_batch(params_cs),
+                        [model.loglike(p) for p in params_cs], 10)
+
+    # steady state switch does not change the likelihood
+    (y_, k, nobs, k_ar, k_ma, k_lags, newparams, Z_mat, m, R_mat, T_mat,
+        paramsdtype) = KalmanFilter._init_kalman_state(res.params, model)
+    llf_steady = kalman_loglike.kalman_loglike_double(y_, k, k_ar, k_ma,
+                                    k_lags, nobs, Z_mat, R_mat, T_mat)
+    llf_full = kalman_loglike.kalman_loglike_double(y_, k, k_ar, k_ma,
+                                    k_lags, nobs, Z_mat, R_mat, T_mat, 0.)
+    assert_almost_equal(llf_steady[0], llf_full[0], 8)
+    assert_almost_equal(llf_steady[1], llf_full[1], 10)
+
+
+def test_fit_many():
+    from statsmodels.tsa.arima_model import fit_many, _ARMABatch
+    np.random.seed(2345)
+    series = [np.cumsum(arma_generate_sample([1, -.5], [1, .3], nobs))
+              for nobs in [120, 150, 200]]
+    res = fit_many(series, (1, 1, 1), steps=4)
+    assert_equal(res.params.shape, (3, 3))
+    assert_equal(res.forecast.shape, (3, 4))
+    assert_equal(res.param_names, ['const', 'ar.L1', 'ma.L1'])
+    # the optimizers differ, the maximum is the same
+    for i, y in enumerate(series):
+        res1 = ARIMA(y, (1, 1, 1)).fit(disp=-1)
+        assert_allclose(res.params[i], res1.params, rtol=1e-6)
+        assert_allclose(res.sigma2[i], res1.sigma2, rtol=1e-8)
+        assert_(res.llf[i] >= res1.llf - 1e-10)
+        assert_almost_equal(res.llf[i], res1.llf, 8)
+        assert_almost_equal(res.bic[i], res1.bic, 8)
+        assert_allclose(res.forecast[i], res1.forecast(4)[0], rtol=1e-8)
+    assert_(res.converged.all())
+
+    # 2d array, the series in the columns, several series of one length
+    y = np.column_stack([np.diff(s[-100:]) for s in series])
+    res = fit_many(y, (1, 1), trend='nc', method='css-mle', n_jobs=2)
+    res1 = ARMA(y[:,2], (1, 1)).fit(trend='nc', disp=-1)
+    assert_allclose(res.params[2], res1.params, rtol=1e-6)
+    assert_equal(res.forecast.shape, (3, 0))
+    # the loglikelihood of all series is evaluated at once
+    batch = _ARMABatch(y.T, (1, 1), 0)
+    llf, sigma2 = batch.loglike(res.params, np.arange(3))
+    assert_almost_equal(llf, res.llf, 10)
+    assert_raises(ValueError, fit_many, y, (1, 1), method='css')
+
+    # failed fits are nan
+    res = fit_many([series[0], np.ones(3)], (1, 1, 1))
+    assert_(np.isnan(res.params[1]).all())
+    assert_equal(res.converged, [True, False])
+
+def test_append():
+    np.random.seed(1234)
+    y = arma_generate_sample([1, -.6, .2], [1, .4], 300) + 1
+    x = np.random.randn(300)
+    for method in ['css-mle', 'css']:
+        for order, has_exog in [((2, 1), False), ((1, 2), True)]:
+            exog = x if has_exog else None
+            res = ARMA(y[:250], order, exog=exog if exog is None else
+                       exog[:250]).fit(method=method, disp=-1)
+            res2 = res
+            for i in range(250, 300, 10):
+                res2 = res2.append(y[i:i+10], exog if exog is None else
+                                   exog[i:i+10])
+            mod = ARMA(y, order, exog=exog)
+            mod._setup_fit('c', method)
+            mod.transparams = False
+            assert_equal(res2.params, res.params)
+            assert_equal(res2.nobs, mod.nobs)
+            assert_almost_equal(res2.resid, mod.geterrors(res.params), 10)
+            assert_almost_equal(res2.llf, mod.loglike(res.params), 8)
+
+    # forecast in the levels and refit
+    y = np.cumsum(y)
+    res = ARIMA(y[:250], (1, 1, 1)).fit(disp=-1)
+    res2 = res.append(y[250:])
+    mod = ARIMA(y, (1, 1, 1))
+    mod._setup_fit('c', 'css-mle')
+    mod.transparams = False
+    resid = mod.geterrors(res.params)
+    assert_almost_equal(res2.resid, resid, 10)
+    fc = _arma_predict_out_of_sample(res.params, 1, resid, 1, 1, 1, 0,
+                                     mod.endog)
+    assert_almost_equal(res2.forecast(1)[0], y[-1] + fc, 10)
+    res2 = res.append(y[250:], refit=True, disp=-1)
+    res3 = ARIMA(y, (1, 1, 1)).fit(disp=-1)
+    assert_almost_equal(res2.params, res3.params, 4)
+
 if __name__ == "__main__":
     import nose
     nose.runmodule(argv=[__file__, '-vvs', '-x', '--pdb'], exit=False)
@@ -1,9 +1,12 @@
 from statsmodels.tsa.stattools import (adfuller, acf, pacf_ols, pacf_yw,
                                                pacf, grangercausalitytests,
-                                               coint, acovf)
+                                               coint, acovf, ccovf, ccf,
+                                               q_stat, acf_many, ccf_many,
+                                               arma_order_select_ic)
 from statsmodels.tsa.base.datetools import dates_from_range
 import numpy as np
-from numpy.testing import assert_almost_equal, assert_equal, assert_raises
+from numpy.testing import (assert_almost_equal, assert_equal, assert_raises,
+                           assert_)
 from numpy import genfromtxt#, concatenate
 from statsmodels.datasets import macrodata, sunspots
 from pandas import Series, Index
@@ -241,6 +244,91 @@ def test_acovf2d():
     X = np.random.random((10,2))
     assert_raises(ValueError, acovf, X)
 
+def test_acovf_fft():
+    np.random.seed(12345)
+    x = np.random.randn(200).cumsum()
+    y = np.random.randn(200) + .5 * x
+    xo, yo = x - x.mean(), y - y.mean()
+    d = np.arange(200, 0, -1.)
+    for unbiased in [False, True]:
+        denom = d if unbiased else 200
+        acov = np.correlate(xo, xo, 'full')[199:] / denom
+        ccov = np.correlate(xo, yo, 'full')[199:] / denom
+        for fft in [True, False, None]:
+            assert_almost_equal(acovf(x, unbiased=unbiased, fft=fft), acov,
+                                10)
+            assert_almost_equal(acovf(x, unbiased=unbiased, fft=fft,
+                                      nlag=10), acov[:11], 10)
+            assert_almost_equal(ccovf(x, y, unbiased=unbiased, fft=fft),
+                                ccov, 10)
+
+def test_acf_many():
+    data = macrodata.load().data
+    x = np.column_stack([np.diff(np.log(data[name])) for name in
+                         ['realgdp', 'realcons', 'realinv', 'cpi']])
+    res = acf_many(x, nlags=20)
+    res_fft = acf_many(x, nlags=20, fft=True)
+    assert_almost_equal(res_fft.acf, res.acf, 12)
+    for i in range(x.shape[1]):
+        acf_, qstat, pvalue = acf(x[:,i], nlags=20, qstat=True)
+        assert_almost_equal(res.acf[:,i], acf_, 12)
+        assert_almost_equal(res.acovf[:,i], acovf(x[:,i])[:21], 12)
+        assert_almost_equal(res.qstat[:,i], qstat, 10)
+        assert_almost_equal(res.pvalues[:,i], pvalue, 12)
+        assert_almost_equal(res.pacf[:,i], pacf(x[:,i], 20, method='ldb'),
+                            10)
+        assert_almost_equal(res.pacf[:,i], pacf_yw(x[:,i], 20, 'mle'), 10)
+    assert_almost_equal(acf_many(x, 20, unbiased=True).pacf[:,0],
+                        pacf_yw(x[:,0], 20), 10)
+    qstat, pvalue = q_stat(res.acf[1:], len(x))
+    assert_almost_equal(qstat, res.qstat, 12)
+
+    ccf_ = ccf_many(x[:,:2], x[:,2:], nlags=10)
+    assert_almost_equal(ccf_[:,1], ccf(x[:,1], x[:,3])[:11], 12)
+
+def test_arma_order_select_ic():
+    from statsmodels.tsa.arima_model import ARMA
+    from statsmodels.tsa.arima_process import arma_generate_sample
+    np.random.seed(12345)
+    y = arma_generate_sample([1, -.6], [1, .4], 250)
+    res = arma_order_select_ic(y, max_ar=2, max_ma=2, ic=['aic', 'bic'])
+    assert_equal(res.aic.shape, (3, 3))
+    for order in [(0, 0), (1, 1), (2, 1)]:
+        res_arma = ARMA(y, order).fit(disp=-1)
+        assert_almost_equal(res.aic.values[order], res_arma.aic, 5)
+        assert_almost_equal(res.bic.values[order], res_arma.bic, 5)
+    bic = res.bic.values
+    assert_equal(res.bic_min_order,
+                 np.unravel_index(np.nanargmin(bic), bic.shape))
+
+    res_parallel = arma_order_select_ic(y, max_ar=2, max_ma=2, n_jobs=2)
+    assert_almost_equal(res_parallel.bic.values, bic, 8)
+
+    # orders next to ones with much larger bic are not fitted
+    res_pruned = arma_order_select_ic(y, max_ar=2, max_ma=2, prune=0.)
+    bic_pruned = res_pruned.bic.values
+    fitted = ~np.isnan(bic_pruned)
+    assert_(not fitted.all())
+    assert_almost_equal(bic_pruned[fitted], bic[fitted], 8)
+    assert_equal(res_pruned.bic_min_order, res.bic_min_order)
+    assert_raises(ValueError, arma_order_select_ic, y, ic='fpe')
+
+
+def test_arma_order_select_ic_prune():
+    # the example of the docstring, the pruned selection agrees if prune is
+    # larger than the increase of the BIC on the path to the best order
+    from statsmodels.tsa.arima_process import arma_generate_sample
+    np.random.seed(2014)
+    y = arma_generate_sample([1, -.75, .25], [1, .65, .35], 250)
+    res = arma_order_select_ic(y, ic='bic', trend='nc')
+    res_pruned = arma_order_select_ic(y, ic='bic', trend='nc', prune=10.)
+    bic, bic_pruned = res.bic.values, res_pruned.bic.values
+    fitted = ~np.isnan(bic_pruned)
+    assert_(np.isnan(bic).sum() < (~fitted).sum())
+    assert_almost_equal(bic_pruned[fitted], bic[fitted], 8)
+    assert_equal(res_pruned.bic_min_order, res.bic_min_order)
+
+
 if __name__=="__main__":
     import nose
 #    nose.runmodule(argv=[__file__, '-vvs','-x','-pdb'], exit=False)
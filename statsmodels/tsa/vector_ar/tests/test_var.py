@@ -562,6 +562,37 @@ def test_get_trendorder():
     for t, trendorder in results.iteritems():
         assert(util.get_trendorder(t) == trendorder)
 
+def test_irf_resim():
+    mdata = sm.datasets.macrodata.load().data
+    data = np.column_stack((mdata['realgdp'], mdata['realcons'],
+                            mdata['realinv']))
+    res = VAR(np.diff(np.log(data), axis=0)).fit(maxlags=2)
+    nobs = res.nobs
+    for orth, cum in [(False, False), (True, True)]:
+        ma_coll = res.irf_resim(orth=orth, cum=cum, repl=5, T=6, seed=123)
+        # same random numbers and estimates as refitting each simulation
+        np.random.seed(123)
+        for i in range(5):
+            sim = util.varsim(res.coefs, res.intercept, res.sigma_u,
+                              steps=nobs + 100)[100:]
+            res_sim = VAR(sim).fit(maxlags=2)
+            if orth:
+                irf = res_sim.orth_ma_rep(maxn=6)
+            else:
+                irf = res_sim.ma_rep(maxn=6)
+            if cum:
+                irf = irf.cumsum(axis=0)
+            assert_almost_equal(ma_coll[i], irf, 8)
+    ma_parallel = res.irf_resim(orth=True, cum=True, repl=5, T=6, seed=123,
+                                n_jobs=2)
+    assert_equal(ma_parallel, ma_coll)
+
+    lower, upper = res.irf_errband_mc(repl=40, T=6, seed=1)
+    assert_equal(lower.shape, (7, 3, 3))
+    assert_(np.all(lower <= upper))
+    lower2 = res.irf_errband_mc(repl=40, T=6, seed=1)[0]
+    assert_equal(lower2, lower)
+
 if __name__ == '__main__':
     import nose
     nose.runmodule(argv=[__file__,'-vvs','-x','--pdb', '--pdb-failure'],
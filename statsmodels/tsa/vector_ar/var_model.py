@@ -268,6 +268,111 @@ def var_loglike(resid, omega, nobs):
     part2 = - (nobs / 2) * (logdet + neqs)
     return part1 + part2
 
+#-------------------------------------------------------------------------------
+# Monte Carlo replications of the impulse responses, each function works on a
+# stack of replications at once
+
+# maximum number of elements of the stacked cross-products of the regressors
+_MC_CHUNK_SIZE = 2**22
+
+
+def _varsim_stack(coefs, intercept, shocks):
+    """
+    Simulates a VAR(p) process for each replication of the shocks
+
+    shocks is repl x steps x k, as util.varsim the first p values are zero.
+    """
+    p = len(coefs)
+    result = np.zeros(shocks.shape)
+    result[:, p:] = intercept + shocks[:, p:]
+    for t in range(p, shocks.shape[1]):
+        for j in range(p):
+            result[:, t] += np.dot(result[:, t-j-1], coefs[j].T)
+    return result
+
+
+def _estimate_var_stack(y, lags):
+    """
+    OLS estimates of a VAR(lags) with a constant for a stack of series
+
+    Returns coefs, repl x lags x k x k, and sigma_u, repl x k x k, as
+    VAR(y[i]).fit(maxlags=lags) for each replication i.
+    """
+    from statsmodels.tools.tools import stacked_cholesky_inv
+    repl, nobs, k = y.shape
+    z = np.ones((repl, nobs - lags, 1 + k * lags))
+    for j in range(lags):
+        z[:, :, 1+j*k:1+(j+1)*k] = y[:, lags-j-1:nobs-j-1]
+    y_sample = y[:, lags:]
+    ztz_inv = stacked_cholesky_inv((z[:,:,:,None] * z[:,:,None,:]).sum(1))
+    zty = (z[:,:,:,None] * y_sample[:,:,None,:]).sum(1)
+    params = (ztz_inv[:,:,:,None] * zty[:,None,:,:]).sum(2)
+    resid = y_sample - (z[:,:,:,None] * params[:,None,:,:]).sum(2)
+    df_resid = nobs - lags - (k * lags + 1)
+    sigma_u = (resid[:,:,:,None] * resid[:,:,None,:]).sum(1) / df_resid
+    coefs = params[:, 1:].reshape((repl, lags, k, k)).swapaxes(2, 3)
+    return coefs, sigma_u
+
+
+def _ma_rep_stack(coefs, maxn=10):
+    """
+    MA representation, see ma_rep, for a stack of coefs repl x p x k x k
+    """
+    repl, p, k, k = coefs.shape
+    phis = np.zeros((repl, maxn + 1, k, k))
+    phis[:, 0] = np.eye(k)
+    for i in range(1, maxn + 1):
+        for j in range(1, min(i, p) + 1):
+            phis[:, i] += (phis[:, i-j, :, :, None] *
+                           coefs[:, j-1, None, :, :]).sum(2)
+    return phis
+
+
+def _irf_replications(coefs, intercept, shocks, burn, T, orth, cum):
+    # impulse responses of the VAR refitted to the simulated series
+    k_ar = len(coefs)
+    sim = _varsim_stack(coefs, intercept, shocks)[:, burn:]
+    coefs_sim, sigma_u_sim = _estimate_var_stack(sim, k_ar)
+    ma_coll = _ma_rep_stack(coefs_sim, maxn=T)
+    if orth:
+        P = np.array([chol(sigma_u) for sigma_u in sigma_u_sim])
+        ma_coll = (ma_coll[:, :, :, :, None] * P[:, None, None]).sum(3)
+    if cum:
+        ma_coll = ma_coll.cumsum(axis=1)
+    return ma_coll
+
+
+def _irf_mc(results, orth, repl, T, seed, burn, cum, n_jobs):
+    """
+    Simulated impulse responses of repl replications of a VARResults
+
+    All shocks are drawn first, so the replications only depend on the
+    seed and not on n_jobs. The replications are processed in chunks that
+    bound the size of the stacked cross-products.
+    """
+    if seed is not None:
+        np.random.seed(seed=seed)
+    neqs, k_ar = results.neqs, results.k_ar
+    steps = results.nobs + burn
+    shocks = np.random.multivariate_normal(np.zeros(neqs), results.sigma_u,
+                                           (repl, steps))
+    size = (steps - burn) * (1 + neqs * k_ar)**2
+    n_chunks = max(n_jobs, int(np.ceil(repl * size / float(_MC_CHUNK_SIZE))))
+    chunks = np.array_split(np.arange(repl), min(n_chunks, repl))
+    args = (burn, T, orth, cum)
+    if n_jobs == 1:
+        ma_coll = [_irf_replications(results.coefs, results.intercept,
+                                     shocks[chunk], *args)
+                   for chunk in chunks]
+    else:
+        from statsmodels.tools.parallel import parallel_func
+        parallel, p_func, n_jobs = parallel_func(_irf_replications,
+                                                 n_jobs=n_jobs, verbose=0)
+        ma_coll = parallel(p_func(results.coefs, results.intercept,
+                                  shocks[chunk], *args) for chunk in chunks)
+    return np.concatenate(ma_coll)
+
+
 def _reordered(self, order):
     #Create new arrays to hold rearranged results from .fit()
     endog = self.endog
@@ -1062,7 +1167,8 @@ class VARResults(VARProcess):
 
     #Monte Carlo irf standard errors
     def irf_errband_mc(self, orth=False, repl=1000, T=10,
-                       signif=0.05, seed=None, burn=100, cum=False):
+                       signif=0.05, seed=None, burn=100, cum=False,
+                       n_jobs=1):
         """
         Compute Monte Carlo integrated error bands assuming normally
         distributed for impulse response functions
@@ -1083,45 +1189,23 @@ class VARResults(VARProcess):
             number of initial observations to discard for simulation
         cum: bool, default False
             produce cumulative irf error bands
+        n_jobs: int
+            number of processes for the replications, -1 uses all cpus.
+            Requires joblib, the replications do not depend on n_jobs.
 
         Notes
         -----
         Lutkepohl (2005) Appendix D
 
+        All replications are simulated and refitted at once, the estimates
+        are the same as VAR(sim).fit(maxlags=k_ar) for each simulated sim.
+
         Returns
         -------
         Tuple of lower and upper arrays of ma_rep monte carlo standard errors
 
         """
-        neqs = self.neqs
-        mean = self.mean()
-        k_ar = self.k_ar
-        coefs = self.coefs
-        sigma_u = self.sigma_u
-        intercept = self.intercept
-        df_model = self.df_model
-        nobs = self.nobs
-
-        ma_coll = np.zeros((repl, T+1, neqs, neqs))
-
-        if (orth == True and cum == True):
-            fill_coll = lambda sim : VAR(sim).fit(maxlags=k_ar).\
-                              orth_ma_rep(maxn=T).cumsum(axis=0)
-        elif (orth == True and cum == False):
-            fill_coll = lambda sim : VAR(sim).fit(maxlags=k_ar).\
-                              orth_ma_rep(maxn=T)
-        elif (orth == False and cum == True):
-            fill_coll = lambda sim : VAR(sim).fit(maxlags=k_ar).\
-                              ma_rep(maxn=T).cumsum(axis=0)
-        elif (orth == False and cum == False):
-            fill_coll = lambda sim : VAR(sim).fit(maxlags=k_ar).\
-                              ma_rep(maxn=T)
-
-        for i in range(repl):
-            #discard first hundred to eliminate correct for starting bias
-            sim = util.varsim(coefs, intercept, sigma_u, steps=nobs+burn)
-            sim = sim[burn:]
-            ma_coll[i,:,:,:] = fill_coll(sim)
+        ma_coll = _irf_mc(self, orth, repl, T, seed, burn, cum, n_jobs)
 
         ma_sort = np.sort(ma_coll, axis=0) #sort to get quantiles
         index = round(signif/2*repl)-1,round((1-signif/2)*repl)-1
@@ -1130,7 +1214,7 @@ class VARResults(VARProcess):
         return lower, upper
 
     def irf_resim(self, orth=False, repl=1000, T=10,
-                      seed=None, burn=100, cum=False):
+                      seed=None, burn=100, cum=False, n_jobs=1):
 
         """
         Simulates impulse response function, returning an array of simulations.
@@ -1152,6 +1236,9 @@ class VARResults(VARProcess):
             number of initial observations to discard for simulation
         cum: bool, default False
             produce cumulative irf error bands
+        n_jobs: int
+            number of processes for the replications, -1 uses all cpus.
+            Requires joblib, the replications do not depend on n_jobs.
 
         Notes
         -----
@@ -1162,39 +1249,7 @@ class VARResults(VARProcess):
         Array of simulated impulse response functions
 
         """
-        neqs = self.neqs
-        mean = self.mean()
-        k_ar = self.k_ar
-        coefs = self.coefs
-        sigma_u = self.sigma_u
-        intercept = self.intercept
-        df_model = self.df_model
-        nobs = self.nobs
-        if seed is not None:
-            np.random.seed(seed=seed)
-
-        ma_coll = np.zeros((repl, T+1, neqs, neqs))
-
-        if (orth == True and cum == True):
-            fill_coll = lambda sim : VAR(sim).fit(maxlags=k_ar).\
-                              orth_ma_rep(maxn=T).cumsum(axis=0)
-        elif (orth == True and cum == False):
-            fill_coll = lambda sim : VAR(sim).fit(maxlags=k_ar).\
-                              orth_ma_rep(maxn=T)
-        elif (orth == False and cum == True):
-            fill_coll = lambda sim : VAR(sim).fit(maxlags=k_ar).\
-                              ma_rep(maxn=T).cumsum(axis=0)
-        elif (orth == False and cum == False):
-            fill_coll = lambda sim : VAR(sim).fit(maxlags=k_ar).\
-                              ma_rep(maxn=T)
-
-        for i in range(repl):
-            #discard first hundred to eliminate correct for starting bias
-            sim = util.varsim(coefs, intercept, sigma_u, steps=nobs+burn)
-            sim = sim[burn:]
-            ma_coll[i,:,:,:] = fill_coll(sim)
-
-        return ma_coll
+        return _irf_mc(self, orth, repl, T, seed, burn, cum, n_jobs)
 
 
     def _omega_forc_cov(self, steps):